@@ -3,9 +3,19 @@
 WF Label Printer - PyInstaller Spec File (Local Build)
 """
 
+import subprocess
+import sys
 from pathlib import Path
 from PyInstaller.utils.hooks import collect_all
 
+# 컴파일된 QSS 임베드 (QSS 원본 파일은 번들에 포함되지 않음)
+# → src/gui/styles/_compiled_qss.py 생성
+subprocess.run(
+    [sys.executable, '-m', 'src.gui.styles.style_cache'],
+    cwd=str(Path('../..').resolve()),
+    check=True,
+)
+
 # PyQt6 전체 수집 (DLL + sip 포함)
 qt_datas, qt_binaries, qt_hiddenimports = collect_all('PyQt6')
 sip_datas, sip_binaries, sip_hiddenimports = collect_all('PyQt6.sip')
@@ -29,6 +39,7 @@ hiddenimports = [
     'usb.backend.libusb1',
     'serial',
     'sqlite3',
+    'src.gui.styles._compiled_qss',
 ]
 
 a = Analysis(
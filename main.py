@@ -3,9 +3,25 @@ GUI Application Entry Point
 Zebra Label Printer - PyQt6 GUI
 """
 
+import time
+
+_PROCESS_START = time.perf_counter()
+
 import sys
 import io
+import json
+import logging
 import traceback
+from datetime import datetime
+from pathlib import Path
+
+
+def _get_log_dir():
+    """로그 디렉토리 (배포 빌드는 AppData)"""
+    import os
+    if getattr(sys, 'frozen', False):
+        return Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WF_Label_Printer" / "logs"
+    return Path("logs")
 
 
 def _setup_exception_hook():
@@ -16,12 +32,7 @@ def _setup_exception_hook():
 
         # 파일에도 저장
         try:
-            from pathlib import Path
-            import os
-            if getattr(sys, 'frozen', False):
-                log_dir = Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WF_Label_Printer" / "logs"
-            else:
-                log_dir = Path("logs")
+            log_dir = _get_log_dir()
             log_dir.mkdir(parents=True, exist_ok=True)
             with open(log_dir / "crash_log.txt", "w", encoding="utf-8") as f:
                 f.write(error_msg)
@@ -35,9 +46,84 @@ def _setup_exception_hook():
 
 _setup_exception_hook()
 
+
+def _profile_startup_path():
+    """--profile-startup[=경로] 인자 (없으면 None)"""
+    for arg in sys.argv[1:]:
+        if arg == "--profile-startup":
+            return str(_get_log_dir() / "startup_profile.json")
+        if arg.startswith("--profile-startup="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+# 시작 프로파일링: 이후의 모든 import 시간을 모듈별로 기록
+_PROFILE_PATH = _profile_startup_path()
+_import_profiler = None
+if _PROFILE_PATH:
+    from src.utils.import_profiler import ImportProfiler
+    _import_profiler = ImportProfiler()
+    _import_profiler.install()
+
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QObject, QEvent
 from src.gui import MainWindow
+from src.utils.event_log import get_event_log
+from src.utils.logger import setup_logging
+from src.utils.startup_timer import StartupTimer
+
+logger = logging.getLogger(__name__)
+
+startup_timer = StartupTimer(start=_PROCESS_START)
+startup_timer.mark("imports")
+
+
+class _FirstPaintWatcher(QObject):
+    """첫 화면 표시(Paint)와 첫 입력 가능 시점 측정"""
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not startup_timer.has("first_paint"):
+            startup_timer.mark("first_paint")
+            QApplication.instance().removeEventFilter(self)
+            # 첫 Paint 이후 이벤트 루프가 처음 한가해지는 시점 = 입력 가능
+            QTimer.singleShot(0, _on_first_interactive)
+        return False
+
+
+def _on_first_interactive():
+    """시작 시간 리포트 출력 및 저장"""
+    startup_timer.mark("first_interactive")
+    print(startup_timer.report())
+    try:
+        from src import __version__
+        startup_timer.save(str(_get_log_dir() / "startup_times.jsonl"), version=__version__)
+    except Exception as e:
+        logger.warning("시작 시간 기록 실패: %s", e)
+
+    if _import_profiler is not None:
+        _save_startup_profile()
+
+
+def _save_startup_profile():
+    """--profile-startup: 단계별 시간과 모듈별 import 시간을 JSON으로 저장"""
+    _import_profiler.uninstall()
+    print(_import_profiler.report(15))
+
+    from src import __version__
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'version': __version__,
+        'phases_ms': {name: round(ms, 1) for name, ms in startup_timer.phases.items()},
+        'imports_total_ms': _import_profiler.total_ms,
+        'imports': _import_profiler.modules,
+    }
+    try:
+        path = Path(_PROFILE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"시작 프로파일 저장: {path}")
+    except Exception as e:
+        logger.warning("시작 프로파일 저장 실패: %s", e)
 
 
 def main():
@@ -50,6 +136,10 @@ def main():
         except (AttributeError, io.UnsupportedOperation):
             pass
 
+    # 로깅 (파일 쓰기/로테이션은 백그라운드 스레드)
+    setup_logging(log_file=str(_get_log_dir() / "app.log"))
+    get_event_log().open(str(_get_log_dir() / "events.jsonl"))
+
     # High DPI 지원
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -59,11 +149,16 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Zebra Label Printer")
     app.setOrganizationName("WF")
+    startup_timer.mark("qapplication")
+
+    paint_watcher = _FirstPaintWatcher()
+    app.installEventFilter(paint_watcher)
 
     try:
         # 메인 윈도우 생성 및 표시
         window = MainWindow()
         window.show()
+        startup_timer.mark("window_created")
 
         # 디버그 모드: 1초 후 geometry 정보 출력
         if "--debug-geometry" in sys.argv:
@@ -79,13 +174,8 @@ def main():
 
         # 오류를 파일로 저장
         try:
-            import os
-            from pathlib import Path
             # AppData에 오류 로그 저장
-            if getattr(sys, 'frozen', False):
-                log_dir = Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WF_Label_Printer" / "logs"
-            else:
-                log_dir = Path("logs")
+            log_dir = _get_log_dir()
             log_dir.mkdir(parents=True, exist_ok=True)
 
             with open(log_dir / "crash_log.txt", "w", encoding="utf-8") as f:
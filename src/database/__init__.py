@@ -1,5 +1,13 @@
 """데이터베이스 모듈"""
 
 from .db_manager import DBManager
+from .history_reader import HistoryReader
+from .archive import ArchiveCatalog, HistoryArchiver
+from .remote import RemoteDBManager, open_database
+from .journal import JournaledDBManager, PrintJournal
+from .records import HistoryRecord
 
-__all__ = ["DBManager"]
+__all__ = [
+    "DBManager", "HistoryReader", "ArchiveCatalog", "HistoryArchiver",
+    "RemoteDBManager", "open_database", "JournaledDBManager", "PrintJournal", "HistoryRecord",
+]
@@ -0,0 +1,246 @@
+"""
+출력 이력 연도별 아카이브
+
+오래된 print_history를 DB 파일 옆의 archive_YYYY.db(연도별)로 옮겨
+운영 DB(label_printer.db)의 조회/백업/생산순서 계산 비용을 일정하게 유지합니다.
+
+- HistoryArchiver: 기준일 이전 이력을 연도별 아카이브로 이동
+  1) 아카이브에 복사 후 커밋 → 2) 운영 DB에서 LOT별 최대 생산순서 기록 + 삭제 후 커밋
+  (2단계 중 중단되어도 행이 사라지지 않고, 다시 실행하면 이어서 처리)
+- ArchiveCatalog: 검색 날짜 범위에 필요한 아카이브만 한 번에 하나씩 ATTACH
+  (운영 테이블로 결과가 다 채워지면 아카이브는 열지 않음)
+
+옮긴 LOT의 최대 생산순서는 archived_lot_sequence 테이블에 남기므로
+get_max_sequence_for_lot은 아카이브를 열지 않고도 이어지는 순서를 계산합니다.
+"""
+
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import DatabaseError
+from .models import CREATE_ARCHIVE_TABLES
+
+ARCHIVE_FILE_PATTERN = re.compile(r"^archive_(\d{4})\.db$")
+
+# app_config 키
+ARCHIVE_CUTOFF_KEY = "archive_cutoff"        # 이 날짜 이전 이력은 아카이브에 있음 (YYYY-MM-DD)
+ARCHIVE_KEEP_DAYS_KEY = "archive_keep_days"  # 운영 DB에 남길 기간 (일)
+
+ATTACH_ALIAS = "archive"
+
+
+def split_serial(serial_number: str) -> Optional[Tuple[str, int]]:
+    """시리얼 번호 → (LOT 번호, 생산순서), 형식이 맞지 않으면 None
+
+    20자리 고정, 마지막 4자리가 생산순서 (P10DL0S0H3A00C100011 → ("P10DL0S0H3A00C10", 11))
+    """
+    if len(serial_number) < 20:
+        return None
+    try:
+        sequence = int(serial_number[-4:])
+    except ValueError:
+        return None
+    return serial_number.replace('-', '')[:-4], sequence
+
+
+class ArchiveCatalog:
+    """DB 파일 옆의 archive_YYYY.db 목록과 ATTACH 관리"""
+
+    def __init__(self, archive_dir: str):
+        """
+        Args:
+            archive_dir: 아카이브 폴더 (운영 DB와 같은 폴더)
+        """
+        self.archive_dir = Path(archive_dir)
+
+    def path(self, year: int) -> Path:
+        """연도별 아카이브 파일 경로"""
+        return self.archive_dir / f"archive_{year}.db"
+
+    def years(self) -> List[int]:
+        """존재하는 아카이브 연도 (최신 연도부터)"""
+        if not self.archive_dir.is_dir():
+            return []
+        years = []
+        for path in self.archive_dir.iterdir():
+            match = ARCHIVE_FILE_PATTERN.match(path.name)
+            if match:
+                years.append(int(match.group(1)))
+        return sorted(years, reverse=True)
+
+    def years_for_range(
+        self,
+        conn: sqlite3.Connection,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[int]:
+        """검색 날짜 범위(YYYY-MM-DD)와 겹치는 아카이브 연도 (최신 연도부터)"""
+        cutoff = _get_cutoff(conn)
+        if cutoff is None or (date_from and date_from >= cutoff):
+            return []
+        return [
+            year for year in self.years()
+            if (not date_from or year >= int(date_from[:4]))
+            and (not date_to or year <= int(date_to[:4]))
+        ]
+
+    def iter_tables(
+        self,
+        conn: sqlite3.Connection,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Iterator[str]:
+        """조회할 테이블 이름 (운영 테이블 → 필요한 아카이브 최신 연도부터)
+
+        아카이브는 다음 테이블을 요청할 때 ATTACH하고 그다음 요청(또는 close) 때 DETACH하므로
+        중간에 반복을 멈추면 나머지 아카이브는 열지 않습니다.
+        같은 연결에서 다른 조회를 시작하기 전에 close()해야 합니다 (contextlib.closing).
+        """
+        yield "print_history"
+        for year in self.years_for_range(conn, date_from, date_to):
+            conn.execute(f"ATTACH DATABASE ? AS {ATTACH_ALIAS}", (str(self.path(year)),))
+            try:
+                yield f"{ATTACH_ALIAS}.print_history"
+            finally:
+                conn.execute(f"DETACH DATABASE {ATTACH_ALIAS}")
+
+
+class HistoryArchiver:
+    """기준일 이전 출력 이력을 연도별 아카이브로 이동"""
+
+    DEFAULT_KEEP_DAYS = 365
+
+    def __init__(self, db):
+        """
+        Args:
+            db: DBManager 인스턴스
+        """
+        self.db = db
+        self.catalog = db.archives
+
+    def archive_expired(self, vacuum: bool = False) -> Dict[int, int]:
+        """설정(archive_keep_days)보다 오래된 이력 이동"""
+        keep_days = int(self.db.get_config(ARCHIVE_KEEP_DAYS_KEY) or self.DEFAULT_KEEP_DAYS)
+        return self.archive_older_than(keep_days, vacuum=vacuum)
+
+    def archive_older_than(self, days: int, vacuum: bool = False) -> Dict[int, int]:
+        """오늘 기준 days일보다 오래된 이력 이동"""
+        if days < 0:
+            raise ValueError(f"보관 기간은 0일 이상이어야 합니다: {days}")
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        return self.archive(cutoff, vacuum=vacuum)
+
+    def archive(self, before: str, vacuum: bool = False) -> Dict[int, int]:
+        """before(YYYY-MM-DD, 제외) 이전 이력을 archive_YYYY.db로 이동
+
+        Args:
+            before: 기준 날짜 (이 날짜 00:00 이전 출력분을 이동)
+            vacuum: 이동 후 운영 DB 파일 크기 줄이기 (VACUUM)
+
+        Returns:
+            {연도: 옮긴 행 수}
+
+        Raises:
+            ValueError: 날짜 형식 오류
+            DatabaseError: 이동 실패 (이미 커밋된 연도는 유지, 다시 실행하면 이어서 처리)
+        """
+        datetime.strptime(before, "%Y-%m-%d")
+        self.db.connect()
+        conn = self.db.conn
+
+        years = [
+            int(row[0]) for row in conn.execute(
+                "SELECT DISTINCT substr(print_datetime, 1, 4) FROM print_history"
+                " WHERE print_datetime < ?",
+                (before,),
+            )
+        ]
+
+        moved: Dict[int, int] = {}
+        for year in sorted(years):
+            start = f"{year:04d}-01-01"
+            end = min(before, f"{year + 1:04d}-01-01")
+            moved[year] = self._move_year(conn, year, start, end)
+
+        # 검색이 아카이브를 찾도록 기준일 기록 (앞당기지는 않음)
+        cutoff = _get_cutoff(conn)
+        if cutoff is None or before > cutoff:
+            self.db.set_config(ARCHIVE_CUTOFF_KEY, before, "이 날짜 이전 이력은 연도별 아카이브에 있음")
+
+        if vacuum and any(moved.values()):
+            conn.execute("VACUUM")
+        return moved
+
+    def _move_year(self, conn: sqlite3.Connection, year: int, start: str, end: str) -> int:
+        """[start, end) 구간(한 해 안)을 archive_YYYY.db로 이동"""
+        path = self.catalog.path(year)
+        main_columns = [(row[1], row[2]) for row in conn.execute("PRAGMA main.table_info(print_history)")]
+        archive = sqlite3.connect(str(path))
+        try:
+            archive.executescript(CREATE_ARCHIVE_TABLES)
+            # 이전 버전에서 만든 아카이브에 운영 DB 마이그레이션으로 추가된 컬럼 보충
+            existing = {row[1] for row in archive.execute("PRAGMA table_info(print_history)")}
+            for column, column_type in main_columns:
+                if column not in existing:
+                    archive.execute(f"ALTER TABLE print_history ADD COLUMN {column} {column_type}")
+            archive.commit()
+        finally:
+            archive.close()
+
+        columns = ", ".join(column for column, _ in main_columns)
+        conn.execute(f"ATTACH DATABASE ? AS {ATTACH_ALIAS}", (str(path),))
+        try:
+            # 1) 복사 (이전에 중단된 경우 이미 있는 행은 건너뜀)
+            conn.execute(
+                f"INSERT OR IGNORE INTO {ATTACH_ALIAS}.print_history ({columns})"
+                f" SELECT {columns} FROM main.print_history"
+                " WHERE print_datetime >= ? AND print_datetime < ?",
+                (start, end),
+            )
+            conn.commit()
+
+            # 2) LOT별 최대 생산순서 기록 + 아카이브에 들어간 행만 삭제
+            floors: Dict[str, int] = {}
+            for (serial,) in conn.execute(
+                "SELECT serial_number FROM main.print_history"
+                " WHERE print_datetime >= ? AND print_datetime < ?",
+                (start, end),
+            ):
+                parsed = split_serial(serial)
+                if parsed and parsed[1] > floors.get(parsed[0], 0):
+                    floors[parsed[0]] = parsed[1]
+
+            conn.executemany(
+                "INSERT INTO archived_lot_sequence (lot_number, max_sequence) VALUES (?, ?)"
+                " ON CONFLICT(lot_number) DO UPDATE"
+                " SET max_sequence = MAX(max_sequence, excluded.max_sequence)",
+                floors.items(),
+            )
+            cursor = conn.execute(
+                "DELETE FROM main.print_history"
+                " WHERE print_datetime >= ? AND print_datetime < ?"
+                f" AND EXISTS (SELECT 1 FROM {ATTACH_ALIAS}.print_history a"
+                "   WHERE a.serial_number = print_history.serial_number AND a.id = print_history.id)",
+                (start, end),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"{year}년 이력 아카이브 오류: {e}")
+        finally:
+            conn.execute(f"DETACH DATABASE {ATTACH_ALIAS}")
+
+
+def _get_cutoff(conn: sqlite3.Connection) -> Optional[str]:
+    try:
+        row = conn.execute(
+            "SELECT value FROM app_config WHERE key = ?", (ARCHIVE_CUTOFF_KEY,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None  # 초기화 전 DB
+    return row[0] if row and row[0] else None
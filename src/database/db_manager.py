@@ -2,18 +2,18 @@
 데이터베이스 관리자
 """
 
+import re
 import sqlite3
-import shutil
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from contextlib import closing
+from typing import Optional, List, Dict, Any, Sequence, Set, Tuple
 
-from .models import (
-    CREATE_TABLES,
-    CREATE_INDEXES,
-    CREATE_TRIGGERS,
-    INSERT_INITIAL_DATA,
-)
+from .archive import ArchiveCatalog, split_serial
+from .migrations import INLINE_INDEX_ROWS, IndexBuilder, deferred_indexes, migrate, pending_indexes
+from .models import CREATE_INDEXES
+from .records import fetch_records
 from .exceptions import (
     DatabaseError,
     DuplicateSerialNumberError,
@@ -22,6 +22,142 @@ from .exceptions import (
 )
 
 
+# 연결별 준비된 문장 캐시 크기 (이력 필터 조합 × 운영/아카이브 테이블 + 단건 조회들)
+STATEMENT_CACHE_SIZE = 256
+
+
+def build_history_query(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    serial_number: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    limit: Optional[int] = 100,
+    offset: int = 0,
+    lot_number: Optional[str] = None,
+    table: str = "print_history",
+    select: str = "*",
+    order: bool = True,
+) -> Tuple[str, list]:
+    """
+    출력 이력 조회 SQL 생성
+
+    날짜 조건은 print_datetime(ISO 문자열)을 직접 비교하여
+    idx_print_history_date 인덱스를 사용할 수 있도록 합니다.
+    (DATE(print_datetime) <= date_to  ==  print_datetime < date_to 다음 날)
+    LOT 조건은 시리얼 번호 접두사 GLOB이므로 UNIQUE(serial_number) 인덱스 범위 검색이 됩니다.
+    limit이 None이면 전체를 조회합니다 (내보내기용).
+    table은 아카이브 조회 시 "archive.print_history"처럼 지정합니다.
+    select는 조회 컬럼("COUNT(*)" 등), order=False면 정렬을 생략합니다 (건수 조회).
+
+    Returns:
+        (SQL, 파라미터 리스트)
+    """
+    params: list = []
+
+    if date_from:
+        params.append(date_from)
+
+    if date_to:
+        next_day = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+        params.append(next_day.strftime("%Y-%m-%d"))
+
+    if serial_number:
+        params.append(f"%{serial_number}%")
+
+    if mac_address:
+        params.append(f"%{mac_address}%")
+
+    if lot_number:
+        params.append(re.sub(r'([*?\[])', r'[\1]', lot_number) + "*")
+
+    if limit is not None:
+        params.extend([limit, offset])
+
+    query = history_sql(
+        table, select, bool(date_from), bool(date_to), bool(serial_number), bool(mac_address),
+        bool(lot_number), limit is not None, order,
+    )
+    return query, params
+
+
+@lru_cache(maxsize=256)
+def history_sql(
+    table: str,
+    select: str,
+    has_date_from: bool,
+    has_date_to: bool,
+    has_serial: bool,
+    has_mac: bool,
+    has_lot: bool,
+    limited: bool,
+    ordered: bool = True,
+) -> str:
+    """
+    필터 조합별 이력 조회 SQL (조합마다 항상 같은 문자열)
+
+    값은 모두 파라미터로 넘기므로 같은 조합의 SQL 텍스트가 같고,
+    sqlite3 연결의 준비된 문장 캐시(cached_statements)에서 다시 컴파일 없이 재사용됩니다.
+    """
+    query = f"SELECT {select} FROM {table} WHERE 1=1"
+    if has_date_from:
+        query += " AND print_datetime >= ?"
+    if has_date_to:
+        query += " AND print_datetime < ?"
+    if has_serial:
+        query += " AND serial_number LIKE ?"
+    if has_mac:
+        query += " AND mac_address LIKE ?"
+    if has_lot:
+        query += " AND serial_number GLOB ?"
+    if ordered:
+        query += " ORDER BY print_datetime DESC"
+    if limited:
+        query += " LIMIT ? OFFSET ?"
+    return query
+
+
+def fetch_history(
+    conn: sqlite3.Connection,
+    archives: ArchiveCatalog,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    serial_number: Optional[str] = None,
+    mac_address: Optional[str] = None,
+    limit: Optional[int] = 100,
+    offset: int = 0,
+    lot_number: Optional[str] = None,
+    records: bool = False,
+) -> list:
+    """
+    운영 테이블 → 아카이브(최신 연도부터) 순으로 이력 조회
+
+    아카이브 행은 항상 운영 테이블 행보다 오래되었으므로
+    앞 테이블에서 limit + offset 행이 채워지면 나머지 아카이브는 ATTACH하지 않습니다.
+    records=True면 dict 대신 HistoryRecord(records.py)를 반환합니다 (GUI용).
+    """
+    wanted = None if limit is None else limit + offset
+    rows: list = []
+
+    with closing(archives.iter_tables(conn, date_from, date_to)) as tables:
+        for table in tables:
+            query, params = build_history_query(
+                date_from, date_to, serial_number, mac_address,
+                limit=None if wanted is None else wanted - len(rows),
+                lot_number=lot_number, table=table,
+            )
+            with closing(conn.cursor()) as cursor:
+                if records:
+                    cursor.row_factory = None
+                    cursor.execute(query, params)
+                    rows.extend(fetch_records(cursor))
+                else:
+                    rows.extend(dict(row) for row in cursor.execute(query, params).fetchall())
+            if wanted is not None and len(rows) >= wanted:
+                break
+
+    return rows[offset:wanted]
+
+
 class DBManager:
     """SQLite 데이터베이스 관리자"""
 
@@ -30,9 +166,11 @@ class DBManager:
         Args:
             db_path: SQLite DB 파일 경로
         """
-        # 항상 절대 경로로 변환
-        self.db_path = str(Path(db_path).resolve())
+        # 항상 절대 경로로 변환 (인메모리 DB는 그대로)
+        self.db_path = db_path if db_path == ":memory:" else str(Path(db_path).resolve())
         self.conn: Optional[sqlite3.Connection] = None
+        self.archives = ArchiveCatalog(str(Path(self.db_path).parent))
+        self.index_builder: Optional[IndexBuilder] = None  # 지연 인덱스 백그라운드 생성
 
     def connect(self) -> None:
         """데이터베이스 연결"""
@@ -47,28 +185,43 @@ class DBManager:
         if not db_dir.exists():
             db_dir.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
         self.conn.row_factory = sqlite3.Row  # dict 형태로 결과 반환
 
-    def initialize(self) -> None:
-        """데이터베이스 초기화 (테이블, 인덱스, 트리거, 초기 데이터)"""
-        self.connect()
+        # WAL: 검색용 읽기 연결(HistoryReader)이 쓰기를 막지 않도록
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
 
-        cursor = self.conn.cursor()
-
-        # 테이블 생성
-        cursor.executescript(CREATE_TABLES)
+    def initialize(self, index_progress=None) -> List[Dict[str, Any]]:
+        """
+        데이터베이스 초기화 (적용되지 않은 스키마 마이그레이션만 실행)
 
-        # 인덱스 생성
-        cursor.executescript(CREATE_INDEXES)
+        오래 걸리는 지연 인덱스는 이력이 INLINE_INDEX_ROWS행 이하이면 바로 만들고,
+        그보다 많으면 index_builder 스레드에서 만듭니다.
 
-        # 트리거 생성
-        cursor.executescript(CREATE_TRIGGERS)
+        Args:
+            index_progress: 백그라운드 인덱스 진행 알림 콜백 (IndexBuilder 참고)
 
-        # 초기 데이터 삽입
-        cursor.executescript(INSERT_INITIAL_DATA)
+        Returns:
+            이번에 적용한 마이그레이션 단계 [{'version', 'name', 'duration_ms'}, ...]
 
-        self.conn.commit()
+        Raises:
+            MigrationError: 마이그레이션 실패
+        """
+        self.connect()
+        applied = migrate(self.conn)
+
+        pending = pending_indexes(self.conn)
+        if pending:
+            rows = self.conn.execute("SELECT MAX(rowid) FROM print_history").fetchone()[0] or 0
+            builder = IndexBuilder(self.db_path, pending, index_progress)
+            if rows <= INLINE_INDEX_ROWS or self.db_path == ":memory:":
+                builder.run(self.conn)
+            else:
+                self.index_builder = builder.start()
+        return applied
 
     def save_print_history(
         self,
@@ -78,6 +231,7 @@ class DBManager:
         status: str,
         error_message: Optional[str] = None,
         prn_template: str = "PSA_LABEL_ZPL_with_mac_address.prn",
+        lease_id: Optional[int] = None,
     ) -> int:
         """
         출력 이력 저장
@@ -89,6 +243,7 @@ class DBManager:
             status: 상태 ('success' or 'failed')
             error_message: 에러 메시지 (실패 시)
             prn_template: 사용한 PRN 템플릿 파일명
+            lease_id: 생산순서를 임대받은 블록 ID (lease_sequences)
 
         Returns:
             삽입된 레코드 ID
@@ -104,8 +259,8 @@ class DBManager:
                 """
                 INSERT INTO print_history (
                     serial_number, mac_address, print_date, print_datetime,
-                    status, error_message, prn_template
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    status, error_message, prn_template, lease_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     serial_number,
@@ -115,6 +270,7 @@ class DBManager:
                     status,
                     error_message,
                     prn_template,
+                    lease_id,
                 ),
             )
             self.conn.commit()
@@ -125,6 +281,366 @@ class DBManager:
                 raise DuplicateSerialNumberError(serial_number)
             raise DatabaseError(f"데이터베이스 오류: {e}")
 
+    # IN (...) 조회 한 번에 넣는 파라미터 수 (SQLite 변수 개수 제한 이하)
+    _IN_CHUNK = 900
+
+    def sync_print_history(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        스테이션 저널의 인쇄 기록 반영 (serial_number 기준 멱등 upsert)
+
+        같은 기록을 여러 번 보내도(응답 유실 후 재전송) 한 번만 저장됩니다.
+        같은 시리얼이 다른 MAC/시각으로 이미 있으면 덮어쓰지 않고 충돌로 보고합니다.
+
+        Args:
+            rows: serial_number, mac_address, print_date, print_datetime, status,
+                  error_message, prn_template, lease_id, production_sequence
+
+        Returns:
+            행마다 {'serial_number', 'state': 'inserted' | 'duplicate' | 'conflict', 'id',
+                    'existing': 충돌 시 기존 {'mac_address', 'print_datetime'}}
+        """
+        self.connect()
+        results: List[Dict[str, Any]] = []
+        max_sequence = None
+
+        try:
+            for row in rows:
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO print_history (
+                        serial_number, mac_address, print_date, print_datetime,
+                        status, error_message, prn_template, lease_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(serial_number) DO NOTHING
+                    """,
+                    (
+                        row['serial_number'], row['mac_address'], row['print_date'],
+                        row['print_datetime'], row.get('status', 'success'), row.get('error_message'),
+                        row.get('prn_template', ''), row.get('lease_id'),
+                    ),
+                )
+                if cursor.rowcount:
+                    results.append({'serial_number': row['serial_number'], 'state': 'inserted',
+                                    'id': cursor.lastrowid})
+                    sequence = row.get('production_sequence')
+                    if sequence and (max_sequence is None or int(sequence) > int(max_sequence)):
+                        max_sequence = sequence
+                    continue
+
+                existing = self.conn.execute(
+                    "SELECT id, mac_address, print_datetime FROM print_history WHERE serial_number = ?",
+                    (row['serial_number'],),
+                ).fetchone()
+                same = (existing['mac_address'], existing['print_datetime']) == (
+                    row['mac_address'], row['print_datetime']
+                )
+                result = {'serial_number': row['serial_number'],
+                          'state': 'duplicate' if same else 'conflict', 'id': existing['id']}
+                if not same:
+                    result['existing'] = {'mac_address': existing['mac_address'],
+                                          'print_datetime': existing['print_datetime']}
+                results.append(result)
+
+            if max_sequence:
+                # 스테이션마다 임대 블록이 달라 도착 순서가 번호 순서가 아니므로 큰 값만 반영
+                self.conn.execute(
+                    """
+                    UPDATE lot_config SET production_sequence = ?
+                    WHERE id = 1 AND COALESCE(CAST(production_sequence AS INTEGER), 0) < ?
+                    """,
+                    (max_sequence, int(max_sequence)),
+                )
+            self.conn.commit()
+            return results
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"저널 동기화 오류: {e}")
+
+    def commit_print(
+        self,
+        serial_number: str,
+        mac_address: str,
+        print_date: str,
+        prn_template: str,
+        production_sequence: Optional[str] = None,
+        lease_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        인쇄 성공 결과 저장 + 현재 생산순서 갱신 후 저장된 레코드 반환
+
+        공유 DB 서버를 쓸 때 왕복 한 번으로 끝나도록 묶은 인쇄 완료 처리입니다.
+        lease_id는 임대 블록에서 받은 번호일 때 기록합니다 (감사용).
+
+        Raises:
+            DuplicateSerialNumberError: 중복된 시리얼 번호
+        """
+        record_id = self.save_print_history(
+            serial_number=serial_number,
+            mac_address=mac_address,
+            print_date=print_date,
+            status='success',
+            error_message=None,
+            prn_template=prn_template,
+            lease_id=lease_id,
+        )
+        if production_sequence:
+            self.update_lot_config(production_sequence=production_sequence)
+        return self.get_print_record(record_id)
+
+    def reserve_sequence(self, lot_number: str, count: int = 1) -> int:
+        """
+        LOT의 다음 생산순서 count개를 예약하고 첫 번호 반환
+
+        인쇄된 최대 순서(아카이브 포함)와 이미 예약된 순서 중 큰 값 다음부터 배정하므로
+        같은 DB(또는 공유 DB 서버)를 쓰는 스테이션끼리 번호가 겹치지 않습니다.
+
+        Args:
+            lot_number: LOT 번호
+            count: 예약할 개수
+
+        Returns:
+            예약된 첫 생산순서 (예약 범위: 첫 번호 ~ 첫 번호 + count - 1)
+        """
+        if count < 1:
+            raise ValueError(f"예약 개수는 1 이상이어야 합니다: {count}")
+        self.connect()
+
+        try:
+            # 쓰기 잠금을 먼저 잡아 조회~갱신 사이에 다른 연결이 끼어들지 않도록
+            self.conn.execute("BEGIN IMMEDIATE")
+            first = self._advance_sequence_counter(lot_number, count)
+            self.conn.commit()
+            return first
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"생산순서 예약 오류: {e}")
+
+    def _advance_sequence_counter(self, lot_number: str, count: int) -> int:
+        """카운터를 count만큼 올리고 첫 번호 반환 (트랜잭션 안에서 호출)"""
+        printed = self.get_max_sequence_for_lot(lot_number) or 0
+        row = self.conn.execute(
+            "SELECT last_sequence FROM lot_sequence_counter WHERE lot_number = ?",
+            (lot_number,),
+        ).fetchone()
+        first = max(printed, row[0] if row else 0) + 1
+        self.conn.execute(
+            """
+            INSERT INTO lot_sequence_counter (lot_number, last_sequence) VALUES (?, ?)
+            ON CONFLICT(lot_number) DO UPDATE
+            SET last_sequence = excluded.last_sequence, updated_at = CURRENT_TIMESTAMP
+            """,
+            (lot_number, first + count - 1),
+        )
+        return first
+
+    def lease_sequences(self, lot_number: str, station: str, count: int) -> Dict[str, int]:
+        """
+        생산순서 블록 임대 (스테이션이 로컬에서 나눠 쓸 번호 묶음)
+
+        reserve_sequence와 같은 카운터에서 배정하고 sequence_lease에 소유 스테이션을 기록합니다.
+
+        Args:
+            lot_number: LOT 번호
+            station: 스테이션 이름
+            count: 블록 크기
+
+        Returns:
+            {'lease_id': 임대 ID, 'first': 첫 번호, 'last': 마지막 번호}
+        """
+        if count < 1:
+            raise ValueError(f"임대 개수는 1 이상이어야 합니다: {count}")
+        self.connect()
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            first = self._advance_sequence_counter(lot_number, count)
+            cursor = self.conn.execute(
+                "INSERT INTO sequence_lease (lot_number, station, first_sequence, last_sequence)"
+                " VALUES (?, ?, ?, ?)",
+                (lot_number, station, first, first + count - 1),
+            )
+            self.conn.commit()
+            return {'lease_id': cursor.lastrowid, 'first': first, 'last': first + count - 1}
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"생산순서 임대 오류: {e}")
+
+    def return_lease(self, lease_id: int, unused: Sequence[int]) -> Dict[str, Any]:
+        """
+        임대 블록 반납 (스테이션 종료/LOT 변경 시)
+
+        블록 끝의 연속된 미사용 번호는 그 뒤로 다른 예약이 없으면 카운터로 되돌리고,
+        나머지 미사용 번호는 sequence_gap에 기록합니다.
+
+        Args:
+            lease_id: 임대 ID
+            unused: 사용하지 않은 번호 목록
+
+        Returns:
+            {'returned': 되돌린 개수, 'gaps': [비게 된 번호, ...]}
+        """
+        self.connect()
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            lease = self.conn.execute(
+                "SELECT lot_number, first_sequence, last_sequence, returned_at"
+                " FROM sequence_lease WHERE id = ?",
+                (lease_id,),
+            ).fetchone()
+            if lease is None or lease['returned_at'] is not None:
+                self.conn.rollback()
+                return {'returned': 0, 'gaps': []}
+
+            lot_number, first, last = lease['lot_number'], lease['first_sequence'], lease['last_sequence']
+            gaps = sorted({seq for seq in unused if first <= seq <= last})
+
+            # 블록 끝부터 연속된 미사용 번호 → 카운터가 아직 블록 끝이면 되돌림
+            tail_start = last + 1
+            while gaps and gaps[-1] == tail_start - 1:
+                tail_start = gaps.pop()
+            returned = last + 1 - tail_start
+            if returned:
+                cursor = self.conn.execute(
+                    "UPDATE lot_sequence_counter SET last_sequence = ?, updated_at = CURRENT_TIMESTAMP"
+                    " WHERE lot_number = ? AND last_sequence = ?",
+                    (tail_start - 1, lot_number, last),
+                )
+                if cursor.rowcount == 0:
+                    gaps.extend(range(tail_start, last + 1))
+                    returned = 0
+
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO sequence_gap (lot_number, sequence, lease_id) VALUES (?, ?, ?)",
+                [(lot_number, seq, lease_id) for seq in gaps],
+            )
+            self.conn.execute(
+                "UPDATE sequence_lease SET returned_at = CURRENT_TIMESTAMP,"
+                " returned_count = ?, gap_count = ? WHERE id = ?",
+                (returned, len(gaps), lease_id),
+            )
+            self.conn.commit()
+            return {'returned': returned, 'gaps': gaps}
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"생산순서 반납 오류: {e}")
+
+    def release_sequence(self, lot_number: str, first: int, count: int = 1) -> bool:
+        """
+        사용하지 않은 예약 반환 (인쇄 실패 시)
+
+        그 뒤로 다른 예약이 없을 때만 되돌리므로 다른 스테이션의 번호와 겹치지 않습니다.
+
+        Returns:
+            반환 여부 (False면 번호가 비게 됨)
+        """
+        self.connect()
+        cursor = self.conn.execute(
+            """
+            UPDATE lot_sequence_counter
+            SET last_sequence = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE lot_number = ? AND last_sequence = ?
+            """,
+            (first - 1, lot_number, first + count - 1),
+        )
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def find_existing_serials(self, serial_numbers: Sequence[str]) -> Set[str]:
+        """
+        이미 저장된 시리얼 번호 조회 (UNIQUE 인덱스 사용)
+
+        Args:
+            serial_numbers: 확인할 시리얼 번호 목록
+
+        Returns:
+            DB에 있는 시리얼 번호 집합
+        """
+        self.connect()
+
+        existing: Set[str] = set()
+        for start in range(0, len(serial_numbers), self._IN_CHUNK):
+            chunk = serial_numbers[start:start + self._IN_CHUNK]
+            cursor = self.conn.execute(
+                "SELECT serial_number FROM print_history WHERE serial_number IN "
+                f"({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            existing.update(row[0] for row in cursor)
+        return existing
+
+    def insert_print_history_many(self, rows: Sequence[tuple]) -> List[str]:
+        """
+        출력 이력 일괄 저장 (executemany, 트랜잭션 한 번)
+
+        중복 시리얼은 예외 없이 건너뛰고 목록으로 돌려줍니다.
+
+        Args:
+            rows: (serial_number, mac_address, print_date, print_datetime,
+                   status, error_message, prn_template) 튜플 목록
+
+        Returns:
+            저장하지 않은 중복 시리얼 번호 목록 (DB에 이미 있거나 rows 안에서 반복된 것)
+        """
+        self.connect()
+
+        existing = self.find_existing_serials([row[0] for row in rows])
+        duplicates: List[str] = []
+        new_rows = []
+        for row in rows:
+            if row[0] in existing:
+                duplicates.append(row[0])
+            else:
+                existing.add(row[0])
+                new_rows.append(row)
+
+        try:
+            self.conn.executemany(
+                """
+                INSERT INTO print_history (
+                    serial_number, mac_address, print_date, print_datetime,
+                    status, error_message, prn_template
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                new_rows,
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"일괄 저장 오류: {e}")
+
+        return duplicates
+
+    def drop_secondary_indexes(self) -> List[str]:
+        """
+        print_history 보조 인덱스 삭제 (대량 입력 전, rebuild_indexes()로 복구)
+
+        UNIQUE(serial_number) 자동 인덱스는 중복 검사에 필요하므로 남깁니다.
+
+        Returns:
+            삭제한 인덱스 이름 목록
+        """
+        self.connect()
+
+        names = [
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'print_history' AND sql IS NOT NULL"
+            )
+        ]
+        for name in names:
+            self.conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+        self.conn.commit()
+        return names
+
+    def rebuild_indexes(self) -> None:
+        """삭제된 인덱스 재생성 (CREATE INDEX IF NOT EXISTS, 지연 인덱스 포함)"""
+        self.connect()
+        self.conn.executescript(CREATE_INDEXES)
+        for _, sql in deferred_indexes():
+            self.conn.execute(sql)
+        self.conn.commit()
+
     def get_print_history(
         self,
         limit: int = 100,
@@ -135,7 +651,7 @@ class DBManager:
         mac_address: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
-        출력 이력 조회
+        출력 이력 조회 (날짜 범위가 아카이브 기간에 걸치면 해당 연도 아카이브 포함)
 
         Args:
             limit: 조회 개수
@@ -150,37 +666,58 @@ class DBManager:
         """
         self.connect()
 
-        query = "SELECT * FROM print_history WHERE 1=1"
-        params = []
+        return fetch_history(
+            self.conn, self.archives, date_from, date_to, serial_number, mac_address, limit, offset
+        )
 
-        if date_from:
-            query += " AND DATE(print_datetime) >= ?"
-            params.append(date_from)
+    def search_history(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        lot_number: Optional[str] = None,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        출력 이력 검색 (get_print_history + LOT 조건, 공유 DB 서버 API)
+
+        Args:
+            lot_number: LOT 번호 (시리얼 접두사)
+        """
+        self.connect()
 
-        if date_to:
-            query += " AND DATE(print_datetime) <= ?"
-            params.append(date_to)
+        return fetch_history(
+            self.conn, self.archives, date_from, date_to, serial_number, mac_address,
+            limit, offset, lot_number,
+        )
 
-        if serial_number:
-            query += " AND serial_number LIKE ?"
-            params.append(f"%{serial_number}%")
+    def get_print_record(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        출력 이력 단건 조회
 
-        if mac_address:
-            query += " AND mac_address LIKE ?"
-            params.append(f"%{mac_address}%")
+        Args:
+            record_id: 레코드 ID
 
-        query += " ORDER BY print_datetime DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        Returns:
+            이력 레코드 (없으면 None)
+        """
+        self.connect()
 
         cursor = self.conn.cursor()
-        cursor.execute(query, params)
+        cursor.execute("SELECT * FROM print_history WHERE id = ?", (record_id,))
+        row = cursor.fetchone()
 
-        return [dict(row) for row in cursor.fetchall()]
+        return dict(row) if row else None
 
     def delete_print_history(self, record_id: int) -> bool:
         """
         출력 이력 삭제
 
+        삭제한 기록이 LOT의 마지막 예약 번호였으면 예약 카운터도 한 칸 되돌려
+        다음 인쇄가 같은 번호를 다시 쓰도록 합니다 (그 뒤로 다른 예약이 있으면 그대로).
+
         Args:
             record_id: 삭제할 레코드 ID
 
@@ -190,9 +727,25 @@ class DBManager:
         try:
             self.connect()
             cursor = self.conn.cursor()
+            row = cursor.execute(
+                "SELECT serial_number FROM print_history WHERE id = ?", (record_id,)
+            ).fetchone()
             cursor.execute("DELETE FROM print_history WHERE id = ?", (record_id,))
+            deleted = cursor.rowcount > 0
+            parsed = split_serial(row['serial_number']) if row else None
+            if deleted and parsed:
+                lot_number, sequence = parsed
+                # release_sequence와 같은 조건: 카운터가 아직 이 번호일 때만
+                cursor.execute(
+                    """
+                    UPDATE lot_sequence_counter
+                    SET last_sequence = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE lot_number = ? AND last_sequence = ?
+                    """,
+                    (sequence - 1, lot_number, sequence),
+                )
             self.conn.commit()
-            return cursor.rowcount > 0
+            return deleted
         except Exception as e:
             raise DatabaseError(f"이력 삭제 오류: {e}")
 
@@ -200,6 +753,8 @@ class DBManager:
         """
         특정 LOT 번호의 최대 생산순서 조회
 
+        아카이브로 옮긴 이력은 archived_lot_sequence에 남은 최대값으로 반영합니다.
+
         Args:
             lot_number: LOT 번호 (예: "P10DL0S0H3A0C10")
 
@@ -214,35 +769,37 @@ class DBManager:
         # LOT 번호: P10DL0S0H3A0C10
         pattern = lot_number.replace('-', '')  # 하이픈 제거
 
-        cursor.execute(
-            """
-            SELECT serial_number
-            FROM print_history
-            WHERE REPLACE(serial_number, '-', '') LIKE ?
-            ORDER BY print_datetime DESC
-            """,
-            (f"{pattern}%",)
-        )
+        # 접두사 범위 [pattern, 마지막 글자 + 1) → idx_print_history_lot 범위 검색
+        if pattern:
+            upper = pattern[:-1] + chr(ord(pattern[-1]) + 1)
+            cursor.execute(
+                """
+                SELECT serial_number
+                FROM print_history
+                WHERE REPLACE(serial_number, '-', '') >= ? AND REPLACE(serial_number, '-', '') < ?
+                """,
+                (pattern, upper)
+            )
+        else:
+            cursor.execute("SELECT serial_number FROM print_history")
 
         rows = cursor.fetchall()
 
-        if not rows:
-            return None
-
         # 모든 시리얼에서 생산순서 추출하여 최대값 찾기
+        # 시리얼에서 생산순서 추출: P10DL0S0H3A00C100011 → 0011
         max_seq = 0
         for row in rows:
-            serial = row['serial_number']
-            # 시리얼에서 생산순서 추출: P10DL0S0H3A00C100011 → 0011
-            # 형식: 20자리 고정, 마지막 4자리가 생산순서
-            if len(serial) >= 20:
-                seq_str = serial[-4:]  # 마지막 4자리
-                try:
-                    seq = int(seq_str)
-                    if seq > max_seq:
-                        max_seq = seq
-                except ValueError:
-                    continue
+            parsed = split_serial(row['serial_number'])
+            if parsed and parsed[1] > max_seq:
+                max_seq = parsed[1]
+
+        cursor.execute(
+            "SELECT MAX(max_sequence) FROM archived_lot_sequence WHERE lot_number LIKE ?",
+            (f"{pattern}%",),
+        )
+        archived = cursor.fetchone()[0]
+        if archived and archived > max_seq:
+            max_seq = archived
 
         return max_seq if max_seq > 0 else None
 
@@ -375,6 +932,25 @@ class DBManager:
 
         return row["value"] if row else None
 
+    def get_configs(self, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+        """
+        앱 설정 여러 개를 한 번에 조회
+
+        Returns:
+            {키: 값 또는 None}
+        """
+        self.connect()
+
+        keys = list(keys)
+        values: Dict[str, Optional[str]] = dict.fromkeys(keys)
+        if keys:
+            placeholders = ", ".join("?" * len(keys))
+            for row in self.conn.execute(
+                f"SELECT key, value FROM app_config WHERE key IN ({placeholders})", keys
+            ):
+                values[row["key"]] = row["value"]
+        return values
+
     def set_config(self, key: str, value: str, description: str = "") -> None:
         """
         앱 설정 저장
@@ -429,18 +1005,26 @@ class DBManager:
         Args:
             backup_path: 백업 파일 경로
         """
-        if self.conn:
-            self.conn.commit()
+        self.connect()
+        self.conn.commit()
 
         # 백업 디렉토리 생성
         backup_dir = Path(backup_path).parent
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # 파일 복사
-        shutil.copy2(self.db_path, backup_path)
+        # 온라인 백업 (WAL 파일의 내용까지 일관되게 복사)
+        dest = sqlite3.connect(backup_path)
+        try:
+            self.conn.backup(dest)
+        finally:
+            dest.close()
 
     def close(self) -> None:
-        """데이터베이스 연결 종료"""
+        """데이터베이스 연결 종료 (진행 중인 백그라운드 인덱스 생성은 중단)"""
+        if self.index_builder is not None:
+            self.index_builder.cancel()
+            self.index_builder.wait()
+            self.index_builder = None
         if self.conn:
             self.conn.close()
             self.conn = None
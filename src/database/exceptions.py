@@ -26,3 +26,23 @@ class ConfigKeyNotFoundError(DatabaseError):
     def __init__(self, key: str):
         self.key = key
         super().__init__(f"설정 키를 찾을 수 없음: {key}")
+
+
+class QueryInterruptedError(DatabaseError):
+    """실행 중인 조회가 interrupt()로 중단됨"""
+    def __init__(self):
+        super().__init__("조회가 취소되었습니다.")
+
+
+class MigrationError(DatabaseError):
+    """스키마 마이그레이션 단계 실패 (해당 단계는 롤백됨)"""
+    def __init__(self, version: int, name: str, reason: str):
+        self.version = version
+        super().__init__(f"DB 마이그레이션 {version} ({name}) 실패: {reason}")
+
+
+class RemoteUnavailableError(DatabaseError):
+    """공유 DB 서버에 연결할 수 없음"""
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        super().__init__(f"공유 DB 서버 연결 실패 ({url}): {reason}")
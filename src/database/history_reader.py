@@ -0,0 +1,168 @@
+"""
+출력 이력 검색 전용 읽기 연결
+
+DBManager와 별도의 SQLite 연결로 이력을 조회합니다.
+- 검색 중에도 인쇄 결과 저장(쓰기 연결)을 막지 않습니다. (WAL)
+- 다른 스레드에서 interrupt()를 호출하여 실행 중인 조회를 즉시 중단할 수 있습니다.
+- data_version으로 다른 연결의 변경 여부를 저렴하게 확인할 수 있습니다.
+- iter_history()는 결과를 fetchmany 단위로 넘겨주므로 행 수와 관계없이 메모리가 일정합니다. (내보내기)
+- 날짜 범위가 아카이브 기간에 걸치면 해당 연도 아카이브(archive_YYYY.db)를 하나씩 ATTACH하여 이어서 조회합니다.
+- search()는 dict 대신 HistoryRecord(records.py)를 반환하여 대량 조회 시 변환 비용/메모리를 줄입니다.
+"""
+
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from .archive import ArchiveCatalog
+from .db_manager import STATEMENT_CACHE_SIZE, build_history_query, fetch_history
+from .exceptions import DatabaseError, QueryInterruptedError
+from .records import HistoryRecord
+
+
+class HistoryReader:
+    """이력 검색용 읽기 전용 연결"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (DBManager와 같은 파일)
+        """
+        self.db_path = db_path
+        self.conn: Optional[sqlite3.Connection] = None
+        self.archives = ArchiveCatalog(str(Path(db_path).resolve().parent))
+        self._lock = threading.Lock()
+
+    def connect(self) -> None:
+        """읽기 연결 열기"""
+        if self.conn is not None:
+            return
+
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA query_only = ON")
+
+    def search(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> List[HistoryRecord]:
+        """
+        출력 이력 검색 (DBManager.get_print_history와 같은 조건)
+
+        Returns:
+            이력 레코드 리스트 (이름 접근은 record.get('serial_number')와 to_dict()만 지원,
+            record['serial_number']는 TypeError)
+
+        Raises:
+            QueryInterruptedError: interrupt()로 중단된 경우
+        """
+        with self._lock:
+            self.connect()
+            try:
+                return fetch_history(
+                    self.conn, self.archives, date_from, date_to,
+                    serial_number, mac_address, limit, offset, records=True,
+                )
+            except sqlite3.OperationalError as e:
+                if "interrupted" in str(e):
+                    raise QueryInterruptedError()
+                raise DatabaseError(f"데이터베이스 오류: {e}")
+
+    def iter_history(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        lot_number: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[List[sqlite3.Row]]:
+        """
+        조건에 맞는 전체 이력을 chunk_size 행씩 반환 (search()와 같은 정렬)
+
+        반복이 끝날 때까지 연결을 점유하므로 내보내기처럼 전용 HistoryReader에서 사용합니다.
+
+        Args:
+            columns: 조회할 컬럼 (None이면 전체)
+
+        Raises:
+            QueryInterruptedError: interrupt()로 중단된 경우
+        """
+        with self._lock:
+            self.connect()
+            try:
+                with closing(self.archives.iter_tables(self.conn, date_from, date_to)) as tables:
+                    for table in tables:
+                        query, params = build_history_query(
+                            date_from, date_to, serial_number, mac_address,
+                            limit=None, lot_number=lot_number, table=table,
+                            select=", ".join(columns) if columns else "*",
+                        )
+
+                        # 아카이브를 DETACH하기 전에 커서를 닫아야 함
+                        with closing(self.conn.execute(query, params)) as cursor:
+                            while True:
+                                rows = cursor.fetchmany(chunk_size)
+                                if not rows:
+                                    break
+                                yield rows
+            except sqlite3.OperationalError as e:
+                if "interrupted" in str(e):
+                    raise QueryInterruptedError()
+                raise DatabaseError(f"데이터베이스 오류: {e}")
+
+    def count_history(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        lot_number: Optional[str] = None,
+    ) -> int:
+        """조건에 맞는 이력 건수 (내보내기 진행률용)"""
+        with self._lock:
+            self.connect()
+            try:
+                total = 0
+                with closing(self.archives.iter_tables(self.conn, date_from, date_to)) as tables:
+                    for table in tables:
+                        query, params = build_history_query(
+                            date_from, date_to, serial_number, mac_address,
+                            limit=None, lot_number=lot_number, table=table,
+                            select="COUNT(*)", order=False,
+                        )
+                        total += self.conn.execute(query, params).fetchone()[0]
+                return total
+            except sqlite3.OperationalError as e:
+                if "interrupted" in str(e):
+                    raise QueryInterruptedError()
+                raise DatabaseError(f"데이터베이스 오류: {e}")
+
+    def data_version(self) -> int:
+        """다른 연결이 커밋할 때마다 바뀌는 값 (PRAGMA data_version)"""
+        with self._lock:
+            self.connect()
+            return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def interrupt(self) -> None:
+        """실행 중인 조회 중단 (어느 스레드에서나 호출 가능)"""
+        conn = self.conn
+        if conn is not None:
+            conn.interrupt()
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,231 @@
+"""
+스테이션 로컬 인쇄 저널 (오프라인 우선)
+
+공유 DB 서버를 쓰는 스테이션이 서버에 닿지 않아도 인쇄를 계속하도록,
+인쇄 결과를 먼저 로컬 SQLite 저널에 추가(append)하고 나중에 서버로 보냅니다.
+
+- PrintJournal: 인쇄 기록을 추가만 하는 로컬 테이블 (동기화 상태만 갱신, 행은 삭제하지 않음)
+- JournaledDBManager: commit_print는 저널에 기록하고 즉시 반환, 나머지 호출은 서버로 전달.
+  설정/LOT/코드 조회는 마지막 응답을 기억해 두었다가 서버가 끊기면 그 값으로 응답합니다.
+
+저널 재전송은 서버의 sync_print_history(serial_number 기준 멱등 upsert)로 하며,
+재전송 루프는 services/journal_sync.py의 JournalSyncWorker가 담당합니다.
+오프라인 동안의 생산순서는 SequenceLeaser가 미리 임대한 블록에서 배정합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .exceptions import DatabaseError, DuplicateSerialNumberError, RemoteUnavailableError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_PATH = "data/print_journal.db"
+
+CREATE_JOURNAL_TABLES = """
+CREATE TABLE IF NOT EXISTS print_journal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    serial_number TEXT NOT NULL UNIQUE,
+    mac_address TEXT NOT NULL,
+    print_date DATE NOT NULL,
+    print_datetime DATETIME NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    prn_template TEXT NOT NULL,
+    lease_id INTEGER,
+    production_sequence TEXT,
+    journaled_at REAL NOT NULL,
+    sync_state TEXT NOT NULL DEFAULT 'pending' CHECK(sync_state IN ('pending', 'synced', 'conflict')),
+    synced_at REAL,
+    remote_id INTEGER,
+    conflict TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_print_journal_state ON print_journal(sync_state, id);
+"""
+
+# 서버로 보내는 열 (sync_print_history 입력)
+SYNC_COLUMNS = (
+    'serial_number', 'mac_address', 'print_date', 'print_datetime',
+    'status', 'error_message', 'prn_template', 'lease_id', 'production_sequence',
+)
+
+
+class PrintJournal:
+    """로컬 인쇄 저널 (인쇄 스레드와 동기화 스레드가 함께 사용)"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH):
+        """
+        Args:
+            path: 저널 DB 파일 경로
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = FULL")  # 인쇄된 라벨의 기록은 전원이 나가도 남도록
+        self.conn.executescript(CREATE_JOURNAL_TABLES)
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """인쇄 기록 추가
+
+        Returns:
+            저널 ID
+
+        Raises:
+            DuplicateSerialNumberError: 이 스테이션에서 이미 기록한 시리얼 번호
+        """
+        values = [record.get(column) for column in SYNC_COLUMNS]
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.execute(
+                    f"INSERT INTO print_journal ({', '.join(SYNC_COLUMNS)}, journaled_at) "
+                    f"VALUES ({', '.join('?' * len(SYNC_COLUMNS))}, ?)",
+                    (*values, time.time()),
+                )
+                return cursor.lastrowid
+        except sqlite3.IntegrityError:
+            raise DuplicateSerialNumberError(record['serial_number'])
+        except sqlite3.Error as e:
+            raise DatabaseError(f"인쇄 저널 기록 오류: {e}")
+
+    def pending(self, limit: int) -> List[Dict[str, Any]]:
+        """아직 보내지 않은 기록 (기록 순서)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM print_journal WHERE sync_state = 'pending' ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark(self, results: Sequence[Dict[str, Any]]) -> None:
+        """서버 응답 반영
+
+        Args:
+            results: [{'journal_id', 'state': 'synced' | 'conflict', 'remote_id', 'conflict'}, ...]
+        """
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE print_journal SET sync_state = ?, synced_at = ?, remote_id = ?, conflict = ? "
+                "WHERE id = ?",
+                [(r['state'], now, r.get('remote_id'), r.get('conflict'), r['journal_id']) for r in results],
+            )
+
+    def conflicts(self) -> List[Dict[str, Any]]:
+        """서버의 기존 기록과 충돌한 기록"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM print_journal WHERE sync_state = 'conflict' ORDER BY id"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """{'pending', 'conflicts', 'oldest_pending_at': 가장 오래된 미전송 기록 시각(epoch) 또는 None}"""
+        with self._lock:
+            row = self.conn.execute(
+                """
+                SELECT
+                    SUM(sync_state = 'pending'),
+                    SUM(sync_state = 'conflict'),
+                    MIN(CASE WHEN sync_state = 'pending' THEN journaled_at END)
+                FROM print_journal
+                """
+            ).fetchone()
+        return {'pending': row[0] or 0, 'conflicts': row[1] or 0, 'oldest_pending_at': row[2]}
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+class JournaledDBManager:
+    """저널에 먼저 기록하는 공유 DB 클라이언트 래퍼
+
+    RemoteDBManager를 감싸며, 감싸지 않은 메서드는 그대로 서버로 전달합니다.
+    """
+
+    # 서버가 끊겼을 때 마지막 응답으로 대신하는 조회 메서드
+    CACHED_METHODS = frozenset({'get_config', 'get_configs', 'get_lot_config', 'get_code_master'})
+
+    def __init__(self, central, journal: PrintJournal):
+        """
+        Args:
+            central: RemoteDBManager (또는 DBManager)
+            journal: 로컬 인쇄 저널
+        """
+        self.central = central
+        self.journal = journal
+        self.db_path = central.db_path
+        self.on_journaled: Optional[Callable[[], None]] = None  # 기록 직후 호출 (동기화 깨우기)
+        self._cache: Dict[tuple, Any] = {}
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.central, name)
+        if name in self.CACHED_METHODS:
+            return lambda *args: self._cached(name, attr, args)
+        return attr
+
+    def _cached(self, name: str, method: Callable, args: tuple) -> Any:
+        key = (name, *(tuple(arg) if isinstance(arg, list) else arg for arg in args))
+        try:
+            value = method(*args)
+        except RemoteUnavailableError:
+            if key not in self._cache:
+                raise
+            logger.debug("서버 연결 없음, 마지막 값 사용: %s%s", name, args)
+            return self._cache[key]
+        self._cache[key] = value
+        return value
+
+    def initialize(self) -> None:
+        """서버 상태 확인 (서버가 꺼져 있어도 저널로 시작)"""
+        try:
+            self.central.initialize()
+        except RemoteUnavailableError as e:
+            logger.warning("공유 DB 서버에 연결할 수 없어 로컬 저널로 시작합니다: %s", e)
+
+    def close(self) -> None:
+        self.central.close()
+        self.journal.close()
+
+    def commit_print(
+        self,
+        serial_number: str,
+        mac_address: str,
+        print_date: str,
+        prn_template: str,
+        production_sequence: Optional[str] = None,
+        lease_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        인쇄 성공 결과를 저널에 기록하고 레코드 반환 (서버 전송은 동기화 스레드가 담당)
+
+        반환 레코드의 id는 서버에 반영되기 전이므로 None이며, journal_id로 저널 행을 가리킵니다.
+
+        Raises:
+            DuplicateSerialNumberError: 이 스테이션에서 이미 기록한 시리얼 번호
+        """
+        record = {
+            'id': None,
+            'serial_number': serial_number,
+            'mac_address': mac_address,
+            'print_date': print_date,
+            'print_datetime': datetime.now().isoformat(),
+            'status': 'success',
+            'error_message': None,
+            'prn_template': prn_template,
+            'created_at': None,
+            'lease_id': lease_id,
+            'production_sequence': production_sequence,
+        }
+        record['journal_id'] = self.journal.append(record)
+        if self.on_journaled is not None:
+            self.on_journaled()
+        return record
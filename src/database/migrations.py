@@ -0,0 +1,273 @@
+"""
+스키마 마이그레이션 (PRAGMA user_version)
+
+DB 파일의 user_version이 마지막으로 적용한 단계 번호입니다. initialize()는 그보다 큰 단계만
+순서대로 실행하므로, 최신 DB에서는 스키마 스크립트를 다시 실행하지 않습니다.
+
+- 단계마다 트랜잭션 하나 (실패하면 그 단계 전체가 롤백되고 user_version은 그대로)
+- 적용 기록과 소요 시간은 schema_migration 테이블에 남김
+- 이전 버전 DB(user_version 0)도 1단계부터 실행 → 모든 단계는 이미 있는 테이블/컬럼/인덱스에 안전해야 함
+  (models.py의 CREATE_* 는 현재 스키마이므로 새 DB에서도 이후 단계가 모두 실행됨)
+
+이력이 많은 DB에서 오래 걸리는 인덱스는 단계의 deferred_indexes로 선언합니다.
+해당 인덱스가 없으면 IndexBuilder가 별도 연결/스레드에서 만들고 진행 상황을 알립니다.
+인덱스가 생기기 전에도 조회 결과는 같고 속도만 느립니다.
+
+새 단계 추가:
+    MIGRATIONS에 다음 번호로 Migration(...)을 덧붙입니다. 이미 배포된 단계는 수정하지 않습니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import MigrationError
+from .models import CREATE_INDEXES, CREATE_TABLES, CREATE_TRIGGERS, INSERT_INITIAL_DATA
+
+logger = logging.getLogger(__name__)
+
+CREATE_MIGRATION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migration (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """마이그레이션 단계"""
+    version: int
+    name: str
+    script: str = ""                                            # 실행할 SQL (여러 문장)
+    apply: Optional[Callable[[sqlite3.Connection], None]] = None  # SQL로 표현하기 어려운 변경
+    deferred_indexes: Tuple[Tuple[str, str], ...] = ()           # (인덱스 이름, CREATE INDEX SQL)
+
+
+def _add_column(table: str, column: str, definition: str) -> Callable[[sqlite3.Connection], None]:
+    """컬럼이 없을 때만 추가하는 단계"""
+    def apply(conn: sqlite3.Connection) -> None:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return apply
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        1, "baseline",
+        script=CREATE_TABLES + CREATE_INDEXES + CREATE_TRIGGERS + INSERT_INITIAL_DATA,
+    ),
+    Migration(
+        2, "print_history.lease_id",
+        apply=_add_column('print_history', 'lease_id', 'INTEGER'),  # 번호를 임대받은 sequence_lease.id
+    ),
+    Migration(
+        # UNIQUE(serial_number) 자동 인덱스와 같은 인덱스 → 쓰기마다 갱신 비용만 추가됨
+        3, "drop duplicate serial index",
+        script="DROP INDEX IF EXISTS idx_print_history_serial;",
+    ),
+    Migration(
+        # get_max_sequence_for_lot (인쇄마다 실행)의 LOT 접두사 범위 검색
+        4, "lot prefix index",
+        deferred_indexes=((
+            'idx_print_history_lot',
+            "CREATE INDEX IF NOT EXISTS idx_print_history_lot ON print_history(REPLACE(serial_number, '-', ''))",
+        ),),
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+# print_history가 이 행 수 이하이면 지연 인덱스를 시작 시 바로 생성
+INLINE_INDEX_ROWS = 100_000
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, migrations: Optional[List[Migration]] = None) -> List[Dict[str, object]]:
+    """
+    적용되지 않은 단계를 순서대로 실행
+
+    Args:
+        conn: DB 연결 (열린 트랜잭션 없음)
+        migrations: 단계 목록 (기본: MIGRATIONS)
+
+    Returns:
+        이번에 적용한 단계 [{'version', 'name', 'duration_ms'}, ...] (최신이면 빈 리스트)
+
+    Raises:
+        MigrationError: 단계 실행 실패 (해당 단계는 롤백됨)
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    current = schema_version(conn)
+    latest = migrations[-1].version if migrations else 0
+    if current > latest:
+        logger.warning("DB 스키마 버전(%d)이 이 프로그램(%d)보다 최신입니다.", current, latest)
+        return []
+
+    applied = []
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(CREATE_MIGRATION_TABLE)
+            for statement in _statements(migration.script):
+                conn.execute(statement)
+            if migration.apply is not None:
+                migration.apply(conn)
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_migration (version, name, duration_ms) VALUES (?, ?, ?)",
+                (migration.version, migration.name, duration_ms),
+            )
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise MigrationError(migration.version, migration.name, str(e))
+
+        logger.info("DB 마이그레이션 %d (%s): %.1f ms", migration.version, migration.name, duration_ms)
+        applied.append({'version': migration.version, 'name': migration.name, 'duration_ms': duration_ms})
+
+    return applied
+
+
+def deferred_indexes(version: int = LATEST_VERSION) -> List[Tuple[str, str]]:
+    """version까지의 단계에서 선언한 지연 인덱스"""
+    return [index for m in MIGRATIONS if m.version <= version for index in m.deferred_indexes]
+
+
+def pending_indexes(conn: sqlite3.Connection) -> List[Tuple[str, str]]:
+    """선언되었지만 아직 없는 지연 인덱스"""
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return [(name, sql) for name, sql in deferred_indexes(schema_version(conn)) if name not in existing]
+
+
+class IndexBuilder:
+    """지연 인덱스를 백그라운드 스레드에서 생성
+
+    DB 파일에 별도 연결을 열어 인덱스를 하나씩 만듭니다. 인덱스를 만드는 동안에는
+    쓰기 잠금을 잡으므로 인쇄 저장은 잠시 기다립니다 (busy timeout 안에서).
+    """
+
+    HEARTBEAT_SECONDS = 0.5   # 진행 알림 간격
+    PROGRESS_OPS = 10_000     # 진행 확인 간격 (SQLite VM 명령 수)
+
+    def __init__(
+        self,
+        db_path: str,
+        indexes: List[Tuple[str, str]],
+        progress: Optional[Callable[[Dict[str, object]], None]] = None,
+    ):
+        """
+        Args:
+            db_path: DB 파일 경로
+            indexes: [(인덱스 이름, CREATE INDEX SQL), ...]
+            progress: 진행 알림 콜백 (빌더 스레드에서 호출)
+                {'index', 'done', 'total', 'elapsed_s', 'finished'}
+        """
+        self.db_path = db_path
+        self.indexes = list(indexes)
+        self.progress = progress
+        self.built: List[str] = []
+        self.error: Optional[str] = None
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "IndexBuilder":
+        self._thread = threading.Thread(target=self.run, name="IndexBuilder", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """진행 중인 인덱스 생성 중단 (다음 실행에서 다시 생성)"""
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """완료 대기 → 끝났으면 True"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run(self, conn: Optional[sqlite3.Connection] = None) -> None:
+        """인덱스 생성 (호출 스레드에서 실행)
+
+        Args:
+            conn: 사용할 연결 (None이면 db_path에 새 연결을 열고 끝나면 닫음)
+        """
+        own = conn is None
+        if own:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            for done, (name, sql) in enumerate(self.indexes):
+                if self._cancel.is_set():
+                    break
+                started = time.perf_counter()
+                last_report = [started]
+
+                def on_progress(name=name, done=done, started=started):
+                    if self._cancel.is_set():
+                        return 1  # 실행 중단
+                    now = time.perf_counter()
+                    if now - last_report[0] >= self.HEARTBEAT_SECONDS:
+                        last_report[0] = now
+                        self._report(name, done, started, finished=False)
+                    return 0
+
+                self._report(name, done, started, finished=False)
+                conn.set_progress_handler(on_progress, self.PROGRESS_OPS)
+                try:
+                    conn.execute(sql)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    if not self._cancel.is_set():
+                        self.error = f"{name}: {e}"
+                        logger.error("인덱스 생성 실패: %s", self.error)
+                    break
+                finally:
+                    conn.set_progress_handler(None, 0)
+
+                self.built.append(name)
+                logger.info("인덱스 생성 완료: %s (%.1f s)", name, time.perf_counter() - started)
+                self._report(name, done + 1, started, finished=True)
+        finally:
+            if own:
+                conn.close()
+
+    def _report(self, name: str, done: int, started: float, finished: bool) -> None:
+        if self.progress is None:
+            return
+        try:
+            self.progress({
+                'index': name, 'done': done, 'total': len(self.indexes),
+                'elapsed_s': round(time.perf_counter() - started, 2), 'finished': finished,
+            })
+        except Exception:
+            logger.exception("인덱스 진행 알림 오류")
+
+
+def _statements(script: str) -> Iterator[str]:
+    """SQL 스크립트를 문장 단위로 분리 (executescript는 열린 트랜잭션을 커밋하므로 사용하지 않음)"""
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            yield buffer.strip()
+            buffer = ""
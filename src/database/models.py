@@ -1,5 +1,7 @@
 """
 데이터베이스 스키마 정의
+
+현재 스키마입니다. 기존 DB의 변경(컬럼/인덱스 추가 등)은 migrations.py의 단계로 추가합니다.
 """
 
 # 테이블 생성 SQL
@@ -15,6 +17,7 @@ CREATE TABLE IF NOT EXISTS print_history (
     error_message TEXT,
     prn_template TEXT NOT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    lease_id INTEGER,
     UNIQUE(serial_number)
 );
 
@@ -52,6 +55,64 @@ CREATE TABLE IF NOT EXISTS code_master (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(code_type, code_value)
 );
+
+-- LOT별 마지막으로 예약된 생산순서 (DBManager.reserve_sequence, 스테이션 간 공유)
+CREATE TABLE IF NOT EXISTS lot_sequence_counter (
+    lot_number TEXT PRIMARY KEY,
+    last_sequence INTEGER NOT NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 스테이션별 생산순서 블록 임대 기록 (DBManager.lease_sequences, 감사용)
+CREATE TABLE IF NOT EXISTS sequence_lease (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lot_number TEXT NOT NULL,
+    station TEXT NOT NULL,
+    first_sequence INTEGER NOT NULL,
+    last_sequence INTEGER NOT NULL,
+    leased_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    returned_at DATETIME,
+    returned_count INTEGER,     -- 카운터로 되돌린 미사용 번호 수
+    gap_count INTEGER           -- 되돌리지 못해 비게 된 번호 수
+);
+
+-- 임대 후 사용하지 않아 비게 된 생산순서 (감사용)
+CREATE TABLE IF NOT EXISTS sequence_gap (
+    lot_number TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    lease_id INTEGER,
+    recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (lot_number, sequence)
+);
+
+-- 아카이브로 옮긴 LOT별 최대 생산순서 (archive.HistoryArchiver)
+CREATE TABLE IF NOT EXISTS archived_lot_sequence (
+    lot_number TEXT PRIMARY KEY,
+    max_sequence INTEGER NOT NULL
+);
+"""
+
+# 연도별 아카이브(archive_YYYY.db) 스키마 - 행은 운영 DB의 id 그대로 복사
+CREATE_ARCHIVE_TABLES = """
+CREATE TABLE IF NOT EXISTS print_history (
+    id INTEGER PRIMARY KEY,
+    serial_number TEXT NOT NULL,
+    mac_address TEXT NOT NULL,
+    print_date DATE NOT NULL,
+    print_datetime DATETIME NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    prn_template TEXT NOT NULL,
+    created_at DATETIME,
+    lease_id INTEGER,
+    UNIQUE(serial_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_print_history_date
+    ON print_history(print_datetime DESC);
+
+CREATE INDEX IF NOT EXISTS idx_print_history_mac
+    ON print_history(mac_address);
 """
 
 # 인덱스 생성 SQL
@@ -59,9 +120,6 @@ CREATE_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_print_history_date
     ON print_history(print_datetime DESC);
 
-CREATE INDEX IF NOT EXISTS idx_print_history_serial
-    ON print_history(serial_number);
-
 CREATE INDEX IF NOT EXISTS idx_print_history_mac
     ON print_history(mac_address);
 
@@ -113,7 +171,9 @@ INSERT OR IGNORE INTO app_config (key, value, description) VALUES
     ('backup_interval', '3600', '백업 주기 (초)'),
     ('backup_path', '', '백업 폴더 경로 (비어있으면 기본 경로 사용)'),
     ('last_backup', '', '마지막 백업 시각'),
-    ('print_copies', '1', '인쇄 매수 (1~5)');
+    ('print_copies', '1', '인쇄 매수 (1~5)'),
+    ('serial_capture_enabled', 'false', '시리얼 수신 원본 데이터 캡처 저장'),
+    ('archive_keep_days', '365', '운영 DB 이력 보관 기간 (일, 이전 이력은 연도별 아카이브로 이동)');
 
 -- 코드 마스터 초기 데이터
 -- 모델명 코드
@@ -0,0 +1,58 @@
+"""
+출력 이력 레코드 (GUI 조회용)
+
+dict 변환 없이 커서가 돌려준 튜플을 그대로 감싼 __slots__ 레코드입니다.
+GUI 코드가 쓰는 dict 방식 접근(record.get('serial_number', ''))을 그대로 지원하며,
+행마다 dict를 만드는 비용과 메모리(키 해시 테이블)를 줄입니다.
+record[0]처럼 위치로 읽는 것은 튜플 그대로이고, 이름으로는 get()을 사용합니다.
+(__getitem__을 재정의하면 위치 접근까지 파이썬 호출이 되어 get()이 dict보다 몇 배 느려짐)
+
+컬럼 위치는 커서의 description으로 정하므로 아카이브처럼 컬럼 수가 다른 테이블도 안전합니다.
+JSON으로 보내는 경로(공유 DB 서버, 헤드리스)는 to_dict()나 DBManager의 dict 결과를 사용하고,
+받은 dict 목록은 from_dicts()로 같은 레코드로 바꿉니다 (공유 DB 서버를 쓰는 GUI).
+매핑이 아니므로 dict(record)는 지원하지 않습니다.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
+
+
+class HistoryRecord(tuple):
+    """읽기 전용 이력 레코드 (튜플 + 컬럼 이름 접근)"""
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._index.get(key)
+        return default if index is None else self[index]
+
+    def fields(self) -> Tuple[str, ...]:
+        # keys()가 아님: 매핑처럼 보이면 dict(record)/{**record}가 알기 어려운 TypeError로 실패함
+        return self._fields
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def __repr__(self) -> str:
+        return f"HistoryRecord({self.to_dict()!r})"
+
+
+@lru_cache(maxsize=32)
+def record_type(fields: Tuple[str, ...]) -> Type[HistoryRecord]:
+    """컬럼 구성별 레코드 클래스 (같은 구성이면 같은 클래스 재사용)"""
+    return type("HistoryRecord", (HistoryRecord,), {
+        '__slots__': (), '_fields': fields, '_index': {name: i for i, name in enumerate(fields)},
+    })
+
+
+def fetch_records(cursor) -> list:
+    """실행된 커서의 남은 행을 HistoryRecord 리스트로 (row_factory 없는 커서)"""
+    cls = record_type(tuple(column[0] for column in cursor.description))
+    return list(map(cls, cursor))
+
+
+def from_dicts(rows) -> list:
+    """dict 행 목록 → HistoryRecord 리스트 (공유 DB 서버 응답 등)"""
+    return [record_type(tuple(row))(row.values()) for row in rows]
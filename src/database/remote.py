@@ -0,0 +1,259 @@
+"""
+공유 DB 서버 클라이언트
+
+RemoteDBManager는 DBManager와 같은 메서드를 공유 DB 서버(server.py)로 전달합니다.
+PrintService/ConfigurationService 등은 어느 쪽을 받아도 그대로 동작합니다.
+
+- HTTP/1.1 keep-alive 연결 하나를 재사용 (스레드 간 lock으로 직렬화)
+- 서버가 유휴 연결을 닫은 경우 한 번만 다시 연결하여 재시도
+- call_many()로 여러 호출을 요청 하나에 묶어 왕복 횟수를 줄임
+- 서버 토큰은 token 인자 또는 LABEL_PRINTER_DB_TOKEN 환경 변수로 지정
+
+open_database()는 경로면 DBManager, http(s):// 주소면 RemoteDBManager를 반환합니다.
+"""
+
+import http.client
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+from .db_manager import DBManager
+from .exceptions import (
+    DatabaseError,
+    DuplicateSerialNumberError,
+    LOTConfigNotFoundError,
+    RemoteUnavailableError,
+)
+from .server import TOKEN_ENV, TOKEN_HEADER
+
+
+def open_database(target: str, timeout: float = 5.0, token: Optional[str] = None):
+    """DB 경로 또는 공유 DB 서버 주소(http://host:port)로 DB 관리자 생성"""
+    if target.startswith(("http://", "https://")):
+        return RemoteDBManager(target, timeout=timeout, token=token)
+    return DBManager(target)
+
+
+class RemoteDBManager:
+    """공유 DB 서버용 DBManager 대체 구현"""
+
+    def __init__(self, url: str, timeout: float = 5.0, token: Optional[str] = None):
+        """
+        Args:
+            url: 서버 주소 (예: "http://192.168.0.10:8765")
+            timeout: 요청 타임아웃 (초)
+            token: 서버 토큰 (None이면 LABEL_PRINTER_DB_TOKEN 환경 변수)
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"공유 DB 서버 주소 오류: {url}")
+
+        self.url = url.rstrip('/')
+        self.db_path = self.url  # 표시/로그용 (파일 경로 아님)
+        self.timeout = timeout
+        self.token = token if token is not None else os.environ.get(TOKEN_ENV)
+        self._parts = parts
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    # ==================== 연결 ====================
+
+    def connect(self) -> None:
+        """서버 연결 (keep-alive로 재사용)"""
+        if self._conn is not None:
+            return
+        connection_class = (
+            http.client.HTTPSConnection if self._parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._conn = connection_class(self._parts.hostname, self._parts.port, timeout=self.timeout)
+
+    def initialize(self) -> None:
+        """서버 상태 확인 (스키마 초기화는 서버가 담당)"""
+        with self._lock:
+            self._request("GET", "/health")
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ==================== 호출 ====================
+
+    def call(self, method: str, **params) -> Any:
+        """원격 메서드 호출
+
+        Raises:
+            RemoteUnavailableError: 서버에 연결할 수 없음
+            DatabaseError: 서버에서 발생한 오류 (DuplicateSerialNumberError 등 원래 예외로 복원)
+        """
+        with self._lock:
+            response = self._request("POST", "/rpc", {'method': method, 'params': params})
+        return _unwrap(response)
+
+    def call_many(self, calls: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """여러 호출을 요청 하나로 실행 (서버에서는 순서대로 실행)
+
+        Args:
+            calls: [(메서드, 파라미터 dict), ...]
+
+        Returns:
+            결과 리스트 (호출 순서)
+
+        Raises:
+            DatabaseError: 실패한 첫 호출의 예외 (다른 호출은 서버에서 이미 실행됨)
+        """
+        if not calls:
+            return []
+        with self._lock:
+            responses = self._request(
+                "POST", "/rpc", [{'method': method, 'params': params} for method, params in calls]
+            )
+        return [_unwrap(response) for response in responses]
+
+    def _request(self, http_method: str, path: str, payload: Any = None) -> Any:
+        """요청 전송 (lock 보유 상태에서 호출)"""
+        body = None if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        if self.token:
+            headers[TOKEN_HEADER] = self.token
+
+        for attempt in range(2):
+            reused = self._conn is not None
+            self.connect()
+            try:
+                self._conn.request(http_method, path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # 서버가 닫은 유휴 keep-alive 연결 → 새 연결로 한 번만 재시도
+                self._conn.close()
+                self._conn = None
+                if not reused or attempt:
+                    raise RemoteUnavailableError(self.url, str(e))
+            except (OSError, http.client.HTTPException) as e:
+                self._conn.close()
+                self._conn = None
+                raise RemoteUnavailableError(self.url, str(e))
+
+        try:
+            result = json.loads(data)
+        except ValueError:
+            raise RemoteUnavailableError(self.url, f"잘못된 응답 (HTTP {response.status})")
+        if response.status != 200 and isinstance(result, dict) and 'error' in result:
+            return _unwrap(result)
+        return result
+
+    # ==================== DBManager 인터페이스 ====================
+
+    def reserve_sequence(self, lot_number: str, count: int = 1) -> int:
+        return self.call('reserve_sequence', lot_number=lot_number, count=count)
+
+    def release_sequence(self, lot_number: str, first: int, count: int = 1) -> bool:
+        return self.call('release_sequence', lot_number=lot_number, first=first, count=count)
+
+    def lease_sequences(self, lot_number: str, station: str, count: int) -> Dict[str, int]:
+        return self.call('lease_sequences', lot_number=lot_number, station=station, count=count)
+
+    def return_lease(self, lease_id: int, unused: Sequence[int]) -> Dict[str, Any]:
+        return self.call('return_lease', lease_id=lease_id, unused=list(unused))
+
+    def commit_print(
+        self,
+        serial_number: str,
+        mac_address: str,
+        print_date: str,
+        prn_template: str,
+        production_sequence: Optional[str] = None,
+        lease_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        return self.call(
+            'commit_print', serial_number=serial_number, mac_address=mac_address,
+            print_date=print_date, prn_template=prn_template,
+            production_sequence=production_sequence, lease_id=lease_id,
+        )
+
+    def sync_print_history(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.call('sync_print_history', rows=list(rows))
+
+    def search_history(self, **conditions) -> List[Dict[str, Any]]:
+        return self.call('search_history', **conditions)
+
+    def save_print_history(self, serial_number: str, mac_address: str, print_date: str,
+                           status: str, error_message: Optional[str] = None,
+                           prn_template: str = "PSA_LABEL_ZPL_with_mac_address.prn",
+                           lease_id: Optional[int] = None) -> int:
+        return self.call(
+            'save_print_history', serial_number=serial_number, mac_address=mac_address,
+            print_date=print_date, status=status, error_message=error_message,
+            prn_template=prn_template, lease_id=lease_id,
+        )
+
+    def get_print_history(self, limit: int = 100, offset: int = 0, **conditions) -> List[Dict[str, Any]]:
+        return self.call('get_print_history', limit=limit, offset=offset, **conditions)
+
+    def get_print_record(self, record_id: int) -> Optional[Dict[str, Any]]:
+        return self.call('get_print_record', record_id=record_id)
+
+    def delete_print_history(self, record_id: int) -> bool:
+        return self.call('delete_print_history', record_id=record_id)
+
+    def get_max_sequence_for_lot(self, lot_number: str) -> Optional[int]:
+        return self.call('get_max_sequence_for_lot', lot_number=lot_number)
+
+    def get_today_stats(self) -> Dict[str, int]:
+        return self.call('get_today_stats')
+
+    def get_lot_config(self) -> Dict[str, Any]:
+        return self.call('get_lot_config')
+
+    def update_lot_config(self, **kwargs) -> None:
+        self.call('update_lot_config', **kwargs)
+
+    def increment_sequence(self, new_sequence: str) -> None:
+        self.call('increment_sequence', new_sequence=new_sequence)
+
+    def get_config(self, key: str) -> Optional[str]:
+        return self.call('get_config', key=key)
+
+    def get_configs(self, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+        return self.call('get_configs', keys=list(keys))
+
+    def set_config(self, key: str, value: str, description: str = "") -> None:
+        self.call('set_config', key=key, value=value, description=description)
+
+    def get_code_master(self, code_type: str) -> List[Dict[str, str]]:
+        return self.call('get_code_master', code_type=code_type)
+
+    def find_existing_serials(self, serial_numbers: Sequence[str]) -> Set[str]:
+        return set(self.call('find_existing_serials', serial_numbers=list(serial_numbers)))
+
+    def insert_print_history_many(self, rows: Sequence[tuple]) -> List[str]:
+        return self.call('insert_print_history_many', rows=[list(row) for row in rows])
+
+
+def _unwrap(response: Dict[str, Any]) -> Any:
+    """{"result": ...} → 값, {"error": ...} → 원래 예외"""
+    error = response.get('error')
+    if error is None:
+        return response.get('result')
+
+    error_type, message = error.get('type'), error.get('message', '')
+    if error_type == 'DuplicateSerialNumberError':
+        raise DuplicateSerialNumberError(error.get('serial_number', ''))
+    if error_type == 'LOTConfigNotFoundError':
+        raise LOTConfigNotFoundError()
+    if error_type == 'ValueError':
+        raise ValueError(message)
+    raise DatabaseError(message)
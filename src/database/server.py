@@ -0,0 +1,194 @@
+"""
+공유 DB 서버 (HTTP/JSON)
+
+여러 스테이션이 생산순서 카운터와 출력 이력을 함께 쓰도록 DB 파일 하나를 소유하는 서버입니다.
+스테이션은 RemoteDBManager(remote.py)로 접속하며, 네트워크 공유 폴더의 SQLite 파일을
+여러 PC가 직접 여는 것과 달리 잠금 경쟁/파일 손상 없이 순서가 보장됩니다.
+
+프로토콜:
+    POST /rpc   {"method": "reserve_sequence", "params": {"lot_number": "..."}}
+                → {"result": ...} 또는 {"error": {"type": "...", "message": "..."}}
+                본문이 배열이면 한 요청에 여러 호출을 묶어 실행하고 결과도 배열로 반환 (배치)
+    GET /health → {"ok": true}
+
+토큰을 지정하면 /rpc 요청은 X-DB-Token 헤더가 같아야 실행합니다 (다르면 401).
+스테이션은 LABEL_PRINTER_DB_TOKEN 환경 변수로 토큰을 설정합니다. LAN에 공개할 때는 필수입니다.
+
+HTTP/1.1 keep-alive로 연결을 재사용하며, DB 호출은 연결 하나에서 순서대로 실행합니다.
+표준 라이브러리만 사용합니다 (헤드리스 실행기의 db-server 명령).
+"""
+
+import hmac
+import json
+import logging
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .exceptions import DuplicateSerialNumberError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+TOKEN_HEADER = "X-DB-Token"
+TOKEN_ENV = "LABEL_PRINTER_DB_TOKEN"
+
+# 원격으로 호출할 수 있는 DBManager 메서드
+REMOTE_METHODS = frozenset({
+    'reserve_sequence', 'release_sequence', 'commit_print', 'search_history',
+    'lease_sequences', 'return_lease', 'sync_print_history',
+    'save_print_history', 'get_print_history', 'get_print_record', 'delete_print_history',
+    'get_max_sequence_for_lot', 'get_today_stats',
+    'get_lot_config', 'update_lot_config', 'increment_sequence',
+    'get_config', 'get_configs', 'set_config', 'get_code_master',
+    'find_existing_serials', 'insert_print_history_many',
+})
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class DBServer(ThreadingHTTPServer):
+    """DBManager를 HTTP/JSON으로 공개하는 서버"""
+
+    daemon_threads = True
+
+    def __init__(
+        self, db, host: str = "127.0.0.1", port: int = DEFAULT_PORT, token: Optional[str] = None,
+    ):
+        """
+        Args:
+            db: DBManager 인스턴스 (initialize 완료)
+            host: 바인드 주소 (LAN 공개 시 "0.0.0.0")
+            port: 포트 (0이면 임의 포트)
+            token: 공유 토큰 (None이면 인증 없음, 127.0.0.1 전용으로만 사용)
+        """
+        super().__init__((host, port), _RPCHandler)
+        self.db = db
+        self.token = token
+        self._db_lock = threading.Lock()
+        self._connections = set()  # 열린 keep-alive 연결 (stop()에서 끊음)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "DBServer":
+        """백그라운드 스레드에서 실행 (테스트/같은 프로세스용 대리 서버)"""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={'poll_interval': 0.05},
+            name="DBServer", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """start()로 실행한 서버 종료 (열린 연결도 끊음, DB 연결은 닫지 않음)"""
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+        with self._db_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def authorized(self, token: Optional[str]) -> bool:
+        """요청 헤더의 토큰 확인"""
+        if not self.token:
+            return True
+        return token is not None and hmac.compare_digest(token.encode('utf-8'), self.token.encode('utf-8'))
+
+    def call(self, request: Any) -> Dict[str, Any]:
+        """호출 하나 실행 → {"result": ...} 또는 {"error": {...}}"""
+        if not isinstance(request, dict) or request.get('method') not in REMOTE_METHODS:
+            method = request.get('method') if isinstance(request, dict) else None
+            return _error("ValueError", f"지원하지 않는 메서드: {method}")
+
+        params = request.get('params') or {}
+        try:
+            with self._db_lock:
+                result = getattr(self.db, request['method'])(**params)
+        except DuplicateSerialNumberError as e:
+            return _error(type(e).__name__, str(e), serial_number=e.serial_number)
+        except (ValueError, TypeError) as e:
+            return _error("ValueError", str(e))
+        except Exception as e:
+            logger.exception("원격 호출 실패: %s", request['method'])
+            return _error(type(e).__name__, str(e))
+
+        if isinstance(result, (set, frozenset)):
+            result = sorted(result)
+        return {'result': result}
+
+    def call_many(self, requests: List[Any]) -> List[Dict[str, Any]]:
+        """배치 실행 (앞 호출이 실패해도 나머지는 실행)"""
+        return [self.call(request) for request in requests]
+
+
+class _RPCHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"    # keep-alive
+    timeout = 60                     # 유휴 연결 정리 (초)
+    disable_nagle_algorithm = True   # 헤더/본문을 나눠 쓸 때 지연 ACK 대기 방지
+
+    def setup(self):
+        super().setup()
+        with self.server._db_lock:
+            self.server._connections.add(self.connection)
+
+    def finish(self):
+        with self.server._db_lock:
+            self.server._connections.discard(self.connection)
+        super().finish()
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {'ok': True})
+        else:
+            self._send(404, _error("NotFound", self.path))
+
+    def do_POST(self):
+        if self.path != "/rpc":
+            self._send(404, _error("NotFound", self.path))
+            return
+
+        if not self.server.authorized(self.headers.get(TOKEN_HEADER)):
+            self.close_connection = True
+            self._send(401, _error("PermissionError", "공유 DB 서버 토큰이 올바르지 않습니다."))
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send(413, _error("ValueError", "요청이 너무 큽니다."))
+            return
+
+        try:
+            request = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send(400, _error("ValueError", f"JSON 오류: {e}"))
+            return
+
+        if isinstance(request, list):
+            self._send(200, self.server.call_many(request))
+        else:
+            self._send(200, self.server.call(request))
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _error(error_type: str, message: str, **fields) -> Dict[str, Any]:
+    return {'error': {'type': error_type, 'message': message, **fields}}
@@ -1,7 +1,7 @@
 from .rows import FormRow, SelectRow, InputRow, DisplayRow, ButtonRow
 from .containers import Section, Card
 from .tree_combo import TreeComboWidget
-from .print_history_table import PrintHistoryTable
+from .print_history_table import PrintHistoryTable, PrintHistoryModel
 from .settings_tree import SettingsTree
 from .settings_detail import SettingsDetailPanel
 from .stat_card import StatCard
@@ -11,7 +11,7 @@ from .status_bar import StatusBar
 
 __all__ = [
     'FormRow', 'SelectRow', 'InputRow', 'DisplayRow', 'ButtonRow',
-    'Section', 'Card', 'TreeComboWidget', 'PrintHistoryTable',
+    'Section', 'Card', 'TreeComboWidget', 'PrintHistoryTable', 'PrintHistoryModel',
     'SettingsTree', 'SettingsDetailPanel', 'StatCard',
     'Toast', 'ToastManager', 'SearchPanel', 'StatusBar'
 ]
@@ -1,33 +1,173 @@
 """출력 이력 테이블 컴포넌트"""
-from PyQt6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QVBoxLayout, QAbstractItemView
-)
-from PyQt6.QtCore import Qt
+from typing import List
+
+from PyQt6.QtWidgets import QTableView, QHeaderView, QVBoxLayout, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor, QBrush, QFont
 from ..core import ComponentBase, Theme
 from ..styles import get_theme_manager
-from ..styles.theme_manager import ThemeMode
+
+
+class PrintHistoryModel(QAbstractTableModel):
+    """출력 이력 테이블 모델
+
+    최신 레코드가 위에 오도록 보관하며, max_rows를 넘는 오래된 행은 잘라냅니다.
+    새 출력은 prepend_records()로 앞에만 삽입하므로 전체 재구성이 없습니다.
+    """
+
+    HEADERS = ["시간", "시리얼 번호", "MAC 주소", "상태"]
+    STATUS_COLUMN = 3
+    STATUS_TEXT = {'success': "성공", 'failed': "실패"}
+
+    def __init__(self, max_rows: int = 500, parent=None):
+        """
+        Args:
+            max_rows: 표시할 최대 행 수 (0이면 제한 없음)
+        """
+        super().__init__(parent)
+        self.max_rows = max_rows
+        self._rows: List[tuple] = []   # (시간, 시리얼, MAC, 상태 표시, 상태, 레코드)
+
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    @classmethod
+    def _to_row(cls, record: dict) -> tuple:
+        """레코드를 표시용 행으로 변환 (삽입 시 1회)"""
+        # 시간 (HH:MM:SS 형식으로 변환)
+        datetime_str = record.get('print_datetime', '') or ''
+        time_str = ''
+        if datetime_str:
+            try:
+                time_str = datetime_str.split('T')[1].split('.')[0]
+            except Exception:
+                time_str = datetime_str
+
+        status = record.get('status', '')
+        return (
+            time_str,
+            record.get('serial_number', ''),
+            record.get('mac_address', '') or '',
+            cls.STATUS_TEXT.get(status, "-"),
+            status,
+            record,
+        )
+
+    # ==================== 데이터 변경 ====================
+
+    def set_records(self, records: List[dict]):
+        """전체 레코드 교체 (최신순 목록)"""
+        if self.max_rows:
+            records = records[:self.max_rows]
+        self.beginResetModel()
+        self._rows = [self._to_row(record) for record in records]
+        self.endResetModel()
+
+    def prepend_records(self, records: List[dict]) -> int:
+        """새 레코드를 맨 앞에 삽입 (records는 최신순)
+
+        삽입과 초과 행 제거를 각각 한 번의 begin/end 쌍으로 처리합니다.
+
+        Returns:
+            잘려나간 행 수
+        """
+        if not records:
+            return 0
+        if self.max_rows:
+            records = records[:self.max_rows]
+
+        self.beginInsertRows(QModelIndex(), 0, len(records) - 1)
+        self._rows[0:0] = [self._to_row(record) for record in records]
+        self.endInsertRows()
+
+        overflow = len(self._rows) - self.max_rows if self.max_rows else 0
+        if overflow > 0:
+            first = len(self._rows) - overflow
+            self.beginRemoveRows(QModelIndex(), first, len(self._rows) - 1)
+            del self._rows[first:]
+            self.endRemoveRows()
+            return overflow
+        return 0
+
+    def clear(self):
+        self.set_records([])
+
+    def records(self) -> List[dict]:
+        """표시 중인 원본 레코드 목록"""
+        return [row[5] for row in self._rows]
+
+    def refresh_status_colors(self):
+        """상태 열 글자색 갱신 알림 (테마 변경 시)"""
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.STATUS_COLUMN),
+                self.index(len(self._rows) - 1, self.STATUS_COLUMN),
+                [Qt.ItemDataRole.ForegroundRole],
+            )
+
+    @staticmethod
+    def _status_color(status: str) -> str:
+        """현재 테마의 상태 색상"""
+        colors = get_theme_manager().colors
+        if status == 'success':
+            return colors.SUCCESS
+        if status == 'failed':
+            return colors.ERROR
+        return colors.GRAY_500
+
+    # ==================== QAbstractTableModel ====================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[column]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (1, 2):
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter
+        if column == self.STATUS_COLUMN:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QBrush(QColor(self._status_color(row[4])))
+            if role == Qt.ItemDataRole.FontRole:
+                return self._bold_font
+            if role == Qt.ItemDataRole.UserRole:
+                return row[4]
+        return None
 
 
 class PrintHistoryTable(ComponentBase):
     """출력 이력 테이블
 
     4개 컬럼: 시간 | 시리얼 번호 | MAC 주소 | 상태
-    테마 변경 시 자동으로 스타일 업데이트
+    테이블 스타일은 전역 QSS(data-variant="history")가 담당하고,
+    테마 변경 시에는 상태 열 글자색만 갱신합니다.
     """
 
-    def __init__(self, theme=None, parent=None):
+    def __init__(self, theme=None, parent=None, max_rows: int = 500):
         super().__init__(parent)
         self.theme = theme or Theme()
-        self._history_data = []
+        self.model = PrintHistoryModel(max_rows, self)
 
-        # 테이블 위젯 생성
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
-            "시간", "시리얼 번호", "MAC 주소", "상태"
-        ])
+        # 테이블 뷰 생성
+        self.table = QTableView(self)
+        self.table.setProperty("data-variant", "history")  # QSS 셀렉터용
+        self.table.setModel(self.model)
 
         # 테이블 설정
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -47,7 +187,8 @@ class PrintHistoryTable(ComponentBase):
         header.resizeSection(0, 100)
         header.resizeSection(3, 80)
 
-        # 행 높이 설정
+        # 행 높이 고정 (행 추가 시 높이 재계산 없음)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(40)
 
         # 레이아웃
@@ -55,99 +196,13 @@ class PrintHistoryTable(ComponentBase):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.table)
 
-        # 초기 스타일 적용
-        self._apply_theme_style()
-
         # 테마 변경 시그널 연결
         theme_mgr = get_theme_manager()
         theme_mgr.theme_changed.connect(self._on_theme_changed)
 
-    def _apply_theme_style(self):
-        """현재 테마에 맞는 스타일 적용"""
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-        is_dark = theme_mgr.mode == ThemeMode.DARK
-
-        # 다크모드와 라이트모드에서 확실히 보이는 색상 사용
-        if is_dark:
-            bg_color = "#0D1117"
-            alt_bg_color = "#161B22"
-            header_bg = "#21262D"
-            border_color = "#30363D"
-            text_color = "#E6EDF3"
-            hover_color = "#30363D"
-        else:
-            bg_color = "#FFFFFF"
-            alt_bg_color = "#F6F8FA"
-            header_bg = "#F6F8FA"
-            border_color = "#D0D7DE"
-            text_color = "#1F2328"
-            hover_color = "#EAEEF2"
-
-        self.table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {bg_color};
-                alternate-background-color: {alt_bg_color};
-                border: 1px solid {border_color};
-                border-radius: 8px;
-                gridline-color: {border_color};
-                color: {text_color};
-                font-size: 13px;
-            }}
-            QTableWidget::item {{
-                padding: 8px 12px;
-                border-bottom: 1px solid {border_color};
-                color: {text_color};
-            }}
-            QTableWidget::item:hover {{
-                background-color: {hover_color};
-            }}
-            QTableWidget::item:selected {{
-                background-color: {colors.PRIMARY};
-                color: #FFFFFF;
-            }}
-            QHeaderView::section {{
-                background-color: {header_bg};
-                color: {text_color};
-                font-weight: 600;
-                font-size: 13px;
-                padding: 10px 12px;
-                border: none;
-                border-bottom: 2px solid {border_color};
-                border-right: 1px solid {border_color};
-            }}
-            QHeaderView::section:last {{
-                border-right: none;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {bg_color};
-                width: 8px;
-                border-radius: 4px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {colors.GRAY_400};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {colors.GRAY_500};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
-
     def _on_theme_changed(self, theme_mode: str):
-        """테마 변경 시 스타일 및 데이터 업데이트"""
-        self._apply_theme_style()
-        # 상태 색상 업데이트를 위해 데이터 다시 설정
-        if self._history_data:
-            self.set_history(self._history_data)
+        """테마 변경 시 상태 열 색상만 업데이트"""
+        self.model.refresh_status_colors()
 
     def set_history(self, history_list):
         """이력 데이터 설정
@@ -163,68 +218,15 @@ class PrintHistoryTable(ComponentBase):
                 ...
             ]
         """
-        self._history_data = history_list
-        self.table.setRowCount(0)
+        self.model.set_records(history_list)
 
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        for record in history_list:
-            row_idx = self.table.rowCount()
-            self.table.insertRow(row_idx)
-
-            # 시간 (HH:MM:SS 형식으로 변환)
-            datetime_str = record.get('print_datetime', '')
-            time_str = ''
-            if datetime_str:
-                try:
-                    time_str = datetime_str.split('T')[1].split('.')[0]
-                except Exception:
-                    time_str = datetime_str
-
-            time_item = QTableWidgetItem(time_str)
-            time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, time_item)
-
-            # 시리얼 번호
-            serial_item = QTableWidgetItem(record.get('serial_number', ''))
-            serial_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.table.setItem(row_idx, 1, serial_item)
+    def prepend_records(self, records):
+        """새 이력을 맨 위에 추가 (records는 최신순)"""
+        self.model.prepend_records(records)
 
-            # MAC 주소
-            mac_address = record.get('mac_address', '')
-            mac_item = QTableWidgetItem(mac_address)
-            mac_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.table.setItem(row_idx, 2, mac_item)
-
-            # 상태
-            status = record.get('status', '')
-            if status == 'success':
-                status_display = "성공"
-                status_color = colors.SUCCESS
-            elif status == 'failed':
-                status_display = "실패"
-                status_color = colors.ERROR
-            else:
-                status_display = "-"
-                status_color = colors.GRAY_500
-
-            status_item = QTableWidgetItem(status_display)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setForeground(QBrush(QColor(status_color)))
-
-            # 상태 폰트 굵게
-            font = QFont()
-            font.setBold(True)
-            status_item.setFont(font)
-
-            self.table.setItem(row_idx, 3, status_item)
+    def row_count(self) -> int:
+        return self.model.rowCount()
 
     def clear(self):
         """테이블 초기화"""
-        self._history_data = []
-        self.table.setRowCount(0)
+        self.model.clear()
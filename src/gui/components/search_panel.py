@@ -3,20 +3,25 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QVBoxLayout, QLabel, QLineEdit,
     QPushButton, QDateEdit
 )
-from PyQt6.QtCore import pyqtSignal, QDate
+from PyQt6.QtCore import pyqtSignal, QDate, QTimer
 from ..core import ComponentBase, Theme
 
 
 class SearchPanel(ComponentBase):
     """검색 패널
 
+    입력 중에는 마지막 입력 후 SEARCH_DEBOUNCE_MS가 지나면 자동으로 검색하며,
+    검색 버튼/Enter는 즉시 검색합니다.
+
     Signals:
-        search_requested: 검색 버튼 클릭 시 필터 딕셔너리 전달
+        search_requested: 검색 요청 시 필터 딕셔너리 전달
         reset_requested: 초기화 버튼 클릭 시
     """
     search_requested = pyqtSignal(dict)
     reset_requested = pyqtSignal()
 
+    SEARCH_DEBOUNCE_MS = 300
+
     def __init__(self, theme=None, parent=None):
         super().__init__(parent)
         self.theme = theme or Theme()
@@ -105,18 +110,51 @@ class SearchPanel(ComponentBase):
         self.result_label.setProperty("data-role", "result-count")  # QSS 셀렉터용
         main_layout.addWidget(self.result_label)
 
+        # ========== 입력 중 자동 검색 (디바운스) ==========
+        self._last_filters = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._on_debounced_search)
+
+        self.serial_input.textChanged.connect(self._schedule_search)
+        self.mac_input.textChanged.connect(self._schedule_search)
+        self.date_from.dateChanged.connect(self._schedule_search)
+        self.date_to.dateChanged.connect(self._schedule_search)
+        self.serial_input.returnPressed.connect(self._on_search)
+        self.mac_input.returnPressed.connect(self._on_search)
+
+    def _schedule_search(self, *_):
+        """입력 변경 시 디바운스 타이머 재시작"""
+        self._debounce.start()
+
+    def _on_debounced_search(self):
+        """디바운스 만료 - 필터가 바뀐 경우에만 검색"""
+        if self.get_filters() != self._last_filters:
+            self._on_search()
+
     def _on_search(self):
-        """검색 버튼 클릭"""
+        """검색 버튼 클릭 / Enter"""
+        self._debounce.stop()
         filters = self.get_filters()
+        self._last_filters = filters
         self.search_requested.emit(filters)
 
     def _on_reset(self):
         """초기화 버튼 클릭"""
-        # 필터 초기화
+        self._debounce.stop()
+        self._last_filters = None
+
+        # 필터 초기화 (자동 검색이 예약되지 않도록 시그널 차단)
+        inputs = (self.date_from, self.date_to, self.serial_input, self.mac_input)
+        for widget in inputs:
+            widget.blockSignals(True)
         self.date_from.setDate(QDate.currentDate().addMonths(-1))
         self.date_to.setDate(QDate.currentDate())
         self.serial_input.clear()
         self.mac_input.clear()
+        for widget in inputs:
+            widget.blockSignals(False)
 
         self.reset_requested.emit()
 
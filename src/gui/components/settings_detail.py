@@ -1,4 +1,5 @@
 """설정 상세 패널 (VSCode 스타일)"""
+import logging
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea, QStackedWidget, QFileDialog
 from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from ..core import Theme, LayoutSystem
@@ -9,10 +10,11 @@ from .setting_item import (
     SelectWithButtonSettingItem,
     InputWithButtonSettingItem
 )
-from ...printer.zebra_win_controller import ZebraWinController
-import serial.tools.list_ports
+from ..services.task_executor import get_task_executor
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 class SettingsDetailPanel(QStackedWidget):
     """설정 상세 패널 (스택 위젯)"""
 
@@ -57,20 +59,21 @@ class SettingsDetailPanel(QStackedWidget):
         """프린터 설정 패널"""
         panel, layout = self._create_scroll_panel("하드웨어 > 프린터")
 
-        # 프린터 선택
-        printer_options = self._scan_printers()
+        # 프린터 선택 (프린터 큐 검색은 백그라운드에서 진행 후 목록 갱신)
+        self._pending_printer = None
         self.printer_item = SelectWithButtonSettingItem(
             "printer_selection",
             "Printer Selection",
-            printer_options if printer_options else ["연결된 프린터 없음"],
+            ["자동 검색 (권장)"],
             "🔄 새로고침",
-            default=printer_options[0] if printer_options else "연결된 프린터 없음",
+            default="자동 검색 (권장)",
             description="USB로 연결된 프린터를 선택하세요. 네트워크 프린터는 지원하지 않습니다.",
             theme=self.theme
         )
         self.printer_item.value_changed.connect(self.setting_changed.emit)
         self.printer_item.button_clicked.connect(self._on_refresh_printers)
         layout.addWidget(self.printer_item)
+        self._on_refresh_printers()
 
         # PRN 템플릿
         prn_templates = self._scan_prn_templates()
@@ -94,18 +97,20 @@ class SettingsDetailPanel(QStackedWidget):
         """시리얼 포트 설정 패널"""
         panel, layout = self._create_scroll_panel("하드웨어 > 시리얼 포트")
 
-        # 포트
-        com_ports = self._scan_com_ports()
+        # 포트 (COM 포트 열거는 백그라운드에서 진행 후 목록 갱신)
+        self._pending_serial_port = None
+        self._scanning_ports = False
         self.serial_port_item = SelectSettingItem(
             "serial_port",
             "Port",
-            com_ports if com_ports else ["포트 없음"],
-            default=com_ports[0] if com_ports else "포트 없음",
+            ["포트 검색 중..."],
+            default="포트 검색 중...",
             description="MCU와 통신할 시리얼 포트를 선택하세요.",
             theme=self.theme
         )
         self.serial_port_item.value_changed.connect(self._on_serial_port_changed)
         layout.addWidget(self.serial_port_item)
+        self._refresh_com_ports()
 
         # 보드레이트
         self.serial_baudrate_item = SelectSettingItem(
@@ -302,17 +307,88 @@ class SettingsDetailPanel(QStackedWidget):
         self.setting_changed.emit(key, str_value)
 
     def _on_refresh_printers(self):
-        """프린터 새로고침"""
-        printer_options = self._scan_printers()
-        self.printer_item.combo.clear()
-        self.printer_item.combo.addItems(printer_options if printer_options else ["연결된 프린터 없음"])
-        self.printer_item.combo.setCurrentIndex(0)
+        """프린터 새로고침 (장치 레인에서 검색)"""
+        self.printer_item.button.setEnabled(False)
+        get_task_executor().submit(
+            self._scan_printers, lane="device", key="scan_printers"
+        ).then(self._apply_printer_options)
+
+    def _apply_printer_options(self, printer_options):
+        """검색된 프린터 목록 적용 (선택값 유지)"""
+        selected = self._pending_printer or self.printer_item.get_value()
+        self._pending_printer = None
+
+        combo = self.printer_item.combo
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(printer_options if printer_options else ["연결된 프린터 없음"])
+        combo.setCurrentIndex(0)
+        combo.blockSignals(False)
+
+        self.printer_item.set_value(selected)
+        self.printer_item.button.setEnabled(True)
+
+    def set_printer_selection(self, value: str):
+        """저장된 프린터 선택값 적용 (검색 중이면 완료 후 적용)"""
+        self._pending_printer = value if not self.printer_item.button.isEnabled() else None
+        self.printer_item.set_value(value)
+
+    def get_printer_selection(self) -> str:
+        """선택된 프린터 (검색 중이면 적용 대기 중인 저장값)"""
+        if not self.printer_item.button.isEnabled() and self._pending_printer:
+            return self._pending_printer
+        return self.printer_item.get_value()
+
+    def _refresh_com_ports(self):
+        """COM 포트 새로고침 (장치 레인에서 검색 - Windows SetupAPI 열거가 느릴 수 있음)"""
+        self._scanning_ports = True
+        get_task_executor().submit(
+            self._scan_com_ports, lane="device", key="scan_com_ports"
+        ).then(self._apply_com_ports)
+
+    def _apply_com_ports(self, com_ports):
+        """검색된 COM 포트 목록 적용 (검색 중에 받은 저장값 선택)"""
+        selected = self._pending_serial_port
+        self._pending_serial_port = None
+        self._scanning_ports = False
+
+        combo = self.serial_port_item.combo
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(com_ports)
+        combo.setCurrentIndex(0)
+        combo.blockSignals(False)
+
+        if selected:
+            self.set_serial_port(selected)
+
+    def set_serial_port(self, port: str):
+        """저장된 시리얼 포트 선택 (COM5 -> COM5 - ... 형식으로 매칭, 검색 중이면 완료 후 적용)"""
+        if self._scanning_ports:
+            self._pending_serial_port = port
+            return
+
+        combo = self.serial_port_item.combo
+        for i in range(combo.count()):
+            item_text = combo.itemText(i)
+            if item_text.startswith(port + ' - ') or item_text == port:
+                combo.setCurrentIndex(i)
+                return
+        if combo.count() > 0:
+            combo.setCurrentIndex(0)
+
+    def get_serial_port(self) -> str:
+        """선택된 시리얼 포트 항목 (검색 중이면 적용 대기 중인 저장값)"""
+        if self._scanning_ports:
+            return self._pending_serial_port or "포트 없음"
+        return self.serial_port_item.get_value()
 
     def _scan_printers(self):
         """프린터 검색 (시스템 프린터 큐)"""
         options = ["자동 검색 (권장)"]
 
         try:
+            from ...printer.zebra_win_controller import ZebraWinController
             zebra_ctrl = ZebraWinController()
 
             # 시스템 프린터 큐 목록 가져오기
@@ -323,7 +399,7 @@ class SettingsDetailPanel(QStackedWidget):
                 if 'zebra' in queue.lower() or 'zdesigner' in queue.lower() or 'zpl' in queue.lower():
                     options.append(f"[프린터 큐] {queue}")
 
-            print(f"프린터 큐 검색 완료: {len(queues)}개 발견")
+            logger.info("프린터 큐 검색 완료: %d개 발견", len(queues))
 
             if len(options) == 1:
                 options.append("연결된 프린터 없음 - 프린터 드라이버를 설치하세요")
@@ -331,14 +407,13 @@ class SettingsDetailPanel(QStackedWidget):
             return options
 
         except Exception as e:
-            print(f"프린터 검색 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("프린터 검색 오류: %s", e)
             return ["자동 검색 (권장)", "⚠️ 프린터 검색 오류 - 콘솔 메시지를 확인하세요"]
 
     def _scan_com_ports(self):
         """COM 포트 검색"""
         try:
+            import serial.tools.list_ports
             ports = serial.tools.list_ports.comports()
             port_list = []
 
@@ -348,7 +423,7 @@ class SettingsDetailPanel(QStackedWidget):
 
             return port_list if port_list else ["포트 없음"]
         except Exception as e:
-            print(f"COM 포트 검색 오류: {e}")
+            logger.warning("COM 포트 검색 오류: %s", e)
             return ["포트 없음"]
 
     def _scan_prn_templates(self):
@@ -364,5 +439,5 @@ class SettingsDetailPanel(QStackedWidget):
             prn_files = list(prn_folder.glob("*.prn"))
             return [f.name for f in sorted(prn_files)]
         except Exception as e:
-            print(f"PRN 템플릿 검색 오류: {e}")
+            logger.warning("PRN 템플릿 검색 오류: %s", e)
             return []
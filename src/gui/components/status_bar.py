@@ -1,7 +1,9 @@
 """상태바 컴포넌트 - 프린터/MCU 연결 상태 표시"""
+import html
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 from ..core import Theme
+from ..styles import DynamicStyle
 
 class StatusBar(QWidget):
     """하단 상태바 - 연결 상태 표시"""
@@ -32,6 +34,14 @@ class StatusBar(QWidget):
 
         layout.addStretch()
 
+    def set_latency_summary(self, table: str):
+        """인쇄 단계별 지연 시간 표를 툴팁으로 표시
+
+        Args:
+            table: Tracer.format_table() 결과 (고정폭 텍스트)
+        """
+        self.setToolTip(f"<pre>{html.escape(table)}</pre>")
+
     def set_printer_status(self, status: str, detail: str = ""):
         """
         프린터 상태 설정
@@ -42,22 +52,20 @@ class StatusBar(QWidget):
         """
         if status == "connected":
             icon = "✓"
-            color = self.theme.colors.SUCCESS
             text = f"프린터: {icon} 연결됨"
             if detail:
                 text += f" ({detail})"
         elif status == "disconnected":
             icon = "✗"
-            color = self.theme.colors.ERROR
             text = f"프린터: {icon} 연결 안 됨"
         else:  # checking
             icon = "🔄"
-            color = self.theme.colors.GRAY_600
             text = f"프린터: {icon} 확인 중..."
 
         self.printer_label.setText(text)
-        # 동적 색상은 인라인 스타일 유지
-        self.printer_label.setStyleSheet(f"color: {color};")
+        # 색상은 QSS의 data-status 셀렉터로 적용 (테마 전환 시 자동 반영)
+        if self.printer_label.property('data-status') != status:
+            DynamicStyle.set_status(self.printer_label, status)
 
     def set_mcu_status(self, status: str, detail: str = ""):
         """
@@ -69,25 +77,22 @@ class StatusBar(QWidget):
         """
         if status == "connected":
             icon = "✓"
-            color = self.theme.colors.SUCCESS
             text = f"MCU: {icon} 연결됨"
             if detail:
                 text += f" ({detail})"
         elif status == "disconnected":
             icon = "✗"
-            color = self.theme.colors.ERROR
             text = f"MCU: {icon} 연결 안 됨"
         elif status == "reconnecting":
             icon = "🔄"
-            color = self.theme.colors.GRAY_600
             text = f"MCU: {icon} 재연결 중..."
             if detail:
                 text += f" ({detail})"
         else:  # checking
             icon = "🔄"
-            color = self.theme.colors.GRAY_600
             text = f"MCU: {icon} 확인 중..."
 
         self.mcu_label.setText(text)
-        # 동적 색상은 인라인 스타일 유지
-        self.mcu_label.setStyleSheet(f"color: {color};")
\ No newline at end of file
+        # 색상은 QSS의 data-status 셀렉터로 적용 (테마 전환 시 자동 반영)
+        if self.mcu_label.property('data-status') != status:
+            DynamicStyle.set_status(self.mcu_label, status)
\ No newline at end of file
@@ -1,14 +1,47 @@
 """메인 레이아웃"""
 from PyQt6.QtWidgets import QHBoxLayout, QStackedWidget
+from PyQt6.QtCore import pyqtSignal
 from ..core import ComponentBase, LayoutSystem, Theme
 from .sidebar import Sidebar
-from ..views.home_view import HomeView
-from ..views.lot_config_view import LotConfigView
-from ..views.settings_view import SettingsView
-from ..views.history_view import HistoryView
+
+
+def _create_home_view(theme):
+    from ..views.home_view import HomeView
+    return HomeView(theme)
+
+
+def _create_config_view(theme):
+    from ..views.lot_config_view import LotConfigView
+    return LotConfigView(theme)
+
+
+def _create_settings_view(theme):
+    from ..views.settings_view import SettingsView
+    return SettingsView(theme)
+
+
+def _create_history_view(theme):
+    from ..views.history_view import HistoryView
+    return HistoryView(theme)
+
 
 class MainLayout(ComponentBase):
-    """메인 레이아웃 - 사이드바 + 페이지"""
+    """메인 레이아웃 - 사이드바 + 페이지
+
+    뷰는 처음 이동할 때 생성됩니다 (홈 화면만 즉시 생성).
+    생성 시 view_created 시그널로 알려 데이터 로드도 그때 수행합니다.
+    """
+
+    # (page_id, view) - 뷰가 처음 생성되었을 때
+    view_created = pyqtSignal(str, object)
+
+    # 페이지별 뷰 팩토리
+    VIEW_FACTORIES = {
+        "home": _create_home_view,
+        "config": _create_config_view,
+        "settings": _create_settings_view,
+        "history": _create_history_view,
+    }
 
     def __init__(self, theme=None, parent=None):
         super().__init__(parent)
@@ -26,25 +59,8 @@ class MainLayout(ComponentBase):
         self.stack = QStackedWidget()
         self.stack.setObjectName("MainStack")
 
-        # 뷰 생성
-        self.home_view = HomeView(self.theme)
-        self.config_view = LotConfigView(self.theme)
-        self.settings_view = SettingsView(self.theme)
-        self.history_view = HistoryView(self.theme)
-
-        # 스택에 추가
-        self.stack.addWidget(self.home_view)      # index 0
-        self.stack.addWidget(self.config_view)    # index 1
-        self.stack.addWidget(self.settings_view)  # index 2
-        self.stack.addWidget(self.history_view)   # index 3
-
-        # 페이지 매핑
-        self.page_map = {
-            "home": 0,
-            "config": 1,
-            "settings": 2,
-            "history": 3
-        }
+        # 생성된 뷰 (page_id → view)
+        self._views = {}
 
         # 레이아웃 조립
         layout.addWidget(self.sidebar)
@@ -55,8 +71,25 @@ class MainLayout(ComponentBase):
 
     def _on_page_changed(self, page_id):
         """페이지 변경"""
-        if page_id in self.page_map:
-            self.stack.setCurrentIndex(self.page_map[page_id])
+        view = self.ensure_view(page_id)
+        if view is not None:
+            self.stack.setCurrentWidget(view)
+
+    def ensure_view(self, page_id):
+        """뷰 가져오기 (없으면 생성)"""
+        view = self._views.get(page_id)
+        if view is not None:
+            return view
+
+        factory = self.VIEW_FACTORIES.get(page_id)
+        if factory is None:
+            return None
+
+        view = factory(self.theme)
+        self._views[page_id] = view
+        self.stack.addWidget(view)
+        self.view_created.emit(page_id, view)
+        return view
 
     def show_page(self, page_id):
         """외부에서 페이지 변경"""
@@ -64,11 +97,26 @@ class MainLayout(ComponentBase):
         self._on_page_changed(page_id)
 
     def get_view(self, page_id):
-        """뷰 가져오기"""
-        views = {
-            "home": self.home_view,
-            "config": self.config_view,
-            "settings": self.settings_view,
-            "history": self.history_view
-        }
-        return views.get(page_id)
+        """뷰 가져오기 (아직 생성되지 않았으면 None)"""
+        return self._views.get(page_id)
+
+    def created_views(self):
+        """생성된 뷰 목록 [(page_id, view), ...]"""
+        return list(self._views.items())
+
+    # 하위 호환 속성
+    @property
+    def home_view(self):
+        return self.ensure_view("home")
+
+    @property
+    def config_view(self):
+        return self.ensure_view("config")
+
+    @property
+    def settings_view(self):
+        return self.ensure_view("settings")
+
+    @property
+    def history_view(self):
+        return self.ensure_view("history")
@@ -2,11 +2,12 @@
 from PyQt6.QtWidgets import QVBoxLayout, QPushButton, QLabel
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
 from ..core import ComponentBase, LayoutSystem
-from ..styles import get_theme_manager
+from ..styles import get_theme_manager, ColorTokens, DarkColorTokens
 from ..utils import SvgIcon
 
 class Sidebar(ComponentBase):
     """사이드바"""
+    ICON_SIZE = 20
     page_changed = pyqtSignal(str)  # "home", "print", "config", "settings", "history"
     theme_toggle_requested = pyqtSignal()  # 다크 모드 토글 요청
 
@@ -53,6 +54,16 @@ class Sidebar(ComponentBase):
         # 초기 선택
         self._set_active("home")
 
+        # 테마 전환/메뉴 선택 시 쓰일 아이콘을 미리 렌더링
+        self._prerender_icons()
+
+    def _prerender_icons(self):
+        """두 테마의 비활성/활성 아이콘을 백그라운드에서 사전 렌더링"""
+        colors = []
+        for tokens in (ColorTokens(), DarkColorTokens()):
+            colors.extend([tokens.GRAY_600, tokens.PRIMARY])
+        SvgIcon.prerender(colors, self.ICON_SIZE)
+
     def _create_menu_button(self, text, page_id):
         """메뉴 버튼 생성 (SVG 아이콘 포함)"""
         btn = QPushButton(text)
@@ -63,9 +74,9 @@ class Sidebar(ComponentBase):
 
         # SVG 아이콘 설정 (테마에 맞는 색상)
         theme_mgr = get_theme_manager()
-        icon = SvgIcon.create_icon(page_id, theme_mgr.colors.GRAY_600, 20)
+        icon = SvgIcon.create_icon(page_id, theme_mgr.colors.GRAY_600, self.ICON_SIZE)
         btn.setIcon(icon)
-        btn.setIconSize(QSize(20, 20))
+        btn.setIconSize(QSize(self.ICON_SIZE, self.ICON_SIZE))
 
         # 스타일은 QSS에서 처리 (_sidebar.qss)
         return btn
@@ -105,30 +116,21 @@ class Sidebar(ComponentBase):
             "history": self.history_btn
         }
 
-        # 테마에서 색상 가져오기
+        # 테마에서 색상 가져오기 (아이콘은 IconCache에서 재사용)
         theme_mgr = get_theme_manager()
         inactive_color = theme_mgr.colors.GRAY_600  # 비활성: 테마에 맞는 회색
+        active_color = theme_mgr.colors.PRIMARY     # 활성: 프라이머리 색상
 
-        # 모든 버튼 비활성화 및 아이콘 색상 업데이트
         for btn_id, btn in btn_map.items():
-            btn.setProperty("active", "false")
-            # 비활성 상태 아이콘 (테마에 맞는 색상)
-            icon = SvgIcon.create_icon(btn_id, inactive_color, 20)
+            active = btn_id == page_id
+            btn.setProperty("active", "true" if active else "false")
+            icon = SvgIcon.create_icon(
+                btn_id, active_color if active else inactive_color, self.ICON_SIZE
+            )
             btn.setIcon(icon)
             btn.style().unpolish(btn)
             btn.style().polish(btn)
 
-        # 선택된 버튼 활성화 및 아이콘 색상 업데이트
-        if page_id in btn_map:
-            btn_map[page_id].setProperty("active", "true")
-            # 활성 상태 아이콘 (프라이머리 색상)
-            active_icon = SvgIcon.create_icon(
-                page_id, theme_mgr.colors.PRIMARY, 20
-            )
-            btn_map[page_id].setIcon(active_icon)
-            btn_map[page_id].style().unpolish(btn_map[page_id])
-            btn_map[page_id].style().polish(btn_map[page_id])
-
     def set_current_page(self, page_id):
         """외부에서 페이지 설정"""
         self._set_active(page_id)
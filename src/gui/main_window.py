@@ -4,8 +4,10 @@
 비즈니스 로직은 services/ 모듈로 분리되어 있습니다.
 """
 
+import logging
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout
 from PyQt6.QtCore import QTimer
@@ -14,11 +16,17 @@ from .core import Theme
 from .styles import ThemeManager
 from .layouts.main_layout import MainLayout
 from .components import ToastManager, StatusBar
-from .services import PrintService, ConfigurationService, HistoryService
+from .services import PrintService, ConfigurationService, HistoryService, get_task_executor
+from ..services import HistoryExportService, JournalSyncWorker, SequenceLeaser
+from .utils import StallWatchdog
 from ..database.db_manager import DBManager
+from ..database.history_reader import HistoryReader
+from ..database.journal import JournaledDBManager, PrintJournal
+from ..database.remote import RemoteDBManager
 from ..printer.print_controller import PrintController
-from ..printer.zebra_win_controller import ZebraWinController
-from ..mcu.mcu_monitor import MCUMonitor
+from ..utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
@@ -60,6 +68,10 @@ class MainWindow(QMainWindow):
         # 초기 데이터 로드
         self._schedule_initial_load()
 
+        # 이벤트 루프 정지 감시 (50 ms 이상 막히는 슬롯 로그)
+        self.stall_watchdog = StallWatchdog(threshold_ms=50, parent=self)
+        self.stall_watchdog.start()
+
         # 디버그 모드
         if debug_mode or Theme.DEBUG:
             self._enable_debug_mode()
@@ -90,20 +102,43 @@ class MainWindow(QMainWindow):
         else:
             self.app_base_dir = Path(__file__).parent.parent.parent
 
-        db_path = self.app_base_dir / "data" / "label_printer.db"
-        self.db = DBManager(str(db_path))
+        # 공유 DB 서버를 쓰는 스테이션 (python src/main.py db-server)
+        # 인쇄 기록은 로컬 저널에 먼저 남기므로 서버가 끊겨도 인쇄를 계속할 수 있음
+        db_url = os.environ.get('LABEL_PRINTER_DB_URL')
+        if db_url:
+            journal = PrintJournal(str(self.app_base_dir / "data" / "print_journal.db"))
+            self.db = JournaledDBManager(RemoteDBManager(db_url), journal)
+        else:
+            self.db = DBManager(str(self.app_base_dir / "data" / "label_printer.db"))
         self.db.initialize()
+        self.is_remote_db = bool(db_url)
 
     def _setup_services(self):
         """서비스 레이어 초기화"""
+        # 인쇄 경로 단계별 지연 시간 수집 (상태바 툴팁에 표시)
+        self.tracer = get_tracer()
+        self.tracer.enabled = True
+
         self.print_controller = PrintController()
-        self.print_service = PrintService(self.db, self.print_controller)
-        self.config_service = ConfigurationService(self.db)
-        self.history_service = HistoryService(self.db)
+        # 공유 DB 서버면 생산순서를 블록으로 임대받아 라벨마다 서버 왕복을 하지 않음
+        self.sequence_leaser = SequenceLeaser(self.db) if self.is_remote_db else None
+        self.print_service = PrintService(self.db, self.print_controller, self.sequence_leaser)
+        self.journal_sync = JournalSyncWorker(self.db).start() if self.is_remote_db else None
+        self.config_service = ConfigurationService(self.db, self.sequence_leaser)
+        # 읽기 연결/내보내기는 DB 파일이 있어야 함 (공유 DB 서버면 서버 쪽에서 실행)
+        self.history_reader = None if self.is_remote_db else HistoryReader(self.db.db_path)
+        self.history_service = HistoryService(self.db, self.history_reader)
+        self.export_service = None if self.is_remote_db else HistoryExportService(self.db.db_path)
+        self._home_loaded_date = None  # 홈 이력이 로드된 날짜 (증분 갱신 기준)
+
+        # DB/프린터 I/O는 백그라운드에서 실행하고 결과만 GUI 스레드로 전달
+        self.executor = get_task_executor()
+        self._print_task = None
 
     def _setup_devices(self):
         """장치 관련 초기화"""
         self.mcu_monitor = None
+        self.serial_capture = None
         self.latest_mac_address = None
 
         # 백업 타이머
@@ -132,29 +167,10 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self):
         """시그널 연결"""
-        # Home View
-        home = self.main_layout.get_view("home")
-        if home:
-            home.reset_clicked.connect(self._load_home_data)
-            home.print_requested.connect(self._on_print)
-            home.test_requested.connect(self._on_test_print)
-
-        # Config View
-        config = self.main_layout.get_view("config")
-        if config:
-            config.config_saved.connect(self._on_config_saved)
-
-        # Settings View
-        settings = self.main_layout.get_view("settings")
-        if settings:
-            settings.settings_saved.connect(self._on_settings_saved)
-
-        # History View
-        history = self.main_layout.get_view("history")
-        if history:
-            history.search_requested.connect(self._on_history_search)
-            history.refresh_requested.connect(self._on_history_refresh)
-            history.delete_requested.connect(self._on_history_delete)
+        # 뷰는 처음 이동할 때 생성되므로 생성 시점에 연결
+        self.main_layout.view_created.connect(self._on_view_created)
+        for page_id, view in self.main_layout.created_views():
+            self._connect_view(page_id, view)
 
         # Sidebar - 테마 토글
         self.main_layout.sidebar.theme_toggle_requested.connect(
@@ -164,12 +180,43 @@ class MainWindow(QMainWindow):
         # ThemeManager - 테마 변경 시그널
         self.theme_manager.theme_changed.connect(self._on_theme_changed)
 
+    def _connect_view(self, page_id: str, view):
+        """뷰 시그널 연결"""
+        if page_id == "home":
+            view.reset_clicked.connect(self._load_home_data)
+            view.print_requested.connect(self._on_print)
+            view.test_requested.connect(self._on_test_print)
+        elif page_id == "config":
+            view.config_saved.connect(self._on_config_saved)
+        elif page_id == "settings":
+            view.settings_saved.connect(self._on_settings_saved)
+        elif page_id == "history":
+            view.search_requested.connect(self._on_history_search)
+            view.refresh_requested.connect(self._on_history_refresh)
+            view.delete_requested.connect(self._on_history_delete)
+            view.export_requested.connect(self._on_history_export)
+            view.export_cancel_requested.connect(self._on_history_export_cancel)
+
+    def _on_view_created(self, page_id: str, view):
+        """뷰 최초 생성 시 시그널 연결 및 데이터 로드"""
+        self._connect_view(page_id, view)
+
+        loaders = {
+            "home": self._load_home_data,
+            "config": self._load_lot_config,
+            "settings": self._load_settings,
+            "history": self._on_history_refresh,
+        }
+        loader = loaders.get(page_id)
+        if loader:
+            loader()
+
     def _schedule_initial_load(self):
-        """초기 데이터 로드 스케줄링"""
+        """초기 데이터 로드 스케줄링
+
+        LOT 설정/앱 설정/이력 화면은 처음 이동할 때 로드됩니다.
+        """
         QTimer.singleShot(100, self._load_home_data)
-        QTimer.singleShot(150, self._load_lot_config)
-        QTimer.singleShot(200, self._load_settings)
-        QTimer.singleShot(250, self._on_history_refresh)
         QTimer.singleShot(350, self._check_printer_status)
         QTimer.singleShot(450, self._start_mcu_monitor)
         QTimer.singleShot(550, self._start_backup_timer)
@@ -177,20 +224,51 @@ class MainWindow(QMainWindow):
     # ==================== 홈 화면 ====================
 
     def _load_home_data(self):
-        """홈 화면 데이터 로드"""
-        try:
-            data = self.config_service.load_home_data(self.latest_mac_address)
+        """홈 화면 데이터 로드 (백그라운드 조회)"""
+        self.executor.submit(
+            self.config_service.load_home_data, self.latest_mac_address, key="home"
+        ).then(
+            self._apply_home_data,
+            on_error=lambda e: logger.error("홈 데이터 로드 오류: %s", e)
+        )
+
+    def _apply_home_data(self, data: dict):
+        """조회된 홈 화면 데이터 적용"""
+        home = self.main_layout.get_view("home")
+        if home:
+            stats = data['stats']
+            home.set_stats(stats['total'], stats['success'], stats['failed'])
+            home.set_serial_info(data['last_serial'], data['next_serial'])
+            home.set_mac_address(self.latest_mac_address)
+            home.set_history(data['history'])
+            self._home_loaded_date = datetime.now().strftime('%Y-%m-%d')
 
-            home = self.main_layout.get_view("home")
-            if home:
-                stats = data['stats']
-                home.set_stats(stats['total'], stats['success'], stats['failed'])
-                home.set_serial_info(data['last_serial'], data['next_serial'])
-                home.set_mac_address(data['mac_address'])
-                home.set_history(data['history'])
+    def _update_home_after_print(self, record, next_serial):
+        """출력 1건을 홈 화면에 증분 반영
 
+        오늘 이력 전체를 다시 읽지 않고 새 레코드만 테이블 맨 위에 추가하며,
+        통계는 증분으로 갱신합니다. 날짜가 바뀌었으면 전체를 다시 로드합니다.
+
+        Args:
+            record: 저장된 이력 레코드 (None이면 전체 로드)
+            next_serial: 다음 시리얼 번호
+        """
+        home = self.main_layout.get_view("home")
+        if not home:
+            return
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        if record is None or self._home_loaded_date != today:
+            self._load_home_data()
+            return
+
+        try:
+            home.add_print_records([record])
+            home.set_serial_info(record['serial_number'], next_serial)
+            home.set_mac_address(self.latest_mac_address)
         except Exception as e:
-            print(f"홈 데이터 로드 오류: {e}")
+            logger.error("홈 화면 갱신 오류: %s", e)
+            self._load_home_data()
 
     # ==================== 인쇄 처리 ====================
 
@@ -203,11 +281,14 @@ class MainWindow(QMainWindow):
         self._execute_print(test_mode=True)
 
     def _execute_print(self, test_mode: bool = False):
-        """인쇄 실행
+        """인쇄 실행 (백그라운드)
 
         Args:
             test_mode: 테스트 모드 여부
         """
+        if self._print_task is not None:
+            return  # 이전 인쇄 진행 중
+
         home = self.main_layout.get_view("home")
         mode_text = "테스트 인쇄" if test_mode else "인쇄"
 
@@ -215,154 +296,245 @@ class MainWindow(QMainWindow):
         if home:
             home.set_print_buttons_enabled(False)
 
-        try:
-            # 프린터 상태 체크
-            self._check_printer_status()
+        # 프린터 상태 체크 (인쇄와 병행)
+        self._check_printer_status()
 
-            # LOT 설정 로드
-            lot_config = self.config_service.load_lot_config()
+        self._print_task = self.executor.submit(
+            self._run_print_job, self.latest_mac_address, test_mode
+        ).then(
+            lambda job: self._on_print_finished(job, test_mode),
+            on_error=lambda e: self._on_print_failed(e, mode_text)
+        )
+
+    def _run_print_job(self, mac_address, test_mode: bool) -> dict:
+        """인쇄 작업 (워커 스레드에서 실행 - 위젯 접근 금지)
 
-            # 생산순서 계산 (실제 인쇄만)
+        Returns:
+            {'result': 인쇄 결과, 'record': 저장된 이력, 'next_serial': 다음 시리얼}
+        """
+        job = self.print_service.run_print_job(mac_address, test_mode)
+        job['next_serial'] = None
+        if job['result']['success'] and not test_mode:
+            job['next_serial'], _ = self.config_service.load_next_serial()
+        return job
+
+    def _on_print_finished(self, job: dict, test_mode: bool):
+        """인쇄 작업 완료 처리"""
+        self._finish_print()
+        mode_text = "테스트 인쇄" if test_mode else "인쇄"
+        result = job['result']
+
+        if result['success']:
             if not test_mode:
-                sequence = self.print_service.calculate_next_sequence(lot_config)
-                lot_config['production_sequence'] = sequence
-
-            # 인쇄 실행
-            result = self.print_service.execute_print(
-                lot_config=lot_config,
-                mac_address=self.latest_mac_address,
-                test_mode=test_mode
-            )
+                # MAC 주소 초기화
+                self.latest_mac_address = None
+                # 홈 화면 증분 갱신
+                self._update_home_after_print(job['record'], job['next_serial'])
 
-            # 결과 처리
-            if result['success']:
-                # DB 저장 (실제 인쇄만)
-                if not test_mode:
-                    prn_template = self.config_service.get_config('prn_template')
-                    self.print_service.save_print_result(
-                        result, lot_config, prn_template
-                    )
-                    # MAC 주소 초기화
-                    self.latest_mac_address = None
-                    # 홈 화면 새로고침
-                    self._load_home_data()
-
-                self.toast.show_success(
-                    f"{mode_text} 완료! {result['serial_number']}"
-                )
-            else:
-                self.toast.show_error(result['message'])
+            self.toast.show_success(
+                f"{mode_text} 완료! {result['serial_number']}"
+            )
+        else:
+            self.toast.show_error(result['message'])
 
-        except Exception as e:
-            self.toast.show_error(f"{mode_text} 실패: {str(e)}", duration=5000)
+    def _on_print_failed(self, error, mode_text: str):
+        """인쇄 작업 오류 처리"""
+        self._finish_print()
+        self.toast.show_error(f"{mode_text} 실패: {str(error)}", duration=5000)
 
-        finally:
-            # 버튼 다시 활성화
-            if home:
-                home.set_print_buttons_enabled(True)
+    def _finish_print(self):
+        """인쇄 작업 종료 (버튼 다시 활성화)"""
+        self._print_task = None
+        self.status_bar.set_latency_summary(self.tracer.format_table())
+        home = self.main_layout.get_view("home")
+        if home:
+            home.set_print_buttons_enabled(True)
 
     # ==================== 설정 관리 ====================
 
     def _load_lot_config(self):
         """LOT 설정 로드"""
-        try:
-            config_view = self.main_layout.get_view("config")
-            if config_view:
-                lot_config = self.config_service.load_lot_config()
-                if lot_config:
-                    config_view.set_config(lot_config)
-        except Exception as e:
-            print(f"LOT 설정 로드 오류: {e}")
+        self.executor.submit(self.config_service.load_lot_config, key="lot_config").then(
+            self._apply_lot_config,
+            on_error=lambda e: logger.error("LOT 설정 로드 오류: %s", e)
+        )
+
+    def _apply_lot_config(self, lot_config: dict):
+        config_view = self.main_layout.get_view("config")
+        if config_view and lot_config:
+            config_view.set_config(lot_config)
 
     def _on_config_saved(self, config: dict):
         """LOT 설정 저장"""
-        try:
-            self.config_service.save_lot_config(config)
+        def saved(_):
             self._load_home_data()
             self.toast.show_success("LOT 설정이 저장되었습니다.")
-        except Exception as e:
-            self.toast.show_error(f"LOT 설정 저장 실패: {str(e)}")
+
+        self.executor.submit(self.config_service.save_lot_config, config).then(
+            saved,
+            on_error=lambda e: self.toast.show_error(f"LOT 설정 저장 실패: {str(e)}")
+        )
 
     def _load_settings(self):
         """앱 설정 로드"""
-        try:
-            settings_view = self.main_layout.get_view("settings")
-            if settings_view:
-                settings = self.config_service.load_settings()
-                if settings:
-                    settings_view.set_settings(settings)
-        except Exception as e:
-            print(f"설정 로드 오류: {e}")
+        self.executor.submit(self.config_service.load_settings, key="settings").then(
+            self._apply_settings,
+            on_error=lambda e: logger.error("설정 로드 오류: %s", e)
+        )
+
+    def _apply_settings(self, settings: dict):
+        settings_view = self.main_layout.get_view("settings")
+        if settings_view and settings:
+            settings_view.set_settings(settings)
 
     def _on_settings_saved(self, settings: dict):
         """앱 설정 저장"""
-        try:
-            self.config_service.save_settings(settings)
-            self.toast.show_success("설정이 저장되었습니다.")
-        except Exception as e:
-            self.toast.show_error(f"설정 저장 실패: {str(e)}")
+        self.executor.submit(self.config_service.save_settings, settings).then(
+            lambda _: self.toast.show_success("설정이 저장되었습니다."),
+            on_error=lambda e: self.toast.show_error(f"설정 저장 실패: {str(e)}")
+        )
 
     # ==================== 이력 관리 ====================
 
     def _on_history_search(self, filters: dict):
-        """이력 검색"""
-        try:
-            history_view = self.main_layout.get_view("history")
-            if history_view:
-                history = self.history_service.search(filters)
-                history_view.set_history(history, update_count=True)
-        except Exception as e:
-            self.toast.show_error(f"검색 실패: {str(e)}")
+        """이력 검색 (이전 검색/새로고침은 취소)"""
+        self._submit_history_query(
+            self.history_service.search, filters, error_text="검색 실패"
+        )
 
     def _on_history_refresh(self):
         """이력 새로고침"""
-        try:
-            history_view = self.main_layout.get_view("history")
-            if history_view:
-                history = self.history_service.get_all()
-                history_view.set_history(history, update_count=True)
-        except Exception as e:
-            self.toast.show_error(f"새로고침 실패: {str(e)}")
+        self._submit_history_query(
+            self.history_service.get_all, error_text="새로고침 실패"
+        )
+
+    def _submit_history_query(self, fn, *args, error_text: str):
+        """이력 조회 제출 (검색 레인)
+
+        새 조회가 들어오면 이전 조회는 취소되고, 실행 중인 SQLite 쿼리는
+        읽기 연결의 interrupt()로 즉시 중단됩니다.
+        """
+        handle = self.executor.submit(fn, *args, lane="search", key="history")
+        handle.cancelled.connect(self.history_service.interrupt)
+        handle.then(
+            self._apply_history,
+            on_error=lambda e: self.toast.show_error(f"{error_text}: {str(e)}")
+        )
+
+    def _apply_history(self, history: list):
+        history_view = self.main_layout.get_view("history")
+        if history_view:
+            history_view.set_history(history, update_count=True)
 
     def _on_history_delete(self, record_id: int):
         """이력 삭제"""
-        try:
-            if self.history_service.delete(record_id):
+        def deleted(success):
+            if success:
                 self.toast.show_success("이력이 삭제되었습니다.")
                 self._on_history_refresh()
                 self._load_home_data()
             else:
                 self.toast.show_error("삭제할 항목을 찾을 수 없습니다.")
-        except Exception as e:
-            self.toast.show_error(f"삭제 실패: {str(e)}")
+
+        self.executor.submit(self.history_service.delete, record_id).then(
+            deleted,
+            on_error=lambda e: self.toast.show_error(f"삭제 실패: {str(e)}")
+        )
+
+    def _on_history_export(self, path: str, filters: dict):
+        """이력 내보내기 (export 레인, 진행률 표시/취소 가능)"""
+        if self.export_service is None:
+            self.toast.show_error("공유 DB 서버를 사용 중입니다. 서버 PC에서 export 명령으로 내보내세요.")
+            return
+
+        history_view = self.main_layout.get_view("history")
+        history_view.set_export_running(True)
+
+        def finished(result):
+            history_view.set_export_running(False)
+            self.toast.show_success(f"{result['rows']:,}건을 내보냈습니다: {Path(result['path']).name}")
+
+        def failed(e):
+            history_view.set_export_running(False)
+            self.toast.show_error(f"내보내기 실패: {str(e)}")
+
+        def cancelled():
+            history_view.set_export_running(False)
+            self.toast.show_info("내보내기가 취소되었습니다.")
+
+        handle = self.executor.submit(
+            self.export_service.export, path, filters,
+            lane="export", key="export", reports_progress=True,
+        )
+        handle.progress.connect(history_view.set_export_progress)
+        handle.cancelled.connect(self.export_service.interrupt)
+        handle.cancelled.connect(cancelled)
+        handle.then(finished, on_error=failed)
+
+    def _on_history_export_cancel(self):
+        """실행 중인 내보내기 취소"""
+        self.executor.cancel("export")
 
     # ==================== 장치 관리 ====================
 
     def _check_printer_status(self):
-        """프린터 상태 체크"""
-        try:
-            zebra = ZebraWinController()
-            printers = zebra.get_zebra_printers()
-            if printers:
-                self.status_bar.set_printer_status("connected", printers[0])
-            else:
-                self.status_bar.set_printer_status("disconnected")
-        except Exception as e:
-            print(f"프린터 상태 체크 오류: {e}")
+        """프린터 상태 체크 (장치 레인에서 검색)"""
+        def scan():
+            # zebra 라이브러리는 여기서 처음 로드 (장치 레인)
+            from ..printer.zebra_win_controller import ZebraWinController
+            return ZebraWinController().get_zebra_printers()
+
+        def on_error(e):
+            logger.warning("프린터 상태 체크 오류: %s", e)
+            self.status_bar.set_printer_status("disconnected")
+
+        self.executor.submit(scan, lane="device", key="printer_status").then(
+            self._apply_printer_status, on_error=on_error
+        )
+
+    def _apply_printer_status(self, printers):
+        if printers:
+            self.status_bar.set_printer_status("connected", printers[0])
+        else:
             self.status_bar.set_printer_status("disconnected")
 
     def _start_mcu_monitor(self):
+        """MCU 모니터 시작 (설정은 백그라운드 조회)"""
+        def load():
+            return {
+                key: self.config_service.get_config(key)
+                for key in ('serial_port', 'serial_baudrate', 'serial_capture_enabled')
+            }
+
+        def on_error(e):
+            logger.error("MCU 모니터 시작 오류: %s", e)
+            self.status_bar.set_mcu_status("disconnected")
+
+        self.executor.submit(load).then(self._start_mcu_monitor_with, on_error=on_error)
+
+    def _start_mcu_monitor_with(self, config: dict):
         """MCU 모니터 시작"""
         try:
-            serial_port = self.config_service.get_config('serial_port')
+            serial_port = config['serial_port']
             if not serial_port:
                 self.status_bar.set_mcu_status("disconnected")
                 return
 
-            baudrate = self.config_service.get_config('serial_baudrate')
+            baudrate = config['serial_baudrate']
             baudrate = int(baudrate) if baudrate else 115200
 
-            self.mcu_monitor = MCUMonitor(serial_port, baudrate)
+            # pyserial/MCU 모듈은 포트가 설정된 경우에만 로드
+            from ..mcu.mcu_monitor import MCUMonitor
+            from ..serial_comm.capture import SerialCapture
+
+            # 시리얼 캡처 (문제 재현용 원본 데이터 기록)
+            if config['serial_capture_enabled'] == 'true':
+                capture_path = self.app_base_dir / "logs" / "serial_capture.bin"
+                self.serial_capture = SerialCapture(str(capture_path))
+
+            self.mcu_monitor = MCUMonitor(
+                serial_port, baudrate, capture=self.serial_capture
+            )
             self.mcu_monitor.connection_status_changed.connect(
                 self._on_mcu_status_changed
             )
@@ -370,7 +542,7 @@ class MainWindow(QMainWindow):
             self.mcu_monitor.start()
 
         except Exception as e:
-            print(f"MCU 모니터 시작 오류: {e}")
+            logger.error("MCU 모니터 시작 오류: %s", e)
             self.status_bar.set_mcu_status("disconnected")
 
     def _on_mcu_status_changed(self, status: str, detail: str):
@@ -386,40 +558,52 @@ class MainWindow(QMainWindow):
             home.set_mac_address(mac_address)
 
         # 자동 인쇄 확인
-        auto_print = self.config_service.get_config('auto_print_on_mac_detected')
-        if auto_print == 'true':
-            QTimer.singleShot(100, self._on_print)
+        def check_auto_print(auto_print):
+            if auto_print == 'true':
+                QTimer.singleShot(100, self._on_print)
+
+        self.executor.submit(
+            self.config_service.get_config, 'auto_print_on_mac_detected'
+        ).then(check_auto_print)
 
     # ==================== 백업 ====================
 
     def _start_backup_timer(self):
         """백업 타이머 시작"""
-        try:
-            if self.config_service.get_config('backup_enabled') == 'true':
-                interval = self.config_service.get_config('backup_interval')
+        def load():
+            return (
+                self.config_service.get_config('backup_enabled'),
+                self.config_service.get_config('backup_interval'),
+            )
+
+        def start(config):
+            enabled, interval = config
+            if enabled == 'true' and not self.is_remote_db:
                 interval = int(interval) if interval else 3600
                 self.backup_timer.start(interval * 1000)
-        except Exception as e:
-            print(f"백업 타이머 시작 오류: {e}")
 
-    def _do_backup(self):
-        """백업 실행"""
-        try:
-            from datetime import datetime
+        self.executor.submit(load).then(
+            start, on_error=lambda e: logger.error("백업 타이머 시작 오류: %s", e)
+        )
 
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"label_printer_{timestamp}.db"
+    def _do_backup(self):
+        """백업 실행 (백그라운드)"""
+        self.executor.submit(self._run_backup, key="backup").then(
+            None, on_error=lambda e: logger.error("백업 실패: %s", e)
+        )
 
-            user_path = self.config_service.get_config('backup_path')
-            if user_path and user_path.strip():
-                backup_dir = Path(user_path)
-            else:
-                backup_dir = self.app_base_dir / "backup"
+    def _run_backup(self):
+        """백업 작업 (워커 스레드에서 실행)"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"label_printer_{timestamp}.db"
 
-            self.db.backup(str(backup_dir / filename))
+        user_path = self.config_service.get_config('backup_path')
+        if user_path and user_path.strip():
+            backup_dir = Path(user_path)
+        else:
+            backup_dir = self.app_base_dir / "backup"
 
-        except Exception as e:
-            print(f"백업 실패: {e}")
+        self.db.backup(str(backup_dir / filename))
 
     # ==================== 테마 ====================
 
@@ -442,9 +626,34 @@ class MainWindow(QMainWindow):
         if self.mcu_monitor:
             self.mcu_monitor.stop()
 
+        if self.serial_capture:
+            self.serial_capture.close()
+
         if self.backup_timer:
             self.backup_timer.stop()
 
+        self.stall_watchdog.stop()
+        self.history_service.interrupt()
+        self.executor.shutdown()
+        if self.history_reader is not None:
+            self.history_reader.close()
+
+        if self.sequence_leaser is not None:
+            try:
+                self.sequence_leaser.close()
+            except Exception as e:
+                logger.warning("생산순서 반납 실패: %s", e)
+
+        if self.journal_sync is not None:
+            status = self.journal_sync.stop()
+            if status['pending']:
+                logger.warning("저널 미전송 %d건 (다음 실행 시 전송)", status['pending'])
+
+        try:
+            self.tracer.save(str(self.app_base_dir / "logs" / "latency_stats.json"))
+        except Exception as e:
+            logger.warning("지연 시간 통계 저장 실패: %s", e)
+
         event.accept()
 
     def _enable_debug_mode(self):
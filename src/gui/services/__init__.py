@@ -1,14 +1,20 @@
 """GUI 서비스 레이어
 
 비즈니스 로직을 MainWindow에서 분리하여 관리합니다.
+Qt와 무관한 PrintService/ConfigurationService는 src.services에 있으며
+기존 import 경로 호환을 위해 여기서도 내보냅니다.
 """
 
-from .print_service import PrintService
-from .configuration_service import ConfigurationService
+from ...services import PrintService, ConfigurationService
 from .history_service import HistoryService
+from .task_executor import TaskExecutor, TaskHandle, TaskCancelledError, get_task_executor
 
 __all__ = [
     'PrintService',
     'ConfigurationService',
     'HistoryService',
+    'TaskExecutor',
+    'TaskHandle',
+    'TaskCancelledError',
+    'get_task_executor',
 ]
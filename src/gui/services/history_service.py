@@ -3,18 +3,35 @@
 인쇄 이력 조회, 검색, 삭제를 담당합니다.
 """
 
+from collections import OrderedDict
 from typing import Optional
 
+from ...database.records import from_dicts
+
 
 class HistoryService:
-    """이력 관리 서비스"""
+    """이력 관리 서비스
+
+    reader(HistoryReader)가 주어지면 조회/검색은 별도의 읽기 연결에서 실행되며,
+    결과는 필터 조합별로 캐시됩니다. 캐시는 다른 연결의 커밋(PRAGMA data_version)이
+    감지되면 비워집니다.
+    """
+
+    CACHE_SIZE = 32
 
-    def __init__(self, db):
+    def __init__(self, db, reader=None):
         """
         Args:
             db: DBManager 인스턴스
+            reader: HistoryReader 인스턴스 (선택, 검색 취소/캐시용)
         """
         self.db = db
+        self.reader = reader
+
+        self._cache: "OrderedDict[tuple, list]" = OrderedDict()
+        self._cache_version: Optional[int] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def get_all(self, limit: int = 1000) -> list:
         """전체 이력 조회
@@ -25,7 +42,7 @@ class HistoryService:
         Returns:
             이력 목록
         """
-        return self.db.get_print_history(limit=limit)
+        return self._query(limit=limit)
 
     def search(self, filters: dict) -> list:
         """이력 검색
@@ -40,7 +57,7 @@ class HistoryService:
         Returns:
             검색 결과 목록
         """
-        return self.db.get_print_history(
+        return self._query(
             limit=1000,
             date_from=filters.get('date_from'),
             date_to=filters.get('date_to'),
@@ -48,6 +65,36 @@ class HistoryService:
             mac_address=filters.get('mac_address')
         )
 
+    def _query(self, **conditions) -> list:
+        """이력 조회 (읽기 연결 + 필터 조합별 캐시)"""
+        if self.reader is None:
+            # 공유 DB 서버는 dict를 반환 → 읽기 연결과 같은 HistoryRecord로 맞춤
+            return from_dicts(self.db.get_print_history(**conditions))
+
+        version = self.reader.data_version()
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+
+        key = tuple(sorted(conditions.items()))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        rows = self.reader.search(**conditions)
+        self._cache[key] = rows
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rows
+
+    def interrupt(self) -> None:
+        """실행 중인 검색 중단 (GUI 스레드에서 호출 가능)"""
+        if self.reader is not None:
+            self.reader.interrupt()
+
     def delete(self, record_id: int) -> bool:
         """이력 삭제 및 생산순서 업데이트
 
@@ -0,0 +1,272 @@
+"""백그라운드 작업 실행기
+
+DB 조회, 프린터 검색/스풀 등 블로킹 I/O를 QThreadPool에서 실행하고
+결과를 시그널로 GUI 스레드에 전달합니다.
+
+레인(lane)별로 별도의 스레드 풀을 사용합니다.
+- "db": DBManager는 연결 하나를 공유하므로 스레드 1개로 직렬 실행
+- "search": 이력 검색 (HistoryReader 전용 연결, 취소 가능)
+- "device": 프린터 큐 검색 등 DB와 무관한 장치 I/O
+- "export": 이력 내보내기 (오래 걸리므로 다른 레인을 막지 않도록 분리)
+
+사용 예:
+    executor = get_task_executor()
+    executor.submit(history_service.search, filters, key="history").then(
+        view.set_history, on_error=lambda e: toast.show_error(str(e))
+    )
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskCancelledError(Exception):
+    """취소된 작업의 결과를 요청한 경우"""
+
+
+class TaskHandle(QObject):
+    """작업 결과 핸들 (future 유사)
+
+    공개 시그널(finished/failed/cancelled)은 항상 GUI 스레드에서 발생하며,
+    취소된 작업은 결과가 도착해도 finished를 발생시키지 않습니다.
+    """
+
+    finished = pyqtSignal(object)   # 결과
+    failed = pyqtSignal(object)     # 예외
+    cancelled = pyqtSignal()
+    progress = pyqtSignal(object)   # 진행 상황 (reports_progress 작업)
+
+    # 워커 스레드 -> GUI 스레드 전달용 (queued)
+    _result_ready = pyqtSignal(object)
+    _error_ready = pyqtSignal(object)
+    _progress_ready = pyqtSignal(object)
+
+    def __init__(self, name: str = "", key: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.key = key
+
+        self._done = threading.Event()
+        self._cancelled = False
+        self._settled = False   # GUI 스레드에 결과 전달 완료
+        self._result = None
+        self._error: Optional[BaseException] = None
+
+        self._result_ready.connect(self._on_result)
+        self._error_ready.connect(self._on_error)
+        self._progress_ready.connect(self._on_progress)
+
+    # ==================== 상태 ====================
+
+    def cancel(self) -> bool:
+        """작업 취소 (결과가 이미 전달된 경우 False)
+
+        실행 전이면 실행하지 않고, 실행 중이거나 전달 대기 중이면 결과를 버립니다.
+        """
+        if self._cancelled or self._settled:
+            return False
+        self._cancelled = True
+        self.cancelled.emit()
+        return True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업 완료 대기 (시그널 전달 없이, 테스트/종료 처리용)"""
+        return self._done.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """작업 결과 (완료될 때까지 대기)
+
+        Raises:
+            TaskCancelledError: 취소된 작업
+            TimeoutError: timeout 초과
+            Exception: 작업에서 발생한 예외
+        """
+        if self._cancelled:
+            raise TaskCancelledError(self.name)
+        if not self._done.wait(timeout):
+            raise TimeoutError(self.name)
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def then(self, on_result: Optional[Callable[[Any], None]],
+             on_error: Optional[Callable[[BaseException], None]] = None) -> "TaskHandle":
+        """결과/예외 콜백 연결 (GUI 스레드에서 호출)
+
+        Returns:
+            self (체이닝용)
+        """
+        if on_result is not None:
+            self.finished.connect(on_result)
+        if on_error is not None:
+            self.failed.connect(on_error)
+        return self
+
+    # ==================== 워커 스레드 측 ====================
+
+    def report_progress(self, value) -> None:
+        """진행 상황 전달 (워커 스레드에서 호출)"""
+        if not self._cancelled:
+            self._progress_ready.emit(value)
+
+    def _set_result(self, result):
+        self._result = result
+        self._done.set()
+        self._result_ready.emit(result)
+
+    def _set_error(self, error: BaseException):
+        self._error = error
+        self._done.set()
+        self._error_ready.emit(error)
+
+    # ==================== GUI 스레드 측 ====================
+
+    def _on_result(self, result):
+        if not self._cancelled:
+            self._settled = True
+            self.finished.emit(result)
+
+    def _on_error(self, error):
+        if not self._cancelled:
+            self._settled = True
+            self.failed.emit(error)
+
+    def _on_progress(self, value):
+        if not self._cancelled and not self._settled:
+            self.progress.emit(value)
+
+
+class _TaskRunnable(QRunnable):
+    """QThreadPool에서 함수를 실행하는 QRunnable"""
+
+    def __init__(self, handle: TaskHandle, fn: Callable, args: tuple, kwargs: dict):
+        super().__init__()
+        self.handle = handle
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        if self.handle.is_cancelled():
+            self.handle._done.set()
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.handle._set_error(e)
+        else:
+            self.handle._set_result(result)
+
+
+class TaskExecutor(QObject):
+    """레인별 QThreadPool 작업 실행기"""
+
+    # 레인 이름: 최대 스레드 수
+    DEFAULT_LANES = {
+        "db": 1,
+        "search": 1,
+        "device": 2,
+        "export": 1,
+    }
+
+    def __init__(self, lanes: Optional[Dict[str, int]] = None, parent=None):
+        """
+        Args:
+            lanes: {레인 이름: 최대 스레드 수} (None이면 DEFAULT_LANES)
+        """
+        super().__init__(parent)
+        self._pools: Dict[str, QThreadPool] = {}
+        for lane, max_threads in (lanes or self.DEFAULT_LANES).items():
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(max_threads)
+            self._pools[lane] = pool
+
+        self._latest: Dict[str, TaskHandle] = {}   # key별 최신 작업
+        self._pending = set()                      # 완료 전 핸들 (GC 방지)
+
+        # 통계
+        self.submitted = 0
+        self.superseded = 0
+
+    def submit(self, fn: Callable, *args, lane: str = "db", key: Optional[str] = None,
+               reports_progress: bool = False, **kwargs) -> TaskHandle:
+        """작업 제출
+
+        Args:
+            fn: 실행할 함수 (워커 스레드에서 호출됨, 위젯 접근 금지)
+            *args, **kwargs: fn 인자
+            lane: 실행 레인 ("db", "search", "device", "export")
+            key: 같은 key의 이전 작업은 취소됨 (연속 검색 등)
+            reports_progress: True면 fn에 progress=handle.report_progress,
+                is_cancelled=handle.is_cancelled 인자를 추가로 전달
+
+        Returns:
+            TaskHandle
+        """
+        if lane not in self._pools:
+            raise ValueError(f"알 수 없는 레인: {lane}")
+
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None and previous.cancel():
+                self.superseded += 1
+
+        handle = TaskHandle(getattr(fn, '__qualname__', repr(fn)), key)
+        handle.finished.connect(lambda _: self._release(handle))
+        handle.failed.connect(lambda _: self._release(handle))
+        handle.cancelled.connect(lambda: self._release(handle))
+
+        self._pending.add(handle)
+        if key is not None:
+            self._latest[key] = handle
+
+        if reports_progress:
+            kwargs.update(progress=handle.report_progress, is_cancelled=handle.is_cancelled)
+
+        self.submitted += 1
+        self._pools[lane].start(_TaskRunnable(handle, fn, args, kwargs))
+        return handle
+
+    def _release(self, handle: TaskHandle):
+        self._pending.discard(handle)
+        if handle.key is not None and self._latest.get(handle.key) is handle:
+            del self._latest[handle.key]
+
+    def cancel(self, key: str) -> bool:
+        """key에 해당하는 작업 취소"""
+        handle = self._latest.get(key)
+        return handle.cancel() if handle is not None else False
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """모든 레인의 실행 중 작업 완료 대기"""
+        return all(pool.waitForDone(timeout_ms) for pool in self._pools.values())
+
+    def shutdown(self, timeout_ms: int = 3000) -> bool:
+        """대기 중 작업 취소 후 실행 중 작업 완료 대기 (앱 종료 시)"""
+        for pool in self._pools.values():
+            pool.clear()
+        for handle in list(self._pending):
+            handle.cancel()
+        return self.wait_for_done(timeout_ms)
+
+
+_task_executor: Optional[TaskExecutor] = None
+
+
+def get_task_executor() -> TaskExecutor:
+    """TaskExecutor 싱글톤 인스턴스 반환"""
+    global _task_executor
+    if _task_executor is None:
+        _task_executor = TaskExecutor()
+    return _task_executor
@@ -0,0 +1,174 @@
+"""컴파일된 QSS 캐시
+
+QSS 원본과 토큰 값의 내용 해시를 키로 컴파일 결과(minify 적용)를
+디스크에 저장합니다. 원본이나 토큰이 바뀌면 키가 달라지므로 별도의
+무효화 없이 다시 컴파일됩니다.
+
+배포 빌드(PyInstaller)는 QSS 원본 파일을 포함하지 않으므로, 빌드 전에
+컴파일 결과를 파이썬 모듈(_compiled_qss.py)로 임베드합니다:
+
+    python -m src.gui.styles.style_cache
+"""
+
+import logging
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 임베드 모듈 경로 (빌드 시 생성, git에는 포함하지 않음)
+EMBEDDED_MODULE_PATH = Path(__file__).parent / '_compiled_qss.py'
+
+# 캐시 형식 버전 (컴파일/minify 방식이 바뀌면 증가)
+CACHE_VERSION = 1
+
+
+def compute_key(raw_qss: str, variables: Dict[str, str]) -> str:
+    """QSS 원본 + 변수 값의 내용 해시
+
+    Args:
+        raw_qss: 변수 치환 전 QSS 원본 (기본 + 테마)
+        variables: 변수 맵 {'@primary': '#2563EB', ...}
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(f'v{CACHE_VERSION}\n'.encode('utf-8'))
+    digest.update(raw_qss.encode('utf-8'))
+    for name in sorted(variables):
+        digest.update(f'\n{name}={variables[name]}'.encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (배포 빌드는 AppData)"""
+    if getattr(sys, 'frozen', False):
+        base = Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WF_Label_Printer"
+    else:
+        base = Path(__file__).parent.parent.parent.parent
+    return base / "cache" / "qss"
+
+
+def load_embedded() -> Dict[str, Tuple[str, str]]:
+    """빌드 시 임베드된 QSS 로드
+
+    Returns:
+        {테마 이름: (키, 컴파일된 QSS)} (임베드 모듈이 없으면 빈 dict)
+    """
+    try:
+        from . import _compiled_qss
+    except ImportError:
+        return {}
+    return dict(getattr(_compiled_qss, 'COMPILED', {}))
+
+
+class StyleCache:
+    """컴파일된 QSS 디스크 캐시
+
+    파일 이름: <theme>-<key>.qss
+    같은 테마의 이전 키 파일은 저장 시 삭제됩니다.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본: default_cache_dir())
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+
+        # 통계 (디버깅용)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def _path(self, theme_name: str, key: str) -> Path:
+        return self._cache_dir / f'{theme_name}-{key}.qss'
+
+    def get(self, theme_name: str, key: str) -> Optional[str]:
+        """캐시된 QSS 조회
+
+        Returns:
+            컴파일된 QSS (없으면 None)
+        """
+        try:
+            qss = self._path(theme_name, key).read_text(encoding='utf-8')
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return qss
+
+    def put(self, theme_name: str, key: str, qss: str):
+        """컴파일된 QSS 저장 (실패해도 무시)"""
+        path = self._path(theme_name, key)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(qss, encoding='utf-8')
+            os.replace(tmp_path, path)
+
+            # 같은 테마의 이전 캐시 정리
+            for old in self._cache_dir.glob(f'{theme_name}-*.qss'):
+                if old != path:
+                    old.unlink()
+        except OSError as e:
+            logger.warning("Error writing %s: %s", path.name, e)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if not self._cache_dir.exists():
+            return
+        for path in self._cache_dir.glob('*.qss'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def write_embedded_module(compiled: Dict[str, Tuple[str, str]], path: Path = EMBEDDED_MODULE_PATH):
+    """컴파일된 QSS를 파이썬 모듈로 저장
+
+    Args:
+        compiled: {테마 이름: (키, 컴파일된 QSS)}
+        path: 출력 모듈 경로
+    """
+    lines = [
+        '"""빌드 시 생성된 컴파일 QSS (직접 수정 금지)\n',
+        '\n',
+        '생성: python -m src.gui.styles.style_cache\n',
+        '"""\n',
+        '\n',
+        'COMPILED = {\n',
+    ]
+    for theme_name in sorted(compiled):
+        key, qss = compiled[theme_name]
+        lines.append(f'    {theme_name!r}: ({key!r}, {qss!r}),\n')
+    lines.append('}\n')
+
+    Path(path).write_text(''.join(lines), encoding='utf-8')
+
+
+def main() -> int:
+    """모든 테마를 컴파일하여 임베드 모듈 생성 (빌드 전 실행)"""
+    from .theme_manager import ThemeManager, ThemeMode
+
+    manager = ThemeManager()
+    compiled = {mode.value: manager.compile_theme(mode) for mode in ThemeMode}
+    write_embedded_module(compiled)
+
+    for theme_name, (key, qss) in sorted(compiled.items()):
+        print(f"✓ {theme_name}: {len(qss)} bytes (key {key[:8]})")
+    print(f"→ {EMBEDDED_MODULE_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 """QSS 템플릿 컴파일러 - 변수 치환"""
 
+import logging
 import re
 from typing import Dict, List, Tuple
 
+logger = logging.getLogger(__name__)
+
 
 class StyleCompiler:
     """QSS 템플릿 변수 치환 컴파일러
@@ -33,7 +36,7 @@ class StyleCompiler:
             value = variables.get(var_name)
             if value is None:
                 # 정의되지 않은 변수는 그대로 유지 (디버깅용)
-                print(f"[StyleCompiler] Warning: undefined variable {var_name}")
+                logger.warning("Undefined variable %s", var_name)
                 return var_name
             return value
 
@@ -1,9 +1,12 @@
 """QSS 파일 로더 + Hot Reload"""
 
+import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from PyQt6.QtCore import QObject, pyqtSignal, QFileSystemWatcher
 
+logger = logging.getLogger(__name__)
+
 
 class StyleLoader(QObject):
     """QSS 파일 로더
@@ -45,14 +48,15 @@ class StyleLoader(QObject):
         self._watcher = QFileSystemWatcher()
         self._hot_reload_enabled = False
         self._cache: Optional[str] = None
+        self._theme_cache: Dict[str, str] = {}
 
     def load_all(self) -> str:
         """모든 QSS 파일 로드 (순서 보장)
 
         Returns:
-            결합된 QSS 문자열
+            결합된 QSS 문자열 (파일 변경 전까지 캐시)
         """
-        if self._cache is not None and not self._hot_reload_enabled:
+        if self._cache is not None:
             return self._cache
 
         combined_qss = []
@@ -65,7 +69,7 @@ class StyleLoader(QObject):
                     combined_qss.append(f'/* === {qss_path} === */')
                     combined_qss.append(content)
                 except Exception as e:
-                    print(f"[StyleLoader] Error loading {qss_path}: {e}")
+                    logger.error("Error loading %s: %s", qss_path, e)
 
         self._cache = '\n'.join(combined_qss)
         return self._cache
@@ -77,15 +81,21 @@ class StyleLoader(QObject):
             theme_name: 테마 이름 (예: 'light', 'dark')
 
         Returns:
-            테마 QSS 문자열
+            테마 QSS 문자열 (파일 변경 전까지 캐시)
         """
+        if theme_name in self._theme_cache:
+            return self._theme_cache[theme_name]
+
+        content = ''
         theme_path = self._qss_dir / 'themes' / f'{theme_name}.qss'
         if theme_path.exists():
             try:
-                return theme_path.read_text(encoding='utf-8')
+                content = theme_path.read_text(encoding='utf-8')
             except Exception as e:
-                print(f"[StyleLoader] Error loading theme {theme_name}: {e}")
-        return ''
+                logger.error("Error loading theme %s: %s", theme_name, e)
+
+        self._theme_cache[theme_name] = content
+        return content
 
     def get_all_qss_files(self) -> List[Path]:
         """모든 QSS 파일 경로 반환"""
@@ -134,7 +144,7 @@ class StyleLoader(QObject):
     def _on_file_changed(self, path: str):
         """파일 변경 시 호출"""
         # 캐시 무효화
-        self._cache = None
+        self.invalidate_cache()
 
         # 파일이 삭제 후 재생성되면 watcher에서 제거되므로 다시 추가
         if path not in self._watcher.files():
@@ -143,8 +153,9 @@ class StyleLoader(QObject):
 
         # 시그널 발생
         self.file_changed.emit(path)
-        print(f"[StyleLoader] Hot Reload: {Path(path).name}")
+        logger.info("Hot Reload: %s", Path(path).name)
 
     def invalidate_cache(self):
         """캐시 무효화"""
         self._cache = None
+        self._theme_cache.clear()
@@ -1,13 +1,18 @@
 """테마 매니저 - 싱글톤 패턴"""
 
+import logging
+import sys
 from enum import Enum
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
 from .tokens import ColorTokens, DarkColorTokens, TypographyTokens, SpacingTokens
 from .style_loader import StyleLoader
 from .style_compiler import StyleCompiler
+from .style_cache import StyleCache, compute_key, load_embedded
+
+logger = logging.getLogger(__name__)
 
 
 class ThemeMode(Enum):
@@ -21,7 +26,7 @@ class ThemeManager(QObject):
 
     기능:
     - 테마 전환 (Light/Dark)
-    - QSS 컴파일 및 적용
+    - QSS 컴파일 및 적용 (테마별 메모리/디스크 캐시)
     - Hot Reload 지원
     - 테마 변경 시그널
     """
@@ -42,6 +47,11 @@ class ThemeManager(QObject):
         self._style_compiler = StyleCompiler()
         self._compiled_qss: str = ""
 
+        # 컴파일 결과 캐시: 메모리(테마별) → 임베드(배포 빌드) → 디스크
+        self._compiled_by_mode: Dict[ThemeMode, str] = {}
+        self._style_cache = StyleCache()
+        self._embedded = load_embedded() if getattr(sys, 'frozen', False) else {}
+
         # 토큰 인스턴스
         self._light_colors = ColorTokens()
         self._dark_colors = DarkColorTokens()
@@ -84,7 +94,7 @@ class ThemeManager(QObject):
             self._recompile_styles()
             self._apply_to_app()
             self.theme_changed.emit(mode.value)
-            print(f"[ThemeManager] Theme changed to: {mode.value}")
+            logger.info("Theme changed to: %s", mode.value)
 
     def toggle_theme(self):
         """라이트/다크 토글"""
@@ -108,7 +118,7 @@ class ThemeManager(QObject):
 
         if app:
             app.setStyleSheet(self.get_compiled_stylesheet())
-            print("[ThemeManager] Stylesheet applied to app")
+            logger.debug("Stylesheet applied to app")
 
     def _apply_to_app(self):
         """내부용: 현재 앱에 스타일 적용"""
@@ -117,34 +127,72 @@ class ThemeManager(QObject):
             app.setStyleSheet(self._compiled_qss)
 
     def _recompile_styles(self):
-        """QSS 재컴파일"""
+        """현재 테마의 컴파일된 QSS 준비 (캐시 우선)"""
+        qss = self._compiled_by_mode.get(self._mode)
+        if qss is None:
+            qss = self._load_compiled(self._mode)
+            self._compiled_by_mode[self._mode] = qss
+        self._compiled_qss = qss
+
+    def _load_compiled(self, mode: ThemeMode) -> str:
+        """임베드/디스크 캐시에서 로드, 없으면 컴파일 후 디스크에 저장"""
+        # 배포 빌드: 빌드 시 임베드된 결과 사용 (파일 I/O, 컴파일 없음)
+        embedded = self._embedded.get(mode.value)
+        if embedded is not None:
+            return embedded[1]
+
+        raw_qss, variables = self._build_source(mode)
+        key = compute_key(raw_qss, variables)
+
+        qss = self._style_cache.get(mode.value, key)
+        if qss is None:
+            qss = self._compile(raw_qss, variables)
+            self._style_cache.put(mode.value, key, qss)
+        return qss
+
+    def compile_theme(self, mode: ThemeMode) -> Tuple[str, str]:
+        """캐시를 거치지 않고 테마 컴파일 (빌드 시 임베드용)
+
+        Returns:
+            (캐시 키, minify된 QSS)
+        """
+        raw_qss, variables = self._build_source(mode)
+        return compute_key(raw_qss, variables), self._compile(raw_qss, variables)
+
+    def _build_source(self, mode: ThemeMode) -> Tuple[str, Dict[str, str]]:
+        """테마의 QSS 원본(기본 + 테마 오버라이드)과 변수 맵"""
         # 기본 QSS 로드
         raw_qss = self._style_loader.load_all()
 
         # 테마별 오버라이드 로드
-        theme_qss = self._style_loader.load_theme(self._mode.value)
+        theme_qss = self._style_loader.load_theme(mode.value)
         if theme_qss:
-            raw_qss += f'\n/* === themes/{self._mode.value}.qss === */\n'
+            raw_qss += f'\n/* === themes/{mode.value}.qss === */\n'
             raw_qss += theme_qss
 
-        # 변수 치환
-        variables = self._get_variable_map()
+        return raw_qss, self._get_variable_map(mode)
 
+    def _compile(self, raw_qss: str, variables: Dict[str, str]) -> str:
+        """변수 치환 + minify"""
         # 유효성 검증 (개발 모드)
         errors = self._style_compiler.validate(raw_qss, variables)
         if errors:
             for line, msg in errors:
-                print(f"[ThemeManager] QSS Error line {line}: {msg}")
+                logger.warning("QSS Error line %s: %s", line, msg)
 
         # 컴파일
-        self._compiled_qss = self._style_compiler.compile(raw_qss, variables)
+        compiled = self._style_compiler.compile(raw_qss, variables)
+        return self._style_compiler.minify(compiled)
+
+    def _get_variable_map(self, mode: Optional[ThemeMode] = None) -> Dict[str, str]:
+        """테마의 변수 맵 생성 (None이면 현재 테마)"""
+        mode = mode or self._mode
+        colors = self._dark_colors if mode == ThemeMode.DARK else self._light_colors
 
-    def _get_variable_map(self) -> Dict[str, str]:
-        """현재 테마의 변수 맵 생성"""
         variables = {}
 
         # 색상 토큰
-        variables.update(self.colors.to_variable_map())
+        variables.update(colors.to_variable_map())
 
         # 타이포그래피 토큰
         variables.update(self._typography.to_variable_map())
@@ -169,17 +217,18 @@ class ThemeManager(QObject):
             except TypeError:
                 pass
             self._style_loader.file_changed.connect(self._on_qss_changed)
-            print("[ThemeManager] Hot Reload enabled")
+            logger.info("Hot Reload enabled")
         else:
             try:
                 self._style_loader.file_changed.disconnect(self._on_qss_changed)
             except TypeError:
                 pass
-            print("[ThemeManager] Hot Reload disabled")
+            logger.info("Hot Reload disabled")
 
     def _on_qss_changed(self, path: str):
         """QSS 파일 변경 감지"""
         self._style_loader.invalidate_cache()
+        self._compiled_by_mode.clear()
         self._recompile_styles()
         self._apply_to_app()
         self.theme_changed.emit(self._mode.value)
@@ -187,6 +236,7 @@ class ThemeManager(QObject):
     def reload(self):
         """수동 리로드"""
         self._style_loader.invalidate_cache()
+        self._compiled_by_mode.clear()
         self._recompile_styles()
         self._apply_to_app()
 
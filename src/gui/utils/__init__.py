@@ -1,4 +1,6 @@
 from .debug import DebugUtils, enable_debug_mode
+from .icon_cache import IconCache, get_icon_cache
 from .icons import IconProvider
 from .svg_icons import SvgIcon
-__all__ = ['DebugUtils', 'enable_debug_mode', 'IconProvider', 'SvgIcon']
+from .stall_watchdog import StallWatchdog
+__all__ = ['DebugUtils', 'enable_debug_mode', 'IconCache', 'get_icon_cache', 'IconProvider', 'SvgIcon', 'StallWatchdog']
@@ -0,0 +1,237 @@
+"""SVG 아이콘 렌더링 캐시
+
+(이름, 색상, 크기, DPR) 키로 렌더링된 QPixmap을 QPixmapCache에 보관하고,
+QIcon 객체는 최대 개수가 제한된 LRU로 재사용합니다.
+테마 전환이나 사이드바 활성 상태 변경 시 SVG를 다시 파싱/래스터화하지 않습니다.
+
+백그라운드 사전 렌더링은 QImage로 그린 뒤(스레드 안전) 처음 요청될 때
+GUI 스레드에서 QPixmap으로 변환합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from PyQt6.QtCore import QByteArray, QSize, Qt
+from PyQt6.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap, QPixmapCache
+
+
+# (이름, SVG 템플릿, 색상, 크기)
+RenderRequest = Tuple[str, str, str, int]
+
+
+class IconCache:
+    """SVG 아이콘 캐시
+
+    SVG 템플릿의 "currentColor"를 색상으로 치환하여 렌더링합니다.
+    """
+
+    KEY_PREFIX = "wf-svg"
+
+    def __init__(self, max_icons: int = 256):
+        """
+        Args:
+            max_icons: 보관할 QIcon 최대 개수 (LRU)
+        """
+        self.max_icons = max_icons
+
+        self._icons: "OrderedDict[str, QIcon]" = OrderedDict()
+        self._pixmap_keys = set()
+        self._prerendered: Dict[str, QImage] = {}
+        self._lock = threading.Lock()
+        self._prerender_thread: Optional[threading.Thread] = None
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._renders = 0
+        self._prerender_hits = 0
+        self._evictions = 0
+        self._render_ms = 0.0
+
+    # ==================== 조회 ====================
+
+    @staticmethod
+    def device_pixel_ratio() -> float:
+        """현재 화면의 DPR (앱이 없으면 1.0)"""
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app else 1.0
+
+    def make_key(self, name: str, color: str, size: int, dpr: float) -> str:
+        """캐시 키 생성"""
+        return f"{self.KEY_PREFIX}:{name}:{color.upper()}:{size}:{dpr:g}"
+
+    def pixmap(self, name: str, svg: str, color: str, size: int, dpr: Optional[float] = None) -> QPixmap:
+        """렌더링된 QPixmap (캐시 우선)
+
+        Args:
+            name: 아이콘 이름 (캐시 키, SVG마다 고유해야 함)
+            svg: "currentColor"를 포함한 SVG 문자열
+            color: 아이콘 색상 (hex)
+            size: 논리 크기 (픽셀)
+            dpr: 장치 픽셀 비율 (None이면 현재 화면)
+
+        Returns:
+            QPixmap 객체
+        """
+        dpr = dpr or self.device_pixel_ratio()
+        key = self.make_key(name, color, size, dpr)
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            self._hits += 1
+            return pixmap
+
+        self._misses += 1
+        with self._lock:
+            image = self._prerendered.pop(key, None)
+
+        if image is not None:
+            self._prerender_hits += 1
+            pixmap = QPixmap.fromImage(image)
+        else:
+            pixmap = QPixmap.fromImage(self._render_image(svg, color, size, dpr))
+
+        QPixmapCache.insert(key, pixmap)
+        self._pixmap_keys.add(key)
+        return pixmap
+
+    def icon(self, name: str, svg: str, color: str, size: int, dpr: Optional[float] = None) -> QIcon:
+        """렌더링된 QIcon (캐시 우선)
+
+        Args:
+            name: 아이콘 이름
+            svg: "currentColor"를 포함한 SVG 문자열
+            color: 아이콘 색상 (hex)
+            size: 논리 크기 (픽셀)
+            dpr: 장치 픽셀 비율 (None이면 현재 화면)
+
+        Returns:
+            QIcon 객체
+        """
+        dpr = dpr or self.device_pixel_ratio()
+        key = self.make_key(name, color, size, dpr)
+
+        icon = self._icons.get(key)
+        if icon is not None:
+            self._icons.move_to_end(key)
+            self._hits += 1
+            return icon
+
+        icon = QIcon(self.pixmap(name, svg, color, size, dpr))
+        self._icons[key] = icon
+        if len(self._icons) > self.max_icons:
+            self._icons.popitem(last=False)
+            self._evictions += 1
+        return icon
+
+    # ==================== 렌더링 ====================
+
+    def _render_image(self, svg: str, color: str, size: int, dpr: float) -> QImage:
+        """SVG를 QImage로 렌더링 (모든 스레드에서 호출 가능)"""
+        # QtSvg는 캐시에 없는 아이콘을 처음 그릴 때만 로드
+        from PyQt6.QtSvg import QSvgRenderer
+
+        started = time.perf_counter()
+
+        renderer = QSvgRenderer(QByteArray(svg.replace("currentColor", color).encode('utf-8')))
+        physical = max(1, round(size * dpr))
+
+        image = QImage(QSize(physical, physical), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+        image.setDevicePixelRatio(dpr)
+
+        with self._lock:
+            self._renders += 1
+            self._render_ms += (time.perf_counter() - started) * 1000
+        return image
+
+    def prerender(self, requests: Iterable[RenderRequest], dpr: Optional[float] = None,
+                  background: bool = True) -> Optional[threading.Thread]:
+        """아이콘 사전 렌더링
+
+        Args:
+            requests: [(이름, SVG, 색상, 크기), ...]
+            dpr: 장치 픽셀 비율 (None이면 현재 화면)
+            background: True면 백그라운드 스레드에서 실행
+
+        Returns:
+            백그라운드 스레드 (background=False면 None)
+        """
+        dpr = dpr or self.device_pixel_ratio()
+        # 이미 QPixmap으로 캐시된 항목은 제외 (QPixmapCache 조회는 호출 스레드에서)
+        requests = [
+            request for request in requests
+            if QPixmapCache.find(self.make_key(request[0], request[2], request[3], dpr)) is None
+        ]
+
+        def work():
+            for name, svg, color, size in requests:
+                key = self.make_key(name, color, size, dpr)
+                with self._lock:
+                    if key in self._prerendered:
+                        continue
+                image = self._render_image(svg, color, size, dpr)
+                with self._lock:
+                    self._prerendered[key] = image
+
+        if not background:
+            work()
+            return None
+
+        self._prerender_thread = threading.Thread(target=work, name="IconPrerender", daemon=True)
+        self._prerender_thread.start()
+        return self._prerender_thread
+
+    # ==================== 관리 ====================
+
+    def stats(self) -> dict:
+        """캐시 통계
+
+        Returns:
+            {
+                'hits': 캐시 적중 수,
+                'misses': 캐시 미스 수,
+                'renders': SVG 렌더링 횟수,
+                'prerender_hits': 사전 렌더링 결과 사용 수,
+                'evictions': QIcon LRU 제거 수,
+                'icons': 보관 중인 QIcon 수,
+                'prerendered': 대기 중인 사전 렌더링 이미지 수,
+                'render_ms': 누적 렌더링 시간 (ms)
+            }
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'renders': self._renders,
+                'prerender_hits': self._prerender_hits,
+                'evictions': self._evictions,
+                'icons': len(self._icons),
+                'prerendered': len(self._prerendered),
+                'render_ms': round(self._render_ms, 3),
+            }
+
+    def clear(self):
+        """캐시 비우기 (QPixmapCache의 이 캐시 항목 포함)"""
+        for key in self._pixmap_keys:
+            QPixmapCache.remove(key)
+        self._pixmap_keys.clear()
+        self._icons.clear()
+        with self._lock:
+            self._prerendered.clear()
+
+
+_icon_cache: Optional[IconCache] = None
+
+
+def get_icon_cache() -> IconCache:
+    """IconCache 싱글톤 인스턴스 반환"""
+    global _icon_cache
+    if _icon_cache is None:
+        _icon_cache = IconCache()
+    return _icon_cache
@@ -0,0 +1,125 @@
+"""이벤트 루프 정지 감시
+
+GUI 스레드의 QTimer 하트비트가 threshold_ms 이상 늦어지면
+이벤트 루프가 슬롯 하나에 묶여 있던 것으로 보고 로그를 남깁니다.
+
+감시 스레드가 정지 중에 GUI 스레드의 스택을 샘플링하므로
+어떤 슬롯이 이벤트 루프를 막았는지 함께 기록됩니다.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class StallWatchdog(QObject):
+    """이벤트 루프 정지 감시기"""
+
+    def __init__(self, threshold_ms: float = 50.0, interval_ms: int = 20,
+                 max_records: int = 50, parent=None):
+        """
+        Args:
+            threshold_ms: 정지로 판단할 최소 시간 (ms)
+            interval_ms: 하트비트 간격 (ms)
+            max_records: 보관할 최근 정지 기록 수
+        """
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.stalls = deque(maxlen=max_records)   # [{'duration_ms', 'where'}]
+        self.max_stall_ms = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat: Optional[float] = None
+        self._sampled_where: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def start(self):
+        """감시 시작 (GUI 스레드에서 호출)"""
+        if self._monitor is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = None
+        self._stop.clear()
+        self._timer.start()
+        self._monitor = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """감시 중지"""
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=1.0)
+            self._monitor = None
+
+    # ==================== GUI 스레드 ====================
+
+    def _beat(self):
+        """하트비트 (늦게 도착하면 정지로 기록)"""
+        now = time.perf_counter()
+        with self._lock:
+            last = self._last_beat
+            where = self._sampled_where
+            self._last_beat = now
+            self._sampled_where = None
+
+        if last is None:
+            return
+
+        stalled_ms = (now - last) * 1000 - self.interval_ms
+        if stalled_ms >= self.threshold_ms:
+            self._report(stalled_ms, where)
+
+    def _report(self, stalled_ms: float, where: Optional[str]):
+        where = where or "알 수 없음"
+        self.stalls.append({'duration_ms': round(stalled_ms, 1), 'where': where})
+        self.max_stall_ms = max(self.max_stall_ms, stalled_ms)
+        logger.warning("이벤트 루프 %.0f ms 정지: %s", stalled_ms, where)
+
+    # ==================== 감시 스레드 ====================
+
+    def _watch(self):
+        """하트비트가 늦어지면 GUI 스레드 스택 샘플링"""
+        poll = max(self.threshold_ms / 2000, 0.005)
+        while not self._stop.wait(poll):
+            with self._lock:
+                last = self._last_beat
+                sampled = self._sampled_where is not None
+            if last is None or sampled:
+                continue
+            if (time.perf_counter() - last) * 1000 - self.interval_ms < self.threshold_ms:
+                continue
+
+            where = self._sample_gui_stack()
+            with self._lock:
+                if self._last_beat == last:
+                    self._sampled_where = where
+
+    def _sample_gui_stack(self) -> str:
+        """GUI 스레드의 현재 호출 위치 요약 (프로젝트 코드 우선)"""
+        frame = sys._current_frames().get(self._gui_thread_id)
+        if frame is None:
+            return "알 수 없음"
+
+        stack = traceback.extract_stack(frame)
+        project = [f for f in stack if f"{os.sep}src{os.sep}" in os.path.normpath(f.filename)]
+        frames: List[traceback.FrameSummary] = (project or stack)[-3:]
+        return " <- ".join(
+            f"{f.name} ({os.path.basename(f.filename)}:{f.lineno})" for f in reversed(frames)
+        )
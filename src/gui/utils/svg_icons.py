@@ -1,7 +1,9 @@
 """SVG 아이콘 유틸리티"""
-from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtGui import QIcon, QPixmap, QPainter
-from PyQt6.QtCore import Qt, QSize
+from typing import Iterable
+
+from PyQt6.QtGui import QIcon, QPixmap
+
+from .icon_cache import get_icon_cache
 
 class SvgIcon:
     """SVG 아이콘 관리 클래스"""
@@ -41,7 +43,7 @@ class SvgIcon:
 
     @staticmethod
     def create_icon(icon_name: str, color: str = "#FFFFFF", size: int = 24) -> QIcon:
-        """SVG 문자열로부터 QIcon 생성
+        """SVG 문자열로부터 QIcon 생성 (이름/색상/크기/DPR별 캐시)
 
         Args:
             icon_name: 아이콘 이름 ("home", "print", "config", "settings", "history")
@@ -55,26 +57,11 @@ class SvgIcon:
             # 기본 아이콘 반환
             return QIcon()
 
-        # SVG 문자열에서 색상 적용
-        svg_string = SvgIcon.ICONS[icon_name].replace('fill="currentColor"', f'fill="{color}"')
-
-        # SVG 렌더러 생성
-        renderer = QSvgRenderer(svg_string.encode('utf-8'))
-
-        # 픽스맵 생성
-        pixmap = QPixmap(QSize(size, size))
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        # SVG를 픽스맵에 렌더링
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        return QIcon(pixmap)
+        return get_icon_cache().icon(icon_name, SvgIcon.ICONS[icon_name], color, size)
 
     @staticmethod
     def create_pixmap(icon_name: str, color: str = "#FFFFFF", size: int = 24) -> QPixmap:
-        """SVG 문자열로부터 QPixmap 생성
+        """SVG 문자열로부터 QPixmap 생성 (이름/색상/크기/DPR별 캐시)
 
         Args:
             icon_name: 아이콘 이름
@@ -87,14 +74,20 @@ class SvgIcon:
         if icon_name not in SvgIcon.ICONS:
             return QPixmap()
 
-        svg_string = SvgIcon.ICONS[icon_name].replace('fill="currentColor"', f'fill="{color}"')
-        renderer = QSvgRenderer(svg_string.encode('utf-8'))
+        return get_icon_cache().pixmap(icon_name, SvgIcon.ICONS[icon_name], color, size)
 
-        pixmap = QPixmap(QSize(size, size))
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
+    @staticmethod
+    def prerender(colors: Iterable[str], size: int = 24, background: bool = True):
+        """모든 아이콘을 주어진 색상들로 사전 렌더링
 
-        return pixmap
\ No newline at end of file
+        Args:
+            colors: 아이콘 색상 목록 (예: 두 테마의 비활성/활성 색상)
+            size: 아이콘 크기 (픽셀)
+            background: True면 백그라운드 스레드에서 실행
+        """
+        requests = [
+            (name, svg, color, size)
+            for color in dict.fromkeys(colors)
+            for name, svg in SvgIcon.ICONS.items()
+        ]
+        return get_icon_cache().prerender(requests, background=background)
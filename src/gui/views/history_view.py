@@ -8,8 +8,6 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QBrush, QFont
 from ..core import ComponentBase, Theme
 from ..components.search_panel import SearchPanel
-from ..styles import get_theme_manager
-from ..styles.theme_manager import ThemeMode
 
 
 class HistoryView(ComponentBase):
@@ -19,6 +17,8 @@ class HistoryView(ComponentBase):
     search_requested = pyqtSignal(dict)
     refresh_requested = pyqtSignal()
     delete_requested = pyqtSignal(int)
+    export_requested = pyqtSignal(str, dict)   # (저장 경로, 검색 필터)
+    export_cancel_requested = pyqtSignal()
 
     def __init__(self, theme=None, parent=None):
         super().__init__(parent)
@@ -63,6 +63,16 @@ class HistoryView(ComponentBase):
         self.delete_btn.clicked.connect(self._on_delete)
         header_layout.addWidget(self.delete_btn)
 
+        # 내보내기 버튼 (실행 중에는 취소 버튼)
+        self.export_btn = QPushButton("내보내기")
+        self.export_btn.setProperty("data-role", "view-secondary")
+        self.export_btn.setMinimumHeight(36)
+        self.export_btn.setMinimumWidth(80)
+        self.export_btn.setMaximumWidth(160)
+        self.export_btn.clicked.connect(self._on_export)
+        header_layout.addWidget(self.export_btn)
+        self._exporting = False
+
         # 새로고침 버튼
         self.refresh_btn = QPushButton("새로고침")
         self.refresh_btn.setProperty("data-role", "view-secondary")
@@ -86,6 +96,7 @@ class HistoryView(ComponentBase):
         # ========== 테이블 ==========
         self.table = QTableWidget()
         self.table.setObjectName("HistoryTable")
+        self.table.setProperty("data-variant", "history")  # QSS 셀렉터용
         self.table.setColumnCount(4)
         self.table.setHorizontalHeaderLabels([
             "시리얼 번호", "MAC 주소", "출력 일시", "PRN 템플릿"
@@ -126,121 +137,6 @@ class HistoryView(ComponentBase):
         scroll_area.setWidget(scroll_content)
         main_layout.addWidget(scroll_area)
 
-        # 스타일 적용
-        self._apply_style()
-
-        # 테마 변경 연결
-        theme_mgr = get_theme_manager()
-        theme_mgr.theme_changed.connect(self._on_theme_changed)
-
-    def _on_theme_changed(self, _):
-        self._apply_style()
-
-    def _apply_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-        is_dark = theme_mgr.mode == ThemeMode.DARK
-
-        if is_dark:
-            bg_color = "#0D1117"
-            alt_bg_color = "#161B22"
-            header_bg = "#21262D"
-            border_color = "#30363D"
-            text_color = "#E6EDF3"
-            hover_color = "#30363D"
-        else:
-            bg_color = "#FFFFFF"
-            alt_bg_color = "#F6F8FA"
-            header_bg = "#F6F8FA"
-            border_color = "#D0D7DE"
-            text_color = "#1F2328"
-            hover_color = "#EAEEF2"
-
-        self.table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {bg_color};
-                alternate-background-color: {alt_bg_color};
-                border: 1px solid {border_color};
-                border-radius: 8px;
-                gridline-color: {border_color};
-                color: {text_color};
-                font-size: 13px;
-            }}
-            QTableWidget::item {{
-                padding: 8px 12px;
-                border-bottom: 1px solid {border_color};
-                color: {text_color};
-            }}
-            QTableWidget::item:hover {{
-                background-color: {hover_color};
-            }}
-            QTableWidget::item:selected {{
-                background-color: {colors.PRIMARY};
-                color: #FFFFFF;
-            }}
-            QHeaderView::section {{
-                background-color: {header_bg};
-                color: {text_color};
-                font-weight: 600;
-                font-size: 13px;
-                padding: 10px 12px;
-                border: none;
-                border-bottom: 2px solid {border_color};
-                border-right: 1px solid {border_color};
-            }}
-            QHeaderView::section:last {{
-                border-right: none;
-            }}
-        """)
-
-        # 스크롤바 스타일
-        self.setStyleSheet(f"""
-            QScrollArea {{
-                background: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: transparent;
-                width: 8px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {colors.GRAY_400};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {colors.GRAY_500};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background: transparent;
-                height: 8px;
-                margin: 0;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {colors.GRAY_400};
-                border-radius: 4px;
-                min-width: 30px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {colors.GRAY_500};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                background: transparent;
-            }}
-        """)
-
     def _on_refresh(self):
         """새로고침"""
         self.refresh_requested.emit()
@@ -253,6 +149,40 @@ class HistoryView(ComponentBase):
         """초기화 - 전체 기록 표시"""
         self.refresh_requested.emit()
 
+    def _on_export(self):
+        """현재 검색 조건으로 CSV/XLSX 내보내기 (실행 중이면 취소)"""
+        if self._exporting:
+            self.export_cancel_requested.emit()
+            return
+
+        from PyQt6.QtWidgets import QFileDialog
+
+        path, selected = QFileDialog.getSaveFileName(
+            self, "이력 내보내기", "print_history.csv",
+            "CSV (*.csv);;Excel (*.xlsx)"
+        )
+        if not path:
+            return
+        if not path.lower().endswith(('.csv', '.xlsx')):
+            path += '.xlsx' if 'xlsx' in selected else '.csv'
+
+        self.export_requested.emit(path, self.search_panel.get_filters())
+
+    def set_export_running(self, running: bool):
+        """내보내기 실행 상태 표시"""
+        self._exporting = running
+        self.export_btn.setText("내보내기 취소" if running else "내보내기")
+
+    def set_export_progress(self, progress):
+        """내보내기 진행률 표시
+
+        Args:
+            progress: (내보낸 행 수, 전체 행 수)
+        """
+        done, total = progress
+        percent = done * 100 // total if total else 100
+        self.export_btn.setText(f"내보내기 취소 ({percent}%)")
+
     def _on_delete(self):
         """선택한 이력 삭제"""
         from PyQt6.QtWidgets import QMessageBox
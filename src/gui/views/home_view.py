@@ -6,37 +6,32 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt
 from ..core import ComponentBase, Theme
 from ..components import PrintHistoryTable
-from ..styles import get_theme_manager
+from ..styles import DynamicStyle
 
 
 class Card(QFrame):
-    """기본 카드 컴포넌트"""
+    """기본 카드 컴포넌트
+
+    스타일은 전역 QSS(_cards.qss)의 objectName 셀렉터로 적용되므로
+    테마 변경 시 별도 처리가 필요 없습니다.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("Card")
         self.setFrameShape(QFrame.Shape.StyledPanel)
 
-        # 테마 변경 연결
-        theme_mgr = get_theme_manager()
-        theme_mgr.theme_changed.connect(self._on_theme_changed)
-
-    def _apply_base_style(self):
-        """기본 카드 스타일"""
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-        return f"""
-            background-color: {colors.WHITE};
-            border: 1px solid {colors.GRAY_200};
-            border-radius: 12px;
-        """
-
-    def _on_theme_changed(self, _):
-        self._apply_style()
+    @staticmethod
+    def _set_value_color(label: QLabel, color_type: str = None):
+        """값 색상 타입 설정 (변경된 경우에만 repolish)
 
-    def _apply_style(self):
-        """서브클래스에서 오버라이드"""
-        pass
+        Args:
+            label: 값 레이블
+            color_type: success, error, primary, muted (None이면 기본 색상)
+        """
+        color_type = color_type or ""
+        if (label.property('data-color') or "") != color_type:
+            DynamicStyle.set_color_type(label, color_type)
 
 
 class StatCard(Card):
@@ -49,7 +44,6 @@ class StatCard(Card):
         self.setMinimumSize(120, 80)
         self.setMaximumSize(200, 120)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self._value_color = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -66,38 +60,17 @@ class StatCard(Card):
         layout.addWidget(self.value_label)
 
         layout.addStretch()
-        self._apply_style()
-
-    def _apply_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QFrame#StatCard {{
-                {self._apply_base_style()}
-            }}
-        """)
-
-        self.title_label.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 500;
-            color: {colors.GRAY_500};
-            background: transparent;
-        """)
-
-        value_color = self._value_color if self._value_color else colors.GRAY_900
-        self.value_label.setStyleSheet(f"""
-            font-size: 24px;
-            font-weight: 700;
-            color: {value_color};
-            background: transparent;
-        """)
-
-    def set_value(self, value: str, color: str = None):
+
+    def set_value(self, value: str, color_type: str = None):
+        """값 설정
+
+        Args:
+            value: 표시할 값
+            color_type: success, error, primary, muted (None이면 이전 색상 유지)
+        """
         self.value_label.setText(value)
-        if color:
-            self._value_color = color
-            self._apply_style()
+        if color_type:
+            self._set_value_color(self.value_label, color_type)
 
 
 class InfoCard(Card):
@@ -109,7 +82,6 @@ class InfoCard(Card):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.setMinimumHeight(50)
         self.setMaximumHeight(70)
-        self._value_color = None
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -130,37 +102,15 @@ class InfoCard(Card):
         )
         layout.addWidget(self.value_label)
 
-        self._apply_style()
-
-    def _apply_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QFrame#InfoCard {{
-                {self._apply_base_style()}
-            }}
-        """)
-
-        self.title_label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {colors.GRAY_500};
-            background: transparent;
-        """)
-
-        value_color = self._value_color if self._value_color else colors.GRAY_900
-        self.value_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {value_color};
-            background: transparent;
-        """)
-
-    def set_value(self, value: str, color: str = None):
+    def set_value(self, value: str, color_type: str = None):
+        """값 설정
+
+        Args:
+            value: 표시할 값
+            color_type: success, error, primary, muted (None이면 기본 색상)
+        """
         self.value_label.setText(value)
-        self._value_color = color
-        self._apply_style()
+        self._set_value_color(self.value_label, color_type)
 
 
 class ActionCard(Card):
@@ -199,54 +149,6 @@ class ActionCard(Card):
         layout.addWidget(self.print_btn)
 
         layout.addStretch()
-        self._apply_style()
-
-    def _apply_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QFrame#ActionCard {{
-                {self._apply_base_style()}
-            }}
-        """)
-
-        self.test_btn.setStyleSheet(f"""
-            QPushButton#SecondaryButton {{
-                background-color: {colors.GRAY_100};
-                color: {colors.GRAY_700};
-                border: 1px solid {colors.GRAY_300};
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }}
-            QPushButton#SecondaryButton:hover {{
-                background-color: {colors.GRAY_200};
-                border-color: {colors.GRAY_400};
-            }}
-            QPushButton#SecondaryButton:pressed {{
-                background-color: {colors.GRAY_300};
-            }}
-        """)
-
-        self.print_btn.setStyleSheet(f"""
-            QPushButton#PrimaryButton {{
-                background-color: {colors.PRIMARY};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }}
-            QPushButton#PrimaryButton:hover {{
-                background-color: {colors.PRIMARY_DARK};
-            }}
-            QPushButton#PrimaryButton:pressed {{
-                background-color: {colors.PRIMARY_DARK};
-            }}
-        """)
 
     def set_buttons_enabled(self, enabled: bool):
         self.test_btn.setEnabled(enabled)
@@ -283,30 +185,12 @@ class HistoryCard(Card):
         )
         layout.addWidget(self.table)
 
-        self._apply_style()
-
-    def _apply_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QFrame#HistoryCard {{
-                {self._apply_base_style()}
-            }}
-        """)
-
-        for child in self.findChildren(QLabel):
-            if child.objectName() == "HistoryCardTitle":
-                child.setStyleSheet(f"""
-                    font-size: 15px;
-                    font-weight: 600;
-                    color: {colors.GRAY_900};
-                    background: transparent;
-                """)
-
     def set_history(self, history_list):
         self.table.set_history(history_list)
 
+    def prepend_records(self, records):
+        self.table.prepend_records(records)
+
 
 class HomeView(ComponentBase):
     """홈 뷰 - 카드 기반 대시보드"""
@@ -319,6 +203,7 @@ class HomeView(ComponentBase):
         super().__init__()
         self.theme = theme or Theme()
         self.setObjectName("HomeView")
+        self._stats = {'total': 0, 'success': 0, 'failed': 0}
 
         # 메인 레이아웃
         main_layout = QVBoxLayout(self)
@@ -400,50 +285,6 @@ class HomeView(ComponentBase):
         scroll_area.setWidget(scroll_content)
         main_layout.addWidget(scroll_area)
 
-        # 스크롤 영역 스타일
-        self._apply_scroll_style()
-
-        # 테마 변경 연결
-        theme_mgr = get_theme_manager()
-        theme_mgr.theme_changed.connect(self._on_theme_changed)
-
-    def _on_theme_changed(self, _):
-        self._apply_scroll_style()
-
-    def _apply_scroll_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QScrollArea {{
-                background: transparent;
-                border: none;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background: transparent;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: transparent;
-                width: 8px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {colors.GRAY_400};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {colors.GRAY_500};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
-
     def _on_reset(self):
         self.reset_clicked.emit()
 
@@ -454,31 +295,44 @@ class HomeView(ComponentBase):
         self.print_requested.emit()
 
     def set_stats(self, today_count, success_count, failed_count):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
+        self._stats = {'total': today_count, 'success': success_count, 'failed': failed_count}
         self.today_card.set_value(str(today_count))
-        self.success_card.set_value(str(success_count), color=colors.SUCCESS)
-        self.failed_card.set_value(str(failed_count), color=colors.ERROR)
+        self.success_card.set_value(str(success_count), color_type="success")
+        self.failed_card.set_value(str(failed_count), color_type="error")
 
     def set_serial_info(self, last_serial, next_serial):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
         self.last_serial_card.set_value(last_serial or "-")
-        self.next_serial_card.set_value(next_serial or "-", color=colors.PRIMARY)
+        self.next_serial_card.set_value(next_serial or "-", color_type="primary")
 
     def set_mac_address(self, mac_address):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
         if mac_address:
-            self.mac_card.set_value(mac_address, color=colors.SUCCESS)
+            self.mac_card.set_value(mac_address, color_type="success")
         else:
-            self.mac_card.set_value("대기 중...", color=colors.GRAY_500)
+            self.mac_card.set_value("대기 중...", color_type="muted")
 
     def set_history(self, history_list):
         self.history_card.set_history(history_list)
 
+    def add_print_records(self, records):
+        """새 출력 이력 반영 (재조회 없이 증분 갱신)
+
+        이력 테이블 맨 위에 추가하고, 통계/마지막 출력은 증분으로 갱신합니다.
+
+        Args:
+            records: 새 출력 레코드 목록 (최신순)
+        """
+        if not records:
+            return
+
+        stats = dict(self._stats)
+        for record in records:
+            stats['total'] += 1
+            if record.get('status') in ('success', 'failed'):
+                stats[record['status']] += 1
+
+        self.set_stats(stats['total'], stats['success'], stats['failed'])
+        self.last_serial_card.set_value(records[0].get('serial_number') or "-")
+        self.history_card.prepend_records(records)
+
     def set_print_buttons_enabled(self, enabled: bool):
         self.action_card.set_buttons_enabled(enabled)
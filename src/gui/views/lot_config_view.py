@@ -1,10 +1,13 @@
 """LOT 설정 화면 (VSCode 스타일)"""
+import logging
 from PyQt6.QtWidgets import QHBoxLayout, QSplitter
 from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from ..core import ComponentBase, Theme
 from ..components.lot_config_tree import LotConfigTree
 from ..components.lot_config_detail import LotConfigDetailPanel
 
+logger = logging.getLogger(__name__)
+
 class LotConfigView(ComponentBase):
     """LOT 설정 뷰 (VSCode 스타일 좌우 분할)"""
 
@@ -52,7 +55,7 @@ class LotConfigView(ComponentBase):
 
     def _on_setting_changed(self, setting_key, value):
         """설정 값 변경 시 - 즉시 저장 (디바운싱)"""
-        print(f"LOT 설정 변경: {setting_key} = {value}")
+        logger.debug("LOT 설정 변경: %s = %s", setting_key, value)
 
         # 타이머 재시작 (500ms 후 저장)
         self.save_timer.stop()
@@ -61,7 +64,7 @@ class LotConfigView(ComponentBase):
     def _save_all_config(self):
         """모든 설정 저장"""
         config = self.get_config()
-        print(f"LOT 설정 저장 중...")
+        logger.debug("LOT 설정 저장 중...")
         self.config_saved.emit(config)
 
     def get_config(self):
@@ -79,4 +82,4 @@ class LotConfigView(ComponentBase):
         if self.save_timer.isActive():
             self.save_timer.stop()
             self._save_all_config()
-            print("LOT 설정 페이지 벗어남 - 즉시 저장 완료")
+            logger.debug("LOT 설정 페이지 벗어남 - 즉시 저장 완료")
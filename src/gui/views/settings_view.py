@@ -1,4 +1,5 @@
 """설정 화면 (VSCode 스타일)"""
+import logging
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
     QScrollArea, QFrame, QSizePolicy
@@ -6,7 +7,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 from ..core import ComponentBase, Theme
 from ..components import SettingsTree, SettingsDetailPanel
-from ..styles import get_theme_manager
+
+logger = logging.getLogger(__name__)
 
 
 class SettingsView(ComponentBase):
@@ -72,54 +74,13 @@ class SettingsView(ComponentBase):
 
         main_layout.addWidget(self.splitter)
 
-        # 스크롤바 스타일
-        self._apply_scroll_style()
-
-        # 테마 변경 연결
-        theme_mgr = get_theme_manager()
-        theme_mgr.theme_changed.connect(self._on_theme_changed)
-
-    def _on_theme_changed(self, _):
-        self._apply_scroll_style()
-
-    def _apply_scroll_style(self):
-        theme_mgr = get_theme_manager()
-        colors = theme_mgr.colors
-
-        self.setStyleSheet(f"""
-            QScrollArea {{
-                background: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: transparent;
-                width: 8px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {colors.GRAY_400};
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {colors.GRAY_500};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
-
     def _on_category_selected(self, category_id, category_name):
         """카테고리 선택 시"""
         self.detail_panel.show_category(category_id)
 
     def _on_setting_changed(self, setting_key, value):
         """설정 값 변경 시 - 즉시 저장 (디바운싱)"""
-        print(f"설정 변경: {setting_key} = {value}")
+        logger.debug("설정 변경: %s = %s", setting_key, value)
 
         # 타이머 재시작 (500ms 후 저장)
         self.save_timer.stop()
@@ -128,17 +89,15 @@ class SettingsView(ComponentBase):
     def _save_all_settings(self):
         """모든 설정 저장"""
         settings = self.get_settings()
-        print(f"설정 저장 중...")
+        logger.debug("설정 저장 중...")
         self.settings_saved.emit(settings)
 
     def get_settings(self):
         """현재 설정값 가져오기"""
         return {
-            'printer_selection': self.detail_panel.printer_item.get_value(),
+            'printer_selection': self.detail_panel.get_printer_selection(),
             'prn_template': self.detail_panel.template_item.get_value(),
-            'serial_port': self._extract_com_port(
-                self.detail_panel.serial_port_item.get_value()
-            ),
+            'serial_port': self._extract_com_port(self.detail_panel.get_serial_port()),
             'serial_baudrate': self.detail_panel.serial_baudrate_item.get_value(),
             'serial_timeout': self.detail_panel.serial_timeout_item.get_value(),
             'auto_increment': (
@@ -166,7 +125,7 @@ class SettingsView(ComponentBase):
         """설정값 적용"""
         # 프린터
         if 'printer_selection' in settings:
-            self.detail_panel.printer_item.set_value(settings['printer_selection'])
+            self.detail_panel.set_printer_selection(settings['printer_selection'])
 
         # PRN 템플릿
         if 'prn_template' in settings:
@@ -174,17 +133,7 @@ class SettingsView(ComponentBase):
 
         # 시리얼 포트 (COM5 -> COM5 - ... 형식으로 매칭)
         if 'serial_port' in settings:
-            saved_port = settings['serial_port']
-            combo = self.detail_panel.serial_port_item.combo
-            found = False
-            for i in range(combo.count()):
-                item_text = combo.itemText(i)
-                if item_text.startswith(saved_port + ' - ') or item_text == saved_port:
-                    combo.setCurrentIndex(i)
-                    found = True
-                    break
-            if not found and combo.count() > 0:
-                combo.setCurrentIndex(0)
+            self.detail_panel.set_serial_port(settings['serial_port'])
 
         # 보드레이트
         if 'serial_baudrate' in settings:
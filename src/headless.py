@@ -0,0 +1,639 @@
+"""헤드리스 인쇄 실행기 (Qt 미사용)
+
+키오스크/라인 컨트롤러처럼 화면 없이 돌리는 배포용 진입점입니다.
+MainWindow와 같은 PrintService/DBManager로 인쇄하고 이력을 저장하며,
+트리거(MAC 주소)는 MCU 시리얼 포트 또는 표준 입력/파일에서 읽습니다.
+템플릿, 인쇄 매수, MAC 사용 여부 등은 GUI 설정 화면에서 저장한 DB 설정을 그대로 씁니다.
+
+사용 예:
+    python src/main.py serve --serial COM5 --transport tcp://192.168.0.50:9100
+    scanner_tool | python src/main.py serve --transport queue
+    python src/main.py batch macs.txt --transport file:labels.zpl
+    python src/main.py latency                 # 저장된 단계별 지연 시간 p50/p95/p99
+    python src/main.py events --serial P10DL0S0H3A00B030001
+    python src/main.py events --since "2026-10-19 09:00" --until "2026-10-19 10:00" --event mcu.
+    python src/main.py export history.xlsx --from 2026-10-01 --to 2026-10-31 --lot P10DL0S0H3A00C10
+    python src/main.py import old_station.csv --defer-indexes
+    python src/main.py archive --before 2026-01-01   # 이전 이력을 data/archive_YYYY.db로 이동
+    python src/main.py db-server --host 0.0.0.0 --token ...  # 여러 스테이션이 공유하는 DB 서버
+    python src/main.py serve --db http://192.168.0.10:8765 --serial COM5
+    python src/main.py journal-sync --db http://192.168.0.10:8765   # 로컬 저널 즉시 전송/상태
+    python src/main.py migrate                       # DB 스키마 업그레이드 (인덱스 생성 진행률 표시)
+
+작업 결과는 한 줄에 하나씩 JSON으로 표준 출력에 기록되고,
+진단 메시지는 표준 에러로 나갑니다. 종료 시 단계별 지연 시간 표를
+표준 에러에 출력하고 --latency-out 파일에 저장합니다.
+인쇄/장치 이벤트는 --events-log(JSON lines)에 기록되며 events 명령으로 조회합니다.
+
+이 모듈과 그 import 경로는 PyQt6를 import하지 않아야 합니다 (tests/test_headless.py).
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO
+
+from .database.archive import HistoryArchiver
+from .database.db_manager import DBManager
+from .database.exceptions import DatabaseError
+from .database.journal import JournaledDBManager, PrintJournal
+from .database.migrations import LATEST_VERSION, schema_version
+from .database.remote import RemoteDBManager, open_database
+from .database.server import DEFAULT_PORT, TOKEN_ENV, DBServer
+from .printer.print_controller import PrintController
+from .printer.transports import PrinterTransport, create_transport
+from .services import (
+    ExportCancelledError, HistoryExportService, HistoryImportService, JournalSyncWorker, PrintService,
+    SequenceLeaser,
+)
+from .utils.event_log import get_event_log, query_events
+from .utils.logger import setup_logging
+from .utils.tracing import format_latency_table, get_tracer, load_latency_snapshot
+
+logger = logging.getLogger(__name__)
+
+# MCU 로그의 MAC 주소: PSAD0CF1336A13031/subTopic (MCUMonitor와 같은 형식)
+SERIAL_MAC_PATTERN = re.compile(r'(PSA[A-Fa-f0-9]{14})/subTopic')
+
+# 입력 줄에서 MAC을 쓰지 않는다는 표시 (라벨에 MAC을 쓰지 않는 설정용)
+NO_MAC_TOKENS = ("-", "none")
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "label_printer.db"
+DEFAULT_LATENCY_PATH = Path(__file__).parent.parent / "logs" / "latency_stats.json"
+DEFAULT_EVENTS_PATH = Path(__file__).parent.parent / "logs" / "events.jsonl"
+DEFAULT_JOURNAL_PATH = Path(__file__).parent.parent / "data" / "print_journal.db"
+
+# 토큰 없이 db-server를 열 수 있는 주소 (같은 PC에서만 접속)
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def parse_trigger_line(line: str) -> Optional[str]:
+    """입력 한 줄에서 MAC 주소 추출
+
+    MCU 로그 형식이면 MAC 부분만, 아니면 줄 전체를 MAC으로 봅니다.
+
+    Returns:
+        MAC 주소 (MAC 없이 인쇄하는 줄이면 None)
+    """
+    match = SERIAL_MAC_PATTERN.search(line)
+    if match:
+        return match.group(1)
+    line = line.strip()
+    return None if line.lower() in NO_MAC_TOKENS else line
+
+
+def iter_line_triggers(stream: TextIO) -> Iterator[Optional[str]]:
+    """표준 입력/파일 트리거 - 빈 줄과 '#' 주석을 제외한 줄마다 인쇄 1회"""
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield parse_trigger_line(line)
+
+
+def iter_serial_triggers(
+    port: str,
+    baudrate: int = 115200,
+    stop_event: Optional[threading.Event] = None,
+    repeat_interval: float = 5.0,
+    retry_interval: float = 2.0,
+) -> Iterator[str]:
+    """MCU 시리얼 트리거 - MAC 감지 시마다 인쇄 1회
+
+    MCU는 같은 MAC을 주기적으로 다시 출력하므로 repeat_interval 안에
+    다시 들어온 같은 MAC은 무시합니다. 포트가 끊기면 retry_interval마다 재연결합니다.
+
+    Args:
+        port: COM 포트 (예: "COM5", "/dev/ttyUSB0")
+        baudrate: 통신 속도
+        stop_event: 설정되면 종료
+        repeat_interval: 같은 MAC 중복 무시 시간 (초)
+        retry_interval: 재연결 대기 시간 (초)
+    """
+    import serial
+
+    stop_event = stop_event or threading.Event()
+    events = get_event_log()
+    ser = None
+    last_mac, last_time = None, 0.0
+
+    try:
+        while not stop_event.is_set():
+            if ser is None:
+                try:
+                    ser = serial.Serial(port=port, baudrate=baudrate, timeout=0.5)
+                    logger.info("MCU 연결됨: %s", port)
+                    events.emit("mcu.connected", port=port)
+                except (serial.SerialException, OSError) as e:
+                    logger.warning("MCU 연결 실패: %s", e)
+                    events.emit("mcu.connect_failed", port=port, message=str(e))
+                    stop_event.wait(retry_interval)
+                    continue
+
+            try:
+                raw = ser.readline()
+            except (serial.SerialException, OSError) as e:
+                logger.warning("시리얼 통신 오류: %s", e)
+                events.emit("mcu.disconnected", port=port, message=str(e))
+                ser.close()
+                ser = None
+                continue
+
+            match = SERIAL_MAC_PATTERN.search(raw.decode('utf-8', errors='ignore'))
+            if not match:
+                continue
+
+            mac_address = match.group(1)
+            now = time.monotonic()
+            if mac_address == last_mac and now - last_time < repeat_interval:
+                continue
+            last_mac, last_time = mac_address, now
+            events.emit("mcu.mac_detected", port=port, mac=mac_address)
+            yield mac_address
+    finally:
+        if ser is not None:
+            ser.close()
+
+
+class HeadlessRunner:
+    """트리거마다 인쇄하고 결과를 JSON 줄로 기록하는 실행기"""
+
+    def __init__(
+        self,
+        db: DBManager,
+        transport: Optional[PrinterTransport] = None,
+        test_mode: bool = False,
+        output: Optional[TextIO] = None,
+        leaser: Optional[SequenceLeaser] = None,
+    ):
+        """
+        Args:
+            db: 초기화된 DBManager (또는 RemoteDBManager)
+            transport: ZPL 전송 방식 (None이면 시스템 프린터 큐)
+            test_mode: 테스트 라벨 출력 (이력 저장 안 함)
+            output: 결과 JSON 줄을 쓸 스트림 (None이면 표준 출력)
+            leaser: 생산순서 임대 블록 (선택, 공유 DB 서버용)
+        """
+        self.db = db
+        self.test_mode = test_mode
+        self.output = output or sys.stdout
+        self.leaser = leaser
+        self.journal_sync: Optional[JournalSyncWorker] = None  # 로컬 저널 사용 시 (_open_runner)
+        self.print_service = PrintService(db, PrintController(transport), leaser)
+
+        # 통계
+        self.printed = 0
+        self.failed = 0
+
+    def print_one(self, mac_address: Optional[str]) -> dict:
+        """인쇄 1회 실행 및 결과 기록
+
+        Returns:
+            결과 이벤트 딕셔너리
+        """
+        started = time.perf_counter()
+        event = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'mac_address': mac_address,
+        }
+
+        try:
+            job = self.print_service.run_print_job(mac_address, self.test_mode)
+        except Exception as e:
+            event.update(success=False, message=str(e))
+        else:
+            result, record = job['result'], job['record']
+            event.update(
+                success=result['success'],
+                serial_number=result['serial_number'],
+                message=result['message'],
+                record_id=record['id'] if record else None,
+            )
+
+        event['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        if event['success']:
+            self.printed += 1
+        else:
+            self.failed += 1
+
+        self.output.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self.output.flush()
+        return event
+
+    def run(self, triggers: Iterable[Optional[str]], max_jobs: Optional[int] = None) -> int:
+        """트리거가 끝날 때까지 (또는 max_jobs회) 인쇄
+
+        Returns:
+            실패 건수
+        """
+        for count, mac_address in enumerate(triggers, start=1):
+            self.print_one(mac_address)
+            if max_jobs is not None and count >= max_jobs:
+                break
+        return self.failed
+
+
+# ==================== 명령줄 ====================
+
+def add_subcommands(subparsers):
+    """serve/batch/latency/events/export/import/archive/db-server 하위 명령 등록 (src/main.py에서 사용)"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--db", default=str(DEFAULT_DB_PATH),
+        help="데이터베이스 경로 또는 공유 DB 서버 주소 (http://host:port)",
+    )
+    common.add_argument(
+        "--transport", default="queue",
+        help='전송 방식: "queue", "tcp://host[:port]", "file:path" (기본: queue)',
+    )
+    common.add_argument("--test-mode", action="store_true", help="테스트 라벨 출력 (이력 저장 안 함)")
+    common.add_argument(
+        "--latency-out", default=str(DEFAULT_LATENCY_PATH),
+        help="종료 시 단계별 지연 시간 통계를 저장할 파일",
+    )
+    common.add_argument(
+        "--events-log", default=str(DEFAULT_EVENTS_PATH),
+        help="인쇄/장치 이벤트 로그 (JSON lines)",
+    )
+    common.add_argument(
+        "--lease-block", type=int,
+        help="생산순서를 N개씩 임대받아 로컬에서 배정 (기본: 공유 DB 서버면 50, 아니면 사용 안 함)",
+    )
+    common.add_argument("--station", help="임대 기록에 남길 스테이션 이름 (기본: 컴퓨터 이름)")
+    common.add_argument(
+        "--journal", default=str(DEFAULT_JOURNAL_PATH),
+        help="공유 DB 서버 사용 시 인쇄 기록을 먼저 남길 로컬 저널 (서버가 끊겨도 인쇄 계속)",
+    )
+    common.add_argument("--no-journal", action="store_true", help="로컬 저널 없이 서버에 바로 저장")
+
+    serve = subparsers.add_parser(
+        "serve", parents=[common],
+        help="트리거를 계속 대기하며 인쇄 (시리얼 또는 표준 입력)",
+    )
+    serve.add_argument("--serial", metavar="PORT", help="MCU 시리얼 포트 (없으면 표준 입력)")
+    serve.add_argument("--baudrate", type=int, default=115200, help="시리얼 통신 속도")
+    serve.add_argument(
+        "--repeat-interval", type=float, default=5.0,
+        help="같은 MAC 중복 무시 시간 (초, 시리얼 전용)",
+    )
+    serve.add_argument("--max-jobs", type=int, help="지정 횟수 인쇄 후 종료")
+    serve.set_defaults(handler=serve_command)
+
+    batch = subparsers.add_parser(
+        "batch", parents=[common],
+        help="파일(또는 표준 입력)의 줄마다 한 장씩 인쇄 후 종료",
+    )
+    batch.add_argument("input", nargs="?", default="-", help="MAC 목록 파일 (기본: 표준 입력)")
+    batch.set_defaults(handler=batch_command)
+
+    latency = subparsers.add_parser("latency", help="저장된 단계별 지연 시간 통계 출력 (p50/p95/p99)")
+    latency.add_argument("path", nargs="?", default=str(DEFAULT_LATENCY_PATH), help="통계 파일")
+    latency.set_defaults(handler=latency_command)
+
+    events = subparsers.add_parser("events", help="이벤트 로그 조회 (시간 범위/시리얼, 로테이션 파일 포함)")
+    events.add_argument("path", nargs="?", default=str(DEFAULT_EVENTS_PATH), help="이벤트 로그 파일")
+    events.add_argument("--since", help='시작 시각 (포함, 예: "2026-10-19 09:00")')
+    events.add_argument("--until", help="종료 시각 (제외)")
+    events.add_argument("--serial", help="시리얼 번호")
+    events.add_argument("--event", help='이벤트 이름 또는 "mcu."처럼 점으로 끝나는 접두사')
+    events.set_defaults(handler=events_command)
+
+    export = subparsers.add_parser("export", help="출력 이력을 CSV/XLSX로 내보내기 (확장자로 형식 결정)")
+    export.add_argument("output", help="저장 파일 (.csv 또는 .xlsx)")
+    export.add_argument("--db", default=str(DEFAULT_DB_PATH), help="데이터베이스 경로")
+    export.add_argument("--from", dest="date_from", help="시작 날짜 (YYYY-MM-DD)")
+    export.add_argument("--to", dest="date_to", help="종료 날짜 (YYYY-MM-DD, 포함)")
+    export.add_argument("--lot", dest="lot_number", help="LOT 번호 (시리얼 접두사)")
+    export.set_defaults(handler=export_command)
+
+    importer = subparsers.add_parser("import", help="이전 기록(CSV)을 출력 이력으로 일괄 가져오기")
+    importer.add_argument("input", help="CSV 파일 (serial_number, mac_address, print_datetime 등)")
+    importer.add_argument("--db", default=str(DEFAULT_DB_PATH), help="데이터베이스 경로")
+    importer.add_argument("--batch-size", type=int, default=HistoryImportService.BATCH_SIZE,
+                          help="트랜잭션 하나에 넣을 행 수")
+    importer.add_argument("--defer-indexes", action="store_true",
+                          help="보조 인덱스를 지우고 끝난 뒤 재생성 (대량 입력용)")
+    importer.add_argument("--dry-run", action="store_true", help="검증/중복 확인만 하고 저장하지 않음")
+    importer.set_defaults(handler=import_command)
+
+    archive = subparsers.add_parser(
+        "archive", help="오래된 출력 이력을 연도별 아카이브(archive_YYYY.db)로 이동",
+    )
+    archive.add_argument("--db", default=str(DEFAULT_DB_PATH), help="데이터베이스 경로")
+    cutoff = archive.add_mutually_exclusive_group()
+    cutoff.add_argument("--before", help="이 날짜(YYYY-MM-DD) 이전 이력 이동")
+    cutoff.add_argument("--keep-days", type=int,
+                        help="최근 N일만 남기고 이동 (둘 다 없으면 archive_keep_days 설정)")
+    archive.add_argument("--vacuum", action="store_true", help="이동 후 운영 DB 파일 크기 줄이기")
+    archive.set_defaults(handler=archive_command)
+
+    server = subparsers.add_parser(
+        "db-server", help="여러 스테이션이 함께 쓰는 공유 DB 서버 (HTTP/JSON, serve --db http://...로 접속)",
+    )
+    server.add_argument("--db", default=str(DEFAULT_DB_PATH), help="데이터베이스 경로")
+    server.add_argument("--host", default="127.0.0.1", help="바인드 주소 (LAN 공개: 0.0.0.0)")
+    server.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트")
+    server.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                        help=f"스테이션이 {TOKEN_ENV}로 보내야 하는 공유 토큰 (127.0.0.1 외 주소에서는 필수)")
+    server.set_defaults(handler=db_server_command)
+
+    migrate = subparsers.add_parser(
+        "migrate", help="DB 스키마를 최신 버전으로 올리고 지연 인덱스까지 생성 (배포 전 실행용)",
+    )
+    migrate.add_argument("--db", default=str(DEFAULT_DB_PATH), help="데이터베이스 경로")
+    migrate.set_defaults(handler=migrate_command)
+
+    sync = subparsers.add_parser(
+        "journal-sync", help="로컬 인쇄 저널의 미전송 기록을 공유 DB 서버로 보내고 상태 출력",
+    )
+    sync.add_argument("--db", required=True, help="공유 DB 서버 주소 (http://host:port)")
+    sync.add_argument("--journal", default=str(DEFAULT_JOURNAL_PATH), help="로컬 저널 경로")
+    sync.set_defaults(handler=journal_sync_command)
+
+
+def _open_runner(args) -> HeadlessRunner:
+    """DB/전송 방식을 열어 실행기 생성 (실패하면 연 DB를 닫고 예외 전달)
+
+    Raises:
+        DatabaseError: DB 초기화 실패 (공유 DB 서버 연결 실패 포함)
+        ValueError: 전송 방식 지정 오류
+        OSError: 저널 파일을 만들 수 없음
+    """
+    db = open_database(args.db)
+    remote = isinstance(db, RemoteDBManager)
+    try:
+        if remote and not args.no_journal:
+            db = JournaledDBManager(db, PrintJournal(args.journal))
+        db.initialize()
+        transport = create_transport(args.transport)
+    except BaseException:
+        db.close()
+        raise
+
+    lease_block = args.lease_block
+    if lease_block is None:
+        lease_block = SequenceLeaser.DEFAULT_BLOCK_SIZE if remote else 0
+    leaser = SequenceLeaser(db, args.station, lease_block) if lease_block > 0 else None
+
+    runner = HeadlessRunner(db, transport, test_mode=args.test_mode, leaser=leaser)
+    if isinstance(db, JournaledDBManager):
+        runner.journal_sync = JournalSyncWorker(db).start()
+    return runner
+
+
+def _run(args, triggers_factory) -> int:
+    """실행기 생성/정리 공통 처리 (진단 로그/print는 표준 에러로 보냄)"""
+    setup_logging(log_file=None)
+    tracer = get_tracer()
+    tracer.enabled = True
+    event_log = get_event_log()
+    event_log.open(args.events_log)
+    try:
+        runner = _open_runner(args)
+    except (DatabaseError, ValueError, OSError) as e:
+        event_log.close()
+        print(f"시작 실패: {e}", file=sys.stderr)
+        return 1
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            failed = runner.run(triggers_factory(), getattr(args, 'max_jobs', None))
+    except KeyboardInterrupt:
+        failed = runner.failed
+    finally:
+        if runner.leaser is not None:
+            _return_leases(runner.leaser)
+        if runner.journal_sync is not None:
+            _print_sync_status(runner.journal_sync.stop())
+        runner.db.close()
+        event_log.close()
+
+    print(f"완료: 성공 {runner.printed}건, 실패 {runner.failed}건", file=sys.stderr)
+    print(tracer.format_table(), file=sys.stderr)
+    try:
+        tracer.save(args.latency_out)
+    except OSError as e:
+        logger.warning("지연 시간 통계 저장 실패: %s", e)
+    return 1 if failed else 0
+
+
+def _return_leases(leaser: SequenceLeaser) -> None:
+    """종료 시 임대 블록의 미사용 번호 반납"""
+    try:
+        summary = leaser.close()
+    except DatabaseError as e:
+        logger.warning("생산순서 반납 실패: %s", e)
+        return
+    print(
+        f"생산순서 반납: {summary['returned']}개, 공백 기록 {len(summary['gaps'])}개 "
+        f"(임대 {leaser.leases}회, 대기 {leaser.stalls}회)",
+        file=sys.stderr,
+    )
+
+
+def _print_sync_status(status: dict) -> None:
+    print(
+        f"저널 동기화: 전송 {status['synced']}건, 대기 {status['pending']}건 "
+        f"(지연 {status['lag_seconds']:.1f}초), 충돌 {status['conflicts']}건",
+        file=sys.stderr,
+    )
+    if status['pending']:
+        print(f"서버 연결 후 journal-sync로 남은 기록을 보낼 수 있습니다: {status['last_error']}",
+              file=sys.stderr)
+
+
+def serve_command(args) -> int:
+    """serve: 시리얼 MAC 감지 또는 표준 입력 줄마다 인쇄"""
+    if args.serial:
+        return _run(args, lambda: iter_serial_triggers(
+            args.serial, args.baudrate, repeat_interval=args.repeat_interval
+        ))
+    return _run(args, lambda: iter_line_triggers(sys.stdin))
+
+
+def batch_command(args) -> int:
+    """batch: 파일의 줄마다 인쇄 후 종료"""
+    if args.input == "-":
+        return _run(args, lambda: iter_line_triggers(sys.stdin))
+
+    with open(args.input, encoding='utf-8') as f:
+        return _run(args, lambda: iter_line_triggers(f))
+
+
+def latency_command(args) -> int:
+    """latency: 저장된 단계별 지연 시간 통계 출력"""
+    try:
+        snapshot = load_latency_snapshot(args.path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"통계 파일을 읽을 수 없습니다: {args.path} ({e})", file=sys.stderr)
+        return 1
+    print(format_latency_table(snapshot))
+    return 0
+
+
+def export_command(args) -> int:
+    """export: 출력 이력 내보내기 (진행률은 표준 에러)"""
+    filters = {'date_from': args.date_from, 'date_to': args.date_to, 'lot_number': args.lot_number}
+
+    def progress(value):
+        done, total = value
+        print(f"\r내보내는 중: {done:,}/{total:,}", end="", file=sys.stderr, flush=True)
+
+    try:
+        result = HistoryExportService(args.db).export(args.output, filters, progress=progress)
+    except (ExportCancelledError, KeyboardInterrupt):
+        print("\n내보내기 취소됨", file=sys.stderr)
+        return 1
+    except (ValueError, OSError, DatabaseError) as e:
+        print(f"\n내보내기 실패: {e}", file=sys.stderr)
+        return 1
+
+    print(f"\n완료: {result['rows']:,}건 → {result['path']}", file=sys.stderr)
+    return 0
+
+
+def import_command(args) -> int:
+    """import: CSV 일괄 가져오기 (결과 요약은 표준 에러, 상세는 JSON 한 줄로 표준 출력)"""
+    db = DBManager(args.db)
+    db.initialize()
+    try:
+        report = HistoryImportService(db).import_csv(
+            args.input,
+            batch_size=args.batch_size,
+            defer_indexes=args.defer_indexes,
+            dry_run=args.dry_run,
+            progress=lambda n: print(f"\r처리 중: {n:,}행", end="", file=sys.stderr, flush=True),
+        )
+    except (ValueError, OSError, DatabaseError) as e:
+        print(f"\n가져오기 실패: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(
+        f"\n{'검증' if args.dry_run else '완료'}: {report['total']:,}행 중 저장 {report['inserted']:,}, "
+        f"중복 {len(report['duplicates']):,}, 오류 {len(report['invalid']):,}",
+        file=sys.stderr,
+    )
+    print(json.dumps(report, ensure_ascii=False))
+    return 1 if report['invalid'] else 0
+
+
+def archive_command(args) -> int:
+    """archive: 기준일 이전 이력을 연도별 아카이브로 이동 (연도별 건수는 JSON 한 줄로 표준 출력)"""
+    db = DBManager(args.db)
+    db.initialize()
+    archiver = HistoryArchiver(db)
+    try:
+        if args.before:
+            moved = archiver.archive(args.before, vacuum=args.vacuum)
+        elif args.keep_days is not None:
+            moved = archiver.archive_older_than(args.keep_days, vacuum=args.vacuum)
+        else:
+            moved = archiver.archive_expired(vacuum=args.vacuum)
+    except (ValueError, DatabaseError) as e:
+        print(f"아카이브 실패: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    for year, count in moved.items():
+        print(f"{year}년: {count:,}건 → {db.archives.path(year)}", file=sys.stderr)
+    print(json.dumps({str(year): count for year, count in moved.items()}))
+    return 0
+
+
+def db_server_command(args) -> int:
+    """db-server: 공유 DB 서버 실행 (Ctrl+C로 종료)"""
+    if not args.token and args.host not in LOOPBACK_HOSTS:
+        print(f"{args.host}에 공개하려면 --token (또는 {TOKEN_ENV})이 필요합니다.", file=sys.stderr)
+        return 2
+
+    setup_logging(log_file=None)
+    db = DBManager(args.db)
+    db.initialize()
+    try:
+        server = DBServer(db, args.host, args.port, token=args.token)
+    except OSError as e:
+        print(f"서버 시작 실패: {e}", file=sys.stderr)
+        db.close()
+        return 1
+
+    print(f"공유 DB 서버: {server.url} ({db.db_path})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        db.close()
+    return 0
+
+
+def migrate_command(args) -> int:
+    """migrate: 스키마 마이그레이션 + 지연 인덱스 생성 대기 (결과는 JSON 한 줄로 표준 출력)"""
+    def progress(p):
+        state = "완료" if p['finished'] else "생성 중"
+        print(f"\r인덱스 {p['index']} {state} ({p['done']}/{p['total']}, {p['elapsed_s']:.1f}초)",
+              end="\n" if p['finished'] else "", file=sys.stderr, flush=True)
+
+    db = DBManager(args.db)
+    try:
+        applied = db.initialize(index_progress=progress)
+        if db.index_builder is not None:
+            db.index_builder.wait()
+            if db.index_builder.error:
+                print(f"인덱스 생성 실패: {db.index_builder.error}", file=sys.stderr)
+                return 1
+        version = schema_version(db.conn)
+    except DatabaseError as e:
+        print(f"마이그레이션 실패: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\n중단됨 (다음 실행 시 이어서 진행)", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    for step in applied:
+        print(f"{step['version']:>3} {step['name']:<32} {step['duration_ms']:>9.1f} ms", file=sys.stderr)
+    print(f"스키마 버전 {version}/{LATEST_VERSION}", file=sys.stderr)
+    print(json.dumps({'version': version, 'applied': applied}, ensure_ascii=False))
+    return 0
+
+
+def journal_sync_command(args) -> int:
+    """journal-sync: 미전송 저널 기록 전송 (상태는 JSON 한 줄로 표준 출력)"""
+    setup_logging(log_file=None)
+    if not Path(args.journal).exists():
+        print(f"저널 파일이 없습니다: {args.journal}", file=sys.stderr)
+        return 1
+
+    db = JournaledDBManager(open_database(args.db), PrintJournal(args.journal))
+    worker = JournalSyncWorker(db)
+    try:
+        worker.sync_once()
+        status = worker.status()
+    finally:
+        db.close()
+
+    _print_sync_status(status)
+    print(json.dumps(status, ensure_ascii=False))
+    return 1 if status['pending'] or status['conflicts'] else 0
+
+
+def events_command(args) -> int:
+    """events: 이벤트 로그 조회 (한 줄에 하나씩 JSON 출력)"""
+    try:
+        for event in query_events(args.path, args.since, args.until, args.serial, args.event):
+            print(json.dumps(event, ensure_ascii=False))
+    except ValueError as e:
+        print(f"잘못된 시각 형식: {e}", file=sys.stderr)
+        return 1
+    return 0
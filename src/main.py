@@ -1,6 +1,6 @@
 """
-Zebra Label Printer - CLI Test Version
-전체 워크플로우 통합 테스트
+Zebra Label Printer - CLI
+전체 워크플로우 통합 테스트 및 헤드리스 실행 (serve/batch, src/headless.py)
 """
 
 import sys
@@ -243,6 +243,7 @@ def test_database():
 
 if __name__ == "__main__":
     import argparse
+    from src import headless
 
     parser_cli = argparse.ArgumentParser(description="Zebra Label Printer CLI")
     parser_cli.add_argument(
@@ -250,10 +251,14 @@ if __name__ == "__main__":
         choices=["serial", "prn", "db", "all"],
         help="Run specific test module",
     )
+    headless.add_subcommands(parser_cli.add_subparsers(dest="command"))
 
     args = parser_cli.parse_args()
 
-    if args.test == "serial":
+    if args.command:
+        # 헤드리스 실행 (Qt 미사용)
+        sys.exit(args.handler(args))
+    elif args.test == "serial":
         test_serial_number_generator()
     elif args.test == "prn":
         test_prn_parser()
@@ -1,5 +1,6 @@
 """MCU 통신 모듈"""
 from .mcu_controller import MCUController
 from .mcu_monitor import MCUMonitor
+from .exceptions import MCUError, MCUTimeoutError, MCUCommandError
 
-__all__ = ['MCUController', 'MCUMonitor']
+__all__ = ['MCUController', 'MCUMonitor', 'MCUError', 'MCUTimeoutError', 'MCUCommandError']
@@ -0,0 +1,30 @@
+"""
+MCU 통신 관련 예외 클래스
+"""
+
+
+class MCUError(RuntimeError):
+    """MCU 통신 관련 기본 예외"""
+    pass
+
+
+class MCUNotConnectedError(MCUError):
+    """MCU가 연결되지 않음"""
+    def __init__(self):
+        super().__init__("MCU가 연결되지 않았습니다")
+
+
+class MCUTimeoutError(MCUError):
+    """MCU 응답 타임아웃"""
+    def __init__(self, command: str, timeout: float):
+        self.command = command
+        self.timeout = timeout
+        super().__init__(f"MCU 응답 타임아웃: {command} ({timeout:.1f}초)")
+
+
+class MCUCommandError(MCUError):
+    """MCU가 명령 실패(ERR)를 응답함"""
+    def __init__(self, command: str, message: str):
+        self.command = command
+        self.message = message
+        super().__init__(f"MCU 명령 실패: {command} ({message})")
@@ -1,80 +1,332 @@
-"""MCU 컨트롤러 - MCU와의 시리얼 통신"""
-import serial
+"""MCU 컨트롤러 - MCU와의 시리얼 통신 (요청/응답 프로토콜)
+
+프레임 형식 (라인 단위, UTF-8):
+    요청:  @<id> <COMMAND> [args]\\r\\n
+    응답:  @<id> OK <payload>\\r\\n   또는   @<id> ERR <message>\\r\\n
+    준비:  READY\\r\\n                  (부팅 완료 시 MCU가 출력)
+
+응답은 요청 ID로 매칭되므로 응답을 기다리지 않고 여러 요청을 연속 전송
+(파이프라이닝)할 수 있습니다. 응답 수신은 디스패처 스레드가 담당합니다.
+"""
+import logging
+import re
+import threading
 import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+import serial
+
+from .exceptions import MCUError, MCUNotConnectedError, MCUTimeoutError, MCUCommandError
+
+logger = logging.getLogger(__name__)
+
 
 class MCUController:
     """MCU 컨트롤러"""
 
-    def __init__(self, port: str, baudrate: int = 115200, timeout: int = 30):
+    # 명령
+    CMD_PING = "PING"
+    CMD_GET_MAC = "GET_MAC"
+    CMD_GET_VERSION = "GET_VERSION"
+    CMD_SELF_TEST = "SELF_TEST"
+
+    # 응답 프레임: @12 OK 00:1A:2B:3C:4D:5E
+    RESPONSE_PATTERN = re.compile(r'^@(\d+)\s+(OK|ERR)(?:\s+(.*))?$')
+    READY_LINE = "READY"
+
+    # 00:1A:2B:3C:4D:5E 형식
+    MAC_PATTERN = re.compile(r'^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$')
+
+    # 디스패처 readline 주기 (타임아웃 만료 검사 간격)
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        timeout: int = 30,
+        ready_timeout: float = 2.0,
+    ):
         """
         Args:
             port: COM 포트 (예: "COM5")
             baudrate: 통신 속도
-            timeout: 타임아웃 (초)
+            timeout: 명령 기본 응답 타임아웃 (초)
+            ready_timeout: 연결 후 MCU 준비 신호 최대 대기 시간 (초)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.ready_timeout = ready_timeout
         self.ser = None
 
+        # 프레임이 아닌 라인(일반 로그) 수신 콜백
+        self.on_unsolicited: Optional[Callable[[str], None]] = None
+
+        # request_id → (future, deadline, command, timeout)
+        self._pending: Dict[int, Tuple[Future, float, str, float]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._next_id = 1
+        self._ready = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._running = False
+
     def connect(self) -> bool:
-        """MCU 연결"""
+        """
+        MCU 연결
+
+        고정 대기 없이 READY 라인 또는 PING 응답 중 먼저 도착하는 것으로
+        준비 완료를 판단합니다. ready_timeout 안에 둘 다 없으면 그대로 진행합니다.
+        """
         try:
             self.ser = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                timeout=self.timeout
+                timeout=self.POLL_INTERVAL
             )
-            time.sleep(2)  # 연결 안정화 대기
-            return True
         except Exception as e:
-            print(f"MCU 연결 실패: {e}")
+            logger.error("MCU 연결 실패: %s", e)
             return False
 
+        self._ready.clear()
+        self._running = True
+        self._reader = threading.Thread(target=self._read_loop, name="MCUDispatcher", daemon=True)
+        self._reader.start()
+
+        self.request(self.CMD_PING, timeout=self.ready_timeout)
+        if not self._ready.wait(self.ready_timeout):
+            logger.warning("MCU 준비 신호 없음 - 계속 진행")
+        return True
+
     def disconnect(self):
         """MCU 연결 해제"""
+        self._running = False
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1.0)
+        self._reader = None
+
         if self.ser and self.ser.is_open:
             self.ser.close()
 
+        self._fail_all(MCUError("MCU 연결이 해제되었습니다"))
+
+    # ==================== 요청/응답 ====================
+
+    def request(self, command: str, *args: str, timeout: Optional[float] = None) -> Future:
+        """
+        명령 전송 (응답을 기다리지 않음)
+
+        Args:
+            command: 명령 (예: "GET_MAC")
+            *args: 명령 인자
+            timeout: 응답 타임아웃 (초, None이면 기본값)
+
+        Returns:
+            응답 payload를 결과로 갖는 Future
+            (실패 시 MCUCommandError / MCUTimeoutError / MCUError)
+        """
+        if not self.is_connected():
+            raise MCUNotConnectedError()
+
+        timeout = self.timeout if timeout is None else timeout
+        future: Future = Future()
+
+        with self._lock:
+            request_id = self._next_id
+            self._next_id = self._next_id % 65535 + 1
+            self._pending[request_id] = (future, time.monotonic() + timeout, command, timeout)
+
+        frame = " ".join((f"@{request_id}", command) + args) + "\r\n"
+        try:
+            with self._write_lock:
+                self.ser.write(frame.encode('utf-8'))
+        except Exception as e:
+            self._resolve(request_id, error=MCUError(f"명령 전송 실패: {command} ({e})"))
+
+        return future
+
+    def call(self, command: str, *args: str, timeout: Optional[float] = None) -> str:
+        """
+        명령 전송 후 응답 대기
+
+        Returns:
+            응답 payload 문자열
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.request(command, *args, timeout=timeout)
+        # 만료 처리는 디스패처가 담당, 여기서는 스레드 정지 대비 여유만 둠
+        return future.result(timeout=timeout + 1.0)
+
+    def execute_many(self, commands: List[str], timeout: Optional[float] = None) -> List[str]:
+        """
+        여러 명령을 파이프라이닝으로 전송하고 모든 응답 수집
+
+        Args:
+            commands: 명령 리스트
+            timeout: 명령별 응답 타임아웃 (초)
+
+        Returns:
+            명령 순서대로의 응답 payload 리스트
+        """
+        timeout = self.timeout if timeout is None else timeout
+        futures = [self.request(command, timeout=timeout) for command in commands]
+        return [future.result(timeout=timeout + 1.0) for future in futures]
+
+    # ==================== 명령 ====================
+
     def read_mac_address(self) -> str:
         """
         MCU로부터 MAC 주소 읽기
 
         Returns:
             MAC 주소 (예: "00:1A:2B:3C:4D:5E")
-            실패 시 빈 문자열
         """
-        if not self.ser or not self.ser.is_open:
+        if not self.is_connected():
             raise RuntimeError("MCU가 연결되지 않았습니다")
 
         try:
-            # 입력 버퍼 비우기
-            self.ser.reset_input_buffer()
+            response = self.call(self.CMD_GET_MAC)
+            return self._validate_mac(response)
+        except Exception as e:
+            raise RuntimeError(f"MAC 주소 읽기 실패: {str(e)}")
 
-            # MAC 주소 요청 명령 전송
-            # TODO: 실제 MCU 프로토콜에 맞게 수정 필요
-            command = b"GET_MAC\r\n"
-            self.ser.write(command)
+    def read_firmware_version(self) -> str:
+        """펌웨어 버전 조회"""
+        return self.call(self.CMD_GET_VERSION)
 
-            # 응답 대기
-            response = self.ser.readline().decode('utf-8').strip()
+    def run_self_test(self) -> str:
+        """자가 진단 실행 결과 조회"""
+        return self.call(self.CMD_SELF_TEST)
 
-            # MAC 주소 검증 (00:1A:2B:3C:4D:5E 형식)
-            if self._is_valid_mac(response):
-                return response
-            else:
-                raise ValueError(f"유효하지 않은 MAC 주소 형식: {response}")
+    def query_device_info(self) -> dict:
+        """
+        MAC, 펌웨어 버전, 자가 진단 결과를 한 번의 왕복 시간 안에 조회
 
-        except Exception as e:
-            raise RuntimeError(f"MAC 주소 읽기 실패: {str(e)}")
+        Returns:
+            {
+                'mac_address': str,
+                'firmware_version': str,
+                'self_test': str
+            }
+        """
+        mac, version, self_test = self.execute_many(
+            [self.CMD_GET_MAC, self.CMD_GET_VERSION, self.CMD_SELF_TEST]
+        )
+        return {
+            'mac_address': self._validate_mac(mac),
+            'firmware_version': version,
+            'self_test': self_test,
+        }
+
+    def _validate_mac(self, response: str) -> str:
+        """MAC 주소 응답 검증"""
+        if not self._is_valid_mac(response):
+            raise ValueError(f"유효하지 않은 MAC 주소 형식: {response}")
+        return response
 
     def _is_valid_mac(self, mac: str) -> bool:
         """MAC 주소 형식 검증"""
-        import re
-        # 00:1A:2B:3C:4D:5E 형식 검증
-        pattern = r'^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$'
-        return bool(re.match(pattern, mac))
+        return bool(self.MAC_PATTERN.match(mac))
 
     def is_connected(self) -> bool:
         """연결 상태 확인"""
         return self.ser is not None and self.ser.is_open
+
+    @property
+    def is_ready(self) -> bool:
+        """MCU 준비 신호 수신 여부"""
+        return self._ready.is_set()
+
+    # ==================== 응답 디스패처 ====================
+
+    def _read_loop(self):
+        """응답 수신 루프 (디스패처 스레드)"""
+        partial = b""
+
+        while self._running:
+            try:
+                chunk = self.ser.readline()
+            except Exception as e:
+                if self._running:
+                    self._fail_all(MCUError(f"시리얼 통신 오류: {e}"))
+                break
+
+            if chunk:
+                partial += chunk
+                # readline 타임아웃으로 잘린 라인은 다음 읽기와 합침
+                if partial.endswith(b"\n"):
+                    self._dispatch(partial.decode('utf-8', errors='ignore').strip())
+                    partial = b""
+
+            self._expire_pending()
+
+    def _dispatch(self, line: str):
+        """수신 라인 처리"""
+        if not line:
+            return
+
+        match = self.RESPONSE_PATTERN.match(line)
+        if match:
+            self._ready.set()
+            request_id = int(match.group(1))
+            payload = (match.group(3) or "").strip()
+            if match.group(2) == "OK":
+                self._resolve(request_id, result=payload)
+            else:
+                self._resolve(request_id, error_message=payload)
+            return
+
+        if line == self.READY_LINE:
+            self._ready.set()
+        elif self.on_unsolicited:
+            self.on_unsolicited(line)
+
+    def _resolve(
+        self,
+        request_id: int,
+        result: Optional[str] = None,
+        error: Optional[Exception] = None,
+        error_message: Optional[str] = None,
+    ):
+        """대기 중인 요청 완료 처리"""
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+        if entry is None:
+            return  # 이미 만료되었거나 알 수 없는 ID
+
+        future, _, command, _ = entry
+        if future.done():
+            return
+        if error_message is not None:
+            future.set_exception(MCUCommandError(command, error_message))
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _expire_pending(self):
+        """타임아웃된 요청 실패 처리"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                (request_id, entry) for request_id, entry in self._pending.items()
+                if entry[1] <= now
+            ]
+            for request_id, _ in expired:
+                del self._pending[request_id]
+
+        for _, (future, _, command, timeout) in expired:
+            if not future.done():
+                future.set_exception(MCUTimeoutError(command, timeout))
+
+    def _fail_all(self, error: Exception):
+        """대기 중인 모든 요청 실패 처리"""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for future, _, _, _ in pending:
+            if not future.done():
+                future.set_exception(error)
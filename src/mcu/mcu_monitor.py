@@ -1,10 +1,16 @@
 """MCU 백그라운드 모니터 - ESP32 시리얼 모니터링"""
+import logging
 import re
+import threading
 import time
 import serial
-import serial.tools.list_ports
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from ..utils.event_log import get_event_log
+from .port_watcher import PortCache, DeviceWatcher, backoff_delay
+
+logger = logging.getLogger(__name__)
+
 
 class MCUMonitor(QThread):
     """MCU 백그라운드 모니터 스레드"""
@@ -13,12 +19,24 @@ class MCUMonitor(QThread):
     connection_status_changed = pyqtSignal(str, str)  # (status, detail)
     mac_detected = pyqtSignal(str)  # MAC 주소
 
-    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 0.5):
+    # 연결 상태에서 포트 존재 여부를 확인하는 주기 (초)
+    PRESENCE_CHECK_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        timeout: float = 0.5,
+        watch_device: bool = True,
+        capture=None,
+    ):
         """
         Args:
             port: COM 포트 (예: "COM5")
             baudrate: 통신 속도
             timeout: 읽기 타임아웃 (초)
+            watch_device: Linux에서 장치 노드 재생성 시 즉시 재연결 (inotify)
+            capture: 수신 원본 데이터를 기록할 SerialCapture (선택)
         """
         super().__init__()
         self.port = port
@@ -26,6 +44,16 @@ class MCUMonitor(QThread):
         self.timeout = timeout
         self.running = True
         self.ser = None
+        self.capture = capture
+        self.events = get_event_log()
+
+        # 재연결 관련 상태
+        self.watch_device = watch_device
+        self._port_cache = PortCache()
+        self._watcher = None
+        self._wake = threading.Event()
+        self._attempt = 0
+        self._last_presence_check = 0.0
 
         # MAC 주소 패턴: PSAD0CF1336A13031/subTopic (총 17자)
         # PSA(3자) + 14자 = 17자
@@ -33,22 +61,36 @@ class MCUMonitor(QThread):
 
     def run(self):
         """백그라운드 모니터링 실행"""
+        if self.watch_device and DeviceWatcher.is_supported(self.port):
+            self._watcher = DeviceWatcher(self.port, self._on_device_changed)
+            self._watcher.start()
+
+        try:
+            self._monitor_loop()
+        finally:
+            if self._watcher:
+                self._watcher.stop()
+                self._watcher = None
+
+    def _monitor_loop(self):
+        """연결/읽기 루프"""
         while self.running:
             try:
                 # 시리얼 포트 연결 시도
                 if not self.ser or not self.ser.is_open:
                     self._connect()
 
-                # 연결되었으면 데이터 읽기
-                if self.ser and self.ser.is_open:
-                    self._read_data()
+                # 연결되었으면 데이터 읽기 (읽은 데이터가 있으면 바로 다음 라인 처리)
+                if self.ser and self.ser.is_open and self._read_data():
+                    continue
 
             except Exception as e:
-                print(f"MCU 모니터 오류: {e}")
+                logger.error("MCU 모니터 오류: %s", e)
                 self._handle_error()
 
-            # 재연결 대기
-            time.sleep(0.1)
+            # 데이터가 없으면 짧게 대기 (MAC 감지 → 자동 인쇄 지연을 줄이기 위해 10ms,
+            # 벤치마크 p50 103ms → 60ms, CPU 1.1% → 1.9%)
+            time.sleep(0.01)
 
     def _connect(self):
         """시리얼 포트 연결"""
@@ -56,9 +98,8 @@ class MCUMonitor(QThread):
             # 연결 시도 중 상태
             self.connection_status_changed.emit("reconnecting", self.port)
 
-            # 포트가 존재하는지 확인
-            available_ports = [p.device for p in serial.tools.list_ports.comports()]
-            if self.port not in available_ports:
+            # 포트가 존재하는지 확인 (캐시된 포트 목록 사용)
+            if not self._port_cache.is_present(self.port):
                 raise RuntimeError(f"포트 {self.port}를 찾을 수 없습니다")
 
             # 시리얼 포트 열기
@@ -69,52 +110,96 @@ class MCUMonitor(QThread):
             )
 
             # 연결 성공
+            self._attempt = 0
+            self._last_presence_check = time.monotonic()
             self.connection_status_changed.emit("connected", self.port)
-            print(f"✓ MCU 연결됨: {self.port}")
+            logger.info("MCU 연결됨: %s", self.port)
+            self.events.emit("mcu.connected", port=self.port)
 
         except Exception as e:
             # 연결 실패
             self.connection_status_changed.emit("disconnected", "")
-            print(f"✗ MCU 연결 실패: {e}")
-            # 5초 대기 후 재시도 (0.5초씩 체크하여 빠른 종료 가능)
-            for _ in range(10):
-                if not self.running:
-                    return
-                time.sleep(0.5)
-
-    def _read_data(self):
-        """시리얼 데이터 읽기"""
+            logger.warning("MCU 연결 실패: %s", e)
+            self.events.emit("mcu.connect_failed", port=self.port, attempt=self._attempt, message=str(e))
+            self._wait_before_retry()
+
+    def _read_data(self) -> bool:
+        """
+        시리얼 데이터 읽기
+
+        Returns:
+            한 줄을 읽었으면 True, 대기 중인 데이터가 없으면 False
+        """
         try:
-            if self.ser.in_waiting > 0:
-                # 한 줄 읽기
-                line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-
-                if line:
-                    # MAC 주소 패턴 검색
-                    match = self.mac_pattern.search(line)
-                    if match:
-                        mac_address = match.group(1)
-                        print(f"✓ MAC 감지: {mac_address}")
-                        self.mac_detected.emit(mac_address)
-
-        except serial.SerialException as e:
-            # 시리얼 통신 오류 (연결 끊김 등)
-            print(f"시리얼 통신 오류: {e}")
+            if self.ser.in_waiting == 0:
+                # 데이터가 없을 때만 주기적으로 포트 존재 여부 확인 (케이블 분리 감지)
+                self._check_port_presence()
+                return False
+
+            # 한 줄 읽기
+            raw = self.ser.readline()
+            if self.capture:
+                self.capture.write(raw)
+            line = raw.decode('utf-8', errors='ignore').strip()
+
+            if line:
+                # MAC 주소 패턴 검색
+                match = self.mac_pattern.search(line)
+                if match:
+                    mac_address = match.group(1)
+                    logger.info("MAC 감지: %s", mac_address)
+                    self.events.emit("mcu.mac_detected", port=self.port, mac=mac_address)
+                    self.mac_detected.emit(mac_address)
+            return True
+
+        except (serial.SerialException, OSError) as e:
+            # 시리얼 통신 오류 (연결 끊김 등, Linux에서는 장치 제거 시 EIO)
+            logger.warning("시리얼 통신 오류: %s", e)
+            self.events.emit("mcu.disconnected", port=self.port, message=str(e))
             self._close()
             self.connection_status_changed.emit("disconnected", "")
 
         except Exception as e:
-            print(f"데이터 읽기 오류: {e}")
+            logger.warning("데이터 읽기 오류: %s", e)
+
+        return False
+
+    def _check_port_presence(self):
+        """포트가 사라졌으면 연결 종료 처리
+
+        장치 경로(/dev/...)는 stat만으로 확인합니다. COM 포트처럼 열거가 필요한 포트는
+        연결 중에는 확인하지 않고, 열린 포트에서 발생하는 SerialException/OSError로 분리를 감지합니다.
+        """
+        if not PortCache.is_device_path(self.port):
+            return
+        now = time.monotonic()
+        if now - self._last_presence_check < self.PRESENCE_CHECK_INTERVAL:
+            return
+        self._last_presence_check = now
+
+        if not self._port_cache.is_present(self.port):
+            logger.warning("시리얼 포트 사라짐: %s", self.port)
+            self.events.emit("mcu.disconnected", port=self.port, message="port removed")
+            self._close()
+            self.connection_status_changed.emit("disconnected", "")
 
     def _handle_error(self):
         """에러 처리"""
         self._close()
         self.connection_status_changed.emit("reconnecting", self.port)
-        # 5초 대기 후 재시도 (0.5초씩 체크하여 빠른 종료 가능)
-        for _ in range(10):
-            if not self.running:
-                return
-            time.sleep(0.5)
+        self._wait_before_retry()
+
+    def _wait_before_retry(self):
+        """재연결 대기 (지수 백오프, 장치 재등장 또는 stop() 시 즉시 깨어남)"""
+        delay = backoff_delay(self._attempt)
+        self._attempt += 1
+        self._wake.wait(delay)
+        self._wake.clear()
+
+    def _on_device_changed(self):
+        """장치 노드 생성 감지 (DeviceWatcher 스레드에서 호출)"""
+        self._port_cache.invalidate()
+        self._wake.set()
 
     def _close(self):
         """시리얼 포트 닫기"""
@@ -128,5 +213,6 @@ class MCUMonitor(QThread):
     def stop(self):
         """모니터링 중지"""
         self.running = False
+        self._wake.set()
         self._close()
         self.wait(2000)  # 최대 2초만 대기 (밀리초 단위)
@@ -0,0 +1,201 @@
+"""시리얼 포트 탐지 유틸리티 - 포트 목록 캐시, 재연결 백오프, 핫플러그 감시"""
+import os
+import random
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+def backoff_delay(attempt: int, base: float = 0.25, cap: float = 5.0) -> float:
+    """
+    재연결 대기 시간 계산 (지수 백오프 + jitter)
+
+    Args:
+        attempt: 연속 실패 횟수 (0부터)
+        base: 첫 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+
+    Returns:
+        대기 시간 (초) - [ceiling/2, ceiling] 구간의 난수
+
+    Example:
+        >>> backoff_delay(0)   # 0.125 ~ 0.25
+        >>> backoff_delay(10)  # 2.5 ~ 5.0
+    """
+    ceiling = min(cap, base * (2 ** min(attempt, 16)))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class PortCache:
+    """serial.tools.list_ports.comports() 결과 캐시
+
+    Windows에서는 포트 열거가 수백 ms 걸리므로 TTL 동안 결과를 재사용합니다.
+    POSIX 장치 경로(/dev/ttyUSB0 등)는 열거 없이 stat으로만 확인합니다.
+    """
+
+    def __init__(self, ttl: float = 2.0):
+        """
+        Args:
+            ttl: 캐시 유효 시간 (초)
+        """
+        self.ttl = ttl
+        self._ports: List[str] = []
+        self._timestamp: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def ports(self, refresh: bool = False) -> List[str]:
+        """
+        사용 가능한 포트 목록 (캐시)
+
+        Args:
+            refresh: True면 캐시를 무시하고 다시 열거
+
+        Returns:
+            포트 이름 리스트
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                refresh
+                or self._timestamp is None
+                or now - self._timestamp > self.ttl
+            ):
+                import serial.tools.list_ports
+                self._ports = [p.device for p in serial.tools.list_ports.comports()]
+                self._timestamp = now
+            return list(self._ports)
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (다음 조회 시 다시 열거)"""
+        with self._lock:
+            self._timestamp = None
+
+    def is_present(self, port: str) -> bool:
+        """
+        포트 존재 여부 확인
+
+        Args:
+            port: 포트 이름 (예: "COM5", "/dev/ttyUSB0")
+
+        Returns:
+            존재 여부
+        """
+        if self.is_device_path(port):
+            return os.path.exists(port)
+        return port in self.ports()
+
+    @staticmethod
+    def is_device_path(port: str) -> bool:
+        """stat만으로 존재 여부를 확인할 수 있는 장치 경로인지 (열거 불필요)"""
+        return os.name == 'posix' and port.startswith('/')
+
+
+class DeviceWatcher:
+    """Linux inotify 기반 장치 노드 감시
+
+    포트가 있는 디렉토리(기본 /dev)를 감시하다가 해당 장치 노드가
+    다시 생성되면 콜백을 호출합니다. Linux 이외의 플랫폼에서는
+    start()가 False를 반환하고 아무것도 하지 않습니다.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    _EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    def __init__(self, port: str, on_change: Callable[[], None]):
+        """
+        Args:
+            port: 감시할 장치 경로 (예: "/dev/ttyUSB0")
+            on_change: 장치 노드가 생성/변경되었을 때 호출할 콜백
+        """
+        self.port = port
+        self.on_change = on_change
+        self._fd: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @staticmethod
+    def is_supported(port: str) -> bool:
+        """현재 플랫폼/포트에서 감시 가능 여부"""
+        return sys.platform.startswith('linux') and port.startswith('/')
+
+    def start(self) -> bool:
+        """
+        감시 시작
+
+        Returns:
+            감시 시작 성공 여부 (미지원 플랫폼이면 False)
+        """
+        if not self.is_supported(self.port) or self._running:
+            return False
+
+        try:
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return False
+
+            watch_dir = os.path.dirname(self.port) or '/dev'
+            mask = self.IN_CREATE | self.IN_ATTRIB | self.IN_MOVED_TO
+            if libc.inotify_add_watch(fd, watch_dir.encode(), mask) < 0:
+                os.close(fd)
+                return False
+        except (OSError, AttributeError):
+            return False
+
+        self._fd = fd
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="DeviceWatcher", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """감시 중지"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _run(self) -> None:
+        """inotify 이벤트 수신 루프"""
+        target = os.path.basename(self.port).encode()
+
+        while self._running:
+            try:
+                readable, _, _ = select.select([self._fd], [], [], 0.2)
+                if not readable:
+                    continue
+                data = os.read(self._fd, 4096)
+            except (OSError, ValueError):
+                return
+
+            if target in self._parse_names(data):
+                self.on_change()
+
+    @classmethod
+    def _parse_names(cls, data: bytes) -> List[bytes]:
+        """inotify 이벤트 버퍼에서 파일 이름 목록 추출"""
+        names = []
+        offset = 0
+        header_size = cls._EVENT_HEADER.size
+
+        while offset + header_size <= len(data):
+            _, _, _, name_len = cls._EVENT_HEADER.unpack_from(data, offset)
+            offset += header_size
+            names.append(data[offset:offset + name_len].rstrip(b'\0'))
+            offset += name_len
+
+        return names
@@ -2,5 +2,9 @@
 
 from .zebra_win_controller import ZebraWinController
 from .prn_parser import PRNParser
+from .transports import PrinterTransport, QueueTransport, TcpTransport, FileTransport, create_transport
 
-__all__ = ["ZebraWinController", "PRNParser"]
+__all__ = [
+    "ZebraWinController", "PRNParser",
+    "PrinterTransport", "QueueTransport", "TcpTransport", "FileTransport", "create_transport",
+]
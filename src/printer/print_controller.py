@@ -1,16 +1,30 @@
 """인쇄 컨트롤러 - 인쇄 프로세스 오케스트레이션"""
+import logging
 import re
+import time
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+from ..utils.event_log import get_event_log
 from ..utils.serial_number_generator import SerialNumberGenerator
-from .zebra_win_controller import ZebraWinController
+from ..utils.tracing import get_tracer
 from .prn_parser import PRNParser
+from .transports import AUTO_SELECTION, PrinterTransport, QueueTransport
+
+logger = logging.getLogger(__name__)
 
 class PrintController:
     """인쇄 컨트롤러"""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[PrinterTransport] = None):
+        """
+        Args:
+            transport: ZPL 전송 방식 (None이면 시스템 프린터 큐)
+        """
         self.project_root = Path(__file__).parent.parent.parent
+        self.transport = transport or QueueTransport()
+        self.tracer = get_tracer()
+        self.events = get_event_log()
 
     def _get_test_zpl_data(self) -> str:
         """테스트 인쇄용 - PRN 템플릿의 모든 설정을 따르되 간단한 TEST LABEL 문구만 출력"""
@@ -46,7 +60,7 @@ class PrintController:
         lot_config: dict,
         mac_address: str,
         template_name: str,
-        printer_selection: str = "자동 검색 (권장)",
+        printer_selection: str = AUTO_SELECTION,
         test_mode: bool = False,
         use_mac_in_label: bool = True,
         print_copies: int = 1
@@ -70,12 +84,16 @@ class PrintController:
                 'message': str
             }
         """
+        # 실패 시 이벤트에 기록할 진행 단계
+        stage = 'serial_generate'
+        serial_number = None
         try:
             if test_mode:
                 # 테스트 모드: 간단한 "ZEBRA TEST LABEL" 문구만 출력
+                stage = 'printer.spool'
                 zpl_data = self._get_test_zpl_data()
                 zpl_data = self._inject_print_quantity(zpl_data, print_copies)
-                self._send_to_printer(zpl_data, printer_selection)
+                self._send_to_printer(zpl_data, printer_selection, 'TEST-LABEL', 'TEST-MODE')
 
                 return {
                     'success': True,
@@ -89,6 +107,7 @@ class PrintController:
                 serial_number = self._generate_serial_number(lot_config)
 
                 # 2. PRN 템플릿 로드
+                stage = 'template_render'
                 template_path = self.project_root / "prns" / template_name
                 zpl_data = self._load_and_replace_template(
                     template_path,
@@ -101,7 +120,8 @@ class PrintController:
                 zpl_data = self._inject_print_quantity(zpl_data, print_copies)
 
                 # 4. 프린터로 전송
-                self._send_to_printer(zpl_data, printer_selection)
+                stage = 'printer.spool'
+                self._send_to_printer(zpl_data, printer_selection, serial_number, mac_address)
 
                 return {
                     'success': True,
@@ -111,6 +131,10 @@ class PrintController:
                 }
 
         except Exception as e:
+            self.events.emit(
+                "print.failed", serial=serial_number, mac=mac_address, stage=stage,
+                test_mode=test_mode, message=str(e),
+            )
             return {
                 'success': False,
                 'serial_number': '',
@@ -151,7 +175,8 @@ class PrintController:
             raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
 
         # PRNParser를 사용하여 변수 치환 및 ZPL 처리
-        parser = PRNParser(str(template_path))
+        with self.tracer.span("print.template_load"):
+            parser = PRNParser(str(template_path))
 
         # 날짜 생성
         date_str = datetime.now().strftime('%Y.%m.%d')
@@ -161,57 +186,46 @@ class PrintController:
 
         # PRNParser의 replace_variables 메서드 사용
         # 이 메서드는 변수 치환 + ^FH\ regex 처리를 모두 수행
-        zpl_data = parser.replace_variables(date_str, serial_number, mac_for_label)
+        with self.tracer.span("print.template_render"):
+            zpl_data = parser.replace_variables(date_str, serial_number, mac_for_label)
+
+        # 디버깅: QR 코드 데이터 확인 및 ZPL 저장 (DEBUG 레벨에서만 - 인쇄 경로 비용 없음)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug_dump_zpl(zpl_data)
 
-        # 디버깅: QR 코드 데이터 확인 및 ZPL 저장
+        return zpl_data
+
+    def _debug_dump_zpl(self, zpl_data: str):
+        """QR 코드 데이터 로그 및 마지막 ZPL 파일 저장 (디버그용)"""
         lines = zpl_data.split('\n')
         for i, line in enumerate(lines):
             if '^BQ' in line and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                print(f"[DEBUG] QR Code at line {i+1}:")
-                print(f"  Command: {line}")
-                print(f"  Data:    {next_line}")
+                logger.debug("QR Code at line %d:\n  Command: %s\n  Data:    %s", i + 1, line, lines[i + 1])
 
-        # ZPL 데이터를 파일로 저장 (디버깅용)
         debug_zpl_path = self.project_root / "debug_last_print.zpl"
         with open(debug_zpl_path, 'w', encoding='utf-8') as f:
             f.write(zpl_data)
-        print(f"[DEBUG] ZPL saved to: {debug_zpl_path}")
-
-        return zpl_data
+        logger.debug("ZPL saved to: %s", debug_zpl_path)
 
-    def _send_to_printer(self, zpl_data: str, printer_selection: str):
-        """프린터로 ZPL 데이터 전송 (시스템 프린터 큐 사용)"""
+    def _send_to_printer(
+        self,
+        zpl_data: str,
+        printer_selection: str,
+        serial_number: Optional[str] = None,
+        mac_address: Optional[str] = None,
+    ):
+        """프린터로 ZPL 데이터 전송 (설정된 transport 사용)"""
         try:
-            # ZebraWinController 사용
-            zebra_ctrl = ZebraWinController()
-
-            # 프린터 선택
-            if printer_selection == "자동 검색 (권장)":
-                # 첫 번째 Zebra 프린터 자동 선택
-                zebra_printers = zebra_ctrl.get_zebra_printers()
-                if not zebra_printers:
-                    raise RuntimeError("시스템에 설치된 Zebra 프린터를 찾을 수 없습니다. 프린터 드라이버를 설치하세요.")
-
-                queue_name = zebra_printers[0]
-                print(f"자동 선택된 프린터: {queue_name}")
-            else:
-                # 설정에서 선택한 프린터 사용
-                # "[프린터 큐] ZDesigner ZT231-203dpi ZPL" 형식으로 저장되어 있을 수 있음
-                if printer_selection.startswith("[프린터 큐] "):
-                    queue_name = printer_selection.replace("[프린터 큐] ", "")
-                else:
-                    # 이전 형식 또는 직접 입력된 큐 이름
-                    queue_name = printer_selection
-                print(f"선택된 프린터: {queue_name}")
-
-            # 프린터 연결
-            zebra_ctrl.connect(queue_name)
-
-            # ZPL 전송
-            zebra_ctrl.send_zpl(zpl_data)
-
-            print(f"✓ 프린터로 ZPL 전송 완료 (큐: {queue_name})")
+            # 큐 전송의 경우 프린터 검색(printer.discovery) 시간 포함
+            started = time.perf_counter()
+            with self.tracer.span("printer.spool"):
+                target = self.transport.send(zpl_data, printer_selection)
+            logger.info("프린터로 ZPL 전송 완료 (%s: %s)", self.transport.name, target)
+            self.events.emit(
+                "print.sent", serial=serial_number, mac=mac_address, stage="printer.spool",
+                transport=self.transport.name, target=target,
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
 
         except Exception as e:
             raise RuntimeError(f"프린터 전송 실패: {e}")
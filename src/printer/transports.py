@@ -0,0 +1,147 @@
+"""프린터 전송 방식 (transport)
+
+PrintController가 만든 ZPL을 실제로 내보내는 방법을 분리합니다.
+- QueueTransport: 시스템 프린터 큐 (zebra 라이브러리, 기본값)
+- TcpTransport: 네트워크 프린터 RAW 포트 (기본 9100)
+- FileTransport: 파일에 추가 기록 (라인 컨트롤러 시험/모의 운전용)
+
+명령줄에서는 create_transport()에 문자열로 지정합니다.
+    "queue", "tcp://192.168.0.50:9100", "file:labels.zpl"
+"""
+
+import logging
+import socket
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from ..utils.tracing import get_tracer
+from .exceptions import PrinterCommunicationError, PrinterError
+
+logger = logging.getLogger(__name__)
+
+AUTO_SELECTION = "자동 검색 (권장)"
+QUEUE_PREFIX = "[프린터 큐] "
+
+
+class PrinterTransport(ABC):
+    """전송 방식 기본 클래스"""
+
+    name = "base"
+
+    @abstractmethod
+    def send(self, zpl_data: str, printer_selection: str = AUTO_SELECTION) -> str:
+        """ZPL 전송
+
+        Args:
+            zpl_data: 전송할 ZPL
+            printer_selection: 설정 화면의 프린터 선택 값 (큐 전송에서만 사용)
+
+        Returns:
+            실제 전송 대상 설명 (로그용)
+        """
+
+
+class QueueTransport(PrinterTransport):
+    """시스템 프린터 큐 전송 (ZebraWinController)"""
+
+    name = "queue"
+
+    def send(self, zpl_data: str, printer_selection: str = AUTO_SELECTION) -> str:
+        # zebra 라이브러리는 큐 전송을 쓸 때만 필요
+        from .zebra_win_controller import ZebraWinController
+
+        zebra_ctrl = ZebraWinController()
+
+        if printer_selection == AUTO_SELECTION:
+            # 첫 번째 Zebra 프린터 자동 선택
+            with get_tracer().span("printer.discovery"):
+                zebra_printers = zebra_ctrl.get_zebra_printers()
+            if not zebra_printers:
+                raise PrinterError("시스템에 설치된 Zebra 프린터를 찾을 수 없습니다. 프린터 드라이버를 설치하세요.")
+            queue_name = zebra_printers[0]
+            logger.info("자동 선택된 프린터: %s", queue_name)
+        else:
+            # "[프린터 큐] ZDesigner ZT231-203dpi ZPL" 형식 또는 직접 입력된 큐 이름
+            queue_name = printer_selection.replace(QUEUE_PREFIX, "", 1)
+            logger.info("선택된 프린터: %s", queue_name)
+
+        zebra_ctrl.connect(queue_name)
+        zebra_ctrl.send_zpl(zpl_data)
+        return queue_name
+
+
+class TcpTransport(PrinterTransport):
+    """네트워크 프린터 RAW 포트 전송"""
+
+    name = "tcp"
+
+    def __init__(self, host: str, port: int = 9100, timeout: float = 5.0):
+        """
+        Args:
+            host: 프린터 IP/호스트 이름
+            port: RAW 포트 (Zebra 기본 9100)
+            timeout: 연결/전송 타임아웃 (초)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def send(self, zpl_data: str, printer_selection: str = AUTO_SELECTION) -> str:
+        target = f"{self.host}:{self.port}"
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+                sock.sendall(zpl_data.encode('utf-8'))
+        except OSError as e:
+            raise PrinterCommunicationError(f"{target} - {e}")
+        return target
+
+
+class FileTransport(PrinterTransport):
+    """파일 추가 기록 (라벨마다 ZPL 한 덩어리)"""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: ZPL을 추가할 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def send(self, zpl_data: str, printer_selection: str = AUTO_SELECTION) -> str:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8', newline='') as f:
+            f.write(zpl_data)
+            if not zpl_data.endswith('\n'):
+                f.write('\n')
+        return str(self.path)
+
+
+def create_transport(spec: Optional[str]) -> PrinterTransport:
+    """문자열 지정으로 전송 방식 생성
+
+    Args:
+        spec: "queue" | "tcp://host[:port]" | "file:path" (None이면 queue)
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    if not spec or spec == "queue":
+        return QueueTransport()
+
+    if spec.startswith("tcp://"):
+        host, _, port = spec[len("tcp://"):].partition(":")
+        if not host:
+            raise ValueError(f"프린터 주소가 없습니다: {spec}")
+        return TcpTransport(host, int(port) if port else 9100)
+
+    if spec.startswith("file:"):
+        path = spec[len("file:"):]
+        if not path:
+            raise ValueError(f"파일 경로가 없습니다: {spec}")
+        return FileTransport(path)
+
+    raise ValueError(f"알 수 없는 전송 방식: {spec} (queue, tcp://host:port, file:path)")
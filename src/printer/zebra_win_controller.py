@@ -4,7 +4,6 @@ Zebra 프린터 제어 (zebra 라이브러리 사용)
 """
 
 from typing import Optional, List
-from zebra import Zebra
 
 
 class ZebraWinController:
@@ -19,6 +18,9 @@ class ZebraWinController:
             queue_name: 시스템 프린터 큐 이름 (예: "ZDesigner ZT231-203dpi ZPL")
                        None이면 나중에 설정
         """
+        # zebra 라이브러리는 실제로 프린터 큐를 쓸 때만 import (시작 시간 단축)
+        from zebra import Zebra
+
         self.zebra = Zebra(queue_name)
         self.queue_name = queue_name
         self._is_connected = False
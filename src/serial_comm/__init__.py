@@ -2,5 +2,6 @@
 
 # MCUMonitor는 PyQt6 의존성이 있어 GUI에서만 import
 from .mac_parser import MACParser
+from .capture import SerialCapture
 
-__all__ = ["MACParser"]
+__all__ = ["MACParser", "SerialCapture"]
@@ -0,0 +1,348 @@
+"""
+시리얼 수신 데이터 캡처 및 재생
+
+MCU가 보낸 원본 바이트를 타임스탬프와 함께 길이 접두(length-prefixed)
+바이너리 파일에 기록하고, 기록된 캡처를 실제 속도 또는 가속 속도로
+다시 재생합니다.
+
+파일 형식:
+    헤더:   b"WFSCAP01" (8바이트)
+    레코드: <int64 time_ns><uint32 length><payload>  (리틀 엔디안)
+
+실행:
+    python -m src.serial_comm.capture info logs/serial_capture.bin
+    python -m src.serial_comm.capture dump logs/serial_capture.bin
+    python -m src.serial_comm.capture replay logs/serial_capture.bin --pty --speed 10
+    python -m src.serial_comm.capture replay logs/serial_capture.bin --port COM7
+"""
+
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+MAGIC = b"WFSCAP01"
+RECORD_HEADER = struct.Struct("<qI")
+
+
+class SerialCapture:
+    """시리얼 원본 데이터 캡처 싱크 (로테이션 지원)
+
+    리더 스레드에서 write()를 호출하는 용도로 설계되었으며,
+    버퍼링된 파일 쓰기로 호출당 오버헤드를 최소화합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10485760,  # 10MB
+        backup_count: int = 5,
+        buffer_size: int = 65536,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Args:
+            path: 캡처 파일 경로
+            max_bytes: 파일 최대 크기 (초과 시 로테이션, 0이면 로테이션 안 함)
+            backup_count: 보관할 이전 파일 개수 (path.1 ~ path.N)
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            flush_interval: 디스크로 flush하는 최소 간격 (초)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self.records_written = 0
+        self.bytes_written = 0
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._open()
+
+    def _open(self) -> None:
+        """캡처 파일 열기 (새 파일이면 헤더 기록)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        self._size = self._file.tell()
+        if self._size == 0:
+            self._file.write(MAGIC)
+            self._size = len(MAGIC)
+
+    def write(self, data: bytes, timestamp_ns: Optional[int] = None) -> None:
+        """
+        수신 데이터 기록
+
+        Args:
+            data: 시리얼에서 읽은 원본 바이트
+            timestamp_ns: 수신 시각 (None이면 현재 시각, time.time_ns 기준)
+        """
+        if not data:
+            return
+
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+
+        record_size = RECORD_HEADER.size + len(data)
+        header = RECORD_HEADER.pack(timestamp_ns, len(data))
+
+        with self._lock:
+            if self._file is None:
+                return
+
+            if self.max_bytes and self._size + record_size > self.max_bytes and self._size > len(MAGIC):
+                self._rotate()
+
+            self._file.write(header)
+            self._file.write(data)
+            self._size += record_size
+            self.records_written += 1
+            self.bytes_written += len(data)
+
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+    def _rotate(self) -> None:
+        """파일 로테이션 (path → path.1 → ... → path.N)"""
+        self._file.close()
+
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                src = self._backup_path(index)
+                if src.exists():
+                    os.replace(src, self._backup_path(index + 1))
+            os.replace(self.path, self._backup_path(1))
+        else:
+            self.path.unlink()
+
+        self._open()
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def flush(self) -> None:
+        """버퍼를 디스크로 기록"""
+        with self._lock:
+            if self._file:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """캡처 파일 닫기"""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def capture_files(path: str) -> List[Path]:
+    """
+    로테이션된 캡처 파일 목록 (오래된 순)
+
+    Args:
+        path: 현재 캡처 파일 경로
+
+    Returns:
+        [path.N, ..., path.1, path] 중 존재하는 파일
+    """
+    base = Path(path)
+    backups = []
+    index = 1
+    while True:
+        candidate = base.with_name(f"{base.name}.{index}")
+        if not candidate.exists():
+            break
+        backups.append(candidate)
+        index += 1
+
+    files = list(reversed(backups))
+    if base.exists():
+        files.append(base)
+    return files
+
+
+def read_capture(path: str) -> Iterator[Tuple[int, bytes]]:
+    """
+    캡처 파일 하나의 레코드 읽기
+
+    Args:
+        path: 캡처 파일 경로
+
+    Yields:
+        (time_ns, payload)
+
+    Raises:
+        ValueError: 캡처 파일 형식이 아님
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"캡처 파일 형식이 아닙니다: {path}")
+
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return  # 파일 끝 (또는 기록 중 잘린 레코드)
+            timestamp_ns, length = RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield timestamp_ns, payload
+
+
+def read_capture_set(path: str) -> Iterator[Tuple[int, bytes]]:
+    """로테이션된 파일을 포함한 전체 캡처 레코드 (오래된 순)"""
+    for file_path in capture_files(path):
+        yield from read_capture(str(file_path))
+
+
+def replay(
+    path: str,
+    write: Callable[[bytes], object],
+    speed: float = 1.0,
+    stop_event: Optional[threading.Event] = None,
+) -> int:
+    """
+    캡처 재생
+
+    Args:
+        path: 캡처 파일 경로 (로테이션 파일 포함)
+        write: 바이트를 받을 함수 (예: serial.Serial.write, os.write 래퍼)
+        speed: 재생 배속 (1.0 = 실제 속도, 0이면 대기 없이 최대 속도)
+        stop_event: 설정되면 재생 중단
+
+    Returns:
+        재생한 레코드 수
+    """
+    count = 0
+    first_ts: Optional[int] = None
+    started = time.monotonic()
+
+    for timestamp_ns, payload in read_capture_set(path):
+        if stop_event is not None and stop_event.is_set():
+            break
+
+        if first_ts is None:
+            first_ts = timestamp_ns
+
+        if speed > 0:
+            target = started + (timestamp_ns - first_ts) / 1e9 / speed
+            delay = target - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        write(payload)
+        count += 1
+
+    return count
+
+
+def capture_info(path: str) -> dict:
+    """
+    캡처 요약 정보
+
+    Returns:
+        {'files': 파일 수, 'records': 레코드 수, 'bytes': 데이터 바이트, 'duration_sec': 기록 구간}
+    """
+    records = 0
+    total = 0
+    first_ts = last_ts = None
+
+    for timestamp_ns, payload in read_capture_set(path):
+        records += 1
+        total += len(payload)
+        if first_ts is None:
+            first_ts = timestamp_ns
+        last_ts = timestamp_ns
+
+    return {
+        'files': len(capture_files(path)),
+        'records': records,
+        'bytes': total,
+        'duration_sec': (last_ts - first_ts) / 1e9 if records else 0.0,
+    }
+
+
+def _open_replay_target(args) -> Tuple[Callable[[bytes], object], Callable[[], None]]:
+    """재생 대상 열기 (pty 또는 시리얼 포트)"""
+    if args.pty:
+        import pty
+        import tty
+
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+        print(f"pty 포트: {os.ttyname(slave)}")
+        input("모니터를 위 포트에 연결한 후 Enter를 누르세요...")
+
+        def close_pty():
+            os.close(master)
+            os.close(slave)
+
+        return (lambda data: os.write(master, data)), close_pty
+
+    import serial
+    port = serial.Serial(port=args.port, baudrate=args.baud, write_timeout=5)
+    return port.write, port.close
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="시리얼 캡처 조회/재생 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    info_parser = sub.add_parser("info", help="캡처 요약")
+    info_parser.add_argument("path")
+
+    dump_parser = sub.add_parser("dump", help="캡처 내용 출력")
+    dump_parser.add_argument("path")
+
+    replay_parser = sub.add_parser("replay", help="캡처 재생")
+    replay_parser.add_argument("path")
+    target = replay_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--pty", action="store_true", help="pty를 열어 재생 (Linux)")
+    target.add_argument("--port", help="재생할 시리얼 포트 (예: COM7, 가상 null-modem 쌍의 한쪽)")
+    replay_parser.add_argument("--baud", type=int, default=115200)
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0 = 최대 속도)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        info = capture_info(args.path)
+        print(f"파일: {info['files']}개, 레코드: {info['records']}, "
+              f"데이터: {info['bytes']} bytes, 구간: {info['duration_sec']:.3f}초")
+        return 0
+
+    if args.command == "dump":
+        for timestamp_ns, payload in read_capture_set(args.path):
+            stamp = datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")
+            print(f"{stamp} [{len(payload):4d}] {payload!r}")
+        return 0
+
+    write, close = _open_replay_target(args)
+    try:
+        started = time.monotonic()
+        count = replay(args.path, write, speed=args.speed)
+        print(f"✓ {count}개 레코드 재생 완료 ({time.monotonic() - started:.3f}초)")
+    finally:
+        close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
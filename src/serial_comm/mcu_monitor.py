@@ -25,18 +25,21 @@ class MCUMonitor(QThread):
         port: str,
         baudrate: int = 115200,
         timeout: int = 1,
+        capture=None,
     ):
         """
         Args:
             port: 시리얼 포트 (COM3, /dev/ttyUSB0 등)
             baudrate: 보드레이트
             timeout: 읽기 타임아웃 (초)
+            capture: 수신 원본 데이터를 기록할 SerialCapture (선택)
         """
         super().__init__()
 
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.capture = capture
 
         self._serial: Optional[serial.Serial] = None
         self._running = False
@@ -60,7 +63,10 @@ class MCUMonitor(QThread):
                 try:
                     if self._serial and self._serial.in_waiting > 0:
                         # 한 줄 읽기
-                        line = self._serial.readline().decode('utf-8', errors='ignore').strip()
+                        raw = self._serial.readline()
+                        if self.capture:
+                            self.capture.write(raw)
+                        line = raw.decode('utf-8', errors='ignore').strip()
 
                         if line:
                             # GUI로 로그 전송
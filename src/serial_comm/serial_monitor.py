@@ -3,14 +3,16 @@ MCU 시리얼 통신 모니터
 실시간 데이터 수신 및 MAC 주소 파싱
 """
 
+import logging
 import serial
-import serial.tools.list_ports
 import threading
 import re
 from typing import Optional, Callable, List
 from queue import Queue
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class SerialMonitor:
     """
@@ -20,8 +22,14 @@ class SerialMonitor:
     MAC 주소를 자동으로 파싱합니다.
     """
 
-    def __init__(self, baudrate: int = 115200):
+    def __init__(self, baudrate: int = 115200, capture=None):
+        """
+        Args:
+            baudrate: 통신 속도
+            capture: 수신 원본 데이터를 기록할 SerialCapture (선택)
+        """
         self.baudrate = baudrate
+        self.capture = capture
         self.serial_port: Optional[serial.Serial] = None
         self.is_connected = False
         self.is_running = False
@@ -40,6 +48,7 @@ class SerialMonitor:
     @staticmethod
     def list_available_ports() -> List[str]:
         """사용 가능한 시리얼 포트 목록 반환"""
+        import serial.tools.list_ports
         ports = serial.tools.list_ports.comports()
         return [port.device for port in ports]
 
@@ -80,7 +89,7 @@ class SerialMonitor:
             return True
 
         except Exception as e:
-            print(f"Serial connection error: {e}")
+            logger.error("Serial connection error: %s", e)
             self.is_connected = False
 
             # 연결 실패 콜백
@@ -102,7 +111,7 @@ class SerialMonitor:
             try:
                 self.serial_port.close()
             except Exception as e:
-                print(f"Error closing serial port: {e}")
+                logger.warning("Error closing serial port: %s", e)
 
         self.is_connected = False
         self.serial_port = None
@@ -129,7 +138,7 @@ class SerialMonitor:
             self.serial_port.write(data.encode('utf-8'))
 
         except Exception as e:
-            print(f"Serial send error: {e}")
+            logger.error("Serial send error: %s", e)
 
     def _receive_loop(self):
         """수신 루프 (별도 스레드에서 실행)"""
@@ -140,6 +149,8 @@ class SerialMonitor:
                 if self.serial_port and self.serial_port.in_waiting > 0:
                     # 데이터 읽기
                     raw_data = self.serial_port.read(self.serial_port.in_waiting)
+                    if self.capture:
+                        self.capture.write(raw_data)
 
                     # UTF-8 디코딩 시도
                     try:
@@ -167,11 +178,11 @@ class SerialMonitor:
                     time.sleep(0.01)
 
             except serial.SerialException as e:
-                print(f"Serial receive error: {e}")
+                logger.error("Serial receive error: %s", e)
                 self.disconnect()
                 break
             except Exception as e:
-                print(f"Unexpected error in receive loop: {e}")
+                logger.exception("Unexpected error in receive loop: %s", e)
                 time.sleep(0.1)
 
     def _check_mac_address(self, line: str):
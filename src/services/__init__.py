@@ -0,0 +1,17 @@
+"""서비스 레이어 (Qt 미사용)
+
+GUI(MainWindow)와 헤드리스 실행기(src.headless)가 함께 사용하는
+인쇄/설정/내보내기/가져오기/생산순서 임대/저널 동기화 비즈니스 로직입니다.
+"""
+
+from .print_service import PrintService
+from .configuration_service import ConfigurationService
+from .export_service import ExportCancelledError, HistoryExportService
+from .import_service import HistoryImportService
+from .sequence_lease import SequenceLeaser
+from .journal_sync import JournalSyncWorker
+
+__all__ = [
+    'PrintService', 'ConfigurationService', 'HistoryExportService', 'ExportCancelledError',
+    'HistoryImportService', 'SequenceLeaser', 'JournalSyncWorker',
+]
@@ -6,7 +6,7 @@
 from datetime import datetime
 from typing import Optional
 
-from ...utils.serial_number_generator import SerialNumberGenerator
+from ..utils.serial_number_generator import SerialNumberGenerator
 
 
 class ConfigurationService:
@@ -21,12 +21,14 @@ class ConfigurationService:
         'print_copies'
     ]
 
-    def __init__(self, db):
+    def __init__(self, db, leaser=None):
         """
         Args:
             db: DBManager 인스턴스
+            leaser: SequenceLeaser (선택, 있으면 다음 번호를 임대 블록에서 표시)
         """
         self.db = db
+        self.leaser = leaser
 
     def load_home_data(self, latest_mac_address: Optional[str] = None) -> dict:
         """홈 화면 데이터 로드
@@ -67,6 +69,14 @@ class ConfigurationService:
             'mac_address': latest_mac_address
         }
 
+    def load_next_serial(self) -> tuple:
+        """다음 시리얼 번호만 조회 (출력 후 증분 갱신용)
+
+        Returns:
+            (next_serial, next_sequence) 튜플
+        """
+        return self._calculate_next_serial(self.db.get_lot_config())
+
     def _calculate_next_serial(self, lot_config: dict) -> tuple:
         """다음 시리얼 번호 계산
 
@@ -82,8 +92,13 @@ class ConfigurationService:
         # 최대 생산순서 조회
         max_seq = self.db.get_max_sequence_for_lot(current_lot)
 
+        # 임대 블록이 있으면 실제로 인쇄할 번호 (없으면 첫 임대 전이라 DB 기준 추정값)
+        leased = self.leaser.peek(current_lot) if self.leaser is not None and auto_increment else None
+
         # 다음 생산순서 결정
-        if max_seq is None:
+        if leased is not None:
+            next_sequence = str(leased).zfill(4)
+        elif max_seq is None:
             next_sequence = '0001'
         elif auto_increment:
             next_sequence = str(max_seq + 1).zfill(4)
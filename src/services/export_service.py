@@ -0,0 +1,144 @@
+"""이력 내보내기 서비스
+
+print_history를 CSV 또는 XLSX로 내보냅니다.
+전용 읽기 연결(HistoryReader)에서 fetchmany 단위로 읽어 바로 파일에 쓰므로
+행 수와 관계없이 메모리 사용량이 일정하고, 내보내는 동안 인쇄 저장을 막지 않습니다.
+
+GUI(MainWindow, export 레인)와 헤드리스 실행기(export 명령)가 함께 사용하므로 Qt에 의존하지 않습니다.
+"""
+
+import csv
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from ..database.exceptions import QueryInterruptedError
+from ..database.history_reader import HistoryReader
+from ..utils.xlsx_writer import XlsxStreamWriter
+
+# (컬럼, 머리글)
+EXPORT_COLUMNS = [
+    ('id', 'ID'),
+    ('serial_number', '시리얼 번호'),
+    ('mac_address', 'MAC 주소'),
+    ('print_date', '출력 날짜'),
+    ('print_datetime', '출력 일시'),
+    ('status', '상태'),
+    ('error_message', '오류 메시지'),
+    ('prn_template', 'PRN 템플릿'),
+]
+
+EXPORT_FORMATS = ('csv', 'xlsx')
+
+# 내보내기 필터 키 (HistoryReader.iter_history 인자)
+FILTER_KEYS = ('date_from', 'date_to', 'serial_number', 'mac_address', 'lot_number')
+
+
+class ExportCancelledError(Exception):
+    """내보내기가 취소됨"""
+
+    def __init__(self):
+        super().__init__("내보내기가 취소되었습니다.")
+
+
+class HistoryExportService:
+    """이력 내보내기 서비스"""
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (DBManager와 같은 파일)
+        """
+        self.db_path = db_path
+        self._reader: Optional[HistoryReader] = None
+
+    def export(
+        self,
+        path: str,
+        filters: Optional[dict] = None,
+        fmt: Optional[str] = None,
+        progress: Optional[Callable[[tuple], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> dict:
+        """이력 내보내기
+
+        임시 파일(.part)에 쓰고 완료되면 대상 경로로 바꾸므로
+        취소/오류 시 불완전한 파일이 남지 않습니다.
+
+        Args:
+            path: 저장 경로
+            filters: date_from, date_to (YYYY-MM-DD), serial_number, mac_address (부분 일치),
+                     lot_number (시리얼 접두사)
+            fmt: "csv" 또는 "xlsx" (None이면 확장자로 판단)
+            progress: 청크마다 (내보낸 행 수, 전체 행 수)로 호출 (워커 스레드)
+            is_cancelled: 청크마다 확인, True면 중단
+
+        Returns:
+            {'path': 저장 경로, 'rows': 내보낸 행 수}
+
+        Raises:
+            ExportCancelledError: 취소된 경우
+            ValueError: 지원하지 않는 형식
+        """
+        fmt = (fmt or Path(path).suffix.lstrip('.')).lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식: {fmt or '(없음)'} (csv, xlsx)")
+
+        conditions = {k: v for k, v in (filters or {}).items() if k in FILTER_KEYS and v}
+        part_path = f"{path}.part"
+        reader = self._reader = HistoryReader(self.db_path)
+        chunks = None
+
+        try:
+            total = reader.count_history(**conditions)
+            chunks = reader.iter_history(
+                columns=[name for name, _ in EXPORT_COLUMNS],
+                chunk_size=self.CHUNK_SIZE,
+                **conditions,
+            )
+            written = 0
+            with _open_writer(part_path, fmt) as write_rows:
+                write_rows([[title for _, title in EXPORT_COLUMNS]])
+                for rows in chunks:
+                    if is_cancelled is not None and is_cancelled():
+                        raise ExportCancelledError()
+                    write_rows(rows)
+                    written += len(rows)
+                    if progress is not None:
+                        progress((written, total))
+
+            os.replace(part_path, path)
+            return {'path': path, 'rows': written}
+
+        except QueryInterruptedError:
+            raise ExportCancelledError()
+        finally:
+            # 중단된 조회 generator가 잡고 있는 읽기 연결 lock을 먼저 해제
+            if chunks is not None:
+                chunks.close()
+            self._reader = None
+            reader.close()
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    def interrupt(self) -> None:
+        """실행 중인 내보내기 조회 중단 (어느 스레드에서나 호출 가능)"""
+        reader = self._reader
+        if reader is not None:
+            reader.interrupt()
+
+
+@contextmanager
+def _open_writer(path: str, fmt: str) -> Iterator[Callable]:
+    """형식별 행 기록 함수 (rows -> None)"""
+    if fmt == 'xlsx':
+        with XlsxStreamWriter(path, sheet_name="Print History") as xlsx:
+            yield xlsx.write_rows
+        return
+
+    # Excel에서 한글이 깨지지 않도록 BOM 포함
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        yield csv.writer(f).writerows
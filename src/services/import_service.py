@@ -0,0 +1,178 @@
+"""이력 일괄 가져오기 서비스
+
+이전 스테이션/스프레드시트의 시리얼·MAC 기록을 print_history로 가져옵니다.
+- 행을 batch_size씩 모아 SerialNumberGenerator.validate_many / MACParser.validate로 검증
+- 배치마다 executemany + 커밋 한 번 (DBManager.insert_print_history_many)
+- 중복 시리얼은 예외 대신 결과 목록으로 보고
+- defer_indexes=True면 보조 인덱스를 지웠다가 끝난 뒤 한 번에 재생성 (대량 입력용)
+
+CSV 머리글은 DB 컬럼 이름(serial_number, ...) 또는 내보내기 머리글(시리얼 번호, ...)을 사용할 수 있습니다.
+헤드리스 실행기(import 명령)에서 사용하며 Qt에 의존하지 않습니다.
+"""
+
+import csv
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..serial_comm.mac_parser import MACParser
+from ..utils.serial_number_generator import SerialNumberGenerator
+from .export_service import EXPORT_COLUMNS
+
+# 머리글 → 컬럼 (내보내기 머리글 포함, 대소문자/공백 무시)
+HEADER_ALIASES: Dict[str, str] = {
+    **{name: name for name, _ in EXPORT_COLUMNS},
+    **{title.lower(): name for name, title in EXPORT_COLUMNS},
+    'serial': 'serial_number',
+    'mac': 'mac_address',
+}
+
+STATUSES = ('success', 'failed')
+
+
+class HistoryImportService:
+    """이력 일괄 가져오기 서비스"""
+
+    BATCH_SIZE = 10000
+
+    def __init__(self, db):
+        """
+        Args:
+            db: DBManager 인스턴스
+        """
+        self.db = db
+
+    def import_csv(self, path: str, **options) -> dict:
+        """CSV 파일 가져오기 (options는 import_records 인자)"""
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            return self.import_records(read_csv_records(f), **options)
+
+    def import_records(
+        self,
+        records: Iterable[Tuple[int, dict]],
+        batch_size: Optional[int] = None,
+        defer_indexes: bool = False,
+        dry_run: bool = False,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> dict:
+        """레코드 일괄 가져오기
+
+        Args:
+            records: (줄 번호, {컬럼: 값}) - serial_number, mac_address 필수,
+                     print_datetime 또는 print_date 중 하나 필수
+            batch_size: 트랜잭션 하나에 넣을 행 수
+            defer_indexes: 보조 인덱스를 지우고 마지막에 재생성
+            dry_run: 검증/중복 확인만 하고 저장하지 않음
+            progress: 배치마다 처리한 행 수로 호출
+
+        Returns:
+            {'total': 처리 행 수, 'inserted': 저장 행 수,
+             'duplicates': [중복 시리얼, ...],
+             'invalid': [{'line': 줄 번호, 'serial_number': 값, 'reason': 사유}, ...]}
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        report = {'total': 0, 'inserted': 0, 'duplicates': [], 'invalid': []}
+        seen = set()  # dry_run 전용 (배치 간 중복 확인)
+
+        dropped = self.db.drop_secondary_indexes() if defer_indexes and not dry_run else []
+        try:
+            for batch in _batches(records, batch_size):
+                rows = self._validate_batch(batch, report['invalid'])
+                report['total'] += len(batch)
+
+                if dry_run:
+                    existing = self.db.find_existing_serials([row[0] for row in rows])
+                    for row in rows:
+                        if row[0] in existing or row[0] in seen:
+                            report['duplicates'].append(row[0])
+                        seen.add(row[0])
+                else:
+                    duplicates = self.db.insert_print_history_many(rows)
+                    report['duplicates'].extend(duplicates)
+                    report['inserted'] += len(rows) - len(duplicates)
+
+                if progress is not None:
+                    progress(report['total'])
+        finally:
+            if dropped:
+                self.db.rebuild_indexes()
+
+        return report
+
+    @staticmethod
+    def _validate_batch(batch: List[Tuple[int, dict]], invalid: List[dict]) -> List[tuple]:
+        """배치 검증 - 유효한 행은 insert 튜플로, 나머지는 invalid에 추가"""
+        serials = [(record.get('serial_number') or '').strip() for _, record in batch]
+        serial_ok = SerialNumberGenerator.validate_many(serials)
+
+        rows = []
+        for (line, record), serial, valid_serial in zip(batch, serials, serial_ok):
+            mac = (record.get('mac_address') or '').strip().upper()
+            status = (record.get('status') or 'success').strip().lower()
+
+            if not valid_serial:
+                reason = "시리얼 번호 형식 오류"
+            elif not MACParser.validate(mac):
+                reason = "MAC 주소 형식 오류"
+            elif status not in STATUSES:
+                reason = f"상태 값 오류: {status}"
+            else:
+                reason = None
+                try:
+                    print_datetime, print_date = _normalize_datetime(
+                        record.get('print_datetime'), record.get('print_date')
+                    )
+                except ValueError as e:
+                    reason = f"날짜 형식 오류: {e}"
+
+            if reason:
+                invalid.append({'line': line, 'serial_number': serial, 'reason': reason})
+                continue
+
+            rows.append((
+                serial, mac, print_date, print_datetime, status,
+                record.get('error_message') or None,
+                record.get('prn_template') or '',
+            ))
+        return rows
+
+
+def read_csv_records(stream) -> Iterator[Tuple[int, dict]]:
+    """CSV를 (줄 번호, {컬럼: 값})으로 읽기 (머리글은 HEADER_ALIASES로 변환)"""
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [HEADER_ALIASES.get(h.strip().lower(), h.strip().lower()) for h in header]
+    if 'serial_number' not in columns or 'mac_address' not in columns:
+        raise ValueError("CSV 머리글에 serial_number, mac_address 컬럼이 필요합니다.")
+
+    for line, values in enumerate(reader, start=2):
+        if values:
+            yield line, dict(zip(columns, values))
+
+
+def _normalize_datetime(print_datetime: Optional[str], print_date: Optional[str]) -> Tuple[str, str]:
+    """(print_datetime ISO, print_date YYYY-MM-DD) - 하나만 있으면 다른 하나를 채움"""
+    print_datetime = (print_datetime or '').strip()
+    print_date = (print_date or '').strip()
+    if not print_datetime and not print_date:
+        raise ValueError("print_datetime/print_date 없음")
+
+    if print_datetime:
+        parsed = datetime.fromisoformat(print_datetime)
+    else:
+        parsed = datetime.strptime(print_date, "%Y-%m-%d")
+    if print_date:
+        datetime.strptime(print_date, "%Y-%m-%d")
+    return parsed.isoformat(), print_date or parsed.strftime("%Y-%m-%d")
+
+
+def _batches(records: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
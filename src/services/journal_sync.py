@@ -0,0 +1,185 @@
+"""인쇄 저널 동기화
+
+스테이션 로컬 저널(database/journal.py)에 쌓인 인쇄 기록을 공유 DB 서버로 보냅니다.
+- 새 기록이 들어오면 바로 깨어나고, 그 외에는 interval마다 확인
+- batch_size개씩 묶어 sync_print_history 호출 (serial_number 기준 멱등 → 응답 유실 후 재전송해도 안전)
+- 서버에 닿지 않으면 대기 시간을 max_interval까지 두 배씩 늘리고, 연결되면 원래 간격으로 복귀
+- 같은 시리얼이 서버에 다른 MAC/시각으로 있으면 덮어쓰지 않고 저널에 충돌로 표시
+
+status()로 미전송 건수와 동기화 지연(가장 오래된 미전송 기록의 나이)을 확인하며,
+배치마다 이벤트 로그에 journal.sync / journal.conflict를 남깁니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..database.exceptions import DatabaseError, RemoteUnavailableError
+from ..database.journal import SYNC_COLUMNS
+from ..utils.event_log import get_event_log
+
+logger = logging.getLogger(__name__)
+
+
+class JournalSyncWorker:
+    """저널 → 공유 DB 서버 재전송 스레드"""
+
+    DEFAULT_BATCH_SIZE = 200
+    DEFAULT_INTERVAL = 5.0
+    MAX_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        db,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        interval: float = DEFAULT_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+    ):
+        """
+        Args:
+            db: JournaledDBManager (journal/central 사용, on_journaled로 깨움)
+            batch_size: 요청 하나에 보낼 기록 수
+            interval: 기본 확인 간격 (초)
+            max_interval: 서버가 끊겼을 때 최대 재시도 간격 (초)
+        """
+        self.journal = db.journal
+        self.central = db.central
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_interval = max_interval
+        self.events = get_event_log()
+        db.on_journaled = self.wake
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._sync_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._delay = interval
+
+        # 통계
+        self.synced = 0        # 이번 실행에서 서버에 반영한 건수 (이미 있던 동일 기록 포함)
+        self.conflicts = 0     # 이번 실행에서 발견한 충돌 건수
+        self.last_sync_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def start(self) -> "JournalSyncWorker":
+        """동기화 스레드 시작 (이전 실행에서 남은 기록은 바로 전송)"""
+        self._wake.set()
+        self._thread = threading.Thread(target=self._run, name="JournalSync", daemon=True)
+        self._thread.start()
+        return self
+
+    def wake(self) -> None:
+        """새 기록 알림 (대기 중이면 바로 동기화)"""
+        self._wake.set()
+
+    def stop(self, flush_timeout: float = 5.0) -> Dict[str, Any]:
+        """스레드 종료 후 남은 기록을 한 번 더 전송 시도
+
+        Args:
+            flush_timeout: 마지막 전송에 쓸 최대 시간 (초)
+
+        Returns:
+            status()
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sync_once(deadline=time.monotonic() + flush_timeout)
+        return self.status()
+
+    def sync_once(self, deadline: Optional[float] = None) -> int:
+        """미전송 기록이 없거나 서버가 끊길 때까지 배치 전송
+
+        Args:
+            deadline: time.monotonic() 기준 중단 시각 (None이면 끝까지)
+
+        Returns:
+            이번에 처리(반영 또는 충돌 표시)한 건수
+        """
+        done = 0
+        with self._sync_lock:
+            while deadline is None or time.monotonic() < deadline:
+                rows = self.journal.pending(self.batch_size)
+                if not rows:
+                    break
+                try:
+                    done += self._sync_batch(rows)
+                except RemoteUnavailableError as e:
+                    self._set_error(str(e))
+                    break
+                except DatabaseError as e:
+                    logger.error("저널 동기화 실패: %s", e)
+                    self._set_error(str(e))
+                    break
+        return done
+
+    def status(self) -> Dict[str, Any]:
+        """동기화 상태
+
+        Returns:
+            {'pending', 'conflicts', 'lag_seconds', 'synced', 'last_sync_at', 'last_error'}
+            lag_seconds: 가장 오래된 미전송 기록이 기다린 시간 (없으면 0)
+        """
+        stats = self.journal.stats()
+        oldest = stats['oldest_pending_at']
+        return {
+            'pending': stats['pending'],
+            'conflicts': stats['conflicts'],
+            'lag_seconds': round(time.time() - oldest, 3) if oldest else 0.0,
+            'synced': self.synced,
+            'last_sync_at': self.last_sync_at,
+            'last_error': self.last_error,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.sync_once()
+            # 서버가 끊겨 있으면 재시도 간격을 늘림 (새 기록이 와도 깨어나지만 바로 실패하고 다시 대기)
+            self._delay = min(self._delay * 2, self.max_interval) if self.last_error else self.interval
+
+    def _sync_batch(self, rows) -> int:
+        lag = time.time() - rows[0]['journaled_at']
+        started = time.perf_counter()
+        results = self.central.sync_print_history(
+            [{column: row[column] for column in SYNC_COLUMNS} for row in rows]
+        )
+
+        marks = []
+        conflicts = 0
+        for row, result in zip(rows, results):
+            mark = {'journal_id': row['id'], 'remote_id': result.get('id'), 'state': 'synced'}
+            if result['state'] == 'conflict':
+                conflicts += 1
+                mark['state'] = 'conflict'
+                mark['conflict'] = json.dumps(result.get('existing'), ensure_ascii=False)
+                logger.warning("저널 충돌: %s (서버 기록 %s)", row['serial_number'], result.get('existing'))
+                self.events.emit(
+                    "journal.conflict", serial=row['serial_number'], mac=row['mac_address'],
+                    remote_mac=(result.get('existing') or {}).get('mac_address'),
+                )
+            marks.append(mark)
+        self.journal.mark(marks)
+
+        self.synced += len(rows) - conflicts
+        self.conflicts += conflicts
+        self.last_sync_at = time.time()
+        self.last_error = None
+        self.events.emit(
+            "journal.sync", count=len(rows), conflicts=conflicts or None,
+            lag_s=round(lag, 3), duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return len(rows)
+
+    def _set_error(self, message: str) -> None:
+        if self.last_error is None:
+            logger.warning("저널 동기화 대기 (서버 연결 없음): %s", message)
+        self.last_error = message
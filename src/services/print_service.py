@@ -0,0 +1,260 @@
+"""인쇄 처리 서비스
+
+인쇄 관련 비즈니스 로직을 담당합니다.
+- 생산순서 계산/예약 (같은 DB 또는 공유 DB 서버를 쓰는 스테이션끼리 겹치지 않도록)
+- 인쇄 실행
+- 인쇄 결과 저장
+
+GUI(MainWindow)와 헤드리스 실행기(src.headless)가 함께 사용하므로 Qt에 의존하지 않습니다.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ..database.exceptions import DatabaseError
+from ..utils.event_log import get_event_log
+from ..utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class PrintService:
+    """인쇄 처리 서비스"""
+
+    def __init__(self, db, print_controller, leaser=None):
+        """
+        Args:
+            db: DBManager 또는 RemoteDBManager 인스턴스
+            print_controller: PrintController 인스턴스
+            leaser: SequenceLeaser (선택, 있으면 임대 블록에서 생산순서를 받음)
+        """
+        self.db = db
+        self.print_controller = print_controller
+        self.leaser = leaser
+        self.tracer = get_tracer()
+        self.events = get_event_log()
+
+    def get_lot_number(self, lot_config: dict) -> str:
+        """LOT 번호 생성 (날짜 제외한 모든 필드 조합)
+
+        LOT 번호 = model + dev + robot_spec + suite_spec + hw + assembly + reserved + production_date
+        """
+        return (
+            lot_config.get('model_code', '') +
+            lot_config.get('dev_code', '') +
+            lot_config.get('robot_spec', '') +
+            lot_config.get('suite_spec', '') +
+            lot_config.get('hw_code', '') +
+            lot_config.get('assembly_code', '') +
+            lot_config.get('reserved', '') +
+            lot_config.get('production_date', '')
+        )
+
+    def calculate_next_sequence(self, lot_config: dict) -> str:
+        """다음 생산순서 계산
+
+        Args:
+            lot_config: LOT 설정 딕셔너리
+
+        Returns:
+            다음 생산순서 (4자리 문자열, 예: "0001")
+        """
+        current_lot = self.get_lot_number(lot_config)
+        with self.tracer.span("print.sequence_lookup"):
+            max_seq = self.db.get_max_sequence_for_lot(current_lot)
+        with self.tracer.span("print.config_read"):
+            auto_increment = self.db.get_config('auto_increment') != 'false'
+
+        if max_seq is None:
+            return '0001'
+
+        if auto_increment:
+            return str(max_seq + 1).zfill(4)
+        return str(max_seq).zfill(4)
+
+    def reserve_sequence(self, lot_config: dict) -> Tuple[str, Optional[Tuple[int, Optional[int]]]]:
+        """인쇄할 생산순서 예약
+
+        자동 증가일 때는 DB(또는 임대 블록)에서 번호를 예약하므로
+        동시에 인쇄하는 다른 스테이션과 겹치지 않습니다.
+        인쇄하지 못하면 release_sequence()로 반환해야 합니다.
+
+        Returns:
+            (생산순서 4자리 문자열, 예약 (번호, lease_id) - 자동 증가가 아니면 None)
+        """
+        with self.tracer.span("print.config_read"):
+            auto_increment = self.db.get_config('auto_increment') != 'false'
+        if not auto_increment:
+            return self.calculate_next_sequence(lot_config), None
+
+        lot_number = self.get_lot_number(lot_config)
+        with self.tracer.span("print.sequence_lookup"):
+            if self.leaser is not None:
+                reservation = self.leaser.acquire(lot_number)
+            else:
+                reservation = (self.db.reserve_sequence(lot_number), None)
+        return str(reservation[0]).zfill(4), reservation
+
+    def release_sequence(self, lot_config: dict, reservation: Tuple[int, Optional[int]]) -> None:
+        """인쇄하지 못한 예약 번호 반환 (다음 인쇄가 같은 번호를 사용)"""
+        sequence, lease_id = reservation
+        lot_number = self.get_lot_number(lot_config)
+        if lease_id is not None:
+            self.leaser.release(lot_number, sequence, lease_id)
+            return
+        try:
+            self.db.release_sequence(lot_number, sequence)
+        except DatabaseError as e:
+            logger.warning("생산순서 %s 반환 실패 (번호를 건너뜀): %s", sequence, e)
+
+    def execute_print(
+        self,
+        lot_config: dict,
+        mac_address: Optional[str],
+        test_mode: bool = False
+    ) -> dict:
+        """인쇄 실행
+
+        Args:
+            lot_config: LOT 설정 (production_sequence 포함)
+            mac_address: MAC 주소 (None이면 테스트 모드에서 "TEST-MAC" 사용)
+            test_mode: 테스트 모드 여부
+
+        Returns:
+            인쇄 결과 딕셔너리 {'success': bool, 'message': str, ...}
+
+        Raises:
+            ValueError: MAC 주소나 템플릿이 없는 경우
+        """
+        # 설정 로드 (한 번에 조회 - 공유 DB 서버면 왕복 한 번)
+        with self.tracer.span("print.config_read"):
+            config = self.db.get_configs(
+                ['printer_selection', 'prn_template', 'use_mac_in_label', 'print_copies']
+            )
+            printer_selection = config['printer_selection'] or '자동 검색 (권장)'
+            prn_template = config['prn_template']
+            use_mac_in_label = config['use_mac_in_label'] != 'false'
+            print_copies = int(config['print_copies'] or '1')
+
+        if not prn_template:
+            raise ValueError("PRN 템플릿이 설정되지 않았습니다. 설정 화면에서 템플릿을 선택하세요.")
+
+        # MAC 주소 처리
+        if use_mac_in_label:
+            if not test_mode and not mac_address:
+                raise ValueError(
+                    "MAC 주소가 감지되지 않았습니다. "
+                    "ESP32 전원을 확인하거나 '라벨 설정'에서 MAC 사용을 비활성화하세요."
+                )
+            mac_to_use = mac_address if mac_address else "TEST-MAC"
+        else:
+            mac_to_use = "NONE"
+
+        # 인쇄 실행
+        return self.print_controller.print_label(
+            lot_config=lot_config,
+            mac_address=mac_to_use,
+            template_name=prn_template,
+            printer_selection=printer_selection,
+            test_mode=test_mode,
+            use_mac_in_label=use_mac_in_label,
+            print_copies=print_copies
+        )
+
+    def save_print_result(
+        self,
+        result: dict,
+        lot_config: dict,
+        prn_template: str,
+        lease_id: Optional[int] = None,
+    ) -> Optional[dict]:
+        """인쇄 결과 저장 (실제 인쇄만)
+
+        Args:
+            result: 인쇄 결과 딕셔너리
+            lot_config: LOT 설정 (production_sequence 포함)
+            prn_template: 사용된 PRN 템플릿 이름
+            lease_id: 생산순서를 받은 임대 블록 ID
+
+        Returns:
+            저장된 이력 레코드 (화면 증분 갱신용)
+        """
+        print_date = datetime.now().strftime('%Y-%m-%d')
+
+        # 이력 저장 + 생산순서 업데이트 + 저장된 레코드 조회
+        with self.tracer.span("db.commit"):
+            return self.db.commit_print(
+                serial_number=result['serial_number'],
+                mac_address=result['mac_address'],
+                print_date=print_date,
+                prn_template=prn_template,
+                production_sequence=lot_config['production_sequence'],
+                lease_id=lease_id,
+            )
+
+    def run_print_job(self, mac_address: Optional[str], test_mode: bool = False) -> dict:
+        """인쇄 작업 전체 (생산순서 예약 → 인쇄 → 이력 저장, 인쇄 실패 시 예약 반환)
+
+        Args:
+            mac_address: MAC 주소
+            test_mode: 테스트 모드 여부 (이력 저장/생산순서 갱신 안 함)
+
+        Returns:
+            {'result': 인쇄 결과, 'record': 저장된 이력 (실제 인쇄 성공 시, 아니면 None)}
+
+        Raises:
+            ValueError: MAC 주소나 템플릿이 없는 경우
+        """
+        started = time.perf_counter()
+        reservation = None
+        try:
+            with self.tracer.span("print.total"):
+                lot_config = self.db.get_lot_config()
+
+                # 생산순서 예약 (실제 인쇄만)
+                if not test_mode:
+                    lot_config['production_sequence'], reservation = self.reserve_sequence(lot_config)
+
+                result = self.execute_print(
+                    lot_config=lot_config,
+                    mac_address=mac_address,
+                    test_mode=test_mode
+                )
+
+                job = {'result': result, 'record': None}
+
+                # 라벨에 찍힌 번호는 저장에 실패해도 반환하지 않음
+                lease_id = reservation[1] if reservation else None
+                if result['success']:
+                    reservation = None
+
+                # DB 저장 (실제 인쇄만)
+                if result['success'] and not test_mode:
+                    job['record'] = self.save_print_result(
+                        result, lot_config, self.db.get_config('prn_template'), lease_id=lease_id
+                    )
+        except Exception as e:
+            if reservation is not None:
+                self.release_sequence(lot_config, reservation)
+            self.events.emit(
+                "print.rejected", mac=mac_address, test_mode=test_mode, message=str(e),
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            raise
+
+        if reservation is not None:
+            self.release_sequence(lot_config, reservation)
+
+        self.events.emit(
+            "print.job",
+            serial=result['serial_number'] or None,
+            mac=mac_address,
+            success=result['success'],
+            test_mode=test_mode,
+            record_id=job['record']['id'] if job['record'] else None,
+            message=None if result['success'] else result['message'],
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return job
@@ -0,0 +1,184 @@
+"""생산순서 블록 임대
+
+공유 DB 서버를 쓰는 스테이션이 라벨마다 서버에 번호를 예약하지 않도록,
+현재 LOT의 생산순서를 블록(예: 50개) 단위로 임대받아 로컬에서 나눠 씁니다.
+- acquire(): 임대 블록에서 다음 번호 (I/O 없음)
+- peek(): acquire()가 돌려줄 번호 확인 (화면 표시용, 번호를 쓰지 않음)
+- 남은 번호가 low_water 이하가 되면 다음 블록을 백그라운드 스레드에서 미리 임대
+- release(): 인쇄하지 못한 번호를 로컬에 돌려두고 다음 인쇄에 먼저 사용
+- close(): 쓰지 않은 번호를 DB에 반납 (되돌리지 못한 번호는 sequence_gap에 기록)
+
+임대 기록(sequence_lease)과 이력(print_history.lease_id)으로 어느 스테이션이 어떤 번호를 썼는지 추적합니다.
+백그라운드 임대는 DB 호출이 스레드 안전한 RemoteDBManager를 전제로 합니다.
+"""
+
+import heapq
+import logging
+import socket
+import threading
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SequenceLeaser:
+    """스테이션의 LOT별 생산순서 임대 블록 관리"""
+
+    DEFAULT_BLOCK_SIZE = 50
+
+    def __init__(
+        self,
+        db,
+        station: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        low_water: Optional[int] = None,
+        renew_async: bool = True,
+    ):
+        """
+        Args:
+            db: DBManager 또는 RemoteDBManager (lease_sequences/return_lease)
+            station: 스테이션 이름 (None이면 컴퓨터 이름)
+            block_size: 한 번에 임대할 번호 수
+            low_water: 남은 번호가 이 값 이하이면 다음 블록 미리 임대 (None이면 block_size의 1/5)
+            renew_async: 미리 임대를 백그라운드 스레드에서 실행
+        """
+        if block_size < 1:
+            raise ValueError(f"블록 크기는 1 이상이어야 합니다: {block_size}")
+        self.db = db
+        self.station = station or socket.gethostname()
+        self.block_size = block_size
+        self.low_water = max(1, block_size // 5) if low_water is None else low_water
+        self.renew_async = renew_async
+
+        self._lock = threading.Lock()
+        self._blocks: Dict[str, List[List[int]]] = {}           # LOT → [[lease_id, 다음 번호, 마지막 번호], ...]
+        self._released: Dict[str, List[Tuple[int, int]]] = {}  # LOT → (번호, lease_id) 힙
+        self._renewing: Dict[str, threading.Thread] = {}
+
+        # 통계
+        self.leases = 0   # 임대 횟수
+        self.stalls = 0   # 블록이 비어 인쇄가 임대를 기다린 횟수
+
+    def acquire(self, lot_number: str) -> Tuple[int, int]:
+        """다음 생산순서
+
+        Returns:
+            (생산순서, lease_id)
+        """
+        with self._lock:
+            taken = self._take(lot_number)
+        if taken is not None:
+            return taken
+
+        # 블록이 비었으면 진행 중인 미리 임대를 기다리거나 직접 임대
+        self.stalls += 1
+        self._wait_renewal(lot_number)
+        with self._lock:
+            taken = self._take(lot_number)
+        if taken is None:
+            self._lease(lot_number)
+            with self._lock:
+                taken = self._take(lot_number)
+        return taken
+
+    def release(self, lot_number: str, sequence: int, lease_id: int) -> None:
+        """인쇄하지 못한 번호를 돌려둠 (다음 acquire가 먼저 사용)"""
+        with self._lock:
+            heapq.heappush(self._released.setdefault(lot_number, []), (sequence, lease_id))
+
+    def peek(self, lot_number: str) -> Optional[int]:
+        """다음 acquire()가 돌려줄 번호 (로컬에 남은 번호가 없으면 None, I/O 없음)"""
+        with self._lock:
+            released = self._released.get(lot_number)
+            if released:
+                return released[0][0]
+            blocks = self._blocks.get(lot_number)
+            return blocks[0][1] if blocks else None
+
+    def remaining(self, lot_number: str) -> int:
+        """로컬에 남은 번호 수"""
+        with self._lock:
+            return self._remaining(lot_number)
+
+    def close(self) -> Dict[str, list]:
+        """모든 임대 블록의 미사용 번호 반납
+
+        Returns:
+            {'returned': 되돌린 개수, 'gaps': [비게 된 번호, ...]}
+        """
+        for lot_number in list(self._renewing):
+            self._wait_renewal(lot_number)
+
+        with self._lock:
+            unused: Dict[int, List[int]] = {}
+            for blocks in self._blocks.values():
+                for lease_id, next_seq, last in blocks:
+                    unused.setdefault(lease_id, []).extend(range(next_seq, last + 1))
+            for released in self._released.values():
+                for sequence, lease_id in released:
+                    unused.setdefault(lease_id, []).append(sequence)
+            self._blocks.clear()
+            self._released.clear()
+
+        summary = {'returned': 0, 'gaps': []}
+        for lease_id, sequences in unused.items():
+            result = self.db.return_lease(lease_id, sequences)
+            summary['returned'] += result['returned']
+            summary['gaps'].extend(result['gaps'])
+        if summary['gaps']:
+            logger.info("생산순서 반납: %d개 반환, %d개 공백 기록", summary['returned'], len(summary['gaps']))
+        return summary
+
+    def _take(self, lot_number: str) -> Optional[Tuple[int, int]]:
+        """로컬에서 번호 하나 꺼내기 (lock 보유 상태)"""
+        released = self._released.get(lot_number)
+        if released:
+            return heapq.heappop(released)
+
+        blocks = self._blocks.get(lot_number)
+        if not blocks:
+            return None
+
+        block = blocks[0]
+        taken = (block[1], block[0])
+        block[1] += 1
+        if block[1] > block[2]:
+            blocks.pop(0)
+
+        if self._remaining(lot_number) <= self.low_water and lot_number not in self._renewing:
+            self._schedule_renewal(lot_number)
+        return taken
+
+    def _remaining(self, lot_number: str) -> int:
+        blocks = self._blocks.get(lot_number, [])
+        return sum(last - next_seq + 1 for _, next_seq, last in blocks) + len(self._released.get(lot_number, []))
+
+    def _schedule_renewal(self, lot_number: str) -> None:
+        """다음 블록 미리 임대 (lock 보유 상태)"""
+        if not self.renew_async:
+            return
+
+        def renew():
+            try:
+                self._lease(lot_number)
+            except Exception as e:
+                logger.warning("생산순서 미리 임대 실패 (%s): %s", lot_number, e)
+            finally:
+                with self._lock:
+                    self._renewing.pop(lot_number, None)
+
+        thread = threading.Thread(target=renew, name=f"SequenceLease-{lot_number}", daemon=True)
+        self._renewing[lot_number] = thread
+        thread.start()
+
+    def _wait_renewal(self, lot_number: str) -> None:
+        thread = self._renewing.get(lot_number)
+        if thread is not None:
+            thread.join()
+
+    def _lease(self, lot_number: str) -> None:
+        """블록 임대 (DB 호출, lock 밖에서 실행)"""
+        lease = self.db.lease_sequences(lot_number, self.station, self.block_size)
+        with self._lock:
+            self._blocks.setdefault(lot_number, []).append([lease['lease_id'], lease['first'], lease['last']])
+            self.leases += 1
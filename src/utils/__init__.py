@@ -2,6 +2,10 @@
 
 from .serial_number_generator import SerialNumberGenerator
 from .config_manager import ConfigManager
-from .logger import setup_logger
+from .logger import setup_logger, setup_logging, shutdown_logging
+from .startup_timer import StartupTimer
+from .import_profiler import ImportProfiler
+from .tracing import Tracer, get_tracer
+from .event_log import EventLog, get_event_log, query_events
 
-__all__ = ["SerialNumberGenerator", "ConfigManager", "setup_logger"]
+__all__ = ["SerialNumberGenerator", "ConfigManager", "setup_logger", "setup_logging", "shutdown_logging", "StartupTimer", "ImportProfiler", "Tracer", "get_tracer", "EventLog", "get_event_log", "query_events"]
@@ -0,0 +1,277 @@
+"""
+구조화 이벤트 로그 (JSON lines)
+
+인쇄/장치 이벤트를 한 줄에 하나씩 JSON으로 기록합니다.
+    {"ts": "2026-10-19T09:12:03.481", "event": "print.job", "serial": "...", "mac": "...",
+     "stage": "printer.spool", "duration_ms": 41.2, ...}
+
+파일이 max_bytes를 넘으면 events.jsonl → events.jsonl.1 → ... 로 로테이션하고,
+각 파일 옆에 시간 색인(.idx)을 둡니다. 색인은 BLOCK_EVENTS개 이벤트 단위 블록마다
+{offset, length, ts, ts_last, serials} 한 줄이며, 조회(query_events)는 색인으로
+시간 범위/시리얼이 맞지 않는 파일과 블록을 건너뛰고 필요한 블록만 읽습니다.
+색인에 없는 구간(마지막 미완성 블록, 비정상 종료 후 남은 꼬리)은 그대로 읽습니다.
+
+사용 예:
+    events = get_event_log()
+    events.open("logs/events.jsonl")
+    events.emit("print.job", serial="...", mac="...", duration_ms=52.3)
+
+    for event in query_events("logs/events.jsonl", since="2026-10-19T09:00", serial="..."):
+        ...
+"""
+
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+INDEX_SUFFIX = ".idx"
+
+
+def _now_ts() -> str:
+    return datetime.now().isoformat(timespec='milliseconds')
+
+
+def normalize_ts(value: Optional[str]) -> Optional[str]:
+    """조회 경계 시각을 이벤트 ts 형식으로 변환 ("2026-10-19", "2026-10-19 09:00" 등)"""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).isoformat(timespec='milliseconds')
+
+
+class EventLog:
+    """JSON lines 이벤트 기록기 (크기 기준 로테이션 + 블록 시간 색인)
+
+    path 없이 생성하거나 open() 전에는 emit()이 아무것도 하지 않습니다.
+    여러 스레드(인쇄 작업 스레드, MCU 모니터)에서 호출해도 안전합니다.
+    """
+
+    BLOCK_EVENTS = 64
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path: Optional[Path] = None
+        self._file = None
+        self._index = None
+        self._size = 0
+        self._block: Optional[dict] = None
+        self._lock = threading.Lock()
+        if path:
+            self.open(path)
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    def open(self, path: str) -> None:
+        """기록 파일 열기 (이미 열려 있으면 닫고 다시 엶)"""
+        self.close()
+        with self._lock:
+            self.path = Path(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._open_files()
+
+    def close(self) -> None:
+        """진행 중인 블록을 색인에 기록하고 파일 닫기"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._close_files()
+
+    def emit(self, event: str, **fields) -> None:
+        """이벤트 기록 (값이 None인 필드는 생략)"""
+        if self._file is None:
+            return
+
+        record = {'ts': _now_ts(), 'event': event}
+        record.update((k, v) for k, v in fields.items() if v is not None)
+        data = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+        with self._lock:
+            if self._file is None:
+                return
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._write(record, data)
+
+    # ==================== 내부 처리 (lock 보유 상태) ====================
+
+    def _write(self, record: dict, data: bytes) -> None:
+        if self._block is None:
+            self._block = {'offset': self._size, 'length': 0, 'count': 0,
+                           'ts': record['ts'], 'ts_last': record['ts'], 'serials': []}
+
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+        block = self._block
+        block['length'] += len(data)
+        block['count'] += 1
+        block['ts_last'] = record['ts']
+        serial = record.get('serial')
+        if serial and serial not in block['serials']:
+            block['serials'].append(serial)
+
+        if block['count'] >= self.BLOCK_EVENTS:
+            self._flush_block()
+
+    def _flush_block(self) -> None:
+        block, self._block = self._block, None
+        if block is None:
+            return
+        del block['count']
+        self._index.write(json.dumps(block, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._index.flush()
+
+    def _open_files(self) -> None:
+        self._file = open(self.path, 'ab')
+        self._index = open(_index_path(self.path), 'a', encoding='utf-8')
+        self._size = self._file.tell()
+        self._block = None
+
+    def _close_files(self) -> None:
+        self._flush_block()
+        self._file.close()
+        self._index.close()
+        self._file = self._index = None
+
+    def _rotate(self) -> None:
+        self._close_files()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src, dst = _rotated_path(self.path, i), _rotated_path(self.path, i + 1)
+                for s, d in ((src, dst), (_index_path(src), _index_path(dst))):
+                    if s.exists():
+                        os.replace(s, d)
+            first = _rotated_path(self.path, 1)
+            os.replace(self.path, first)
+            if _index_path(self.path).exists():
+                os.replace(_index_path(self.path), _index_path(first))
+        else:
+            self.path.unlink()
+            _index_path(self.path).unlink(missing_ok=True)
+        self._open_files()
+
+
+def _rotated_path(path: Path, number: int) -> Path:
+    return path.with_name(f"{path.name}.{number}")
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def event_log_files(path: str) -> List[Path]:
+    """로테이션된 파일 포함 이벤트 로그 파일 목록 (오래된 순)"""
+    base = Path(path)
+    rotated = []
+    for candidate in base.parent.glob(base.name + ".*"):
+        suffix = candidate.name[len(base.name) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), candidate))
+    files = [p for _, p in sorted(rotated, reverse=True)]
+    if base.exists():
+        files.append(base)
+    return files
+
+
+def _load_index(path: Path) -> List[dict]:
+    blocks = []
+    try:
+        with open(_index_path(path), encoding='utf-8') as f:
+            for line in f:
+                try:
+                    blocks.append(json.loads(line))
+                except ValueError:
+                    break  # 기록 중 끊긴 마지막 줄
+    except OSError:
+        pass
+    return blocks
+
+
+def _read_range(f, start: int, end: Optional[int]) -> Iterator[dict]:
+    f.seek(start)
+    data = f.read() if end is None else f.read(end - start)
+    for line in data.splitlines():
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def query_events(
+    path: str,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    serial: Optional[str] = None,
+    event: Optional[str] = None,
+) -> Iterator[dict]:
+    """이벤트 조회 (로테이션된 파일 포함, 오래된 순)
+
+    Args:
+        path: 이벤트 로그 경로 (events.jsonl)
+        since: 시작 시각 (포함, ISO 형식)
+        until: 종료 시각 (제외, ISO 형식)
+        serial: 시리얼 번호
+        event: 이벤트 이름 (예: "print.job") 또는 접두사 (예: "mcu.")
+    """
+    since, until = normalize_ts(since), normalize_ts(until)
+
+    def block_matches(block: dict) -> bool:
+        if since is not None and block['ts_last'] < since:
+            return False
+        if until is not None and block['ts'] >= until:
+            return False
+        return serial is None or serial in block['serials']
+
+    def record_matches(record: dict) -> bool:
+        ts = record.get('ts', '')
+        if since is not None and ts < since:
+            return False
+        if until is not None and ts >= until:
+            return False
+        if serial is not None and record.get('serial') != serial:
+            return False
+        if event is not None and not (
+            record.get('event') == event or (event.endswith('.') and record.get('event', '').startswith(event))
+        ):
+            return False
+        return True
+
+    for file_path in event_log_files(path):
+        blocks = _load_index(file_path)
+        # 색인된 블록 사이/뒤의 색인 없는 구간은 전부 읽어야 하므로 (start, end, 색인 여부) 목록 구성
+        ranges, position = [], 0
+        for block in blocks:
+            if block['offset'] > position:
+                ranges.append((position, block['offset'], None))
+            ranges.append((block['offset'], block['offset'] + block['length'], block))
+            position = block['offset'] + block['length']
+        ranges.append((position, None, None))
+
+        with open(file_path, 'rb') as f:
+            for start, end, block in ranges:
+                if block is not None and not block_matches(block):
+                    continue
+                for record in _read_range(f, start, end):
+                    if record_matches(record):
+                        yield record
+
+
+_event_log = EventLog()
+atexit.register(_event_log.close)
+
+
+def get_event_log() -> EventLog:
+    """EventLog 싱글톤 인스턴스 반환 (open() 전에는 비활성)"""
+    return _event_log
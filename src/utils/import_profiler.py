@@ -0,0 +1,147 @@
+"""
+모듈 import 시간 측정 (-X importtime 방식)
+
+sys.meta_path 맨 앞에 측정용 finder를 넣어 모듈마다 로드 시간을 기록합니다.
+-X importtime과 같이 self(자기 자신만)와 cumulative(하위 import 포함) 시간을 구분하며,
+인터프리터 옵션 없이 동작하므로 배포(frozen) 빌드에서도 쓸 수 있습니다.
+Qt에 의존하지 않으므로 다른 import보다 먼저 설치할 수 있습니다.
+
+사용 예:
+    profiler = ImportProfiler()
+    profiler.install()
+    import heavy_module
+    profiler.uninstall()
+    print(profiler.report(10))
+"""
+
+import sys
+import threading
+import time
+from typing import Dict, List
+
+
+class _TimedLoader:
+    """원래 loader를 감싸 create_module/exec_module 시간을 측정"""
+
+    def __init__(self, loader, profiler: "ImportProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        # 확장 모듈(.pyd/.so)은 create_module에서 대부분의 시간이 걸림
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        return self._profiler._timed(self._name, create_module, spec)
+
+    def exec_module(self, module):
+        # 모듈에는 원래 loader를 남겨 importlib.resources 등이 그대로 동작하도록 함
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._timed(self._name, self._loader.exec_module, module)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _TimingFinder:
+    """다른 finder가 찾은 spec의 loader를 _TimedLoader로 교체"""
+
+    def __init__(self, profiler: "ImportProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        if loader is None or not hasattr(loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(loader, self._profiler, fullname)
+        return spec
+
+
+class ImportProfiler:
+    """모듈별 import 시간 측정기"""
+
+    def __init__(self):
+        self._finder = _TimingFinder(self)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 모듈 이름 → [self 시간, cumulative 시간] (초, 처음 import된 순서)
+        self._times: Dict[str, List[float]] = {}
+
+    def install(self) -> None:
+        """측정 시작 (이미 import된 모듈은 측정되지 않음)"""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """측정 중지"""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _timed(self, name: str, fn, *args):
+        """fn 실행 시간을 name에 누적 (중첩 import 시간은 self 시간에서 제외)"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        stack.append(0.0)  # 하위 import 누적 시간
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                times = self._times.setdefault(name, [0.0, 0.0])
+                times[0] += elapsed - children
+                times[1] += elapsed
+
+    # ==================== 결과 ====================
+
+    @property
+    def modules(self) -> List[dict]:
+        """모듈별 시간 (cumulative 내림차순)
+
+        Returns:
+            [{'module', 'self_ms', 'cumulative_ms'}, ...]
+        """
+        with self._lock:
+            items = list(self._times.items())
+        rows = [
+            {'module': name, 'self_ms': round(s * 1000, 2), 'cumulative_ms': round(c * 1000, 2)}
+            for name, (s, c) in items
+        ]
+        rows.sort(key=lambda r: r['cumulative_ms'], reverse=True)
+        return rows
+
+    @property
+    def total_ms(self) -> float:
+        """측정된 전체 import 시간 (self 시간 합계)"""
+        with self._lock:
+            return round(sum(s for s, _ in self._times.values()) * 1000, 1)
+
+    def report(self, top: int = 20) -> str:
+        """사람이 읽을 수 있는 리포트 (cumulative 상위 top개)"""
+        lines = [
+            f"import 시간 리포트 (모듈 {len(self._times)}개, 합계 {self.total_ms:.1f} ms):",
+            f"  {'self':>9} | {'cumulative':>10} | module",
+        ]
+        for row in self.modules[:top]:
+            lines.append(f"  {row['self_ms']:7.1f}ms | {row['cumulative_ms']:8.1f}ms | {row['module']}")
+        return "\n".join(lines)
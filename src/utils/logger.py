@@ -1,64 +1,149 @@
 """
 로깅 설정
+
+모든 모듈은 logging.getLogger(__name__)으로 모듈별 로거를 사용하고,
+setup_logging()이 루트 로거에 QueueHandler 하나만 붙입니다.
+호출한 스레드는 레코드를 큐에 넣기만 하며, 콘솔/파일 쓰기와
+로그 파일 로테이션·압축은 QueueListener 백그라운드 스레드가 처리합니다.
+
+디버그 출력은 레벨 가드로 비활성 시 비용이 없도록 작성합니다.
+    logger.debug("값: %s", value)                 # 포맷팅은 출력될 때만
+    if logger.isEnabledFor(logging.DEBUG):        # 준비 비용이 큰 디버그 출력
+        ...
 """
 
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Optional, TextIO
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-def setup_logger(
-    name: str = "label_printer",
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """로테이션된 로그 파일을 gzip으로 압축하는 RotatingFileHandler
+
+    QueueListener 스레드에서만 호출되므로 로테이션/압축이 로그를 남기는 스레드를 막지 않습니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+def setup_logging(
     level: str = "INFO",
-    log_file: str = "logs/app.log",
+    log_file: Optional[str] = "logs/app.log",
     max_bytes: int = 10485760,  # 10MB
     backup_count: int = 5,
-) -> logging.Logger:
+    console: bool = True,
+    stream: Optional[TextIO] = None,
+    compress: bool = True,
+) -> QueueListener:
     """
-    로거 설정
+    비동기 로깅 파이프라인 설정 (여러 번 호출하면 이전 설정을 교체)
 
     Args:
-        name: 로거 이름
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: 로그 파일 경로
+        log_file: 로그 파일 경로 (None이면 파일 기록 안 함)
         max_bytes: 로그 파일 최대 크기 (바이트)
         backup_count: 백업 파일 개수
+        console: 콘솔 출력 여부
+        stream: 콘솔 출력 스트림 (None이면 호출 시점의 sys.stderr)
+        compress: 로테이션된 파일 gzip 압축 여부
 
     Returns:
-        로거 인스턴스
+        실행 중인 QueueListener
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    global _listener, _queue_handler
+    shutdown_logging()
 
-    # 기존 핸들러 제거 (중복 방지)
-    logger.handlers.clear()
-
-    # 포맷터
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
+    handlers = []
 
     # 콘솔 핸들러
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if console:
+        console_handler = logging.StreamHandler(stream or sys.stderr)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
 
     # 파일 핸들러 (로테이션)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = RotatingFileHandler(
+        handler_class = CompressedRotatingFileHandler if compress else RotatingFileHandler
+        file_handler = handler_class(
             log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding='utf-8'
         )
-        file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    _queue_handler = QueueHandler(queue.SimpleQueue())
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(getattr(logging, level.upper()))
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 기록하고 백그라운드 스레드 종료"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
-    return logger
+
+atexit.register(shutdown_logging)
+
+
+def setup_logger(
+    name: str = "label_printer",
+    level: str = "INFO",
+    log_file: str = "logs/app.log",
+    max_bytes: int = 10485760,  # 10MB
+    backup_count: int = 5,
+) -> logging.Logger:
+    """
+    로거 설정 (setup_logging + 이름 있는 로거 반환, CLI 테스트 스크립트용)
+
+    Args:
+        name: 로거 이름
+        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: 로그 파일 경로
+        max_bytes: 로그 파일 최대 크기 (바이트)
+        backup_count: 백업 파일 개수
+
+    Returns:
+        로거 인스턴스
+    """
+    setup_logging(level, log_file, max_bytes, backup_count, stream=sys.stdout)
+    return logging.getLogger(name)
@@ -3,12 +3,24 @@
 """
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple, Union
 from datetime import datetime
 
 from .exceptions import CounterOverflowError, InvalidSerialNumberError, InvalidCounterError
 
 
+# 생산순서 문자열 테이블 ("0000" ~ "9999"), 최초 사용 시 생성
+_SEQUENCE_TABLE: Optional[Tuple[str, ...]] = None
+
+
+def _sequence_table() -> Tuple[str, ...]:
+    """4자리 zero-padding 생산순서 문자열 테이블"""
+    global _SEQUENCE_TABLE
+    if _SEQUENCE_TABLE is None:
+        _SEQUENCE_TABLE = tuple(f"{i:04d}" for i in range(10000))
+    return _SEQUENCE_TABLE
+
+
 class SerialNumberGenerator:
     """시리얼 번호 생성 및 관리"""
 
@@ -25,6 +37,15 @@ class SerialNumberGenerator:
         r'\d{4}$'  # 생산순서: 0001 (4자리)
     )
 
+    # 시리얼 번호 앞 16자리 (LOT 코드 + 생산일자) 검증 정규식
+    SERIAL_PREFIX_PATTERN = re.compile(
+        r'^[A-Z]\d{2}[A-Z][A-Z]\d[A-Z]\d[A-Z]\d[A-Z]\d\d'  # LOT 코드 (13자리)
+        r'[A-Z](0[1-9]|1[0-2])$'  # 생산일자 (3자리)
+    )
+
+    # 생산순서 최대값
+    MAX_SEQUENCE = 9999
+
     # 생산일자 코드 형식 검증 (A01 ~ Z12)
     PRODUCTION_DATE_PATTERN = re.compile(r'^[A-Z](0[1-9]|1[0-2])$')
 
@@ -72,6 +93,9 @@ class SerialNumberGenerator:
         self._production_date = production_date
         self._production_sequence = production_sequence
 
+        # 검증된 시리얼 앞부분 캐시 (LOT 정보가 바뀌면 다시 검증)
+        self._valid_prefix: Optional[str] = None
+
         # 초기 검증
         if not self.PRODUCTION_DATE_PATTERN.match(production_date):
             raise InvalidCounterError(f"생산일자 형식 오류: {production_date} (예: C10)")
@@ -108,23 +132,63 @@ class SerialNumberGenerator:
             >>> gen.generate()
             'P10DL0S0H3A00C100001'
         """
-        serial_number = (
-            f"{self.model_code}"
-            f"{self.dev_code}"
-            f"{self.robot_spec}"
-            f"{self.suite_spec}"
-            f"{self.hw_code}"
-            f"{self.assembly_code}"
-            f"{self.reserved}"
-            f"{self._production_date}"
-            f"{self._production_sequence}"
-        )
+        # 생산순서는 생성자/reset_sequence에서 이미 검증됨 → 앞부분만 검증
+        return self._checked_prefix(self._production_sequence) + self._production_sequence
+
+    def get_serial_prefix(self) -> str:
+        """
+        시리얼 번호 앞 16자리 (LOT 코드 + 생산일자) 반환
+
+        Example:
+            >>> gen.get_serial_prefix()
+            'P10DL0S0H3A00C10'
+        """
+        return self.get_lot_code() + self._production_date
+
+    def _checked_prefix(self, sequence_for_error: str) -> str:
+        """검증된 시리얼 앞부분 반환 (같은 값이면 재검증하지 않음)"""
+        prefix = self.get_serial_prefix()
+        if prefix != self._valid_prefix:
+            if not self.SERIAL_PREFIX_PATTERN.fullmatch(prefix):
+                raise InvalidSerialNumberError(prefix + sequence_for_error, "형식이 올바르지 않습니다")
+            self._valid_prefix = prefix
+        return prefix
+
+    def generate_range(self, start: Union[int, str], count: int) -> List[str]:
+        """
+        연속된 시리얼 번호 일괄 생성 (현재 생산순서는 변경하지 않음)
 
-        # 생성된 시리얼 번호 검증
-        if not self.validate(serial_number):
-            raise InvalidSerialNumberError(serial_number, "형식이 올바르지 않습니다")
+        Args:
+            start: 시작 생산순서 (정수 1~9999 또는 "0001" 형식 문자열)
+            count: 생성 개수
 
-        return serial_number
+        Returns:
+            시리얼 번호 리스트
+
+        Raises:
+            InvalidCounterError: 시작 순서 형식 오류
+            CounterOverflowError: 9999 초과
+            InvalidSerialNumberError: LOT 정보 형식 오류
+
+        Example:
+            >>> gen.generate_range(1, 3)
+            ['P10DL0S0H3A00C100001', 'P10DL0S0H3A00C100002', 'P10DL0S0H3A00C100003']
+        """
+        if isinstance(start, str):
+            if not self.PRODUCTION_SEQUENCE_PATTERN.match(start):
+                raise InvalidCounterError(start)
+            start = int(start)
+
+        if not (0 <= start <= self.MAX_SEQUENCE) or count < 0:
+            raise InvalidCounterError(f"생산순서 범위 오류: start={start}, count={count}")
+
+        end = start + count
+        if end - 1 > self.MAX_SEQUENCE:
+            raise CounterOverflowError()
+
+        table = _sequence_table()
+        prefix = self._checked_prefix(table[start])
+        return [prefix + sequence for sequence in table[start:end]]
 
     def increment_sequence(self) -> None:
         """
@@ -140,10 +204,10 @@ class SerialNumberGenerator:
         """
         current_seq = int(self._production_sequence)
 
-        if current_seq >= 9999:
+        if current_seq >= self.MAX_SEQUENCE:
             raise CounterOverflowError()
 
-        self._production_sequence = f"{current_seq + 1:04d}"
+        self._production_sequence = _sequence_table()[current_seq + 1]
 
     def reset_sequence(self, start: str = "0001") -> None:
         """
@@ -259,6 +323,44 @@ class SerialNumberGenerator:
 
         return SerialNumberGenerator.SERIAL_NUMBER_PATTERN.match(serial_number) is not None
 
+    @staticmethod
+    def validate_many(serial_numbers: Iterable[str]) -> List[bool]:
+        """
+        시리얼 번호 일괄 검증
+
+        같은 앞 16자리(LOT + 생산일자)는 한 번만 정규식으로 검증하고,
+        생산순서 4자리는 숫자 여부만 확인합니다. 결과는 validate()와 동일합니다.
+
+        Args:
+            serial_numbers: 시리얼 번호 목록
+
+        Returns:
+            입력 순서대로의 유효 여부 리스트
+
+        Example:
+            >>> SerialNumberGenerator.validate_many(["P10DL0S0H3A00C100001", "INVALID"])
+            [True, False]
+        """
+        prefix_match = SerialNumberGenerator.SERIAL_PREFIX_PATTERN.fullmatch
+        prefix_cache = {}
+        results = []
+        append = results.append
+
+        for serial_number in serial_numbers:
+            if not isinstance(serial_number, str) or len(serial_number) != 20:
+                append(False)
+                continue
+
+            prefix = serial_number[:16]
+            valid_prefix = prefix_cache.get(prefix)
+            if valid_prefix is None:
+                valid_prefix = prefix_match(prefix) is not None
+                prefix_cache[prefix] = valid_prefix
+
+            append(valid_prefix and serial_number[16:].isdecimal())
+
+        return results
+
     @staticmethod
     def parse_serial_number(serial_number: str) -> dict:
         """
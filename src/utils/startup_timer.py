@@ -0,0 +1,80 @@
+"""
+시작 시간 측정
+
+프로세스 시작부터 각 단계(import, QApplication 생성, 첫 화면 표시,
+첫 입력 가능 시점)까지의 경과 시간을 기록하고 리포트합니다.
+Qt에 의존하지 않으므로 어느 시점에서든 import할 수 있습니다.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class StartupTimer:
+    """시작 단계별 시간 측정기"""
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Args:
+            start: 기준 시각 (time.perf_counter 값, None이면 현재 시각)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self._phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str) -> float:
+        """
+        단계 완료 기록 (같은 단계는 처음 한 번만 기록)
+
+        Args:
+            phase: 단계 이름 (예: "imports", "first_paint")
+
+        Returns:
+            기준 시각부터의 경과 시간 (ms)
+        """
+        for name, elapsed in self._phases:
+            if name == phase:
+                return elapsed
+
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self._phases.append((phase, elapsed))
+        return elapsed
+
+    def has(self, phase: str) -> bool:
+        """단계 기록 여부"""
+        return any(name == phase for name, _ in self._phases)
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """{단계: 누적 경과 시간(ms)} (기록 순서)"""
+        return dict(self._phases)
+
+    def report(self) -> str:
+        """사람이 읽을 수 있는 리포트 (누적 시간 + 단계별 소요 시간)"""
+        lines = ["시작 시간 리포트:"]
+        previous = 0.0
+        for name, elapsed in self._phases:
+            lines.append(f"  {name:<20} {elapsed:8.1f} ms  (+{elapsed - previous:.1f} ms)")
+            previous = elapsed
+        return "\n".join(lines)
+
+    def save(self, path: str, **extra) -> None:
+        """
+        리포트를 JSON Lines 파일에 한 줄 추가 (실행마다 누적)
+
+        Args:
+            path: 저장 파일 경로 (예: logs/startup_times.jsonl)
+            **extra: 함께 기록할 추가 정보 (예: version)
+        """
+        record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'phases_ms': {name: round(elapsed, 1) for name, elapsed in self._phases},
+        }
+        record.update(extra)
+
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
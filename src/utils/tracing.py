@@ -0,0 +1,200 @@
+"""
+인쇄 경로 지연 시간 추적
+
+단계별(span) 소요 시간을 단조 시계(time.perf_counter_ns)로 재고,
+단계마다 HDR 방식(로그-선형 버킷) 히스토그램에 누적합니다.
+비활성 상태에서 span()은 공유 no-op 객체를 돌려주므로 비용이 거의 없습니다.
+Qt에 의존하지 않으므로 GUI와 헤드리스 실행기에서 함께 사용합니다.
+
+사용 예:
+    tracer = get_tracer()
+    with tracer.span("print.template_render"):
+        zpl = parser.replace_variables(...)
+
+    print(tracer.format_table())   # p50/p95/p99
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """HDR 방식 지연 시간 히스토그램 (마이크로초 단위)
+
+    2의 거듭제곱 구간마다 SUB_BUCKETS개의 균등 버킷을 두어
+    값 크기와 관계없이 상대 오차가 1/SUB_BUCKETS 이하로 유지됩니다.
+    버킷은 기록된 것만 보관하므로 메모리는 관측값 분포 폭에 비례합니다.
+    """
+
+    SUB_BUCKETS = 64        # 상대 오차 약 1.6%
+    _SUB_BITS = 6           # log2(SUB_BUCKETS)
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, value_us: int) -> None:
+        """값 기록 (마이크로초)"""
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls._SUB_BITS - 1
+        return ((shift + 1) << cls._SUB_BITS) + ((value >> shift) - cls.SUB_BUCKETS)
+
+    @classmethod
+    def _bucket_value(cls, index: int) -> int:
+        """버킷의 대표값 (구간 중앙)"""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = (index >> cls._SUB_BITS) - 1
+        low = (cls.SUB_BUCKETS + (index & (cls.SUB_BUCKETS - 1))) << shift
+        return low + ((1 << shift) >> 1)
+
+    def percentile(self, p: float) -> int:
+        """백분위수 (마이크로초, 0 <= p <= 100)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, round(self.count * p / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bucket_value(index), self.max_us)
+        return self.max_us
+
+    def summary(self) -> dict:
+        """요약 통계 (밀리초)"""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_us / self.count / 1000, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(50) / 1000,
+            'p95_ms': self.percentile(95) / 1000,
+            'p99_ms': self.percentile(99) / 1000,
+            'max_ms': self.max_us / 1000,
+        }
+
+
+class _NullSpan:
+    """비활성 상태의 span (아무것도 하지 않음)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """활성 상태의 span - 종료 시 히스토그램에 기록"""
+
+    __slots__ = ('_tracer', '_name', '_started')
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self._tracer = tracer
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._tracer.record(self._name, (time.perf_counter_ns() - self._started) // 1000)
+        return False
+
+
+class Tracer:
+    """단계별 지연 시간 수집기"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str):
+        """단계 측정 context manager (비활성이면 no-op)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, value_us: int) -> None:
+        """측정값 직접 기록 (마이크로초)"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(value_us)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """{단계: 요약 통계} (단계 이름 순)"""
+        with self._lock:
+            return {name: self._histograms[name].summary() for name in sorted(self._histograms)}
+
+    def format_table(self, snapshot: Optional[Dict[str, dict]] = None) -> str:
+        """p50/p95/p99 표 (상태바 툴팁/CLI 출력용)"""
+        return format_latency_table(self.snapshot() if snapshot is None else snapshot)
+
+    def save(self, path: str) -> None:
+        """요약 통계를 JSON 파일로 저장 (CLI에서 다시 출력 가능)"""
+        data = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'stages': self.snapshot(),
+        }
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def format_latency_table(snapshot: Dict[str, dict]) -> str:
+    """단계별 요약 통계를 고정폭 표로 변환"""
+    if not snapshot:
+        return "지연 시간 기록 없음"
+
+    width = max(len(name) for name in snapshot)
+    lines = [f"{'stage':<{width}}  {'n':>5}  {'p50':>8}  {'p95':>8}  {'p99':>8}  {'max':>8}  (ms)"]
+    for name, s in snapshot.items():
+        lines.append(
+            f"{name:<{width}}  {s['count']:>5}  {s['p50_ms']:>8.2f}  "
+            f"{s['p95_ms']:>8.2f}  {s['p99_ms']:>8.2f}  {s['max_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def load_latency_snapshot(path: str) -> Dict[str, dict]:
+    """Tracer.save()로 저장한 요약 통계 로드"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)['stages']
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Tracer 싱글톤 인스턴스 반환 (기본 비활성)"""
+    return _tracer
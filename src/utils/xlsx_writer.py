@@ -0,0 +1,115 @@
+"""
+스트리밍 XLSX 작성기 (외부 라이브러리 없음)
+
+행을 받는 즉시 시트 XML을 zip 항목에 압축하며 기록하므로
+행 수와 관계없이 메모리 사용량이 일정합니다.
+문자열은 inline string, 숫자는 숫자 셀로 기록하며 서식은 지원하지 않습니다.
+
+사용 예:
+    with XlsxStreamWriter("history.xlsx", sheet_name="이력") as xlsx:
+        xlsx.write_row(["시리얼 번호", "MAC 주소"])
+        xlsx.write_rows(rows)
+"""
+
+import re
+import zipfile
+from typing import Any, Iterable, List, Sequence
+from xml.sax.saxutils import escape
+
+# XML 1.0에서 허용하지 않는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+</Relationships>"""
+
+_SHEET_HEAD = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+               '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+               '<sheetData>')
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def column_letter(index: int) -> str:
+    """0부터 시작하는 열 번호 → 엑셀 열 이름 (0 → A, 26 → AA)"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class XlsxStreamWriter:
+    """단일 시트 XLSX 스트리밍 작성기"""
+
+    def __init__(self, path: str, sheet_name: str = "Sheet1"):
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name[:31], {'"': "&quot;"})))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", 'w', force_zip64=True)
+        self._sheet.write(_SHEET_HEAD.encode('utf-8'))
+        self._columns: List[str] = []
+        self.rows_written = 0
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """한 행 기록"""
+        self.write_rows((values,))
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """여러 행 기록 (청크 단위로 한 번에 압축 스트림에 씀)"""
+        parts = []
+        for values in rows:
+            self.rows_written += 1
+            row = self.rows_written
+            while len(self._columns) < len(values):
+                self._columns.append(column_letter(len(self._columns)))
+
+            parts.append(f'<row r="{row}">')
+            for column, value in zip(self._columns, values):
+                if value is None or value == "":
+                    continue
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    parts.append(f'<c r="{column}{row}"><v>{value}</v></c>')
+                else:
+                    text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+                    parts.append(f'<c r="{column}{row}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+            parts.append('</row>')
+
+        self._sheet.write("".join(parts).encode('utf-8'))
+
+    def close(self) -> None:
+        """시트를 마무리하고 파일 닫기"""
+        if self._sheet is None:
+            return
+        self._sheet.write(_SHEET_TAIL.encode('utf-8'))
+        self._sheet.close()
+        self._sheet = None
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
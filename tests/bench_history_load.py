@@ -0,0 +1,152 @@
+"""
+이력 조회 (1만 건) 벤치마크
+
+이력 화면이 한 번에 읽는 결과를 행마다 dict로 바꾸는 방식과
+커서 튜플을 그대로 감싼 HistoryRecord 방식을 비교합니다.
+  - dict:    fetch_history(records=False) (DBManager.get_print_history, 공유 DB 서버 API)
+  - records: fetch_history(records=True)  (HistoryReader.search, GUI)
+  - access:  화면 표 채우기처럼 행마다 컬럼 4개를 .get()으로 읽는 시간
+  - peak_kb: 결과 리스트를 만드는 동안의 최대 할당량 (tracemalloc)
+  - statements: 필터를 바꿔 가며 작은 검색을 반복할 때 문장 캐시 유무 비교
+
+실행:
+    python -m tests.bench_history_load
+    python -m tests.bench_history_load --rows 10000 --repeat 20 --json
+"""
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+def _build_db(path: str, rows: int) -> None:
+    from src.database.db_manager import DBManager
+
+    with DBManager(path) as db:
+        db.initialize()
+        db.conn.executemany(
+            "INSERT INTO print_history "
+            "(serial_number, mac_address, print_date, print_datetime, status, prn_template) "
+            "VALUES (?, ?, '2026-10-19', ?, ?, 'PSA_LABEL_ZPL_with_mac_address.prn')",
+            [
+                (f"P10DL0S0H3A00C1{i:05d}", f"PSAD0CF13{i:08d}",
+                 f"2026-10-{1 + i % 28:02d}T{(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d}.000000",
+                 'success' if i % 7 else 'failed')
+                for i in range(rows)
+            ],
+        )
+        db.conn.commit()
+
+
+def _time(func: Callable[[], object], repeat: int) -> List[float]:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def _peak_kb(func: Callable[[], object]) -> float:
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def _access(rows) -> None:
+    for record in rows:
+        record.get('print_datetime', '')
+        record.get('serial_number', '')
+        record.get('mac_address', '')
+        record.get('status', '')
+
+
+def run_benchmark(rows: int = 10000, repeat: int = 20, searches: int = 2000) -> Dict[str, float]:
+    """
+    1만 건 이력 조회 비용 측정
+
+    Args:
+        rows: 이력 수 (한 번에 모두 조회)
+        repeat: 반복 횟수 (중앙값 사용)
+        searches: 문장 캐시 비교용 작은 검색 횟수
+
+    Returns:
+        {'dict_ms', 'records_ms', 'dict_access_ms', 'records_access_ms',
+         'dict_peak_kb', 'records_peak_kb', 'uncached_search_us', 'cached_search_us'}
+    """
+    from src.database.archive import ArchiveCatalog
+    from src.database.db_manager import STATEMENT_CACHE_SIZE, fetch_history
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.db")
+        _build_db(path, rows)
+        archives = ArchiveCatalog(tmp)
+
+        conn = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        load_dicts = lambda: fetch_history(conn, archives, limit=rows)
+        load_records = lambda: fetch_history(conn, archives, limit=rows, records=True)
+        assert [r.to_dict() for r in load_records()] == load_dicts()
+
+        dicts, records = load_dicts(), load_records()
+        result = {
+            'dict_ms': statistics.median(_time(load_dicts, repeat)),
+            'records_ms': statistics.median(_time(load_records, repeat)),
+            'dict_access_ms': statistics.median(_time(lambda: _access(dicts), repeat)),
+            'records_access_ms': statistics.median(_time(lambda: _access(records), repeat)),
+            'dict_peak_kb': _peak_kb(load_dicts),
+            'records_peak_kb': _peak_kb(load_records),
+        }
+
+        # 검색창 입력처럼 값만 바뀌는 작은 검색 반복 (문장 캐시 없음 / 있음)
+        def small_searches(connection):
+            for i in range(searches):
+                fetch_history(connection, archives, serial_number=str(i % 97), limit=20,
+                              date_from="2026-10-01", records=True)
+
+        for key, size in (('uncached_search_us', 0), ('cached_search_us', STATEMENT_CACHE_SIZE)):
+            connection = sqlite3.connect(path, cached_statements=size)
+            connection.row_factory = sqlite3.Row
+            result[key] = statistics.median(_time(lambda: small_searches(connection), 3)) * 1000 / searches
+            connection.close()
+        conn.close()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="이력 조회 (1만 건) 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000, help="이력 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--searches", type=int, default=2000, help="문장 캐시 비교용 검색 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    r = run_benchmark(rows=args.rows, repeat=args.repeat, searches=args.searches)
+
+    if args.json:
+        print(json.dumps(r, indent=2))
+    else:
+        print(f"{args.rows:,}건 조회 (dict / records):   {r['dict_ms']:.1f} / {r['records_ms']:.1f} ms "
+              f"({r['dict_ms'] / r['records_ms']:.2f}x)")
+        print(f"표 채우기 접근 (dict / records): {r['dict_access_ms']:.1f} / {r['records_access_ms']:.1f} ms")
+        total_dict = r['dict_ms'] + r['dict_access_ms']
+        total_records = r['records_ms'] + r['records_access_ms']
+        print(f"합계 (dict / records):          {total_dict:.1f} / {total_records:.1f} ms "
+              f"({total_dict / total_records:.2f}x)")
+        print(f"최대 메모리 (dict / records):    {r['dict_peak_kb']:,.0f} / {r['records_peak_kb']:,.0f} KB")
+        print(f"작은 검색 1회 (캐시 없음 / 있음): {r['uncached_search_us']:.0f} / {r['cached_search_us']:.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
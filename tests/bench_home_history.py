@@ -0,0 +1,118 @@
+"""
+홈 화면 출력 이력 갱신 벤치마크
+
+오늘 이력이 N건 쌓인 상태에서 라벨 1장 출력 후의 화면 갱신 비용을 비교합니다.
+  - full:        set_history()로 전체 목록 재설정 (기존 방식)
+  - incremental: add_print_records()로 새 레코드만 추가
+
+실행:
+    python -m tests.bench_home_history
+    python -m tests.bench_home_history --rows 1000 --prints 50 --json
+    QT_QPA_PLATFORM=offscreen python -m tests.bench_home_history
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+
+def _record(i: int) -> dict:
+    return {
+        'id': i + 1,
+        'serial_number': f"P10DL0S0H3A00C1{i % 10000:04d}0",
+        'mac_address': f"PSAD0CF13{i:08d}",
+        'print_datetime': f"2025-10-17T19:{(i // 60) % 60:02d}:{i % 60:02d}.000000",
+        'prn_template': "template.prn",
+        'status': 'success' if i % 7 else 'failed',
+    }
+
+
+def _measure(app, update, prints: int) -> List[float]:
+    durations = []
+    for i in range(prints):
+        started = time.perf_counter()
+        update(i)
+        app.processEvents()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def run_benchmark(rows: int = 1000, prints: int = 30) -> Dict[str, float]:
+    """
+    출력 1건당 홈 화면 갱신 시간 측정
+
+    Args:
+        rows: 초기 오늘 이력 수
+        prints: 측정할 출력 횟수
+
+    Returns:
+        {'full_ms_mean', 'incremental_ms_mean', 'full_ms_max', 'incremental_ms_max', 'visible_rows'}
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from src.gui.views.home_view import HomeView
+
+    history = [_record(i) for i in reversed(range(rows))]
+
+    home = HomeView()
+    home.resize(1280, 800)
+    home.show()
+
+    # 기존 방식: 매 출력마다 전체 목록 재설정
+    home.set_history(history)
+    app.processEvents()
+    full_history = list(history)
+
+    def full_update(i):
+        full_history.insert(0, _record(rows + i))
+        home.set_stats(len(full_history), 0, 0)
+        home.set_history(full_history)
+
+    full = _measure(app, full_update, prints)
+
+    # 증분 방식: 새 레코드만 추가
+    home.set_history(history)
+    app.processEvents()
+
+    def incremental_update(i):
+        home.add_print_records([_record(rows + prints + i)])
+
+    incremental = _measure(app, incremental_update, prints)
+
+    result = {
+        'full_ms_mean': statistics.fmean(full),
+        'full_ms_max': max(full),
+        'incremental_ms_mean': statistics.fmean(incremental),
+        'incremental_ms_max': max(incremental),
+        'visible_rows': home.history_card.table.row_count(),
+    }
+    home.close()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="홈 화면 출력 이력 갱신 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="초기 오늘 이력 수")
+    parser.add_argument("--prints", type=int, default=30, help="측정할 출력 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    result = run_benchmark(rows=args.rows, prints=args.prints)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"표시 행 수:           {result['visible_rows']}")
+        print(f"전체 재설정 (평균/최대): {result['full_ms_mean']:.2f} / {result['full_ms_max']:.2f} ms")
+        print(f"증분 추가 (평균/최대):   {result['incremental_ms_mean']:.2f} / "
+              f"{result['incremental_ms_max']:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
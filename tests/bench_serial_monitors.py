@@ -0,0 +1,201 @@
+"""
+시리얼 모니터 처리량 벤치마크
+
+PtyMCUSimulator로 ESP32 로그를 재생하면서 각 모니터 구현의
+처리량(lines/sec), MAC 감지 지연(p50/p95/p99), CPU 사용률을 측정합니다.
+
+실행:
+    python -m tests.bench_serial_monitors
+    python -m tests.bench_serial_monitors --baud 0 --lines 20000 --burst 16
+    python -m tests.bench_serial_monitors --monitor mcu.MCUMonitor --json
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from tests.mcu_simulator import PtyMCUSimulator
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값에서 백분위수 계산 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def _start_mcu_monitor(port: str, on_mac: Callable[[str], None]) -> Callable[[], None]:
+    """src.mcu.mcu_monitor.MCUMonitor (QThread, subTopic 패턴)"""
+    from PyQt6.QtCore import Qt
+    from src.mcu.mcu_monitor import MCUMonitor
+
+    monitor = MCUMonitor(port, watch_device=False)
+    # 이벤트 루프 없이 측정하므로 방출 스레드에서 직접 호출
+    monitor.mac_detected.connect(on_mac, Qt.ConnectionType.DirectConnection)
+    monitor.start()
+    return monitor.stop
+
+
+def _start_serial_comm_monitor(port: str, on_mac: Callable[[str], None]) -> Callable[[], None]:
+    """src.serial_comm.mcu_monitor.MCUMonitor (QThread, device id 패턴)"""
+    from PyQt6.QtCore import Qt
+    from src.serial_comm.mcu_monitor import MCUMonitor
+
+    monitor = MCUMonitor(port)
+    monitor.mac_received.connect(on_mac, Qt.ConnectionType.DirectConnection)
+    monitor.start()
+    return monitor.stop
+
+
+def _start_serial_monitor(port: str, on_mac: Callable[[str], None]) -> Callable[[], None]:
+    """src.serial_comm.serial_monitor.SerialMonitor (threading, 콜백)"""
+    from src.serial_comm.serial_monitor import SerialMonitor
+
+    monitor = SerialMonitor()
+    monitor.on_mac_detected = on_mac
+    if not monitor.connect(port):
+        raise RuntimeError(f"SerialMonitor 연결 실패: {port}")
+    return monitor.disconnect
+
+
+MONITORS: Dict[str, Callable[[str, Callable[[str], None]], Callable[[], None]]] = {
+    "mcu.MCUMonitor": _start_mcu_monitor,
+    "serial_comm.MCUMonitor": _start_serial_comm_monitor,
+    "serial_comm.SerialMonitor": _start_serial_monitor,
+}
+
+
+def run_benchmark(
+    monitor_name: str,
+    total_lines: int = 5000,
+    baudrate: int = 115200,
+    burst_size: int = 1,
+    burst_interval: float = 0.0,
+    mac_every: int = 50,
+    settle_timeout: float = 5.0,
+) -> Dict[str, float]:
+    """
+    모니터 하나에 대한 벤치마크 실행
+
+    Returns:
+        {
+            'lines': 전송 라인 수,
+            'lines_per_sec': 처리량 (마지막 MAC 감지 시각 기준),
+            'macs_sent': 전송한 MAC 수,
+            'macs_detected': 감지한 MAC 수,
+            'latency_p50_ms' / 'latency_p95_ms' / 'latency_p99_ms': MAC 감지 지연,
+            'cpu_percent': 프로세스 CPU 사용률 (시뮬레이터 포함)
+        }
+    """
+    detected: Dict[str, float] = {}
+    lock = threading.Lock()
+
+    def on_mac(mac: str) -> None:
+        now = time.monotonic()
+        with lock:
+            detected.setdefault(mac.upper(), now)
+
+    sim = PtyMCUSimulator(
+        total_lines=total_lines,
+        baudrate=baudrate,
+        burst_size=burst_size,
+        burst_interval=burst_interval,
+        mac_every=mac_every,
+    )
+    port = sim.open()
+    stop_monitor = MONITORS[monitor_name](port, on_mac)
+
+    try:
+        # 모니터가 포트를 열 때까지 대기
+        time.sleep(0.5)
+
+        cpu_start = time.process_time()
+        sim.start()
+        sim.wait_done()
+
+        # 마지막 MAC이 감지될 때까지 대기
+        deadline = time.monotonic() + settle_timeout
+        while time.monotonic() < deadline:
+            with lock:
+                if len(detected) >= len(sim.sent_macs):
+                    break
+            time.sleep(0.01)
+
+        wall_end = max(detected.values()) if detected else time.monotonic()
+        cpu_used = time.process_time() - cpu_start
+    finally:
+        stop_monitor()
+        sim.stop()
+
+    wall = max(wall_end - sim.started_at, 1e-9)
+    latencies = sorted(
+        (detected[mac] - sent) * 1000.0
+        for mac, sent in sim.sent_macs.items()
+        if mac in detected
+    )
+
+    return {
+        "lines": sim.lines_sent,
+        "lines_per_sec": sim.lines_sent / wall,
+        "macs_sent": len(sim.sent_macs),
+        "macs_detected": len(latencies),
+        "latency_p50_ms": percentile(latencies, 50),
+        "latency_p95_ms": percentile(latencies, 95),
+        "latency_p99_ms": percentile(latencies, 99),
+        "cpu_percent": 100.0 * cpu_used / wall,
+    }
+
+
+def _print_table(results: List[Tuple[str, Dict[str, float]]]) -> None:
+    header = f"{'monitor':<28}{'lines/s':>10}{'MAC':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'CPU %':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results:
+        print(
+            f"{name:<28}{r['lines_per_sec']:>10.0f}"
+            f"{int(r['macs_detected']):>5}/{int(r['macs_sent']):<4}"
+            f"{r['latency_p50_ms']:>9.2f}{r['latency_p95_ms']:>9.2f}{r['latency_p99_ms']:>9.2f}"
+            f"{r['cpu_percent']:>8.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="시리얼 모니터 벤치마크 (Linux pty)")
+    parser.add_argument("--monitor", choices=list(MONITORS), action="append",
+                        help="측정할 모니터 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--lines", type=int, default=5000, help="전송 라인 수")
+    parser.add_argument("--baud", type=int, default=115200, help="보드레이트 (0 = 제한 없음)")
+    parser.add_argument("--burst", type=int, default=1, help="버스트당 라인 수")
+    parser.add_argument("--burst-interval", type=float, default=0.0, help="버스트 간격 (초)")
+    parser.add_argument("--mac-every", type=int, default=50, help="N 라인마다 MAC 삽입")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("pty 기반 벤치마크는 Linux에서만 실행할 수 있습니다.")
+        return 1
+
+    results = []
+    for name in args.monitor or list(MONITORS):
+        results.append((name, run_benchmark(
+            name,
+            total_lines=args.lines,
+            baudrate=args.baud,
+            burst_size=args.burst,
+            burst_interval=args.burst_interval,
+            mac_every=args.mac_every,
+        )))
+
+    if args.json:
+        print(json.dumps(dict(results), indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
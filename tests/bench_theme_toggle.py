@@ -0,0 +1,161 @@
+"""
+테마 전환 벤치마크
+
+홈/이력 화면을 띄운 상태에서 라이트/다크 테마를 반복 전환하며
+전환당 소요 시간(이벤트 처리 포함)과 스타일시트 파싱 횟수
+(QWidget/QApplication.setStyleSheet 호출 수)를 측정합니다.
+
+실행:
+    python -m tests.bench_theme_toggle
+    python -m tests.bench_theme_toggle --toggles 40 --rows 500 --json
+    QT_QPA_PLATFORM=offscreen python -m tests.bench_theme_toggle
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+
+class StyleSheetCounter:
+    """setStyleSheet 호출 횟수 계측 (스타일시트 파싱 1회 = 호출 1회)"""
+
+    def __init__(self):
+        from PyQt6.QtWidgets import QApplication, QWidget
+
+        self.widget_calls = 0
+        self.app_calls = 0
+        self._originals = {
+            QWidget: QWidget.setStyleSheet,
+            QApplication: QApplication.setStyleSheet,
+        }
+
+        widget_original = self._originals[QWidget]
+        app_original = self._originals[QApplication]
+        counter = self
+
+        def widget_set(widget, qss):
+            counter.widget_calls += 1
+            return widget_original(widget, qss)
+
+        def app_set(app, qss):
+            counter.app_calls += 1
+            return app_original(app, qss)
+
+        QWidget.setStyleSheet = widget_set
+        QApplication.setStyleSheet = app_set
+
+    def reset(self):
+        self.widget_calls = 0
+        self.app_calls = 0
+
+    def restore(self):
+        for cls, original in self._originals.items():
+            cls.setStyleSheet = original
+
+
+def _sample_history(rows: int) -> List[dict]:
+    """테이블 채우기용 이력 데이터"""
+    return [
+        {
+            'id': i + 1,
+            'serial_number': f"P10DL0S0H3A00C1{i % 10000:04d}0",
+            'mac_address': f"PSAD0CF13{i:08d}",
+            'print_datetime': f"2025-10-17T19:{(i // 60) % 60:02d}:{i % 60:02d}.000000",
+            'prn_template': "template.prn",
+            'status': 'success' if i % 7 else 'failed',
+        }
+        for i in range(rows)
+    ]
+
+
+def run_benchmark(toggles: int = 20, rows: int = 200) -> Dict[str, float]:
+    """
+    테마 전환 측정
+
+    Args:
+        toggles: 전환 횟수
+        rows: 이력 테이블 행 수
+
+    Returns:
+        {'toggle_ms_mean', 'toggle_ms_p50', 'toggle_ms_max',
+         'widget_parses_per_toggle', 'app_parses_per_toggle', 'widgets'}
+    """
+    from PyQt6.QtWidgets import QApplication, QTabWidget, QWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    counter = StyleSheetCounter()
+
+    try:
+        from src.gui.styles import get_theme_manager
+        from src.gui.views.home_view import HomeView
+        from src.gui.views.history_view import HistoryView
+
+        theme_mgr = get_theme_manager()
+        theme_mgr.apply_to_app(app)
+
+        history = _sample_history(rows)
+        container = QTabWidget()
+        home = HomeView()
+        home.set_history(history[:50])
+        home.set_stats(rows, rows - rows // 7, rows // 7)
+        history_view = HistoryView()
+        history_view.set_history(history)
+        container.addTab(home, "home")
+        container.addTab(history_view, "history")
+        container.resize(1280, 800)
+        container.show()
+        app.processEvents()
+
+        # 워밍업 (컴파일 캐시 채우기)
+        theme_mgr.toggle_theme()
+        theme_mgr.toggle_theme()
+        app.processEvents()
+
+        counter.reset()
+        durations = []
+        for _ in range(toggles):
+            started = time.perf_counter()
+            theme_mgr.toggle_theme()
+            app.processEvents()
+            durations.append((time.perf_counter() - started) * 1000)
+
+        durations.sort()
+        result = {
+            'toggle_ms_mean': statistics.fmean(durations),
+            'toggle_ms_p50': durations[len(durations) // 2],
+            'toggle_ms_max': durations[-1],
+            'widget_parses_per_toggle': counter.widget_calls / toggles,
+            'app_parses_per_toggle': counter.app_calls / toggles,
+            'widgets': len(container.findChildren(QWidget)),
+        }
+        container.close()
+        return result
+    finally:
+        counter.restore()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="테마 전환 벤치마크")
+    parser.add_argument("--toggles", type=int, default=20, help="전환 횟수")
+    parser.add_argument("--rows", type=int, default=200, help="이력 테이블 행 수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    result = run_benchmark(toggles=args.toggles, rows=args.rows)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"위젯 수:                 {result['widgets']}")
+        print(f"전환 시간 (평균/p50/최대): {result['toggle_ms_mean']:.1f} / "
+              f"{result['toggle_ms_p50']:.1f} / {result['toggle_ms_max']:.1f} ms")
+        print(f"전환당 위젯 setStyleSheet: {result['widget_parses_per_toggle']:.0f}")
+        print(f"전환당 앱 setStyleSheet:   {result['app_parses_per_toggle']:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+PTY 기반 MCU(ESP32) 시뮬레이터
+
+Linux pty 쌍을 열고 ESP32 부팅/동작 로그를 지정한 보드레이트와 버스트 패턴으로
+재생합니다. 주기적으로 `device id: PSA...` / `PSA.../subTopic` 라인을 삽입하고
+각 MAC의 전송 완료 시각을 기록하므로 모니터의 감지 지연을 측정할 수 있습니다.
+
+Example:
+    >>> with PtyMCUSimulator(baudrate=115200, mac_every=20) as sim:
+    ...     monitor = MCUMonitor(sim.port)
+    ...     sim.start()
+    ...     sim.wait_done()
+"""
+
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+# ESP32 (ESP-IDF) 로그 샘플
+DEFAULT_ESP32_LOG = [
+    "ets Jun  8 2016 00:22:57",
+    "rst:0x1 (POWERON_RESET),boot:0x13 (SPI_FAST_FLASH_BOOT)",
+    "configsip: 0, SPIWP:0xee",
+    "clk_drv:0x00,q_drv:0x00,d_drv:0x00,cs0_drv:0x00,hd_drv:0x00,wp_drv:0x00",
+    "mode:DIO, clock div:2",
+    "load:0x3fff0030,len:7104",
+    "entry 0x400805f0",
+    "I (29) boot: ESP-IDF v4.4.4 2nd stage bootloader",
+    "I (29) boot: compile time 10:12:31",
+    "I (512) cpu_start: Pro cpu start user code",
+    "I (530) heap_init: Initializing. RAM available for dynamic allocation:",
+    "I (610) wifi:wifi driver task: 3ffc0c9c, prio:23, stack:6656, core=0",
+    "I (650) wifi:mode : sta (d0:cf:13:27:82:94)",
+    "I (1720) wifi:connected with WITHFORCE_AP, aid = 3, channel 6, BW20",
+    "I (2530) esp_netif_handlers: sta ip: 192.168.0.42, mask: 255.255.255.0",
+    "I (2840) MQTT: MQTT_EVENT_CONNECTED",
+    "I (3010) sensor: adc raw=2048 mv=1650",
+    "W (3120) sensor: calibration eFuse not burnt, using default vref",
+]
+
+
+def generate_mac(rng: random.Random) -> str:
+    """PSA + 14자리 16진수 형태의 MAC(device id) 생성"""
+    return "PSA" + "".join(rng.choice("0123456789ABCDEF") for _ in range(14))
+
+
+class PtyMCUSimulator:
+    """pty 쌍으로 ESP32 시리얼 출력을 흉내내는 시뮬레이터"""
+
+    MAC_STYLES = ("device_id", "subtopic", "both")
+
+    def __init__(
+        self,
+        log_lines: Optional[Iterable[str]] = None,
+        total_lines: int = 1000,
+        baudrate: int = 115200,
+        burst_size: int = 1,
+        burst_interval: float = 0.0,
+        mac_every: int = 50,
+        mac_style: str = "both",
+        seed: int = 0,
+    ):
+        """
+        Args:
+            log_lines: 재생할 로그 라인 (None이면 DEFAULT_ESP32_LOG 반복)
+            total_lines: 전송할 전체 라인 수 (MAC 라인 포함)
+            baudrate: 전송 속도 제한 (0이면 제한 없음, 1바이트 = 10비트로 계산)
+            burst_size: 한 번에 몰아서 쓰는 라인 수
+            burst_interval: 버스트 사이 대기 시간 (초)
+            mac_every: N 라인마다 MAC 라인 삽입 (0이면 삽입 안 함)
+            mac_style: "device_id", "subtopic", "both"
+            seed: MAC 생성 난수 시드
+        """
+        if mac_style not in self.MAC_STYLES:
+            raise ValueError(f"mac_style은 {self.MAC_STYLES} 중 하나여야 합니다: {mac_style}")
+
+        self.log_lines = list(log_lines) if log_lines is not None else list(DEFAULT_ESP32_LOG)
+        self.total_lines = total_lines
+        self.baudrate = baudrate
+        self.burst_size = max(1, burst_size)
+        self.burst_interval = burst_interval
+        self.mac_every = mac_every
+        self.mac_style = mac_style
+        self._rng = random.Random(seed)
+
+        self.master_fd: Optional[int] = None
+        self.slave_fd: Optional[int] = None
+        self.port: Optional[str] = None
+
+        # MAC → 전송 완료 시각 (time.monotonic)
+        self.sent_macs: Dict[str, float] = {}
+        self.lines_sent = 0
+        self.bytes_sent = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._done = threading.Event()
+
+    @classmethod
+    def from_log_file(cls, path: str, **kwargs) -> "PtyMCUSimulator":
+        """녹화된 ESP32 로그 파일로 시뮬레이터 생성"""
+        text = Path(path).read_text(encoding="utf-8", errors="replace")
+        return cls(log_lines=[line for line in text.splitlines() if line.strip()], **kwargs)
+
+    def open(self) -> str:
+        """
+        pty 쌍 열기
+
+        Returns:
+            모니터가 열어야 할 포트 경로 (slave, 예: "/dev/pts/3")
+        """
+        import pty
+        import tty
+
+        self.master_fd, self.slave_fd = pty.openpty()
+        # 라인 디시플린(에코/canonical) 비활성화
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+        return self.port
+
+    def start(self) -> None:
+        """로그 재생 시작 (백그라운드 스레드)"""
+        if self.master_fd is None:
+            self.open()
+        self._running = True
+        self._done.clear()
+        self._thread = threading.Thread(target=self._run, name="PtyMCUSimulator", daemon=True)
+        self._thread.start()
+
+    def wait_done(self, timeout: Optional[float] = None) -> bool:
+        """재생 완료 대기"""
+        return self._done.wait(timeout)
+
+    def stop(self) -> None:
+        """재생 중지 및 pty 닫기"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self.master_fd = None
+        self.slave_fd = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def iter_lines(self) -> Iterable[str]:
+        """재생할 라인 생성 (MAC 라인 삽입 포함)"""
+        log_index = 0
+        for index in range(self.total_lines):
+            if self.mac_every and (index + 1) % self.mac_every == 0:
+                yield from self._mac_lines(generate_mac(self._rng))
+            else:
+                yield self.log_lines[log_index % len(self.log_lines)]
+                log_index += 1
+
+    def _mac_lines(self, mac: str) -> List[str]:
+        """MAC 삽입 라인 (MAC 값은 라인 끝에 표시하여 전송 시각 기록에 사용)"""
+        lines = []
+        if self.mac_style in ("device_id", "both"):
+            lines.append(f"I (4100) app_main: device id: {mac}")
+        if self.mac_style in ("subtopic", "both"):
+            lines.append(f"I (4120) MQTT: subscribed {mac}/subTopic")
+        return lines
+
+    def _run(self) -> None:
+        """재생 루프"""
+        self.started_at = time.monotonic()
+        # 보드레이트 제한: 절대 일정(schedule) 기준으로 대기하여 누적 오차 방지
+        byte_time = 10.0 / self.baudrate if self.baudrate else 0.0
+        schedule = self.started_at
+
+        batch: List[str] = []
+        try:
+            for line in self.iter_lines():
+                if not self._running:
+                    break
+                batch.append(line)
+                if len(batch) < self.burst_size:
+                    continue
+                schedule = self._write_batch(batch, byte_time, schedule)
+                batch = []
+            if batch and self._running:
+                self._write_batch(batch, byte_time, schedule)
+        except OSError:
+            # 리더 쪽이 pty를 닫은 경우
+            pass
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+    def _write_batch(self, batch: List[str], byte_time: float, schedule: float) -> float:
+        """라인 묶음 전송 후 다음 전송 시각 반환"""
+        payload = "".join(line + "\r\n" for line in batch).encode("utf-8")
+
+        view = memoryview(payload)
+        while view:
+            written = os.write(self.master_fd, view)
+            view = view[written:]
+
+        now = time.monotonic()
+        for line in batch:
+            if "device id:" in line or "/subTopic" in line:
+                mac = line.rsplit(" ", 1)[-1].split("/", 1)[0]
+                self.sent_macs.setdefault(mac, now)
+
+        self.lines_sent += len(batch)
+        self.bytes_sent += len(payload)
+
+        schedule += len(payload) * byte_time + self.burst_interval
+        delay = schedule - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return schedule
@@ -0,0 +1,111 @@
+"""
+출력 이력 연도별 아카이브 테스트
+"""
+
+import pytest
+
+from src.database.archive import HistoryArchiver
+from src.database.db_manager import DBManager
+from src.database.history_reader import HistoryReader
+
+LOT_OLD = "P10DL0S0H3A00B03"
+LOT_NEW = "P10DL0S0H3A00C10"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "label_printer.db"))
+    db.initialize()
+    rows = []
+    for year, lot in ((2023, LOT_OLD), (2024, LOT_OLD), (2025, LOT_NEW)):
+        for i in range(1, 6):
+            seq = (year - 2023) * 10 + i
+            rows.append((
+                f"{lot}{seq:04d}", f"PSA{seq:014X}", f"{year}-06-{i:02d}",
+                f"{year}-06-{i:02d}T12:00:00", 'success', None, 'template.prn',
+            ))
+    db.insert_print_history_many(rows)
+    yield db
+    db.close()
+
+
+def test_moves_rows_into_per_year_files(db, tmp_path):
+    """기준일 이전 이력이 연도별 파일로 옮겨지고 운영 테이블에서 빠지는지 테스트"""
+    moved = HistoryArchiver(db).archive("2025-01-01")
+
+    assert moved == {2023: 5, 2024: 5}
+    assert sorted(p.name for p in tmp_path.glob("archive_*.db")) == ["archive_2023.db", "archive_2024.db"]
+    hot = db.conn.execute("SELECT COUNT(*) FROM print_history").fetchone()[0]
+    assert hot == 5
+
+    # 다시 실행해도 옮길 행이 없음
+    assert HistoryArchiver(db).archive("2025-01-01") == {}
+
+
+def test_queries_span_archives_transparently(db):
+    """검색/건수/반복 조회가 날짜 범위에 맞는 아카이브를 포함하는지 테스트"""
+    HistoryArchiver(db).archive("2025-01-01")
+
+    everything = db.get_print_history(limit=100)
+    assert len(everything) == 15
+    dates = [r['print_datetime'] for r in everything]
+    assert dates == sorted(dates, reverse=True)
+
+    only_2023 = db.get_print_history(date_from="2023-01-01", date_to="2023-12-31")
+    assert [r['serial_number'] for r in only_2023][-1] == f"{LOT_OLD}0001"
+    assert len(only_2023) == 5
+
+    # 페이지가 운영 테이블에서 아카이브로 넘어가는 경계
+    page = db.get_print_history(limit=4, offset=3)
+    assert [r['serial_number'] for r in page] == [
+        f"{LOT_NEW}0022", f"{LOT_NEW}0021", f"{LOT_OLD}0015", f"{LOT_OLD}0014",
+    ]
+
+    reader = HistoryReader(db.db_path)
+    try:
+        assert len(reader.search(date_from="2024-01-01")) == 10
+        assert reader.count_history(date_to="2024-12-31") == 10
+        chunks = list(reader.iter_history(chunk_size=4))
+        assert sum(len(c) for c in chunks) == 15
+    finally:
+        reader.close()
+
+
+def test_archives_attached_only_when_needed(db):
+    """날짜 범위가 운영 기간뿐이거나 운영 테이블로 페이지가 채워지면 ATTACH하지 않는지 테스트"""
+    HistoryArchiver(db).archive("2025-01-01")
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+
+    db.get_print_history(date_from="2025-01-01")
+    db.get_print_history(limit=3)
+    assert not any("ATTACH" in s for s in statements)
+
+    db.get_print_history(date_from="2024-01-01")
+    attached = [s for s in statements if s.startswith("ATTACH")]
+    assert len(attached) == 1 and "archive_2024.db" in attached[0]
+    assert db.conn.execute("PRAGMA database_list").fetchall()[-1]['name'] == "main"
+
+
+def test_sequence_counter_survives_archiving(db):
+    """옮긴 LOT의 최대 생산순서가 계속 반영되는지 테스트"""
+    assert db.get_max_sequence_for_lot(LOT_OLD) == 15
+
+    HistoryArchiver(db).archive("2025-01-01")
+
+    assert db.get_max_sequence_for_lot(LOT_OLD) == 15
+    assert db.get_max_sequence_for_lot(LOT_NEW) == 25
+    db.save_print_history(f"{LOT_OLD}0016", "PSA00000000000099", "2026-01-02", "success")
+    assert db.get_max_sequence_for_lot(LOT_OLD) == 16
+
+
+def test_keep_days_from_config(db, tmp_path):
+    """archive_keep_days 설정을 기준으로 이동하는지 테스트"""
+    db.set_config("archive_keep_days", "0")
+
+    moved = HistoryArchiver(db).archive_expired()
+
+    assert moved == {2023: 5, 2024: 5, 2025: 5}
+    assert len(db.get_print_history(limit=100)) == 15
+    with pytest.raises(ValueError):
+        HistoryArchiver(db).archive("2025/01/01")
@@ -0,0 +1,108 @@
+"""
+이력 일괄 가져오기 테스트
+"""
+
+import io
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.services.export_service import HistoryExportService
+from src.services.import_service import HistoryImportService, read_csv_records
+
+LOT = "P10DL0S0H3A00C10"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "import.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+def _records(count, start=0):
+    return [
+        (i + 2, {'serial_number': f"{LOT}{i:04d}", 'mac_address': f"PSA{i:014X}",
+                 'print_datetime': f"2025-10-17T12:00:{i % 60:02d}"})
+        for i in range(start, start + count)
+    ]
+
+
+def _index_names(db):
+    return {
+        row[0] for row in db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'print_history'"
+            " AND sql IS NOT NULL"
+        )
+    }
+
+
+def test_reports_invalid_and_duplicates_without_raising(db):
+    """검증 오류/중복을 행별 예외 없이 모아서 보고하는지 테스트"""
+    db.save_print_history(f"{LOT}0001", "PSA00000000000001", "2025-10-17", "success")
+    records = _records(5) + [
+        (90, {'serial_number': "INVALID", 'mac_address': "PSA1", 'print_date': "2025-10-17"}),
+        (91, {'serial_number': f"{LOT}0100", 'mac_address': "bad-mac!", 'print_date': "2025-10-17"}),
+        (92, {'serial_number': f"{LOT}0101", 'mac_address': "PSA1", 'print_date': "17/10/2025"}),
+        (93, {'serial_number': f"{LOT}0003", 'mac_address': "PSA1", 'print_date': "2025-10-17"}),
+    ]
+
+    report = HistoryImportService(db).import_records(records, batch_size=3)
+
+    assert report['total'] == 9
+    assert report['inserted'] == 4
+    assert sorted(report['duplicates']) == [f"{LOT}0001", f"{LOT}0003"]
+    assert [i['line'] for i in report['invalid']] == [90, 91, 92]
+    assert "MAC" in report['invalid'][1]['reason']
+
+    row = db.get_print_history(serial_number=f"{LOT}0002")[0]
+    assert row['print_date'] == "2025-10-17" and row['status'] == "success"
+
+
+def test_dry_run_does_not_write(db):
+    """dry_run은 중복까지 확인하되 저장하지 않는지 테스트"""
+    report = HistoryImportService(db).import_records(_records(4) + _records(1), dry_run=True)
+
+    assert report['inserted'] == 0
+    assert report['duplicates'] == [f"{LOT}0000"]
+    assert db.get_print_history() == []
+
+
+def test_defer_indexes_restores_indexes(db):
+    """보조 인덱스를 지웠다가 가져오기 후 다시 만드는지 테스트"""
+    before = _index_names(db)
+    dropped = []
+    original = db.insert_print_history_many
+
+    def insert(rows):
+        dropped.append(_index_names(db))
+        return original(rows)
+
+    db.insert_print_history_many = insert
+    report = HistoryImportService(db).import_records(_records(2500), batch_size=1000, defer_indexes=True)
+
+    assert report['inserted'] == 2500
+    assert dropped and all(names == set() for names in dropped)
+    assert _index_names(db) == before and before
+
+
+def test_exported_csv_round_trips(db, tmp_path):
+    """내보내기 CSV(한글 머리글)를 그대로 다시 가져올 수 있는지 테스트"""
+    HistoryImportService(db).import_records(_records(30))
+    out = tmp_path / "history.csv"
+    HistoryExportService(db.db_path).export(str(out))
+
+    target = DBManager(str(tmp_path / "target.db"))
+    target.initialize()
+    try:
+        report = HistoryImportService(target).import_csv(str(out))
+        assert report['inserted'] == 30 and report['invalid'] == []
+        assert len(target.get_print_history(limit=100)) == 30
+    finally:
+        target.close()
+
+
+def test_csv_requires_serial_and_mac_columns():
+    with pytest.raises(ValueError):
+        list(read_csv_records(io.StringIO("foo,bar\n1,2\n")))
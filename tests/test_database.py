@@ -47,6 +47,10 @@ def test_save_print_history(db):
     assert history[0]["serial_number"] == "P10DL0S0H3A00A01"
     assert history[0]["mac_address"] == "PSAD0CF1327829495"
 
+    # 단건 조회
+    assert db.get_print_record(record_id) == history[0]
+    assert db.get_print_record(record_id + 1) is None
+
 
 def test_duplicate_serial_number(db):
     """중복 시리얼 번호 테스트"""
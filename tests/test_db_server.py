@@ -0,0 +1,155 @@
+"""
+공유 DB 서버 / 원격 클라이언트 테스트
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.database.exceptions import DatabaseError, DuplicateSerialNumberError, RemoteUnavailableError
+from src.database.remote import RemoteDBManager, open_database
+from src.database.server import TOKEN_ENV, DBServer
+from src.headless import db_server_command
+
+LOT = "P10DL0S0H3A00C10"
+
+
+@pytest.fixture
+def server(tmp_path):
+    db = DBManager(str(tmp_path / "shared.db"))
+    db.initialize()
+    server = DBServer(db, port=0).start()
+    yield server
+    server.stop()
+    db.close()
+
+
+@pytest.fixture
+def client(server):
+    client = RemoteDBManager(server.url)
+    client.initialize()
+    yield client
+    client.close()
+
+
+def test_concurrent_reservations_never_overlap(server):
+    """여러 스테이션이 동시에 예약해도 번호가 겹치지 않는지 테스트"""
+    clients = [RemoteDBManager(server.url) for _ in range(4)]
+
+    def reserve(client):
+        return [client.reserve_sequence(LOT) for _ in range(25)]
+
+    try:
+        with ThreadPoolExecutor(len(clients)) as pool:
+            results = [seq for chunk in pool.map(reserve, clients) for seq in chunk]
+    finally:
+        for client in clients:
+            client.close()
+
+    assert sorted(results) == list(range(1, 101))
+
+
+def test_commit_and_search_round_trip(client):
+    """commit_print/search_history와 원래 예외 복원 테스트"""
+    first = client.reserve_sequence(LOT)
+    record = client.commit_print(
+        f"{LOT}{first:04d}", "PSA00000000000001", "2025-10-17", "template.prn",
+        production_sequence=f"{first:04d}",
+    )
+
+    assert record['serial_number'] == f"{LOT}0001"
+    assert client.get_lot_config()['production_sequence'] == "0001"
+    assert [r['id'] for r in client.search_history(lot_number=LOT)] == [record['id']]
+    assert client.find_existing_serials([f"{LOT}0001", "NONE"]) == {f"{LOT}0001"}
+
+    with pytest.raises(DuplicateSerialNumberError) as exc:
+        client.commit_print(f"{LOT}0001", "PSA00000000000002", "2025-10-17", "template.prn")
+    assert exc.value.serial_number == f"{LOT}0001"
+
+
+def test_batch_and_keep_alive(client):
+    """배치 호출이 한 요청으로 실행되고 연결이 재사용되는지 테스트"""
+    client.get_config("auto_increment")
+    sock = client._conn.sock
+
+    results = client.call_many([
+        ('set_config', {'key': "station", 'value': "A"}),
+        ('get_configs', {'keys': ["station", "missing"]}),
+        ('reserve_sequence', {'lot_number': LOT, 'count': 10}),
+    ])
+
+    assert results == [None, {'station': "A", 'missing': None}, 1]
+    assert client._conn.sock is sock
+    assert client.reserve_sequence(LOT) == 11
+
+
+def test_release_returns_only_latest_reservation(tmp_path):
+    """인쇄 실패로 반환한 번호를 다음 예약이 다시 쓰는지 테스트"""
+    with DBManager(str(tmp_path / "local.db")) as db:
+        db.initialize()
+        assert db.reserve_sequence(LOT) == 1
+        assert db.release_sequence(LOT, 1) is True
+        assert db.reserve_sequence(LOT) == 1
+
+        assert db.reserve_sequence(LOT) == 2
+        assert db.release_sequence(LOT, 1) is False  # 뒤에 예약이 있으면 건너뜀
+        assert db.reserve_sequence(LOT) == 3
+
+
+def test_delete_latest_record_reuses_sequence(tmp_path):
+    """마지막 인쇄 기록을 지우면 그 번호를 다음 예약이 다시 쓰는지 테스트"""
+    with DBManager(str(tmp_path / "local.db")) as db:
+        db.initialize()
+        ids = []
+        for _ in range(3):
+            sequence = db.reserve_sequence(LOT)
+            ids.append(db.save_print_history(f"{LOT}{sequence:04d}", "MAC", "2025-01-01", "success"))
+
+        assert db.delete_print_history(ids[2]) is True
+        assert db.get_max_sequence_for_lot(LOT) == 2
+        assert db.reserve_sequence(LOT) == 3
+
+        # 뒤에 예약이 있으면 지운 번호는 비워 둠
+        assert db.delete_print_history(ids[0]) is True
+        assert db.reserve_sequence(LOT) == 4
+
+
+def test_unavailable_server_and_factory(tmp_path):
+    """서버가 없으면 RemoteUnavailableError, 경로면 DBManager를 반환하는지 테스트"""
+    client = open_database("http://127.0.0.1:9", timeout=0.5)
+    assert isinstance(client, RemoteDBManager)
+    with pytest.raises(RemoteUnavailableError):
+        client.get_config("auto_increment")
+
+    assert isinstance(open_database(str(tmp_path / "x.db")), DBManager)
+
+
+def test_token_required_when_configured(tmp_path, monkeypatch):
+    """토큰을 지정한 서버는 토큰이 같은 요청만 실행하는지 테스트"""
+    db = DBManager(str(tmp_path / "secure.db"))
+    db.initialize()
+    server = DBServer(db, port=0, token="s3cret").start()
+    try:
+        monkeypatch.delenv(TOKEN_ENV, raising=False)
+        with RemoteDBManager(server.url) as anonymous:
+            with pytest.raises(DatabaseError):
+                anonymous.delete_print_history(1)
+        with RemoteDBManager(server.url, token="wrong") as wrong:
+            with pytest.raises(DatabaseError):
+                wrong.reserve_sequence(LOT)
+
+        monkeypatch.setenv(TOKEN_ENV, "s3cret")
+        with RemoteDBManager(server.url) as station:
+            assert station.reserve_sequence(LOT) == 1
+    finally:
+        server.stop()
+        db.close()
+
+
+def test_db_server_refuses_lan_without_token(tmp_path):
+    """127.0.0.1 외 주소는 토큰 없이 시작하지 않는지 테스트"""
+    args = argparse.Namespace(db=str(tmp_path / "lan.db"), host="0.0.0.0", port=0, token=None)
+    assert db_server_command(args) == 2
+    assert not (tmp_path / "lan.db").exists()
@@ -0,0 +1,110 @@
+"""
+구조화 이벤트 로그 (JSON lines + 시간 색인) 테스트
+"""
+
+import json
+
+import pytest
+
+from src.utils.event_log import EventLog, event_log_files, query_events
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "events.jsonl"
+
+
+def _write_jobs(log, count, start=0):
+    for i in range(start, start + count):
+        log.emit("print.job", serial=f"SN{i:04d}", mac=f"MAC{i:04d}", duration_ms=1.5)
+
+
+def test_emit_writes_json_lines_without_none_fields(log_path):
+    """이벤트가 한 줄에 하나씩 JSON으로 기록되는지 테스트"""
+    log = EventLog(str(log_path))
+    log.emit("mcu.mac_detected", mac="PSAD0CF1336A13031", port="COM5", serial=None)
+    log.close()
+
+    (line,) = log_path.read_text(encoding="utf-8").splitlines()
+    event = json.loads(line)
+    assert event['event'] == "mcu.mac_detected"
+    assert event['mac'] == "PSAD0CF1336A13031"
+    assert 'serial' not in event and 'ts' in event
+
+
+def test_disabled_log_is_noop(tmp_path):
+    """open() 전에는 아무것도 기록하지 않는지 테스트"""
+    log = EventLog()
+    log.emit("print.job", serial="SN")
+    assert not log.enabled
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_query_across_rotated_files(log_path):
+    """로테이션된 파일을 포함해 오래된 순으로 조회되는지 테스트"""
+    log = EventLog(str(log_path), max_bytes=2000, backup_count=10)
+    _write_jobs(log, 200)
+    log.close()
+
+    files = event_log_files(str(log_path))
+    assert len(files) > 2 and files[-1] == log_path
+
+    events = list(query_events(str(log_path)))
+    assert [e['serial'] for e in events] == [f"SN{i:04d}" for i in range(200)]
+    assert [e['serial'] for e in query_events(str(log_path), serial="SN0137")] == ["SN0137"]
+
+
+def test_query_uses_index_to_skip_blocks(log_path):
+    """시리얼/시간 조회가 색인으로 맞지 않는 블록을 읽지 않는지 테스트
+
+    대상이 아닌 블록을 같은 길이의 쓰레기 값으로 덮어써도 결과가 같아야 합니다.
+    """
+    log = EventLog(str(log_path))
+    _write_jobs(log, EventLog.BLOCK_EVENTS * 2)
+    log.emit("print.job", serial="TAIL", mac="M")     # 색인 없는 마지막 블록
+    log.close()
+
+    first_block = json.loads(log_path.with_name("events.jsonl.idx").read_text().splitlines()[0])
+    data = bytearray(log_path.read_bytes())
+    data[first_block['offset']:first_block['offset'] + first_block['length']] = b"x" * first_block['length']
+    log_path.write_bytes(bytes(data))
+
+    target = f"SN{EventLog.BLOCK_EVENTS + 3:04d}"
+    assert [e['serial'] for e in query_events(str(log_path), serial=target)] == [target]
+
+    second_start = list(query_events(str(log_path), serial=f"SN{EventLog.BLOCK_EVENTS:04d}"))[0]['ts']
+    since_events = list(query_events(str(log_path), since=second_start))
+    assert since_events[-1]['serial'] == "TAIL"
+    assert len(since_events) >= EventLog.BLOCK_EVENTS + 1
+
+
+def test_query_filters_time_window_and_event_prefix(log_path):
+    """시간 범위(until 제외)와 이벤트 접두사 필터 테스트"""
+    lines = [
+        {'ts': "2026-10-18T23:59:59.000", 'event': "print.job", 'serial': "A"},
+        {'ts': "2026-10-19T08:00:00.000", 'event': "mcu.connected", 'port': "COM5"},
+        {'ts': "2026-10-19T09:30:00.000", 'event': "print.job", 'serial': "B"},
+        {'ts': "2026-10-20T00:00:00.000", 'event': "print.job", 'serial': "C"},
+    ]
+    log_path.write_text("".join(json.dumps(e) + "\n" for e in lines), encoding="utf-8")
+
+    day = list(query_events(str(log_path), since="2026-10-19", until="2026-10-20"))
+    assert [e['event'] for e in day] == ["mcu.connected", "print.job"]
+    assert [e['port'] for e in query_events(str(log_path), event="mcu.")] == ["COM5"]
+    assert [e['serial'] for e in query_events(str(log_path), event="print.job", since="2026-10-19 09:00")] == ["B", "C"]
+
+
+def test_reopen_appends_after_unindexed_tail(log_path):
+    """비정상 종료로 색인되지 않은 꼬리가 남아도 다시 연 뒤 조회되는지 테스트"""
+    log = EventLog(str(log_path))
+    _write_jobs(log, 3)
+    log._file.close()           # close() 없이 종료된 상황 (블록 색인 미기록)
+    log._index.close()
+    log._file = None
+
+    log = EventLog(str(log_path))
+    _write_jobs(log, EventLog.BLOCK_EVENTS, start=3)
+    log.close()
+
+    serials = [e['serial'] for e in query_events(str(log_path))]
+    assert serials == [f"SN{i:04d}" for i in range(EventLog.BLOCK_EVENTS + 3)]
@@ -0,0 +1,121 @@
+"""
+이력 내보내기 (CSV/XLSX 스트리밍) 테스트
+"""
+
+import csv
+import re
+import tracemalloc
+import zipfile
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.services.export_service import ExportCancelledError, HistoryExportService
+from src.utils.xlsx_writer import column_letter
+
+LOT_A = "P10DL0S0H3A00C10"
+LOT_B = "P10DL0S0H3A00C11"
+
+
+def _make_db(path, count):
+    db = DBManager(str(path))
+    db.initialize()
+    db.conn.executemany(
+        "INSERT INTO print_history "
+        "(serial_number, mac_address, print_date, print_datetime, status, prn_template) "
+        "VALUES (?, ?, ?, ?, 'success', 'template.prn')",
+        (
+            (f"{LOT_A if i % 2 else LOT_B}{i:06d}", f"MAC{i:08d}", f"2025-10-{15 + i % 3:02d}",
+             f"2025-10-{15 + i % 3:02d}T12:{i // 60 % 60:02d}:{i % 60:02d}.000000")
+            for i in range(count)
+        ),
+    )
+    db.conn.commit()
+    db.close()
+    return str(path)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return _make_db(tmp_path / "export.db", 2500)
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.reader(f))
+
+
+def test_csv_export_with_date_and_lot_filters(db_path, tmp_path):
+    """날짜/LOT 필터가 적용되고 진행률이 청크마다 보고되는지 테스트"""
+    out = tmp_path / "out.csv"
+    progress = []
+    service = HistoryExportService(db_path)
+
+    result = service.export(
+        str(out), {'date_from': "2025-10-16", 'date_to': "2025-10-16", 'lot_number': LOT_A},
+        progress=progress.append,
+    )
+
+    rows = _read_csv(out)
+    assert rows[0][1] == "시리얼 번호"
+    body = rows[1:]
+    assert result['rows'] == len(body) > 0
+    assert all(r[1].startswith(LOT_A) and r[4].startswith("2025-10-16") for r in body)
+    assert progress[-1] == (len(body), len(body))
+
+
+def test_xlsx_export_is_valid_workbook(db_path, tmp_path):
+    """XLSX가 zip/시트 XML 구조를 갖추고 모든 행을 포함하는지 테스트"""
+    out = tmp_path / "out.xlsx"
+
+    result = HistoryExportService(db_path).export(str(out))
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert {"[Content_Types].xml", "xl/workbook.xml", "xl/worksheets/sheet1.xml"} <= set(zf.namelist())
+        sheet = zf.read("xl/worksheets/sheet1.xml").decode("utf-8")
+
+    assert result['rows'] == 2500
+    assert sheet.count("<row ") == 2501
+    assert "<t xml:space=\"preserve\">시리얼 번호</t>" in sheet
+    assert re.search(r'<c r="A2"><v>\d+</v></c>', sheet)
+    assert column_letter(0) == "A" and column_letter(25) == "Z" and column_letter(27) == "AB"
+
+
+def test_cancel_removes_partial_file(db_path, tmp_path):
+    """취소하면 예외가 발생하고 파일이 남지 않는지 테스트"""
+    out = tmp_path / "out.csv"
+    service = HistoryExportService(db_path)
+    calls = []
+
+    def is_cancelled():
+        calls.append(1)
+        return len(calls) > 1
+
+    with pytest.raises(ExportCancelledError):
+        service.export(str(out), is_cancelled=is_cancelled)
+
+    assert list(tmp_path.glob("out.csv*")) == []
+
+
+def test_unknown_format_is_rejected(db_path, tmp_path):
+    with pytest.raises(ValueError):
+        HistoryExportService(db_path).export(str(tmp_path / "out.txt"))
+
+
+@pytest.mark.parametrize("suffix", ["csv", "xlsx"])
+def test_memory_stays_flat(tmp_path, suffix):
+    """행 수가 10배가 되어도 최대 메모리 사용량이 거의 같은지 테스트"""
+    small = _make_db(tmp_path / "small.db", 5000)
+    large = _make_db(tmp_path / "large.db", 50000)
+
+    def peak(db):
+        tracemalloc.start()
+        try:
+            HistoryExportService(db).export(str(tmp_path / f"out.{suffix}"))
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak_small, peak_large = peak(small), peak(large)
+    assert peak_large < peak_small * 1.5 + 256 * 1024
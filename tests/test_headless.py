@@ -0,0 +1,164 @@
+"""
+헤드리스 실행기 (serve/batch) 테스트
+"""
+
+import io
+import json
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.headless import HeadlessRunner, iter_line_triggers, parse_trigger_line
+from src.printer.transports import FileTransport, QueueTransport, TcpTransport, create_transport
+from src.utils.event_log import get_event_log, query_events
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MAC_1 = "PSAD0CF1336A13031"
+MAC_2 = "PSAD0CF1336A13032"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "headless.db"))
+    db.initialize()
+    db.set_config('prn_template', 'PSA_LABEL_ZPL_with_mac_address.prn')
+    db.set_config('use_mac_in_label', 'true')
+    yield db
+    db.close()
+
+
+def test_import_does_not_load_qt():
+    """헤드리스 진입점이 PyQt6를 import하지 않는지 테스트"""
+    code = (
+        "import sys; import src.headless; "
+        "print(sorted(m for m in sys.modules if m.startswith('PyQt6')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True,
+    ).stdout
+
+    assert out.strip() == "[]"
+
+
+def test_parse_trigger_lines():
+    """입력 줄 해석 (MCU 로그 / 단독 MAC / MAC 없음 / 주석)"""
+    assert parse_trigger_line(f"mqtt: {MAC_1}/subTopic") == MAC_1
+    assert parse_trigger_line(f"  {MAC_2} ") == MAC_2
+    assert parse_trigger_line("-") is None
+
+    stream = io.StringIO(f"{MAC_1}\n\n# comment\nNONE\n")
+    assert list(iter_line_triggers(stream)) == [MAC_1, None]
+
+
+def test_create_transport():
+    """전송 방식 문자열 해석"""
+    assert isinstance(create_transport(None), QueueTransport)
+    tcp = create_transport("tcp://10.0.0.5")
+    assert isinstance(tcp, TcpTransport) and (tcp.host, tcp.port) == ("10.0.0.5", 9100)
+    assert create_transport("tcp://printer:6101").port == 6101
+    assert isinstance(create_transport("file:out.zpl"), FileTransport)
+    with pytest.raises(ValueError):
+        create_transport("usb")
+
+
+def test_tcp_transport_sends_raw_zpl():
+    """TCP 전송이 ZPL을 그대로 보내는지 테스트"""
+    server = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def accept():
+        conn, _ = server.accept()
+        with conn:
+            received.append(conn.makefile('rb').read())
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    try:
+        target = TcpTransport("127.0.0.1", server.getsockname()[1]).send("^XA^FDHI^FS^XZ")
+        thread.join(2)
+    finally:
+        server.close()
+
+    assert target.startswith("127.0.0.1:")
+    assert received == [b"^XA^FDHI^FS^XZ"]
+
+
+def test_runner_prints_and_records_each_trigger(db, tmp_path):
+    """트리거마다 인쇄/이력 저장/생산순서 증가 및 JSON 결과 기록"""
+    out_path = tmp_path / "labels.zpl"
+    output = io.StringIO()
+    runner = HeadlessRunner(db, FileTransport(str(out_path)), output=output)
+
+    failed = runner.run(iter_line_triggers(io.StringIO(f"{MAC_1}\n{MAC_2}\n")))
+
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 0
+    assert [e['mac_address'] for e in events] == [MAC_1, MAC_2]
+    assert all(e['success'] and e['record_id'] for e in events)
+    assert events[0]['serial_number'] != events[1]['serial_number']
+
+    history = db.get_print_history()
+    assert {r['serial_number'] for r in history} == {e['serial_number'] for e in events}
+
+    zpl = out_path.read_text(encoding='utf-8')
+    assert MAC_1 in zpl and MAC_2 in zpl
+
+
+def test_runner_reports_failure_without_stopping(db, tmp_path):
+    """MAC 없는 트리거는 실패로 기록하고 다음 트리거를 계속 처리"""
+    output = io.StringIO()
+    runner = HeadlessRunner(db, FileTransport(str(tmp_path / "labels.zpl")), output=output)
+
+    failed = runner.run([None, MAC_1])
+
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 1
+    assert [e['success'] for e in events] == [False, True]
+    assert "MAC" in events[0]['message']
+    assert len(db.get_print_history()) == 1
+
+
+def test_runner_emits_structured_events(db, tmp_path):
+    """인쇄 작업마다 print.sent/print.job 이벤트가 기록되고 시리얼로 조회되는지 테스트"""
+    events_path = tmp_path / "events.jsonl"
+    event_log = get_event_log()
+    event_log.open(str(events_path))
+    try:
+        output = io.StringIO()
+        runner = HeadlessRunner(db, FileTransport(str(tmp_path / "labels.zpl")), output=output)
+        runner.run([MAC_1, None])
+    finally:
+        event_log.close()
+
+    serial = json.loads(output.getvalue().splitlines()[0])['serial_number']
+    names = [e['event'] for e in query_events(str(events_path), serial=serial)]
+    assert names == ["print.sent", "print.job"]
+
+    job = list(query_events(str(events_path), event="print.job"))[0]
+    assert job['mac'] == MAC_1 and job['success'] and job['duration_ms'] >= 0
+    rejected = list(query_events(str(events_path), event="print.rejected"))
+    assert len(rejected) == 1 and "MAC" in rejected[0]['message']
+
+
+def test_batch_reports_open_failure(tmp_path, capsys):
+    """DB를 열 수 없으면 트레이스백 대신 표준 에러 메시지와 종료 코드 1을 반환하는지 테스트"""
+    import argparse
+    from src.headless import add_subcommands
+
+    (tmp_path / "macs.txt").write_text(MAC_1 + "\n", encoding='utf-8')
+    parser = argparse.ArgumentParser()
+    add_subcommands(parser.add_subparsers())
+    args = parser.parse_args([
+        "batch", str(tmp_path / "macs.txt"), "--db", "http://127.0.0.1:9", "--no-journal",
+        "--events-log", str(tmp_path / "events.jsonl"), "--latency-out", str(tmp_path / "latency.json"),
+    ])
+
+    assert args.handler(args) == 1
+    assert "시작 실패" in capsys.readouterr().err
+    assert not get_event_log().enabled
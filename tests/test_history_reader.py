@@ -0,0 +1,156 @@
+"""
+이력 검색 읽기 연결 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.database.db_manager import DBManager, build_history_query
+from src.database.exceptions import QueryInterruptedError
+from src.database.history_reader import HistoryReader
+from src.database.records import HistoryRecord
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "history.db"
+    db = DBManager(str(path))
+    db.initialize()
+    cursor = db.conn.cursor()
+    cursor.executemany(
+        "INSERT INTO print_history "
+        "(serial_number, mac_address, print_date, print_datetime, status, prn_template) "
+        "VALUES (?, ?, ?, ?, 'success', 'template.prn')",
+        [
+            (f"P10DL0S0H3A00C1{i:06d}0", f"MAC{i:08d}", "2025-10-17",
+             f"2025-10-{15 + i % 3:02d}T12:00:{i % 60:02d}.000000")
+            for i in range(3000)
+        ],
+    )
+    db.conn.commit()
+    db.close()
+    return str(path)
+
+
+def test_date_bounds_use_raw_datetime():
+    """날짜 조건이 인덱스를 쓸 수 있는 형태로 생성되는지 테스트"""
+    query, params = build_history_query(date_from="2025-10-16", date_to="2025-10-16", limit=10)
+
+    assert "DATE(" not in query
+    assert params == ["2025-10-16", "2025-10-17", 10, 0]
+
+
+def test_search_matches_db_manager(db_path):
+    """읽기 연결 검색 결과가 DBManager 조회와 같은지 테스트"""
+    db = DBManager(db_path)
+    reader = HistoryReader(db_path)
+    try:
+        conditions = dict(date_from="2025-10-16", date_to="2025-10-16", serial_number="12", limit=1000)
+        rows = reader.search(**conditions)
+
+        assert [r.to_dict() for r in rows] == db.get_print_history(**conditions)
+        assert rows and all(r.get('print_datetime').startswith("2025-10-16") for r in rows)
+    finally:
+        reader.close()
+        db.close()
+
+
+def test_data_version_changes_on_other_connection_commit(db_path):
+    """쓰기 연결의 커밋이 data_version에 반영되는지 테스트"""
+    db = DBManager(db_path)
+    reader = HistoryReader(db_path)
+    try:
+        before = reader.data_version()
+        assert reader.data_version() == before
+
+        db.save_print_history("P10DL0S0H3A00C19999990", "MAC", "2025-10-17", "success")
+        assert reader.data_version() != before
+    finally:
+        reader.close()
+        db.close()
+
+
+def test_interrupt_stops_running_query(db_path):
+    """다른 스레드의 interrupt()가 실행 중인 조회를 중단하는지 테스트"""
+    reader = HistoryReader(db_path)
+    reader.connect()
+    # 진행 핸들러로 조회를 인위적으로 느리게 만듦 (약 1초)
+    reader.conn.set_progress_handler(lambda: time.sleep(0.001), 100)
+
+    timer = threading.Timer(0.05, reader.interrupt)
+    started = time.perf_counter()
+    timer.start()
+    try:
+        with pytest.raises(QueryInterruptedError):
+            reader.search(serial_number="no-such-serial", limit=10)
+        assert time.perf_counter() - started < 0.5
+    finally:
+        timer.cancel()
+        reader.close()
+
+
+def test_history_service_caches_until_data_changes(db_path):
+    """필터 조합별 캐시와 쓰기 후 무효화 테스트"""
+    history_service = pytest.importorskip("src.gui.services.history_service")
+
+    db = DBManager(db_path)
+    reader = HistoryReader(db_path)
+    service = history_service.HistoryService(db, reader)
+    filters = {'date_from': "2025-10-15", 'date_to': "2025-10-17", 'serial_number': "5"}
+    try:
+        first = service.search(filters)
+        assert service.search(dict(filters)) is first
+        assert (service.cache_hits, service.cache_misses) == (1, 1)
+
+        db.save_print_history("P10DL0S0H3A00C15555550", "MAC", "2025-10-17", "success")
+        assert service.search(filters) is not first
+        assert service.cache_misses == 2
+    finally:
+        reader.close()
+        db.close()
+
+
+def test_same_filters_reuse_sql_text():
+    """같은 필터 조합은 값이 달라도 같은 SQL 문자열을 쓰는지 테스트 (문장 캐시 재사용)"""
+    first, _ = build_history_query(serial_number="12", date_from="2025-10-01", limit=10)
+    second, params = build_history_query(serial_number="99", date_from="2025-10-05", limit=50, offset=50)
+    other, _ = build_history_query(mac_address="12", date_from="2025-10-01", limit=10)
+
+    assert second is first and other != first
+    assert params == ["2025-10-05", "%99%", 50, 50]
+
+
+def test_search_records_act_like_dicts(db_path):
+    """검색 결과 레코드가 GUI의 dict 방식 접근을 지원하는지 테스트"""
+    reader = HistoryReader(db_path)
+    try:
+        record = reader.search(serial_number="000007", limit=1)[0]
+    finally:
+        reader.close()
+
+    assert record.get('serial_number') == "P10DL0S0H3A00C10000070"
+    assert record.get('id') == record[0] and record.get('missing', "-") == "-"
+    assert set(record.fields()) >= {'id', 'mac_address', 'print_datetime', 'status', 'lease_id'}
+    assert record.to_dict()['mac_address'] == record.get('mac_address')
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(TypeError):
+        dict(record)  # 매핑이 아님 → 명확히 실패
+
+
+def test_history_service_returns_records_for_every_backend(db_path):
+    """읽기 연결이 없는 경우(공유 DB 서버)에도 같은 HistoryRecord를 반환하는지 테스트"""
+    history_service = pytest.importorskip("src.gui.services.history_service")
+
+    db = DBManager(db_path)
+    reader = HistoryReader(db_path)
+    try:
+        local = history_service.HistoryService(db, reader).get_all(limit=5)
+        remote = history_service.HistoryService(db).get_all(limit=5)
+    finally:
+        reader.close()
+        db.close()
+
+    assert isinstance(remote[0], HistoryRecord) and type(remote[0]) is type(local[0])
+    assert [r.to_dict() for r in remote] == [r.to_dict() for r in local]
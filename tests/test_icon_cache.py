@@ -0,0 +1,79 @@
+"""
+SVG 아이콘 캐시 테스트
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6.QtSvg")
+icon_cache = pytest.importorskip("src.gui.utils.icon_cache")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.gui.utils.icon_cache import IconCache
+from src.gui.utils.svg_icons import SvgIcon
+
+
+SVG = SvgIcon.ICONS["home"]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def cache(app):
+    cache = IconCache(max_icons=4)
+    yield cache
+    cache.clear()
+
+
+def test_repeat_request_does_not_render_again(cache):
+    """같은 키 재요청 시 다시 렌더링하지 않는지 테스트"""
+    first = cache.pixmap("home", SVG, "#0969DA", 20, dpr=1.0)
+    second = cache.pixmap("home", SVG, "#0969da", 20, dpr=1.0)
+
+    assert first.cacheKey() == second.cacheKey()
+    assert cache.stats()['renders'] == 1
+    assert cache.stats()['hits'] == 1
+
+    cache.icon("home", SVG, "#0969DA", 20, dpr=1.0)
+    cache.icon("home", SVG, "#0969DA", 20, dpr=1.0)
+    assert cache.stats()['renders'] == 1
+
+
+def test_key_includes_color_size_and_dpr(cache):
+    """색상/크기/DPR마다 별도로 렌더링되는지 테스트"""
+    cache.pixmap("home", SVG, "#0969DA", 20, dpr=1.0)
+    cache.pixmap("home", SVG, "#57606A", 20, dpr=1.0)
+    cache.pixmap("home", SVG, "#0969DA", 24, dpr=1.0)
+    hidpi = cache.pixmap("home", SVG, "#0969DA", 20, dpr=2.0)
+
+    assert cache.stats()['renders'] == 4
+    assert hidpi.width() == 40
+    assert hidpi.devicePixelRatio() == 2.0
+
+
+def test_icon_lru_eviction(cache):
+    """QIcon 보관 수가 max_icons를 넘지 않는지 테스트"""
+    for size in range(10, 16):
+        cache.icon("home", SVG, "#0969DA", size, dpr=1.0)
+
+    stats = cache.stats()
+    assert stats['icons'] == 4
+    assert stats['evictions'] == 2
+
+
+def test_prerendered_image_is_used(cache):
+    """사전 렌더링 결과가 첫 요청에 사용되는지 테스트"""
+    thread = cache.prerender([("home", SVG, "#58A6FF", 20)], dpr=1.0)
+    thread.join(timeout=5)
+    assert cache.stats()['prerendered'] == 1
+
+    pixmap = cache.pixmap("home", SVG, "#58A6FF", 20, dpr=1.0)
+
+    stats = cache.stats()
+    assert not pixmap.isNull()
+    assert stats['prerender_hits'] == 1
+    assert stats['renders'] == 1
+    assert stats['prerendered'] == 0
@@ -0,0 +1,100 @@
+"""
+import 시간 예산 / 지연 import 회귀 테스트
+
+새 프로세스에서 모듈을 import하는 시간이 예산을 넘으면 실패합니다.
+무거운 모듈을 최상위 import로 되돌리는 변경을 잡기 위한 것입니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.utils.import_profiler import ImportProfiler
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 모듈: cold import 예산 (ms) - 개발 PC 측정값의 약 4배
+#   src.headless  ~50 ms
+#   src.gui       ~170 ms
+IMPORT_BUDGET_MS = {
+    'src.headless': 250,
+    'src.gui': 800,
+}
+
+# 실제로 쓰일 때까지 import하지 않아야 하는 모듈
+LAZY_MODULES = ('zebra', 'serial', 'PyQt6.QtSvg')
+
+RUNS = 3
+
+
+def _cold_import(module: str) -> dict:
+    """새 인터프리터에서 module import 시간(ms)과 로드된 모듈 목록 측정"""
+    code = textwrap.dedent(f"""
+        import json, sys, time
+        started = time.perf_counter()
+        import {module}
+        elapsed = (time.perf_counter() - started) * 1000
+        print(json.dumps({{'ms': elapsed, 'modules': sorted(sys.modules)}}))
+    """)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, env={**os.environ, 'QT_QPA_PLATFORM': 'offscreen'},
+    )
+    if result.returncode != 0:
+        pytest.skip(f"{module} import 불가: {result.stderr.strip().splitlines()[-1]}")
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_cold_import_within_budget(module):
+    """cold import 시간이 예산 이내인지 테스트 (여러 번 중 최솟값)"""
+    best = min(_cold_import(module)['ms'] for _ in range(RUNS))
+
+    assert best <= IMPORT_BUDGET_MS[module], (
+        f"{module} import {best:.0f} ms > 예산 {IMPORT_BUDGET_MS[module]} ms "
+        f"(python main.py --profile-startup 으로 원인 모듈 확인)"
+    )
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_optional_modules_are_lazy(module):
+    """프린터/시리얼/SVG 모듈이 import 시점에 로드되지 않는지 테스트"""
+    loaded = _cold_import(module)['modules']
+
+    eager = [m for m in loaded if m in LAZY_MODULES or m.startswith(tuple(f"{n}." for n in LAZY_MODULES))]
+    assert eager == []
+
+
+def test_profiler_separates_self_and_cumulative(tmp_path, monkeypatch):
+    """중첩 import에서 self/cumulative 시간이 구분되는지 테스트"""
+    (tmp_path / "prof_outer.py").write_text(
+        "import time\nimport prof_inner\ntime.sleep(0.02)\n", encoding="utf-8"
+    )
+    (tmp_path / "prof_inner.py").write_text(
+        "import time\ntime.sleep(0.03)\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import prof_outer  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("prof_outer", None)
+        sys.modules.pop("prof_inner", None)
+
+    rows = {r['module']: r for r in profiler.modules}
+    outer, inner = rows['prof_outer'], rows['prof_inner']
+
+    assert inner['self_ms'] >= 25
+    assert outer['cumulative_ms'] >= outer['self_ms'] + inner['cumulative_ms'] - 1
+    assert 15 <= outer['self_ms'] < 30
+    assert profiler.modules[0]['module'] == 'prof_outer'
+    assert 'prof_outer' in profiler.report()
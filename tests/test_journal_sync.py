@@ -0,0 +1,132 @@
+"""
+로컬 인쇄 저널 / 동기화 테스트
+"""
+
+import io
+import json
+import time
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.database.journal import JournaledDBManager, PrintJournal
+from src.database.remote import RemoteDBManager
+from src.database.server import DBServer
+from src.headless import HeadlessRunner
+from src.printer.transports import FileTransport
+from src.services.journal_sync import JournalSyncWorker
+from src.services.sequence_lease import SequenceLeaser
+
+LOT = "P10DL0S0H3A00C10"
+MAC = "PSAD0CF1336A13031"
+
+
+@pytest.fixture
+def central(tmp_path):
+    db = DBManager(str(tmp_path / "central.db"))
+    db.initialize()
+    db.set_config('prn_template', 'PSA_LABEL_ZPL_with_mac_address.prn')
+    db.set_config('use_mac_in_label', 'true')
+    yield db
+    db.close()
+
+
+def _row(serial, mac=MAC, when="2026-10-19T09:00:00"):
+    return {'serial_number': serial, 'mac_address': mac, 'print_date': when[:10],
+            'print_datetime': when, 'status': 'success', 'prn_template': 'template.prn'}
+
+
+def test_sync_is_idempotent_and_reports_conflicts(central):
+    """같은 기록 재전송은 한 번만 저장되고, 다른 MAC의 같은 시리얼은 덮어쓰지 않는지 테스트"""
+    rows = [_row(f"{LOT}0001"), _row(f"{LOT}0002")]
+
+    first = central.sync_print_history(rows)
+    again = central.sync_print_history(rows + [_row(f"{LOT}0001", mac="PSA00000000000002")])
+
+    assert [r['state'] for r in first] == ['inserted', 'inserted']
+    assert [r['state'] for r in again] == ['duplicate', 'duplicate', 'conflict']
+    assert again[0]['id'] == first[0]['id']
+    assert again[2]['existing']['mac_address'] == MAC
+    assert len(central.get_print_history()) == 2
+
+
+def test_sync_keeps_highest_production_sequence(central):
+    """여러 스테이션의 저널이 번호 순서와 다르게 도착해도 생산순서가 뒤로 가지 않는지 테스트"""
+    def rows(*sequences):
+        return [dict(_row(f"{LOT}{seq:04d}"), production_sequence=f"{seq:04d}") for seq in sequences]
+
+    central.sync_print_history(rows(51, 53, 52))  # 스테이션 B 블록
+    central.sync_print_history(rows(1, 2))        # 스테이션 A 블록 (늦게 도착)
+
+    assert central.get_lot_config()['production_sequence'] == "0053"
+
+
+def test_prints_continue_while_server_down(central, tmp_path):
+    """서버가 꺼진 동안 저널에 인쇄를 쌓고, 서버가 돌아오면 모두 반영하는지 테스트"""
+    server = DBServer(central, port=0).start()
+    port = server.server_address[1]
+    db = JournaledDBManager(RemoteDBManager(server.url, timeout=0.5), PrintJournal(str(tmp_path / "journal.db")))
+    worker = JournalSyncWorker(db)
+    leaser = SequenceLeaser(db, "A", block_size=10, renew_async=False)
+    runner = HeadlessRunner(db, FileTransport(str(tmp_path / "labels.zpl")), output=io.StringIO(), leaser=leaser)
+
+    try:
+        runner.run([MAC])
+        assert worker.sync_once() == 1
+
+        server.stop()
+        runner.run([MAC, MAC, MAC])
+        assert runner.printed == 4 and runner.failed == 0
+        assert worker.sync_once() == 0
+        assert worker.status()['pending'] == 3 and worker.last_error
+
+        server = DBServer(central, port=port).start()
+        assert worker.sync_once() == 3
+        leaser.close()
+        status = worker.status()
+    finally:
+        server.stop()
+        db.close()
+
+    assert (status['pending'], status['lag_seconds'], status['last_error']) == (0, 0.0, None)
+    records = central.get_print_history()
+    assert sorted(r['serial_number'][-4:] for r in records) == ["0001", "0002", "0003", "0004"]
+    assert all(r['lease_id'] is not None for r in records)
+    assert central.get_lot_config()['production_sequence'] == "0004"
+
+
+def test_conflict_is_kept_in_journal(central, tmp_path):
+    """서버에 다른 MAC으로 이미 있는 시리얼은 저널에 충돌로 남는지 테스트"""
+    central.commit_print(f"{LOT}0001", "PSA00000000000002", "2026-10-19", "template.prn")
+    db = JournaledDBManager(central, PrintJournal(str(tmp_path / "journal.db")))
+    db.commit_print(f"{LOT}0001", MAC, "2026-10-19", "template.prn")
+    worker = JournalSyncWorker(db)
+
+    assert worker.sync_once() == 1
+
+    conflicts = db.journal.conflicts()
+    assert [c['serial_number'] for c in conflicts] == [f"{LOT}0001"]
+    assert json.loads(conflicts[0]['conflict'])['mac_address'] == "PSA00000000000002"
+    assert worker.status()['conflicts'] == 1 and worker.conflicts == 1
+    assert central.get_print_history()[0]['mac_address'] == "PSA00000000000002"
+    db.journal.close()
+
+
+def test_background_worker_syncs_new_prints(central, tmp_path):
+    """새 기록이 들어오면 동기화 스레드가 바로 깨어나 전송하는지 테스트"""
+    server = DBServer(central, port=0).start()
+    db = JournaledDBManager(RemoteDBManager(server.url), PrintJournal(str(tmp_path / "journal.db")))
+    worker = JournalSyncWorker(db, interval=30).start()
+
+    try:
+        db.commit_print(f"{LOT}0001", MAC, "2026-10-19", "template.prn", production_sequence="0001")
+        deadline = time.monotonic() + 5
+        while worker.status()['pending'] and time.monotonic() < deadline:
+            time.sleep(0.02)
+        status = worker.stop()
+    finally:
+        server.stop()
+        db.close()
+
+    assert status['pending'] == 0 and status['synced'] == 1
+    assert central.get_print_history()[0]['serial_number'] == f"{LOT}0001"
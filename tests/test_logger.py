@@ -0,0 +1,87 @@
+"""
+로깅 파이프라인 테스트 (QueueHandler + QueueListener, gzip 로테이션)
+"""
+
+import gzip
+import io
+import logging
+import threading
+
+import pytest
+
+from src.utils.logger import setup_logging, shutdown_logging
+
+SERIAL = "P10DL0S0H3A00B030001"
+MAC = "PSAD0CF1327829495"
+
+
+@pytest.fixture
+def restore_root_level():
+    root = logging.getLogger()
+    level = root.level
+    yield
+    shutdown_logging()
+    root.setLevel(level)
+
+
+class _ThreadRecordingHandler(logging.Handler):
+    """레코드를 처리한 스레드 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(threading.current_thread())
+
+
+def test_records_are_written_by_listener_thread(tmp_path, restore_root_level):
+    """호출 스레드는 큐에 넣기만 하고 기록은 리스너 스레드가 하는지 테스트"""
+    log_file = tmp_path / "app.log"
+    stream = io.StringIO()
+    listener = setup_logging(log_file=str(log_file), stream=stream)
+    recorder = _ThreadRecordingHandler()
+    listener.handlers = listener.handlers + (recorder,)
+
+    logging.getLogger("src.test").info("인쇄 완료: %s", "WF-0001")
+    shutdown_logging()
+
+    assert "src.test - INFO - 인쇄 완료: WF-0001" in log_file.read_text(encoding="utf-8")
+    assert "인쇄 완료: WF-0001" in stream.getvalue()
+    assert recorder.threads and threading.main_thread() not in recorder.threads
+
+
+def test_rotated_files_are_gzipped(tmp_path, restore_root_level):
+    """로테이션된 로그 파일이 .gz로 압축되는지 테스트"""
+    log_file = tmp_path / "app.log"
+    setup_logging(log_file=str(log_file), max_bytes=200, backup_count=2, console=False)
+
+    logger = logging.getLogger("src.test")
+    for i in range(20):
+        logger.info("줄 %02d %s", i, "x" * 40)
+    shutdown_logging()
+
+    backup = tmp_path / "app.log.1.gz"
+    assert backup.exists()
+    assert not (tmp_path / "app.log.1").exists()
+    assert "줄" in gzip.decompress(backup.read_bytes()).decode("utf-8")
+    assert not (tmp_path / "app.log.3.gz").exists()
+
+
+def test_debug_guard_skips_work_at_info(tmp_path, restore_root_level):
+    """INFO 레벨에서 디버그 전용 처리(ZPL 덤프)를 건너뛰는지 테스트"""
+    from src.printer.print_controller import PrintController
+
+    setup_logging(level="INFO", log_file=None, console=False)
+    controller = PrintController()
+    dumped = []
+    controller._debug_dump_zpl = dumped.append
+
+    template = tmp_path / "label.prn"
+    template.write_text("^XA^FDTEST^FS^XZ", encoding="utf-8")
+    controller._load_and_replace_template(template, SERIAL, MAC)
+    assert dumped == []
+
+    logging.getLogger().setLevel(logging.DEBUG)
+    controller._load_and_replace_template(template, SERIAL, MAC)
+    assert len(dumped) == 1
@@ -0,0 +1,147 @@
+"""
+MCU 컨트롤러 (요청/응답 프로토콜) 테스트
+"""
+
+import queue
+import re
+import time
+
+import pytest
+
+pytest.importorskip("serial")
+pytest.importorskip("PyQt6")
+
+from src.mcu import mcu_controller
+from src.mcu.mcu_controller import MCUController
+from src.mcu.exceptions import MCUCommandError, MCUTimeoutError
+
+
+class FakeMCUSerial:
+    """요청 프레임에 응답하는 가짜 시리얼 포트
+
+    hold_until 개의 요청이 모일 때까지 응답을 보류하므로 요청을 하나씩
+    기다리며 보내는 클라이언트는 타임아웃됩니다 (파이프라이닝 검증용).
+    """
+
+    FRAME = re.compile(rb'^@(\d+) (\S+)')
+
+    def __init__(self, replies=None, ready=True, hold_until=1, **kwargs):
+        self.is_open = True
+        self.written = []
+        self.replies = replies or {
+            "PING": "OK PONG",
+            "GET_MAC": "OK 00:1A:2B:3C:4D:5E",
+            "GET_VERSION": "OK 1.4.2",
+            "SELF_TEST": "OK PASS",
+        }
+        self.hold_until = hold_until
+        self._held = []
+        self._out = queue.Queue()
+        if ready:
+            self._out.put(b"READY\r\n")
+
+    def write(self, data: bytes) -> int:
+        self.written.append(data)
+        match = self.FRAME.match(data)
+        reply = self.replies.get(match.group(2).decode())
+        if reply is not None:
+            self._held.append(f"@{match.group(1).decode()} {reply}\r\n".encode())
+        if len(self._held) >= self.hold_until:
+            for line in self._held:
+                self._out.put(line)
+            self._held = []
+        return len(data)
+
+    def readline(self) -> bytes:
+        try:
+            return self._out.get(timeout=0.02)
+        except queue.Empty:
+            return b""
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def make_controller(monkeypatch):
+    controllers = []
+
+    def factory(**fake_kwargs):
+        fake = FakeMCUSerial(**fake_kwargs)
+        monkeypatch.setattr(mcu_controller.serial, "Serial", lambda **kwargs: fake)
+        controller = MCUController("COM_TEST", timeout=2, ready_timeout=1.0)
+        controllers.append(controller)
+        return controller, fake
+
+    yield factory
+
+    for controller in controllers:
+        controller.disconnect()
+
+
+def test_connect_returns_immediately_when_ready(make_controller):
+    """READY 신호가 있으면 고정 대기 없이 연결"""
+    controller, _ = make_controller(ready=True)
+
+    started = time.monotonic()
+    assert controller.connect() is True
+    assert time.monotonic() - started < 0.5
+    assert controller.is_ready
+
+
+def test_read_mac_address(make_controller):
+    """MAC 주소 요청/응답"""
+    controller, fake = make_controller()
+    controller.connect()
+
+    assert controller.read_mac_address() == "00:1A:2B:3C:4D:5E"
+    assert any(b"GET_MAC" in frame for frame in fake.written)
+
+
+def test_query_device_info_is_pipelined(make_controller):
+    """세 명령이 응답을 기다리지 않고 연속 전송되는지 테스트"""
+    controller, fake = make_controller()
+    controller.connect()
+    fake.hold_until = 3  # 세 요청이 모두 도착해야 응답
+
+    info = controller.query_device_info()
+
+    assert info == {
+        'mac_address': "00:1A:2B:3C:4D:5E",
+        'firmware_version': "1.4.2",
+        'self_test': "PASS",
+    }
+
+
+def test_error_response_raises_command_error(make_controller):
+    """ERR 응답은 MCUCommandError"""
+    controller, _ = make_controller(replies={"PING": "OK", "SELF_TEST": "ERR SENSOR_FAIL"})
+    controller.connect()
+
+    with pytest.raises(MCUCommandError) as exc_info:
+        controller.run_self_test()
+    assert exc_info.value.message == "SENSOR_FAIL"
+
+
+def test_per_command_timeout(make_controller):
+    """응답이 없는 명령은 명령별 타임아웃으로 실패"""
+    controller, _ = make_controller(replies={"PING": "OK"})
+    controller.connect()
+
+    started = time.monotonic()
+    with pytest.raises(MCUTimeoutError):
+        controller.call("GET_VERSION", timeout=0.2)
+    assert time.monotonic() - started < 1.0
+
+
+def test_invalid_mac_response(make_controller):
+    """잘못된 MAC 형식은 RuntimeError"""
+    controller, _ = make_controller(replies={"PING": "OK", "GET_MAC": "OK NOT-A-MAC"})
+    controller.connect()
+
+    with pytest.raises(RuntimeError):
+        controller.read_mac_address()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+MCU 모니터 재연결 테스트 (백오프, 포트 캐시, pty 핫플러그)
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from src.mcu.port_watcher import backoff_delay, PortCache, DeviceWatcher
+
+
+def test_backoff_delay_grows_and_caps():
+    """백오프 대기 시간이 지수적으로 증가하고 상한을 넘지 않는지 테스트"""
+    for attempt in range(20):
+        ceiling = min(5.0, 0.25 * (2 ** attempt))
+        delay = backoff_delay(attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+    assert backoff_delay(100, cap=2.0) <= 2.0
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX 전용")
+def test_port_cache_posix_path_uses_stat(tmp_path):
+    """POSIX 장치 경로는 포트 열거 없이 존재 여부 확인"""
+    cache = PortCache()
+    device = tmp_path / "ttyFAKE0"
+
+    assert cache.is_present(str(device)) is False
+    device.touch()
+    assert cache.is_present(str(device)) is True
+
+
+def test_device_watcher_parse_names():
+    """inotify 이벤트 버퍼 파싱 테스트"""
+    header = DeviceWatcher._EVENT_HEADER
+
+    def event(name: bytes) -> bytes:
+        padded = name + b'\0' * (16 - len(name))
+        return header.pack(1, DeviceWatcher.IN_CREATE, 0, len(padded)) + padded
+
+    data = event(b"ttyUSB0") + event(b"ttyACM1")
+    assert DeviceWatcher._parse_names(data) == [b"ttyUSB0", b"ttyACM1"]
+
+
+def test_connected_com_port_is_not_enumerated(monkeypatch):
+    """연결 중인 COM 포트는 포트 열거 없이 읽기 오류로만 분리를 감지하는지 테스트"""
+    serial = pytest.importorskip("serial")
+    pytest.importorskip("PyQt6")
+    import serial.tools.list_ports
+    from src.mcu.mcu_monitor import MCUMonitor
+
+    calls = []
+    monkeypatch.setattr(serial.tools.list_ports, "comports", lambda: calls.append(1) or [])
+
+    class FakeSerial:
+        is_open = True
+        removed = False
+
+        @property
+        def in_waiting(self):
+            if self.removed:
+                raise serial.SerialException("ClearCommError failed")
+            return 0
+
+        def close(self):
+            self.is_open = False
+
+    monitor = MCUMonitor("COM5")
+    monitor.ser = FakeSerial()
+    monitor._last_presence_check = 0.0
+
+    assert monitor._read_data() is False
+    assert calls == [] and monitor.ser is not None
+
+    monitor.ser.removed = True
+    assert monitor._read_data() is False
+    assert monitor.ser is None
+
+
+def _open_pty_link(link_path: str):
+    """pty 쌍을 열고 slave에 대한 심볼릭 링크 생성 (장치 연결 흉내)"""
+    import pty
+
+    master, slave = pty.openpty()
+    os.symlink(os.ttyname(slave), link_path)
+    return master, slave
+
+
+def _wait_until(predicate, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux pty 필요")
+def test_reconnect_after_pty_reappears(tmp_path):
+    """pty 장치가 사라졌다가 다시 나타났을 때 재연결 시간 측정"""
+    pytest.importorskip("serial")
+    pytest.importorskip("PyQt6")
+    from src.mcu.mcu_monitor import MCUMonitor
+
+    link = str(tmp_path / "ttyMCU")
+    master, slave = _open_pty_link(link)
+
+    monitor = MCUMonitor(link, timeout=0.1)
+    monitor.start()
+
+    try:
+        connected = lambda: monitor.ser is not None and monitor.ser.is_open
+        assert _wait_until(connected, 3.0), "초기 연결 실패"
+
+        # 장치 분리: 링크 제거 + pty 닫기
+        os.unlink(link)
+        os.close(master)
+        os.close(slave)
+        assert _wait_until(lambda: not connected(), 3.0), "분리 감지 실패"
+
+        # 백오프가 충분히 커지도록 잠시 대기 후 장치 재연결
+        time.sleep(1.5)
+        master, slave = _open_pty_link(link)
+        started = time.monotonic()
+        assert _wait_until(connected, 5.0), "재연결 실패"
+        elapsed = time.monotonic() - started
+
+        print(f"\ntime-to-reconnect: {elapsed * 1000:.1f} ms")
+        # inotify 감시로 백오프 대기 없이 즉시 재연결 (기존 고정 5초 대기 대비)
+        assert elapsed < 1.0
+
+    finally:
+        monitor.stop()
+        for fd in (master, slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,88 @@
+"""
+PTY MCU 시뮬레이터 및 모니터 벤치마크 테스트
+"""
+
+import os
+import select
+import sys
+
+import pytest
+
+from tests.mcu_simulator import PtyMCUSimulator
+from tests.bench_serial_monitors import MONITORS, percentile, run_benchmark
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux pty 필요")
+
+
+def test_iter_lines_injects_mac_lines():
+    """N 라인마다 device id / subTopic 라인 삽입 테스트"""
+    sim = PtyMCUSimulator(total_lines=20, mac_every=10, mac_style="both")
+    lines = list(sim.iter_lines())
+
+    device_lines = [line for line in lines if "device id:" in line]
+    subtopic_lines = [line for line in lines if line.endswith("/subTopic")]
+
+    assert len(device_lines) == 2
+    assert len(subtopic_lines) == 2
+    # 같은 MAC이 두 형식으로 출력됨
+    assert device_lines[0].rsplit(" ", 1)[-1] in subtopic_lines[0]
+
+
+def test_invalid_mac_style():
+    """잘못된 MAC 스타일"""
+    with pytest.raises(ValueError):
+        PtyMCUSimulator(mac_style="unknown")
+
+
+def test_percentile():
+    """백분위수 계산 테스트"""
+    values = sorted(float(v) for v in range(1, 101))
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+@linux_only
+def test_pty_replay_respects_baudrate():
+    """pty로 전송된 데이터가 보드레이트 제한을 따르는지 테스트"""
+    sim = PtyMCUSimulator(total_lines=100, baudrate=57600, mac_every=25)
+    port = sim.open()
+    reader = os.open(port, os.O_RDONLY | os.O_NOCTTY)
+
+    try:
+        sim.start()
+        received = b""
+        while not (sim.wait_done(0) and not select.select([reader], [], [], 0.05)[0]):
+            if select.select([reader], [], [], 0.05)[0]:
+                received += os.read(reader, 65536)
+
+        assert len(received) == sim.bytes_sent
+        assert len(sim.sent_macs) == 4
+        for mac in sim.sent_macs:
+            assert f"device id: {mac}".encode() in received
+
+        # 57600 baud = 5760 bytes/sec
+        expected = sim.bytes_sent / 5760
+        assert sim.finished_at - sim.started_at >= expected * 0.9
+    finally:
+        sim.stop()
+        os.close(reader)
+
+
+@linux_only
+@pytest.mark.parametrize("monitor_name", list(MONITORS))
+def test_monitor_detects_all_macs(monitor_name):
+    """각 모니터 구현이 시뮬레이터가 보낸 MAC을 모두 감지하는지 테스트"""
+    pytest.importorskip("serial")
+    pytest.importorskip("PyQt6")
+
+    result = run_benchmark(monitor_name, total_lines=300, baudrate=0, mac_every=30)
+
+    print(f"\n{monitor_name}: {result}")
+    assert result["macs_sent"] == 10
+    assert result["macs_detected"] == result["macs_sent"]
+    assert result["lines_per_sec"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,135 @@
+"""
+스키마 마이그레이션 테스트
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database import migrations
+from src.database.db_manager import DBManager
+from src.database.exceptions import MigrationError
+from src.database.migrations import LATEST_VERSION, Migration, migrate, schema_version
+
+LOT = "P10DL0S0H3A00C10"
+
+# 마이그레이션 도입 전 DB (lease_id 없음, 중복 시리얼 인덱스 있음, user_version 0)
+LEGACY_SCHEMA = """
+CREATE TABLE print_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    serial_number TEXT NOT NULL,
+    mac_address TEXT NOT NULL,
+    print_date DATE NOT NULL,
+    print_datetime DATETIME NOT NULL,
+    status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    error_message TEXT,
+    prn_template TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(serial_number)
+);
+CREATE INDEX idx_print_history_serial ON print_history(serial_number);
+CREATE TABLE app_config (key TEXT PRIMARY KEY, value TEXT NOT NULL, description TEXT,
+                         updated_at DATETIME DEFAULT CURRENT_TIMESTAMP);
+INSERT INTO app_config (key, value) VALUES ('prn_template', 'custom.prn');
+"""
+
+
+def _index_names(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def _insert_history(conn, count, lot=LOT):
+    conn.executemany(
+        "INSERT INTO print_history (serial_number, mac_address, print_date, print_datetime, status, prn_template)"
+        " VALUES (?, 'PSA00000000000001', '2026-10-19', '2026-10-19T09:00:00', 'success', 't.prn')",
+        [(f"{lot}{i:04d}",) for i in range(1, count + 1)],
+    )
+    conn.commit()
+
+
+def test_fresh_db_applies_all_steps_once(tmp_path):
+    """새 DB는 모든 단계를 기록하고, 다시 시작하면 스키마 스크립트를 실행하지 않는지 테스트"""
+    with DBManager(str(tmp_path / "fresh.db")) as db:
+        applied = db.initialize()
+        assert [step['version'] for step in applied] == list(range(1, LATEST_VERSION + 1))
+        assert schema_version(db.conn) == LATEST_VERSION
+        recorded = db.conn.execute("SELECT version, duration_ms FROM schema_migration ORDER BY version").fetchall()
+        assert [row[0] for row in recorded] == list(range(1, LATEST_VERSION + 1))
+
+    with DBManager(str(tmp_path / "fresh.db")) as db:
+        statements = []
+        db.conn.set_trace_callback(statements.append)
+        assert db.initialize() == []
+        assert not [s for s in statements if s.lstrip().upper().startswith(("CREATE", "INSERT", "ALTER"))]
+
+
+def test_legacy_db_upgrade_keeps_data(tmp_path):
+    """이전 버전 DB에 컬럼/인덱스를 추가하고 기존 이력과 설정을 유지하는지 테스트"""
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    _insert_history(conn, 3)
+    conn.close()
+
+    with DBManager(path) as db:
+        db.initialize()
+        columns = {row[1] for row in db.conn.execute("PRAGMA table_info(print_history)")}
+        indexes = _index_names(db.conn)
+
+        assert 'lease_id' in columns
+        assert 'idx_print_history_serial' not in indexes and 'idx_print_history_lot' in indexes
+        assert db.get_config('prn_template') == 'custom.prn'
+        assert db.get_max_sequence_for_lot(LOT) == 3
+
+
+def test_failed_step_rolls_back(tmp_path, monkeypatch):
+    """실패한 단계는 변경 전체가 롤백되고 버전이 올라가지 않는지 테스트"""
+    broken = Migration(LATEST_VERSION + 1, "broken", script="CREATE TABLE half_done (x); SELECT * FROM missing;")
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS + [broken])
+
+    with DBManager(str(tmp_path / "broken.db")) as db:
+        with pytest.raises(MigrationError) as exc:
+            db.initialize()
+        assert exc.value.version == LATEST_VERSION + 1
+        assert schema_version(db.conn) == LATEST_VERSION
+        assert "half_done" not in {row[0] for row in db.conn.execute("SELECT name FROM sqlite_master")}
+
+
+def test_large_db_builds_index_in_background(tmp_path, monkeypatch):
+    """이력이 많으면 인덱스를 백그라운드에서 만들고 진행 상황을 알리는지 테스트"""
+    path = str(tmp_path / "large.db")
+    conn = sqlite3.connect(path)
+    migrate(conn, migrations.MIGRATIONS[:-1])  # 지연 인덱스 단계 직전 버전
+    _insert_history(conn, 500)
+    conn.close()
+    monkeypatch.setattr('src.database.db_manager.INLINE_INDEX_ROWS', 100)
+    progress = []
+
+    with DBManager(path) as db:
+        db.initialize(index_progress=progress.append)
+        builder = db.index_builder
+        assert builder is not None
+        assert builder.wait(timeout=10)
+
+        assert builder.built == ['idx_print_history_lot'] and builder.error is None
+        assert (progress[-1]['index'], progress[-1]['done'], progress[-1]['finished']) == (
+            'idx_print_history_lot', 1, True)
+        assert db.get_max_sequence_for_lot(LOT) == 500
+
+
+def test_lot_sequence_lookup_uses_index(tmp_path):
+    """LOT 최대 생산순서 조회가 전체 스캔 대신 LOT 인덱스를 쓰는지 테스트"""
+    with DBManager(str(tmp_path / "plan.db")) as db:
+        db.initialize()
+        _insert_history(db.conn, 5)
+        _insert_history(db.conn, 2, lot="P10DL0S0H3A00C11")
+
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT serial_number FROM print_history"
+            " WHERE REPLACE(serial_number, '-', '') >= ? AND REPLACE(serial_number, '-', '') < ?",
+            (LOT, LOT[:-1] + "1"),
+        ).fetchall()
+
+        assert "idx_print_history_lot" in " ".join(row[-1] for row in plan)
+        assert db.get_max_sequence_for_lot(LOT) == 5
+        assert db.get_max_sequence_for_lot("P10DL0S0H3A00C11") == 2
@@ -0,0 +1,60 @@
+"""
+홈 화면 출력 이력 모델 테스트
+"""
+
+import pytest
+
+pytest.importorskip("src.gui.components.print_history_table")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from src.gui.components.print_history_table import PrintHistoryModel
+
+
+def _record(i, status='success'):
+    return {
+        'id': i,
+        'serial_number': f"P10DL0S0H3A00C1{i:04d}0",
+        'mac_address': f"PSAD0CF13{i:08d}",
+        'print_datetime': f"2025-10-17T19:35:{i % 60:02d}.738152",
+        'status': status,
+    }
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_set_records_formats_rows(app):
+    """표시 형식 (시간/상태) 테스트"""
+    model = PrintHistoryModel(max_rows=10)
+    model.set_records([_record(2, 'failed'), _record(1)])
+
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 0)) == "19:35:02"
+    assert model.data(model.index(0, 3)) == "실패"
+    assert model.data(model.index(0, 3), Qt.ItemDataRole.UserRole) == 'failed'
+    assert model.data(model.index(1, 3)) == "성공"
+
+
+def test_prepend_inserts_on_top_and_caps_rows(app):
+    """새 레코드가 맨 위에 삽입되고 max_rows를 넘는 행이 잘리는지 테스트"""
+    model = PrintHistoryModel(max_rows=3)
+    model.set_records([_record(3), _record(2), _record(1)])
+
+    inserted = []
+    removed = []
+    resets = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    trimmed = model.prepend_records([_record(5), _record(4)])
+
+    assert trimmed == 2
+    assert inserted == [(0, 1)]
+    assert removed == [(3, 4)]
+    assert resets == []
+    assert [r['id'] for r in model.records()] == [5, 4, 3]
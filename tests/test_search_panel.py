@@ -0,0 +1,65 @@
+"""
+검색 패널 자동 검색(디바운스) 테스트
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("src.gui.components.search_panel")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.gui.components.search_panel import SearchPanel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def _wait(app, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def test_typing_is_debounced_into_one_search(app):
+    """연속 입력이 마지막 입력 후 한 번의 검색으로 합쳐지는지 테스트"""
+    panel = SearchPanel()
+    panel._debounce.setInterval(50)
+    emitted = []
+    panel.search_requested.connect(emitted.append)
+
+    for text in ("P", "P1", "P10", "P10D"):
+        panel.serial_input.setText(text)
+        _wait(app, 0.01)
+    assert emitted == []
+
+    _wait(app, 0.15)
+    assert len(emitted) == 1
+    assert emitted[0]['serial_number'] == "P10D"
+
+    # 같은 필터로 다시 만료되면 검색하지 않음
+    panel.serial_input.setText("P10D ")
+    _wait(app, 0.15)
+    assert len(emitted) == 1
+
+
+def test_reset_does_not_schedule_search(app):
+    """초기화가 자동 검색을 예약하지 않는지 테스트"""
+    panel = SearchPanel()
+    panel._debounce.setInterval(30)
+    emitted = []
+    resets = []
+    panel.search_requested.connect(emitted.append)
+    panel.reset_requested.connect(lambda: resets.append(True))
+
+    panel.serial_input.setText("P10")
+    panel._on_reset()
+    _wait(app, 0.1)
+
+    assert emitted == []
+    assert resets == [True]
+    assert panel.serial_input.text() == ""
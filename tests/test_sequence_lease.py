@@ -0,0 +1,141 @@
+"""
+생산순서 블록 임대 테스트
+"""
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.database.db_manager import DBManager
+from src.database.remote import RemoteDBManager
+from src.database.server import DBServer
+from src.headless import HeadlessRunner
+from src.printer.transports import FileTransport
+from src.services.configuration_service import ConfigurationService
+from src.services.sequence_lease import SequenceLeaser
+
+LOT = "P10DL0S0H3A00C10"
+MAC = "PSAD0CF1336A13031"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "lease.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+def _count_calls(db, name):
+    calls = []
+    original = getattr(db, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    setattr(db, name, wrapper)
+    return calls
+
+
+def test_allocates_locally_within_block(db):
+    """블록 안에서는 DB 호출 없이 번호를 배정하고, 비면 다음 블록을 임대하는지 테스트"""
+    calls = _count_calls(db, 'lease_sequences')
+    leaser = SequenceLeaser(db, "A", block_size=5, renew_async=False)
+
+    taken = [leaser.acquire(LOT)[0] for _ in range(12)]
+
+    assert taken == list(range(1, 13))
+    assert len(calls) == 3 and leaser.leases == 3
+    assert leaser.remaining(LOT) == 3
+
+
+def test_release_reuses_number_and_close_returns_tail(db):
+    """돌려둔 번호를 먼저 쓰고, 종료 시 블록 끝 미사용 번호를 카운터로 되돌리는지 테스트"""
+    leaser = SequenceLeaser(db, "A", block_size=10, renew_async=False)
+    first, lease_id = leaser.acquire(LOT)
+    leaser.release(LOT, first, lease_id)
+    assert leaser.acquire(LOT) == (first, lease_id)
+    leaser.acquire(LOT)
+
+    summary = leaser.close()
+
+    assert summary == {'returned': 8, 'gaps': []}
+    assert db.reserve_sequence(LOT) == 3
+    lease = db.conn.execute("SELECT * FROM sequence_lease WHERE id = ?", (lease_id,)).fetchone()
+    assert (lease['station'], lease['returned_count'], lease['gap_count']) == ("A", 8, 0)
+
+
+def test_next_serial_shows_leased_number(db):
+    """다른 스테이션이 앞 번호를 인쇄해도 홈 화면의 다음 번호가 임대 블록 번호인지 테스트"""
+    a = SequenceLeaser(db, "A", block_size=5, renew_async=False)
+    b = SequenceLeaser(db, "B", block_size=5, renew_async=False)
+    config = ConfigurationService(db, b)
+    assert a.peek(LOT) is None
+    a.acquire(LOT)
+    first, lease_id = b.acquire(LOT)
+    b.release(LOT, first, lease_id)
+
+    assert b.peek(LOT) == first == 6
+    assert config.load_next_serial() == (f"{LOT}0006", "0006")  # 기본 LOT 설정 = LOT
+    b.acquire(LOT)
+    assert config.load_next_serial()[1] == "0007"
+
+
+def test_close_records_gaps_when_counter_moved_on(db):
+    """다른 스테이션이 뒤에 임대했으면 미사용 번호를 공백으로 기록하는지 테스트"""
+    a = SequenceLeaser(db, "A", block_size=5, renew_async=False)
+    b = SequenceLeaser(db, "B", block_size=5, renew_async=False)
+    a.acquire(LOT)
+    assert b.acquire(LOT)[0] == 6
+
+    summary = a.close()
+
+    assert summary['gaps'] == [2, 3, 4, 5]
+    gaps = [row[0] for row in db.conn.execute("SELECT sequence FROM sequence_gap ORDER BY sequence")]
+    assert gaps == [2, 3, 4, 5]
+    assert b.close()['returned'] == 4
+
+
+def test_stations_share_server_without_overlap(tmp_path):
+    """공유 DB 서버에서 여러 스테이션이 미리 임대하며 동시에 배정해도 겹치지 않는지 테스트"""
+    db = DBManager(str(tmp_path / "shared.db"))
+    db.initialize()
+    server = DBServer(db, port=0).start()
+    clients = [RemoteDBManager(server.url) for _ in range(3)]
+    leasers = [SequenceLeaser(client, f"S{i}", block_size=10) for i, client in enumerate(clients)]
+
+    def run(leaser):
+        return [leaser.acquire(LOT)[0] for _ in range(40)]
+
+    try:
+        with ThreadPoolExecutor(len(leasers)) as pool:
+            taken = [seq for chunk in pool.map(run, leasers) for seq in chunk]
+        for leaser in leasers:
+            leaser.close()
+    finally:
+        for client in clients:
+            client.close()
+        server.stop()
+        db.close()
+
+    assert len(taken) == len(set(taken)) == 120
+
+
+def test_printed_history_records_lease(db, tmp_path):
+    """임대 번호로 인쇄한 이력에 lease_id가 남고 실패한 번호는 다음 인쇄가 사용하는지 테스트"""
+    db.set_config('prn_template', 'PSA_LABEL_ZPL_with_mac_address.prn')
+    db.set_config('use_mac_in_label', 'true')
+    leaser = SequenceLeaser(db, "A", block_size=50, renew_async=False)
+    output = io.StringIO()
+    runner = HeadlessRunner(db, FileTransport(str(tmp_path / "labels.zpl")), output=output, leaser=leaser)
+
+    runner.run([None, MAC])
+
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [e['success'] for e in events] == [False, True]
+    record = db.get_print_history()[0]
+    assert record['serial_number'].endswith("0001")
+    assert record['lease_id'] is not None
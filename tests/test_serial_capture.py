@@ -0,0 +1,137 @@
+"""
+시리얼 캡처/재생 테스트
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from src.serial_comm.capture import (
+    MAGIC,
+    SerialCapture,
+    capture_files,
+    capture_info,
+    read_capture,
+    read_capture_set,
+    replay,
+)
+
+
+def test_capture_round_trip(tmp_path):
+    """기록한 레코드가 그대로 읽히는지 테스트"""
+    path = tmp_path / "capture.bin"
+
+    with SerialCapture(str(path)) as capture:
+        capture.write(b"device id: PSAD0CF1327829495\r\n", timestamp_ns=1_000)
+        capture.write(b"\x00\xffbinary", timestamp_ns=2_000)
+        capture.write(b"")  # 빈 데이터는 무시
+
+    assert path.read_bytes().startswith(MAGIC)
+    assert list(read_capture(str(path))) == [
+        (1_000, b"device id: PSAD0CF1327829495\r\n"),
+        (2_000, b"\x00\xffbinary"),
+    ]
+
+
+def test_capture_rotation(tmp_path):
+    """최대 크기를 넘으면 로테이션되고 순서가 유지되는지 테스트"""
+    path = tmp_path / "capture.bin"
+    payloads = [f"line {i:03d}\r\n".encode() for i in range(50)]
+
+    with SerialCapture(str(path), max_bytes=200, backup_count=3) as capture:
+        for i, payload in enumerate(payloads):
+            capture.write(payload, timestamp_ns=i)
+
+    files = capture_files(str(path))
+    assert len(files) == 4  # capture.bin.3, .2, .1, capture.bin
+    assert all(f.stat().st_size <= 200 for f in files)
+
+    # 가장 오래된 파일은 삭제되었지만 남은 레코드는 순서대로
+    records = [payload for _, payload in read_capture_set(str(path))]
+    assert records == payloads[-len(records):]
+
+
+def test_read_truncated_capture(tmp_path):
+    """기록 중 잘린 마지막 레코드는 무시"""
+    path = tmp_path / "capture.bin"
+    with SerialCapture(str(path)) as capture:
+        capture.write(b"complete", timestamp_ns=1)
+        capture.write(b"truncated", timestamp_ns=2)
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+
+    assert [payload for _, payload in read_capture(str(path))] == [b"complete"]
+
+
+def test_read_invalid_file(tmp_path):
+    """캡처 형식이 아닌 파일"""
+    path = tmp_path / "not_capture.bin"
+    path.write_bytes(b"hello world")
+
+    with pytest.raises(ValueError):
+        list(read_capture(str(path)))
+
+
+def test_replay_accelerated(tmp_path):
+    """가속 재생 시 타이밍이 배속에 비례하는지 테스트"""
+    path = tmp_path / "capture.bin"
+    with SerialCapture(str(path)) as capture:
+        for i in range(5):
+            capture.write(f"{i}\n".encode(), timestamp_ns=i * 100_000_000)  # 100ms 간격
+
+    received = []
+    started = time.monotonic()
+    count = replay(str(path), received.append, speed=4.0)
+    elapsed = time.monotonic() - started
+
+    assert count == 5
+    assert received == [b"0\n", b"1\n", b"2\n", b"3\n", b"4\n"]
+    # 원본 400ms → 4배속 100ms
+    assert 0.08 <= elapsed < 0.3
+
+    info = capture_info(str(path))
+    assert info['records'] == 5
+    assert info['duration_sec'] == pytest.approx(0.4)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux pty 필요")
+def test_replay_into_monitor(tmp_path):
+    """캡처를 pty로 재생하여 모니터가 MAC을 감지하는지 테스트"""
+    pytest.importorskip("serial")
+    pytest.importorskip("PyQt6")
+    import pty
+    import tty
+    from src.serial_comm.serial_monitor import SerialMonitor
+
+    path = tmp_path / "capture.bin"
+    with SerialCapture(str(path)) as capture:
+        capture.write(b"I (29) boot: ESP-IDF v4.4.4\r\n", timestamp_ns=0)
+        capture.write(b"I (4100) app_main: device id: PSAD0CF13", timestamp_ns=1_000_000)
+        capture.write(b"27829495\r\n", timestamp_ns=2_000_000)
+
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    detected = []
+    monitor = SerialMonitor()
+    monitor.on_mac_detected = detected.append
+
+    try:
+        assert monitor.connect(os.ttyname(slave))
+        replay(str(path), lambda data: os.write(master, data), speed=0)
+
+        deadline = time.monotonic() + 2.0
+        while not detected and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert detected == ["PSAD0CF1327829495"]
+    finally:
+        monitor.disconnect()
+        os.close(master)
+        os.close(slave)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -169,5 +169,70 @@ def test_repr():
     assert "A00" in repr_str
 
 
+def test_generate_range():
+    """연속 시리얼 번호 일괄 생성 테스트"""
+    gen = SerialNumberGenerator(production_date="C10")
+
+    serials = gen.generate_range(1, 3)
+    assert serials == [
+        "P10DL0S0H3A00C100001",
+        "P10DL0S0H3A00C100002",
+        "P10DL0S0H3A00C100003",
+    ]
+    assert gen.generate_range("9998", 2) == ["P10DL0S0H3A00C109998", "P10DL0S0H3A00C109999"]
+    assert gen.generate_range(5, 0) == []
+    # 현재 생산순서는 변경되지 않음
+    assert gen.production_sequence == "0001"
+
+
+def test_generate_range_matches_generate():
+    """일괄 생성 결과가 generate() + increment_sequence()와 동일한지 테스트"""
+    gen = SerialNumberGenerator(production_date="C10", production_sequence="0100")
+    expected = []
+    for _ in range(50):
+        expected.append(gen.generate())
+        gen.increment_sequence()
+
+    assert SerialNumberGenerator(production_date="C10").generate_range(100, 50) == expected
+
+
+def test_generate_range_overflow():
+    """9999 초과 일괄 생성"""
+    gen = SerialNumberGenerator(production_date="C10")
+
+    with pytest.raises(CounterOverflowError):
+        gen.generate_range(9999, 2)
+
+    with pytest.raises(InvalidCounterError):
+        gen.generate_range("12", 1)
+
+
+def test_generate_range_invalid_lot():
+    """LOT 정보가 잘못되면 일괄 생성 실패"""
+    gen = SerialNumberGenerator(production_date="C10")
+    gen.set_lot_info(model_code="p10")
+
+    with pytest.raises(InvalidSerialNumberError):
+        gen.generate_range(1, 10)
+
+
+def test_validate_many():
+    """시리얼 번호 일괄 검증 결과가 validate()와 동일한지 테스트"""
+    serials = [
+        "P10DL0S0H3A00C100001",
+        "W10ML1S1H4A10C120050",
+        "P10DL0S0H3A00C130001",  # 잘못된 월
+        "P10DL0S0H3A00C10000A",  # 생산순서에 문자
+        "p10DL0S0H3A00C100001",  # 소문자
+        "P10DL0S0H3A00C10001",  # 19자리
+        "",
+    ]
+
+    assert SerialNumberGenerator.validate_many(serials) == [
+        SerialNumberGenerator.validate(sn) for sn in serials
+    ]
+    assert SerialNumberGenerator.validate_many(serials)[:2] == [True, True]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+"""
+시작 시간 측정 테스트
+"""
+
+import json
+import time
+
+import pytest
+
+from src.utils.startup_timer import StartupTimer
+
+
+def test_mark_records_cumulative_phases():
+    """단계가 기록 순서대로 누적 시간으로 저장되는지 테스트"""
+    timer = StartupTimer()
+    timer.mark("imports")
+    time.sleep(0.01)
+    timer.mark("first_paint")
+
+    phases = timer.phases
+    assert list(phases) == ["imports", "first_paint"]
+    assert phases["first_paint"] - phases["imports"] >= 9
+
+    # 같은 단계는 처음 값 유지
+    first = phases["imports"]
+    assert timer.mark("imports") == first
+    assert timer.has("first_paint") and not timer.has("first_interactive")
+    assert "first_paint" in timer.report()
+
+
+def test_save_appends_json_lines(tmp_path):
+    """실행마다 한 줄씩 누적 저장"""
+    path = tmp_path / "logs" / "startup_times.jsonl"
+
+    for _ in range(2):
+        timer = StartupTimer(start=time.perf_counter() - 0.5)
+        timer.mark("qapplication")
+        timer.save(str(path), version="0.1.0")
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 2
+    assert records[0]["version"] == "0.1.0"
+    assert records[0]["phases_ms"]["qapplication"] >= 500
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
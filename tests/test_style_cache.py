@@ -0,0 +1,89 @@
+"""
+컴파일된 QSS 캐시 테스트
+"""
+
+import pytest
+
+style_cache = pytest.importorskip("src.gui.styles.style_cache")
+theme_manager = pytest.importorskip("src.gui.styles.theme_manager")
+
+from src.gui.styles.style_cache import StyleCache, compute_key, write_embedded_module
+from src.gui.styles.theme_manager import ThemeManager, ThemeMode
+
+
+def test_key_depends_on_sources_and_tokens():
+    """원본 또는 토큰 값이 바뀌면 키가 달라지는지 테스트"""
+    base = compute_key("QLabel { color: @primary; }", {'@primary': '#2563EB'})
+
+    assert base == compute_key("QLabel { color: @primary; }", {'@primary': '#2563EB'})
+    assert base != compute_key("QLabel { color: @primary;}", {'@primary': '#2563EB'})
+    assert base != compute_key("QLabel { color: @primary; }", {'@primary': '#000000'})
+
+
+def test_cache_put_get_replaces_old_key(tmp_path):
+    """저장/조회 및 같은 테마의 이전 키 정리"""
+    cache = StyleCache(tmp_path)
+
+    assert cache.get("light", "aaa") is None
+    cache.put("light", "aaa", "QLabel{color:#000}")
+    cache.put("dark", "bbb", "QLabel{color:#fff}")
+    assert cache.get("light", "aaa") == "QLabel{color:#000}"
+
+    cache.put("light", "ccc", "QLabel{color:#111}")
+    assert cache.get("light", "aaa") is None
+    assert cache.get("dark", "bbb") == "QLabel{color:#fff}"
+    assert sorted(p.name for p in tmp_path.glob("*.qss")) == ["dark-bbb.qss", "light-ccc.qss"]
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """디스크 캐시를 임시 디렉토리로 사용하는 ThemeManager"""
+    monkeypatch.setattr(ThemeManager, "_instance", None)
+    tm = ThemeManager()
+    tm._style_cache = StyleCache(tmp_path)
+    return tm
+
+
+def test_theme_manager_uses_disk_cache(manager, monkeypatch):
+    """두 번째 실행은 컴파일 없이 디스크 캐시 사용"""
+    first = manager.get_compiled_stylesheet()
+    assert first
+    assert "/*" not in first  # minify 적용
+
+    # 새 인스턴스 (재시작) - 컴파일이 호출되면 실패
+    fresh = ThemeManager()
+    fresh._style_cache = manager._style_cache
+    monkeypatch.setattr(fresh._style_compiler, "compile", pytest.fail)
+
+    assert fresh.get_compiled_stylesheet() == first
+    assert fresh._style_cache.hits == 1
+
+
+def test_theme_toggle_reuses_compiled(manager, monkeypatch):
+    """테마 전환을 되돌릴 때 파일 읽기/컴파일 없음"""
+    light = manager.get_compiled_stylesheet()
+    manager._recompile_styles()
+    manager._mode = ThemeMode.DARK
+    manager._recompile_styles()
+    dark = manager._compiled_qss
+    assert dark != light
+
+    monkeypatch.setattr(manager._style_loader, "load_all", pytest.fail)
+    manager._mode = ThemeMode.LIGHT
+    manager._recompile_styles()
+    assert manager._compiled_qss == light
+
+
+def test_embedded_module_round_trip(manager, tmp_path):
+    """임베드 모듈 생성 후 그대로 로드되는지 테스트"""
+    compiled = {mode.value: manager.compile_theme(mode) for mode in ThemeMode}
+    path = tmp_path / "_compiled_qss.py"
+    write_embedded_module(compiled, path)
+
+    namespace = {}
+    exec(path.read_text(encoding="utf-8"), namespace)
+    assert namespace["COMPILED"] == compiled
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
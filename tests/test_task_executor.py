@@ -0,0 +1,137 @@
+"""
+백그라운드 작업 실행기 / 이벤트 루프 정지 감시 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("src.gui.services.task_executor")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.gui.services.task_executor import TaskCancelledError, TaskExecutor
+from src.gui.utils.stall_watchdog import StallWatchdog
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def executor(app):
+    executor = TaskExecutor()
+    yield executor
+    executor.shutdown()
+
+
+def _process_until(app, condition, timeout=3.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+def test_result_delivered_on_gui_thread(app, executor):
+    """결과가 GUI 스레드에서 finished 시그널로 전달되는지 테스트"""
+    received = []
+    gui_thread = threading.get_ident()
+
+    handle = executor.submit(lambda x: (x * 2, threading.get_ident()), 21)
+    handle.then(lambda r: received.append((r, threading.get_ident())))
+
+    assert _process_until(app, lambda: received)
+    (value, worker_thread), delivered_thread = received[0]
+    assert value == 42
+    assert worker_thread != gui_thread
+    assert delivered_thread == gui_thread
+    assert handle.result()[0] == 42
+    assert executor.pending_count() == 0
+
+
+def test_error_delivered_to_failed(app, executor):
+    """작업 예외가 failed 시그널로 전달되는지 테스트"""
+    errors = []
+
+    def boom():
+        raise ValueError("bad")
+
+    handle = executor.submit(boom).then(lambda r: None, on_error=errors.append)
+
+    assert _process_until(app, lambda: errors)
+    assert isinstance(errors[0], ValueError)
+    with pytest.raises(ValueError):
+        handle.result()
+
+
+def test_superseded_request_is_cancelled(app, executor):
+    """같은 key의 새 요청이 이전 요청을 취소하는지 테스트"""
+    gate = threading.Event()
+    results = []
+
+    def slow(value):
+        gate.wait(2)
+        return value
+
+    first = executor.submit(slow, "old", key="search").then(results.append)
+    second = executor.submit(slow, "new", key="search").then(results.append)
+    gate.set()
+
+    assert _process_until(app, lambda: results)
+    executor.wait_for_done(2000)
+    app.processEvents()
+
+    assert results == ["new"]
+    assert first.is_cancelled()
+    assert executor.superseded == 1
+    with pytest.raises(TaskCancelledError):
+        first.result()
+    assert second.result() == "new"
+
+
+
+def test_progress_reported_and_cancellation_visible_to_task(app, executor):
+    """reports_progress 작업이 진행률을 GUI 스레드로 보내고 취소를 확인할 수 있는지 테스트"""
+    progress = []
+    stopped = threading.Event()
+
+    def long_task(progress=None, is_cancelled=None):
+        for i in range(1000):
+            if is_cancelled():
+                stopped.set()
+                return i
+            progress(i)
+            time.sleep(0.002)
+        return -1
+
+    handle = executor.submit(long_task, lane="export", key="export", reports_progress=True)
+    handle.progress.connect(progress.append)
+
+    assert _process_until(app, lambda: len(progress) >= 3)
+    assert executor.cancel("export")
+    assert stopped.wait(2)
+    assert progress[:3] == [0, 1, 2]
+
+def test_watchdog_reports_blocking_slot(app, caplog):
+    """50 ms 이상 이벤트 루프를 막는 슬롯이 기록되는지 테스트"""
+    watchdog = StallWatchdog(threshold_ms=50, interval_ms=10)
+    watchdog.start()
+    try:
+        _process_until(app, lambda: False, timeout=0.1)
+
+        def blocking_slot():
+            time.sleep(0.15)
+
+        blocking_slot()
+        _process_until(app, lambda: watchdog.stalls, timeout=1.0)
+    finally:
+        watchdog.stop()
+
+    assert len(watchdog.stalls) == 1
+    stall = watchdog.stalls[0]
+    assert stall['duration_ms'] >= 100
+    assert "blocking_slot" in stall['where']
+    assert any("이벤트 루프" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,94 @@
+"""
+인쇄 경로 지연 시간 추적 테스트
+"""
+
+import random
+
+from src.utils.tracing import LatencyHistogram, Tracer, format_latency_table, load_latency_snapshot
+
+
+def test_histogram_percentiles_within_relative_error():
+    """HDR 버킷 백분위수가 정확한 값과 상대 오차 2% 이내인지 테스트"""
+    rng = random.Random(1)
+    values = sorted(int(rng.lognormvariate(8, 1.5)) for _ in range(5000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for p in (50, 95, 99):
+        exact = values[round(len(values) * p / 100) - 1]
+        assert abs(histogram.percentile(p) - exact) <= max(1, exact * 0.02)
+    assert histogram.percentile(100) == values[-1]
+    assert histogram.count == len(values)
+
+
+def test_histogram_small_values_are_exact():
+    """SUB_BUCKETS 미만 값은 버킷 오차 없이 기록되는지 테스트"""
+    histogram = LatencyHistogram()
+    for value in (3, 3, 7, 40):
+        histogram.record(value)
+
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(75) == 7
+    assert histogram.summary()['max_ms'] == 0.04
+
+
+def test_disabled_tracer_records_nothing():
+    """비활성 상태에서는 공유 no-op span을 쓰고 아무것도 기록하지 않는지 테스트"""
+    tracer = Tracer(enabled=False)
+    with tracer.span("a") as first, tracer.span("b") as second:
+        pass
+
+    assert first is second
+    assert tracer.snapshot() == {}
+
+
+def test_spans_record_stages_and_save(tmp_path):
+    """span 기록, 표 출력, 저장/로드 테스트"""
+    tracer = Tracer(enabled=True)
+    for _ in range(3):
+        with tracer.span("print.total"):
+            with tracer.span("db.commit"):
+                pass
+
+    snapshot = tracer.snapshot()
+    assert list(snapshot) == ["db.commit", "print.total"]
+    assert snapshot["print.total"]["count"] == 3
+    assert snapshot["print.total"]["p99_ms"] >= snapshot["db.commit"]["p50_ms"]
+
+    path = tmp_path / "latency.json"
+    tracer.save(str(path))
+    table = format_latency_table(load_latency_snapshot(str(path)))
+    assert "p95" in table and "print.total" in table
+
+
+def test_print_pipeline_stages_are_traced(tmp_path):
+    """인쇄 경로의 각 단계가 기록되는지 테스트"""
+    import io
+
+    from src.database.db_manager import DBManager
+    from src.headless import HeadlessRunner
+    from src.printer.transports import FileTransport
+    from src.utils.tracing import get_tracer
+
+    db = DBManager(str(tmp_path / "trace.db"))
+    db.initialize()
+    db.set_config('prn_template', 'PSA_LABEL_ZPL_with_mac_address.prn')
+
+    tracer = get_tracer()
+    tracer.reset()
+    tracer.enabled = True
+    try:
+        runner = HeadlessRunner(db, FileTransport(str(tmp_path / "out.zpl")), output=io.StringIO())
+        runner.run(["PSAD0CF1336A13031", "PSAD0CF1336A13032"])
+        snapshot = tracer.snapshot()
+    finally:
+        tracer.enabled = False
+        tracer.reset()
+        db.close()
+
+    assert set(snapshot) == {
+        "print.total", "print.sequence_lookup", "print.config_read",
+        "print.template_load", "print.template_render", "printer.spool", "db.commit",
+    }
+    assert snapshot["print.total"]["count"] == 2